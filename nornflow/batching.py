@@ -0,0 +1,45 @@
+"""Rolling execution: running a workflow over the inventory in serial batches."""
+
+import math
+from collections.abc import Callable
+from typing import NamedTuple
+
+from nornir.core.inventory import Host
+
+from nornflow.inventory_index import register_indexed_filter
+
+
+class BatchProgress(NamedTuple):
+    """
+    Progress of a rolling execution, reported after each batch completes.
+
+    Attributes:
+        number: 1-based number of the batch that just completed.
+        total: Total number of batches.
+        hosts: Names of the hosts in the completed batch.
+        failed_hosts: Names of the hosts of the completed batch that failed.
+        remaining_hosts: Number of hosts in the batches that have not run yet.
+    """
+
+    number: int
+    total: int
+    hosts: tuple[str, ...]
+    failed_hosts: tuple[str, ...]
+    remaining_hosts: int
+
+
+# Called between batches with the progress so far; returning False aborts the rollout.
+BatchGate = Callable[[BatchProgress], bool]
+
+
+def in_batch(host: Host, batch_hosts: frozenset[str]) -> bool:
+    """Nornir filter function selecting the hosts of one batch."""
+    return host.name in batch_hosts
+
+
+register_indexed_filter(in_batch, lambda index, batch_hosts: index.named(batch_hosts))
+
+
+def count_batches(total_hosts: int, hosts_per_batch: int) -> int:
+    """Return how many batches of 'hosts_per_batch' cover 'total_hosts' hosts."""
+    return math.ceil(total_hosts / hosts_per_batch) if total_hosts else 0
@@ -3,7 +3,16 @@ from typing import Any
 
 from pydantic_serdes.utils import load_file_to_dict
 
-from nornflow.constants import FailureStrategy, NORNFLOW_SUPPORTED_YAML_EXTENSIONS
+from nornflow.batching import BatchGate
+from nornflow.connection_pool import ConnectionPool
+from nornflow.constants import (
+    BatchSize,
+    ExecutionStrategy,
+    FailureBudget,
+    FailureStrategy,
+    NORNFLOW_SUPPORTED_YAML_EXTENSIONS,
+)
+from nornflow.distributed import Transport
 from nornflow.exceptions import InitializationError, ResourceError, SettingsError, WorkflowError
 from nornflow.logger import logger
 from nornflow.models import WorkflowModel
@@ -72,6 +81,13 @@ class NornFlowBuilder:
         self._vars: dict[str, Any] | None = None
         self._filters: dict[str, Any] | None = None
         self._failure_strategy: FailureStrategy | None = None
+        self._failure_budget: FailureBudget | None = None
+        self._batch_size: BatchSize | None = None
+        self._batch_gate: BatchGate | None = None
+        self._execution_strategy: ExecutionStrategy | None = None
+        self._shards: int | None = None
+        self._distributed: Transport | str | None = None
+        self._connection_pool: ConnectionPool | None = None
         self._kwargs: dict[str, Any] = {}
 
     def with_settings_object(self, settings_object: NornFlowSettings) -> "NornFlowBuilder":
@@ -267,6 +283,116 @@ class NornFlowBuilder:
         self._failure_strategy = failure_strategy
         return self
 
+    def with_failure_budget(self, failure_budget: FailureBudget) -> "NornFlowBuilder":
+        """
+        Set the failure budget for the NornFlow instance.
+
+        The budget is used by the 'failure-budget' failure strategy. It has the
+        highest precedence and overrides any failure budget defined in the
+        workflow YAML or settings.
+
+        Args:
+            failure_budget: FailureBudget with highest precedence
+
+        Returns:
+            The builder instance for method chaining.
+        """
+        self._failure_budget = failure_budget
+        return self
+
+    def with_batch_size(self, batch_size: BatchSize) -> "NornFlowBuilder":
+        """
+        Set the batch size for a rolling execution of the workflow.
+
+        The workflow runs over one batch of hosts at a time. This has the highest
+        precedence and overrides any batch size defined in the workflow YAML or
+        settings.
+
+        Args:
+            batch_size: BatchSize with highest precedence
+
+        Returns:
+            The builder instance for method chaining.
+        """
+        self._batch_size = batch_size
+        return self
+
+    def with_batch_gate(self, batch_gate: BatchGate) -> "NornFlowBuilder":
+        """
+        Set the gate consulted between batches of a rolling execution.
+
+        Args:
+            batch_gate: Callable receiving a BatchProgress and returning False to
+                abort the rollout before the next batch.
+
+        Returns:
+            The builder instance for method chaining.
+        """
+        self._batch_gate = batch_gate
+        return self
+
+    def with_execution_strategy(self, execution_strategy: ExecutionStrategy) -> "NornFlowBuilder":
+        """
+        Set how the workflow's tasks are scheduled across hosts.
+
+        This has the highest precedence and overrides any execution strategy
+        defined in the workflow YAML or settings.
+
+        Args:
+            execution_strategy: ExecutionStrategy enum value with highest precedence
+
+        Returns:
+            The builder instance for method chaining.
+        """
+        self._execution_strategy = execution_strategy
+        return self
+
+    def with_shards(self, shards: int) -> "NornFlowBuilder":
+        """
+        Set how many worker processes the inventory is split across.
+
+        This has the highest precedence and overrides any shard count defined in
+        settings.
+
+        Args:
+            shards: Number of worker processes with highest precedence
+
+        Returns:
+            The builder instance for method chaining.
+        """
+        self._shards = shards
+        return self
+
+    def with_distributed(self, distributed: Transport | str) -> "NornFlowBuilder":
+        """
+        Coordinate a distributed run on the given address or transport.
+
+        The filtered inventory is handed out in batches to workers started with
+        'nornflow worker' on other machines.
+
+        Args:
+            distributed: Address URL (e.g. 'tcp://0.0.0.0:7300') or Transport
+
+        Returns:
+            The builder instance for method chaining.
+        """
+        self._distributed = distributed
+        return self
+
+    def with_connection_pool(self, connection_pool: ConnectionPool) -> "NornFlowBuilder":
+        """
+        Keep device connections open between runs sharing the given pool.
+
+        Args:
+            connection_pool: The pool connections are handed over to at the end of
+                the run, and reused from by the next run.
+
+        Returns:
+            The builder instance for method chaining.
+        """
+        self._connection_pool = connection_pool
+        return self
+
     def with_kwargs(self, **kwargs: Any) -> "NornFlowBuilder":
         """
         Set additional keyword arguments for the builder.
@@ -367,6 +493,13 @@ class NornFlowBuilder:
             vars=self._vars,
             filters=self._filters,
             failure_strategy=self._failure_strategy,
+            failure_budget=self._failure_budget,
+            batch_size=self._batch_size,
+            batch_gate=self._batch_gate,
+            execution_strategy=self._execution_strategy,
+            shards=self._shards,
+            distributed=self._distributed,
+            connection_pool=self._connection_pool,
             **self._kwargs,
         )
 
@@ -6,6 +6,15 @@ This package contains the default filters and processors included with NornFlow.
 
 from nornflow.builtins.filters import groups, hosts
 from nornflow.builtins.hooks import IfHook, ShushHook, SingleHook, StoreAsHook
-from nornflow.builtins.processors import DefaultNornFlowProcessor
+from nornflow.builtins.processors import DefaultNornFlowProcessor, JsonlResultsProcessor
 
-__all__ = ["DefaultNornFlowProcessor", "IfHook", "ShushHook", "SingleHook", "StoreAsHook", "groups", "hosts"]
+__all__ = [
+    "DefaultNornFlowProcessor",
+    "IfHook",
+    "JsonlResultsProcessor",
+    "ShushHook",
+    "SingleHook",
+    "StoreAsHook",
+    "groups",
+    "hosts",
+]
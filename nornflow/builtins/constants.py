@@ -2,3 +2,13 @@
 
 SKIP_FLAG = "nornflow_skip_flag"
 SILENT_SKIP_FLAG = "nornflow_silent_skip_flag"
+
+# Maximum number of task result records waiting for the background output writer
+# before Nornir worker threads block (see DefaultNornFlowProcessor).
+DEFAULT_OUTPUT_QUEUE_SIZE = 1000
+
+# Write buffer size (bytes) of JsonlResultsProcessor's output file.
+DEFAULT_JSONL_BUFFER_SIZE = 1024 * 1024
+
+# Number of slowest hosts listed per task in DefaultNornFlowProcessor's timing summary.
+DEFAULT_SLOWEST_HOSTS = 5
@@ -4,6 +4,8 @@ NornFlow provided filters for Nornir inventory.
 
 from nornir.core.inventory import Host
 
+from nornflow.inventory_index import InventoryIndex, register_indexed_filter
+
 
 def hosts(host: Host, hosts: list[str]) -> bool:
     """
@@ -35,3 +37,21 @@ def groups(host: Host, groups: list[str]) -> bool:
     if not groups:
         return True
     return any(group in host.groups for group in groups)
+
+
+def _select_hosts(index: InventoryIndex, hosts: list[str]) -> frozenset[str] | None:
+    """Index fast path of the 'hosts' filter."""
+    if isinstance(hosts, str):  # substring semantics of 'in': keep the plain filter
+        return None
+    return index.named(hosts) if hosts else index.names
+
+
+def _select_groups(index: InventoryIndex, groups: list[str]) -> frozenset[str] | None:
+    """Index fast path of the 'groups' filter."""
+    if isinstance(groups, str):
+        return None
+    return index.in_groups(groups) if groups else index.names
+
+
+register_indexed_filter(hosts, _select_hosts)
+register_indexed_filter(groups, _select_groups)
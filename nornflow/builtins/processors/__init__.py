@@ -6,5 +6,13 @@ This subpackage contains built-in processor implementations for NornFlow.
 from .default_processor import DefaultNornFlowProcessor
 from .failure_strategy_processor import NornFlowFailureStrategyProcessor
 from .hook_processor import NornFlowHookProcessor
+from .jsonl_processor import JsonlResultsProcessor
+from .timing_metrics import TaskTimingMetrics
 
-__all__ = ["DefaultNornFlowProcessor", "NornFlowFailureStrategyProcessor", "NornFlowHookProcessor"]
+__all__ = [
+    "DefaultNornFlowProcessor",
+    "JsonlResultsProcessor",
+    "NornFlowFailureStrategyProcessor",
+    "NornFlowHookProcessor",
+    "TaskTimingMetrics",
+]
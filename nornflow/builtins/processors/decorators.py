@@ -25,8 +25,8 @@ def hook_delegator(func: Callable) -> Callable:
         if not task:
             return func(self, *args, **kwargs)
 
-        hooks = self.task_hooks
-        context = self.context
+        hooks = self.hooks_for(task)
+        context = self.context_for(task)
 
         for hook in hooks:
             if hasattr(hook, method_name):
@@ -1,15 +1,26 @@
 # ruff: noqa: T201, SLF001
 import contextlib
 import threading
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 from colorama import Back, Fore, init, Style
 from nornir.core.inventory import Host
 from nornir.core.processor import Processor
 from nornir.core.task import Result, Task
 
-from nornflow.builtins.constants import SILENT_SKIP_FLAG
+from nornflow.builtins.constants import DEFAULT_OUTPUT_QUEUE_SIZE, DEFAULT_SLOWEST_HOSTS, SILENT_SKIP_FLAG
+from nornflow.constants import OutputMode
+from nornflow.j2 import Jinja2Service
+from nornflow.logger import logger
 from nornflow.masking import mask_for_display
+from .hook_processor import NornFlowHookProcessor
+from .output_writer import AsyncOutputWriter
+from .timing_metrics import TaskTimingMetrics, TIMING_PERCENTILES
 
 # Initialize colorama
 init(autoreset=True)
@@ -24,9 +35,45 @@ init(autoreset=True)
 # return boundary into task_instance_completed on the same thread.
 output_lock = threading.RLock()
 
+# Template cache counters reported as activity of the run (the size is reported as is)
+TEMPLATE_CACHE_COUNTERS = ("hits", "misses", "evictions")
+
+
+@dataclass(frozen=True)
+class _TaskResultRecord:
+    """Everything needed to print one task result block, captured on the worker thread."""
+
+    task_name: str
+    host: Host
+    hostname: str | None
+    status: str
+    status_color: str
+    start_time: datetime
+    finish_time: datetime
+    result: Any
+    suppress_output: bool
+
 
 class DefaultNornFlowProcessor(Processor):
-    """Default processor for NornFlow that tracks execution time and statistics."""
+    """Default processor for NornFlow that tracks execution time and statistics.
+
+    Console output is asynchronous by default: worker threads only capture a small
+    result record and hand it to an AsyncOutputWriter, which formats, masks and
+    prints it on a dedicated thread. Pending output is drained before any summary
+    is printed, and the writer is stopped by print_final_workflow_summary().
+
+    The 'output_mode' selects which per-host result blocks are printed (see
+    OutputMode). Hosts whose results won't be shown are only counted: no result
+    record is built and no masking or formatting work is done for them.
+
+    Every host's execution time is recorded in a TaskTimingMetrics collector, and
+    the summary reports per-task percentiles and the slowest hosts. The same data
+    can be written as JSON through 'metrics_file' or read via metrics_report().
+
+    In a sharded run each shard's instance sends its task headers and formatted
+    result blocks to the parent's instance, which prints them and merges every
+    shard's statistics into a single summary (see start_shard()).
+    """
 
     supports_shush_hook = True
 
@@ -34,19 +81,60 @@ class DefaultNornFlowProcessor(Processor):
         self,
         redaction_enabled: bool = True,
         sensitive_names: frozenset[str] | None = None,
+        *,
+        async_output: bool = True,
+        output_queue_size: int = DEFAULT_OUTPUT_QUEUE_SIZE,
+        output_mode: OutputMode | str = OutputMode.FULL,
+        slowest_hosts: int = DEFAULT_SLOWEST_HOSTS,
+        metrics_file: str | None = None,
     ):
         """Initialize processor with tracking variables for timing and statistics.
 
         Args:
             redaction_enabled: When True, sensitive values in task output are redacted.
             sensitive_names: User-declared identifiers from 'redaction.sensitive_names'.
+            async_output: When True, output is printed by a background writer thread.
+                When False, each worker thread prints its own results synchronously.
+            output_queue_size: Maximum number of pending output records before worker
+                threads block waiting for the writer.
+            output_mode: Which per-host results to print: 'full', 'failures-only',
+                'changed-only' or 'summary'.
+            slowest_hosts: How many of the slowest hosts to report per task. Set to 0
+                to leave the per-task timing section out of the summary.
+            metrics_file: Path of a JSON file to write metrics_report() to at the end
+                of the workflow. Nothing is written when None.
         """
         super().__init__()
         self.redaction_enabled = redaction_enabled
         self.sensitive_names = sensitive_names
+        self.output_mode = OutputMode(output_mode)
+        self.slowest_hosts = slowest_hosts
+        self.metrics_file = metrics_file
+
+        # Per-task, per-host execution times feeding the timing section of the summary
+        self.timing_metrics = TaskTimingMetrics()
+
+        # Timing key and label of the workflow step each running Nornir task belongs
+        # to, keyed by Nornir task name (set in task_started)
+        self._task_steps: dict[str, tuple[str, str]] = {}
+
+        # Template cache counters when the processor was created, so the summary
+        # reports the activity of this run only
+        self._template_stats_start = Jinja2Service().template_cache_stats
+
+        # Template cache activity reported by the shards of a sharded run
+        self._shard_template_stats = dict.fromkeys(TEMPLATE_CACHE_COUNTERS, 0)
+
+        # Largest template cache size reported by a shard. Shards fill their own
+        # caches, so the parent's stays empty in a sharded run.
+        self._shard_template_size = 0
+
+        # Background writer performing console output (None when output is synchronous)
+        self._writer = AsyncOutputWriter(output_lock, output_queue_size) if async_output else None
 
         # Dictionary to track start times for each (task_name, host) pair for timing calculations
         self.start_times = {}
+        self._start_times_lock = threading.Lock()
 
         # Timestamp when the entire workflow started, used for overall duration
         self.workflow_start_time = None
@@ -70,12 +158,20 @@ class DefaultNornFlowProcessor(Processor):
         # Number of skipped task-host executions (hosts skipped due to predicates or result.skipped)
         self.skipped_executions = 0
 
-        # Total number of hosts in the inventory (set once from the first task)
+        # Total number of hosts in the inventory (set once from the first task, or by
+        # the rollout before the first batch of a batched run)
         self.total_hosts = None
 
         # Flag to enable printing workflow summary after each task completion
         self.print_summary_after_each_task = False
 
+        # Set while running as one shard of a sharded run: sends messages to the
+        # parent's DefaultNornFlowProcessor instead of printing (see start_shard)
+        self._shard_send: Callable[[Any], None] | None = None
+
+        # Number of task headers printed for shards (parent side of a sharded run)
+        self._announced_tasks = 0
+
         # Tracks (task_name, host_name) pairs where pause() acquired output_lock
         # and deferred release to task_instance_completed. Entries are added by
         # pause() and removed by task_instance_completed after printing the result
@@ -95,12 +191,49 @@ class DefaultNornFlowProcessor(Processor):
         if not hasattr(task.nornir, "_nornflow_suppressed_tasks"):
             return False
 
+        nornflow_task_model = self._get_task_model(task)
+        if nornflow_task_model is None:
+            return False
+        return nornflow_task_model.canonical_id in task.nornir._nornflow_suppressed_tasks
+
+    def _get_task_model(self, task: Task) -> Any | None:
+        """Find the NornFlow TaskModel a Nornir task was started from.
+
+        Args:
+            task: The Nornir task
+
+        Returns:
+            The TaskModel from the hook processor's task context, or None when there
+            is no hook processor or it holds no task model.
+        """
         for proc in task.nornir.processors:
             if hasattr(proc, "task_specific_context"):
-                nornflow_task_model = proc.task_specific_context.get("task_model")
-                return nornflow_task_model.canonical_id in task.nornir._nornflow_suppressed_tasks
+                task_context = (
+                    proc.get_task_context(task)
+                    if isinstance(proc, NornFlowHookProcessor)
+                    else proc.task_specific_context
+                )
+                return task_context.get("task_model")
 
-        return False
+        return None
+
+    def _register_task_step(self, task: Task) -> None:
+        """Assign the timing key of the workflow step a starting task belongs to.
+
+        Steps running the same task function get separate keys: the TaskModel's
+        canonical_id when known, otherwise the task name suffixed with its position
+        in the run. Shards and the free strategy see the same steps in the same
+        order, so they produce the same keys.
+
+        Args:
+            task: The Nornir task that started.
+        """
+        task_model = self._get_task_model(task)
+        if task_model is not None:
+            step = (task_model.canonical_id, task_model.name)
+        else:
+            step = (f"{task.name}_{self.task_count}", task.name)
+        self._task_steps[task.name] = step
 
     def _format_task_output(self, result: Result, suppress_output: bool) -> str:
         """Format the output section of a task result.
@@ -135,23 +268,76 @@ class DefaultNornFlowProcessor(Processor):
         """
         return host.data.get(SILENT_SKIP_FLAG, False)
 
+    def _is_result_shown(self, status: str, result: Result) -> bool:
+        """Check whether a host's result block is printed under the current output mode.
+
+        Args:
+            status: The status computed for the result ('Success', 'Failed' or 'Skipped').
+            result: The task result for the host.
+
+        Returns:
+            True if the result block should be printed.
+        """
+        if self.output_mode == OutputMode.FULL:
+            return True
+        if self.output_mode == OutputMode.FAILURES_ONLY:
+            return status == "Failed"
+        if self.output_mode == OutputMode.CHANGED_ONLY:
+            return status == "Failed" or bool(result.changed)
+        return False
+
     def task_started(self, task: Task) -> None:
         """Record task start time and print header information."""
+        if self.total_hosts is None:
+            self.total_hosts = len(task.nornir.inventory.hosts)
+
+        self.task_count += 1
+        self._register_task_step(task)
+        if self._shard_send is not None:
+            # The parent prints the banner and headers once for every shard
+            if not self.workflow_start_time:
+                self.workflow_start_time = datetime.now()
+            self._shard_send(("task", (self.task_count, task.name)))
+            return
+        self._announce_task(task.name)
+
+    def _announce_task(self, task_name: str) -> None:
+        """Print the execution banner before the first task, then the header of a task.
+
+        Args:
+            task_name: Name of the task that started.
+        """
         if not self.workflow_start_time:
             self.workflow_start_time = datetime.now()
-            with output_lock:
-                print(
-                    f"\n{Fore.GREEN}{Style.BRIGHT}Execution started at: "
-                    f"{self.workflow_start_time.strftime('%H:%M:%S.%f')[:-3]}{Style.RESET_ALL}"
+            started_at = self.workflow_start_time.strftime("%H:%M:%S.%f")[:-3]
+            self._emit(
+                lambda: print(
+                    f"\n{Fore.GREEN}{Style.BRIGHT}Execution started at: {started_at}{Style.RESET_ALL}"
                 )
+            )
 
-        if self.total_hosts is None:
-            self.total_hosts = len(task.nornir.inventory.hosts)
+        if self.output_mode == OutputMode.SUMMARY:
+            return
 
-        self.task_count += 1
         # Print task header only once per task, not per host
-        with output_lock:
-            print(f"\n{Fore.CYAN}{Style.BRIGHT}Running task: {task.name}{Style.RESET_ALL}")
+        self._emit(lambda: print(f"\n{Fore.CYAN}{Style.BRIGHT}Running task: {task_name}{Style.RESET_ALL}"))
+
+    def _emit(self, job: Callable[[], None]) -> None:
+        """Run an output job on the writer thread, or inline when output is synchronous.
+
+        Args:
+            job: Zero-argument callable performing the output.
+        """
+        if self._writer is None:
+            with output_lock:
+                job()
+        else:
+            self._writer.submit(job)
+
+    def flush_output(self) -> None:
+        """Block until all output queued so far has been printed."""
+        if self._writer is not None:
+            self._writer.flush()
 
     def task_instance_started(self, task: Task, host: Host) -> None:
         """Record start time for a specific task on a specific host."""
@@ -159,12 +345,12 @@ class DefaultNornFlowProcessor(Processor):
             return
 
         start_time = datetime.now()
-        with output_lock:
+        with self._start_times_lock:
             self.start_times[(task.name, host)] = start_time
         self.task_executions += 1
 
     def task_instance_completed(self, task: Task, host: Host, result: Result) -> None:
-        """Process task completion and print results for a specific host.
+        """Process task completion and queue the result block for a specific host.
 
         Silent-skip flag cleanup is owned by SingleHook.task_completed,
         not this processor. We only check the flag to skip output/stats.
@@ -191,68 +377,86 @@ class DefaultNornFlowProcessor(Processor):
             status_color = Fore.RED
             self.failed_executions += 1
 
-        start_time = self.start_times.get((task.name, host), finish_time)
-        start_str = start_time.strftime("%H:%M:%S.%f")[:-3]
-        finish_str = finish_time.strftime("%H:%M:%S.%f")[:-3]
+        with self._start_times_lock:
+            start_time = self.start_times.pop((task.name, host), finish_time)
+        task_key, task_label = self._task_steps.get(task.name, (task.name, task.name))
+        self.timing_metrics.record(
+            task_key, host.name, (finish_time - start_time).total_seconds() * 1000, label=task_label
+        )
 
-        # Calculate duration
-        duration = finish_time - start_time
-        duration_ms = duration.total_seconds() * 1000
+        if not self._is_result_shown(status, result):
+            # Nothing is printed for this host, so skip building, masking and formatting.
+            if held_by_pause:
+                self._release_pause_lock(pause_key)
+            return
 
-        suppress_output = self._is_output_suppressed(task)
-        output_section = self._format_task_output(result, suppress_output)
+        record = _TaskResultRecord(
+            task_name=task.name,
+            host=host,
+            hostname=task.host.hostname,
+            status=status,
+            status_color=status_color,
+            start_time=start_time,
+            finish_time=finish_time,
+            result=result,
+            suppress_output=self._is_output_suppressed(task),
+        )
 
         if held_by_pause:
-            self._print_task_result(
-                task, host, status, status_color, start_str, finish_str, duration_ms, output_section
-            )
-            self._pause_lock_holders.discard(pause_key)
-            output_lock.release()
+            # pause() holds output_lock for this thread: print now so the result block
+            # directly follows the prompt, then hand the lock back.
+            self._print_task_result(record)
+            self._release_pause_lock(pause_key)
+        elif self._shard_send is not None:
+            # Format and mask in this shard's process; the parent only prints the lines
+            self._emit(lambda: self._shard_send(("output", self._task_result_lines(record))))
         else:
-            with output_lock:
-                self._print_task_result(
-                    task, host, status, status_color, start_str, finish_str, duration_ms, output_section
-                )
+            self._emit(lambda: self._print_task_result(record))
 
-    def _print_task_result(
-        self,
-        task: Task,
-        host: Host,
-        status: str,
-        status_color: str,
-        start_str: str,
-        finish_str: str,
-        duration_ms: float,
-        output_section: str,
-    ) -> None:
-        """Print the formatted task result block.
+    def _release_pause_lock(self, pause_key: tuple[str, str]) -> None:
+        """Hand back output_lock acquired by pause() for a (task_name, host_name) pair."""
+        self._pause_lock_holders.discard(pause_key)
+        output_lock.release()
+
+    def _print_task_result(self, record: _TaskResultRecord) -> None:
+        """Format and print a task result block.
+
+        Must be called while holding output_lock.
 
         Args:
-            task: The Nornir task.
-            host: The host the task ran on.
-            status: Status string (Success/Failed/Skipped).
-            status_color: Colorama color for the status.
-            start_str: Formatted start time string.
-            finish_str: Formatted finish time string.
-            duration_ms: Duration in milliseconds.
-            output_section: Pre-formatted output section string.
+            record: The task result record captured when the host completed.
         """
-        print(f"{Fore.WHITE}{'-' * 80}")
-        print(
-            f"{Style.BRIGHT}{Fore.CYAN}Task: {task.name} "
-            f"{Fore.WHITE}| {Fore.YELLOW}Host: {host} "
-            f"{Fore.WHITE}| {Fore.MAGENTA}Hostname: {task.host.hostname or 'N/A'} "
-            f"{Fore.WHITE}| {status_color}Status: {status}"
-        )
-        print(f"{Fore.BLUE}{start_str} - {finish_str} ({duration_ms:.0f}ms)")
+        for line in self._task_result_lines(record):
+            print(line)
 
-        if output_section:
-            print(output_section)
+    def _task_result_lines(self, record: _TaskResultRecord) -> list[str]:
+        """Format a task result block.
 
-        print(f"{Fore.WHITE}{'-' * 80}")
+        Args:
+            record: The task result record captured when the host completed.
 
-        if (task.name, host) in self.start_times:
-            del self.start_times[(task.name, host)]
+        Returns:
+            The lines of the block, each printed with its own print() call.
+        """
+        start_str = record.start_time.strftime("%H:%M:%S.%f")[:-3]
+        finish_str = record.finish_time.strftime("%H:%M:%S.%f")[:-3]
+        duration_ms = (record.finish_time - record.start_time).total_seconds() * 1000
+        output_section = self._format_task_output(record.result, record.suppress_output)
+
+        lines = [
+            f"{Fore.WHITE}{'-' * 80}",
+            (
+                f"{Style.BRIGHT}{Fore.CYAN}Task: {record.task_name} "
+                f"{Fore.WHITE}| {Fore.YELLOW}Host: {record.host} "
+                f"{Fore.WHITE}| {Fore.MAGENTA}Hostname: {record.hostname or 'N/A'} "
+                f"{Fore.WHITE}| {record.status_color}Status: {record.status}"
+            ),
+            f"{Fore.BLUE}{start_str} - {finish_str} ({duration_ms:.0f}ms)",
+        ]
+        if output_section:
+            lines.append(output_section)
+        lines.append(f"{Fore.WHITE}{'-' * 80}")
+        return lines
 
     def _cleanup_pause_lock_holders(self, task_name: str) -> None:
         """Remove any orphaned pause lock entries for the given task and release the lock.
@@ -303,8 +507,151 @@ class DefaultNornFlowProcessor(Processor):
             self.print_workflow_summary()
 
     def print_final_workflow_summary(self) -> None:
-        """Print the final workflow summary when explicitly called at the end of all workflow tasks."""
+        """Print the final workflow summary when explicitly called at the end of all workflow tasks.
+
+        Drains any pending output first and stops the background writer thread.
+        """
         self.print_workflow_summary()
+        if self._writer is not None:
+            self._writer.close()
+        if self.metrics_file and self.workflow_start_time:
+            self.export_metrics(self.metrics_file)
+
+    def start_shard(self, shard: Any, send: Callable[[Any], None]) -> None:
+        """Relay output to the parent instead of printing it, in a shard of a sharded run.
+
+        Task headers and formatted result blocks are sent to the parent's
+        DefaultNornFlowProcessor, which prints them through receive_shard_message().
+        Masking and formatting still happen here, in the shard's process.
+
+        Args:
+            shard: The shard this processor runs in.
+            send: Callable delivering a message to the parent processor.
+        """
+        self._shard_send = send
+
+    def finish_shard(self) -> dict[str, Any]:
+        """Send any pending output and return this shard's statistics.
+
+        Returns:
+            A report for the parent's merge_shard_report().
+        """
+        self.flush_output()
+        if self._writer is not None:
+            self._writer.close()
+        return {
+            "workflow_start_time": self.workflow_start_time,
+            "total_hosts": self.total_hosts or 0,
+            "task_count": self.task_count,
+            "tasks_completed": self.tasks_completed,
+            "task_executions": self.task_executions,
+            "successful_executions": self.successful_executions,
+            "failed_executions": self.failed_executions,
+            "skipped_executions": self.skipped_executions,
+            "timings": self.timing_metrics.samples(),
+            "template_cache": self.template_cache_report(),
+        }
+
+    def receive_shard_message(self, message: tuple[str, Any]) -> None:
+        """Print a task header or result block relayed by a shard.
+
+        Each task header is printed once, when the first shard starts the task.
+
+        Args:
+            message: A ('task', (task_number, task_name)) or ('output', lines) tuple.
+        """
+        kind, payload = message
+        if kind == "task":
+            task_number, task_name = payload
+            if task_number > self._announced_tasks:
+                self._announced_tasks = task_number
+                self._announce_task(task_name)
+        elif kind == "output":
+
+            def _print_lines() -> None:
+                for line in payload:
+                    print(line)
+
+            self._emit(_print_lines)
+
+    def merge_shard_report(self, report: dict[str, Any]) -> None:
+        """Add a shard's statistics to this processor's, for the final summary.
+
+        Execution counts and timings add up across shards. Every shard runs the
+        same tasks, so task counts are those of the shard that got furthest.
+
+        Args:
+            report: The shard's finish_shard() report.
+        """
+        started = report["workflow_start_time"]
+        if started and (self.workflow_start_time is None or started < self.workflow_start_time):
+            self.workflow_start_time = started
+        self.total_hosts = (self.total_hosts or 0) + report["total_hosts"]
+        self.task_count = max(self.task_count, report["task_count"])
+        self.tasks_completed = max(self.tasks_completed, report["tasks_completed"])
+        self.task_executions += report["task_executions"]
+        self.successful_executions += report["successful_executions"]
+        self.failed_executions += report["failed_executions"]
+        self.skipped_executions += report["skipped_executions"]
+        self.timing_metrics.merge(report["timings"])
+        shard_template_cache = report.get("template_cache") or {}
+        for name, value in shard_template_cache.items():
+            if name in self._shard_template_stats:
+                self._shard_template_stats[name] += value
+        self._shard_template_size = max(self._shard_template_size, shard_template_cache.get("size", 0))
+
+    def metrics_report(self) -> dict[str, Any]:
+        """Build a machine-readable report of the workflow's counts and timings.
+
+        Returns:
+            A JSON-serializable dict with workflow-level 'started_at', 'finished_at',
+            'duration_ms', 'total_hosts', execution counts and template cache activity, plus a 'tasks'
+            dict holding each task's count, total, percentiles, max and slowest hosts (all in ms).
+        """
+        end_time = datetime.now()
+        started_at = self.workflow_start_time or end_time
+        return {
+            "started_at": started_at.isoformat(timespec="milliseconds"),
+            "finished_at": end_time.isoformat(timespec="milliseconds"),
+            "duration_ms": round((end_time - started_at).total_seconds() * 1000, 3),
+            "total_hosts": self.total_hosts or 0,
+            "task_executions": self.task_executions,
+            "successful_executions": self.successful_executions,
+            "failed_executions": self.failed_executions,
+            "skipped_executions": self.skipped_executions,
+            "template_cache": self.template_cache_report(),
+            "tasks": self.timing_metrics.summarize(self.slowest_hosts),
+        }
+
+    def template_cache_report(self) -> dict[str, int]:
+        """Count the template cache hits, misses and evictions since this processor was created.
+
+        In a sharded run, the activity reported by the shards is included, and
+        'size' is that of the fullest shard's cache.
+
+        Returns:
+            A dict with 'hits', 'misses' and 'evictions', plus the cache's current
+            'size' and 'max_size'.
+        """
+        now = Jinja2Service().template_cache_stats
+        start = self._template_stats_start
+        report = {
+            name: max(getattr(now, name) - getattr(start, name), 0) + self._shard_template_stats[name]
+            for name in TEMPLATE_CACHE_COUNTERS
+        }
+        report.update(size=max(now.size, self._shard_template_size), max_size=now.max_size)
+        return report
+
+    def export_metrics(self, path: str | Path) -> None:
+        """Write metrics_report() to a JSON file.
+
+        Args:
+            path: Destination file. Parent directories are created if needed.
+        """
+        report = self.metrics_report()
+        tasks = report.pop("tasks")
+        written = self.timing_metrics.export_json(path, extra=report, summary=tasks)
+        logger.debug(f"Wrote timing metrics for {len(tasks)} task(s) to '{written}'")
 
     def print_workflow_summary(self) -> None:
         """
@@ -313,6 +660,9 @@ class DefaultNornFlowProcessor(Processor):
         if not self.workflow_start_time:
             return
 
+        # Results still queued for the writer must be printed before the summary
+        self.flush_output()
+
         end_time = datetime.now()
         duration = end_time - self.workflow_start_time
         duration_ms = duration.total_seconds() * 1000
@@ -333,6 +683,10 @@ class DefaultNornFlowProcessor(Processor):
         failure_bars = int(bar_length * failure_percent / 100)
         skipped_bars = int(bar_length * skipped_percent / 100)
 
+        timing_summary = self.timing_metrics.summarize(self.slowest_hosts) if self.slowest_hosts > 0 else {}
+        template_cache = self.template_cache_report()
+        compilations = template_cache["hits"] + template_cache["misses"]
+
         # Add extra space before summary
         with output_lock:
             print("\n\n")
@@ -354,6 +708,19 @@ class DefaultNornFlowProcessor(Processor):
             print(f"  {Fore.WHITE}Task Executions: {Style.BRIGHT}{self.task_executions}")
             print()
 
+            if compilations:
+                hit_percent = template_cache["hits"] / compilations * 100
+                print(f"{Fore.WHITE}{Style.BRIGHT}Template Cache:{Style.RESET_ALL}")
+                print(
+                    f"  {Fore.WHITE}Hits: {template_cache['hits']} ({hit_percent:.1f}%)  "
+                    f"Misses: {template_cache['misses']}  Evictions: {template_cache['evictions']}  "
+                    f"Size: {template_cache['size']}/{template_cache['max_size']}"
+                )
+                print()
+
+            if timing_summary:
+                self._print_timing_summary(timing_summary)
+
             # EXECUTION RESULTS
             print(f"{Fore.WHITE}{Style.BRIGHT}Execution Results:{Style.RESET_ALL}")
             print(
@@ -377,3 +744,25 @@ class DefaultNornFlowProcessor(Processor):
             )
             print(f"  {bar}")
             print()
+
+    def _print_timing_summary(self, timing_summary: dict[str, dict[str, Any]]) -> None:
+        """Print per-task duration percentiles and slowest hosts.
+
+        Must be called while holding output_lock.
+
+        Args:
+            timing_summary: Output of TaskTimingMetrics.summarize().
+        """
+        print(f"{Fore.WHITE}{Style.BRIGHT}Task Timing (per host):{Style.RESET_ALL}")
+        label_counts = Counter(stats["label"] for stats in timing_summary.values())
+        for task_key, stats in timing_summary.items():
+            # Steps sharing a task function are told apart by their key
+            task_name = stats["label"] if label_counts[stats["label"]] == 1 else task_key
+            percentiles = "  ".join(f"p{p}: {stats[f'p{p}_ms']:.0f}ms" for p in TIMING_PERCENTILES)
+            print(
+                f"  {Fore.CYAN}{task_name}{Fore.WHITE}  hosts: {stats['count']}  "
+                f"{percentiles}  max: {Style.BRIGHT}{stats['max_ms']:.0f}ms{Style.RESET_ALL}"
+            )
+            slowest = ", ".join(f"{h['host']} ({h['duration_ms']:.0f}ms)" for h in stats["slowest_hosts"])
+            print(f"    {Fore.YELLOW}Slowest: {slowest}")
+        print()
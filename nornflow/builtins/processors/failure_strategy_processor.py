@@ -1,5 +1,7 @@
 # ruff: noqa: T201
 import threading
+from collections.abc import Callable
+from typing import Any
 
 from colorama import Fore, init, Style
 from nornir.core.inventory import Host
@@ -7,9 +9,12 @@ from nornir.core.processor import Processor
 from nornir.core.task import Result, Task
 from tabulate import tabulate
 
-from nornflow.constants import FailureStrategy
+from nornflow.constants import FailureBudget, FailureStrategy
+from nornflow.exceptions import ProcessorError, TaskCancelledError
 from nornflow.logger import logger
 from nornflow.masking import mask_text
+from nornflow.runners.cancellation import CancellationToken
+from nornflow.utils import AtomicCounter
 
 # Initialize colorama
 init(autoreset=True)
@@ -25,13 +30,28 @@ class NornFlowFailureStrategyProcessor(Processor):
     when tasks fail:
     - SKIP_FAILED: Nornir's default behavior - failed hosts are automatically removed
       from subsequent tasks
-    - FAIL_FAST: Signals all threads to stop by adding all hosts to failed_hosts when
-      a failure is detected. Already-running threads will complete before stopping.
+    - FAIL_FAST: On the first failure, cancels the shared CancellationToken and adds
+      all hosts to failed_hosts. With CancellableThreadedRunner, hosts that have not
+      started are never dispatched; hosts already running stop at their next
+      subtask (or 'raise_if_cancelled' call) with a TaskCancelledError.
     - RUN_ALL: Resets failed_hosts before each task to ensure all hosts run all tasks
       regardless of previous failures
+    - FAILURE_BUDGET: Like SKIP_FAILED until the number of failed hosts exceeds the
+      failure budget, then halts exactly like FAIL_FAST. The budget is resolved
+      against the inventory size when the first task starts, so each failure only
+      costs an atomic counter increment and an integer comparison.
 
     Args:
         failure_strategy: The failure handling strategy to apply.
+        redaction_enabled: When True, secrets in error messages are redacted.
+        sensitive_names: User-declared identifiers from 'redaction.sensitive_names'.
+        cancellation_token: Token cancelled when execution halts. A private token
+            is created if omitted.
+        failure_budget: Failures tolerated by FAILURE_BUDGET. Required for that
+            strategy and ignored by the others.
+
+    Raises:
+        ProcessorError: If FAILURE_BUDGET is used without a failure budget.
     """
 
     def __init__(
@@ -39,12 +59,30 @@ class NornFlowFailureStrategyProcessor(Processor):
         failure_strategy: FailureStrategy,
         redaction_enabled: bool = True,
         sensitive_names: frozenset[str] | None = None,
+        *,
+        cancellation_token: CancellationToken | None = None,
+        failure_budget: FailureBudget | None = None,
     ) -> None:
+        if failure_strategy == FailureStrategy.FAILURE_BUDGET and failure_budget is None:
+            raise ProcessorError(
+                "The 'failure-budget' failure strategy requires a failure budget "
+                "(e.g. failure_budget: '10%' or failure_budget: 5)."
+            )
         self.failure_strategy = failure_strategy
         self.redaction_enabled = redaction_enabled
         self.sensitive_names = sensitive_names
+        self.cancellation_token = cancellation_token or CancellationToken()
+        self.failure_budget = failure_budget
+        self.failure_count = AtomicCounter()
+        self.allowed_failures: int | None = None
         self.collected_errors = []
+        # Names of the hosts that failed a task, kept across tasks even when RUN_ALL
+        # resets Nornir's failed_hosts (cleared by the rollout before each batch)
+        self.failed_host_names: set[str] = set()
+        # Rows of the failure summary reported by shards of a sharded run
+        self.shard_errors: list[list[str]] = []
         self.fail_fast_triggered = False
+        self.budget_exceeded = False
         self.nornir = None
 
     def task_started(self, task: Task) -> None:
@@ -52,6 +90,9 @@ class NornFlowFailureStrategyProcessor(Processor):
         if not self.nornir and hasattr(task, "nornir"):
             self.nornir = task.nornir
 
+        if self.failure_strategy == FailureStrategy.FAILURE_BUDGET and self.allowed_failures is None:
+            self.resolve_failure_budget()
+
         # For RUN_ALL, reset failed hosts before each task
         # This ensures all hosts run all tasks regardless of previous failures
         if self.failure_strategy == FailureStrategy.RUN_ALL and self.nornir:
@@ -64,6 +105,13 @@ class NornFlowFailureStrategyProcessor(Processor):
                     f"failed and FAIL_FAST is enabled.{Style.RESET_ALL}"
                 )
 
+        elif self.budget_exceeded:
+            with output_lock:
+                print(
+                    f"{Fore.RED}{Style.BRIGHT}Execution is halting because the failure "
+                    f"budget ({self.failure_budget}) was exceeded.{Style.RESET_ALL}"
+                )
+
     def task_instance_started(self, task: Task, host: Host) -> None:
         pass
 
@@ -71,43 +119,110 @@ class NornFlowFailureStrategyProcessor(Processor):
         """Called after each host completes for a task."""
         if result.failed:
             self.collected_errors.append((task.name, host.name, result))
+            self.failed_host_names.add(host.name)
+            if isinstance(result.exception, TaskCancelledError):
+                logger.warning(f"Task '{task.name}' was cancelled on host '{host.name}'")
+                return
             logger.error(
                 f"Task '{task.name}' failed on host '{host.name}': {result.exception}",
                 exc_info=result.exception,
             )
+            failures = self.failure_count.increment()
 
             if self.failure_strategy == FailureStrategy.FAIL_FAST and not self.fail_fast_triggered:
                 self.fail_fast_triggered = True
                 logger.debug(f"Fail fast triggered for task '{task.name}' on host '{host.name}'.")
+                self._halt(
+                    task,
+                    host,
+                    result,
+                    headline="FAILURE DETECTED: HALTING WORKFLOW",
+                    reason=f"task '{task.name}' failed on host '{host.name}'",
+                )
 
-                # Add ALL hosts to failed_hosts immediately
-                # This causes Nornir to skip them in all running threads
-                if self.nornir:
-                    with output_lock:
-                        print(
-                            f"\n{Fore.RED}{Style.BRIGHT}━━━ FAILURE DETECTED: HALTING WORKFLOW ━━━{Style.RESET_ALL}"  # noqa: E501
-                        )
-                        print(f"{Fore.RED}Task '{task.name}' failed on host '{host.name}'")
-                        if result.exception:
-                            error_text = mask_text(
-                                str(result.exception),
-                                reveal=not self.redaction_enabled,
-                                sensitive_names=self.sensitive_names,
-                            )
-                            print(f"{Fore.RED}Error: {error_text}")
-                        print(f"{Fore.RED}Signaling all threads to stop...")
-                        print(
-                            f"{Fore.RED}NOTE: Tasks already started will continue "
-                            f"to completion.{Style.RESET_ALL}"
-                        )
-                        print()
-
-                    # Add all hosts to failed_hosts
-                    for hostname in self.nornir.inventory.hosts:
-                        self.nornir.data.failed_hosts.add(hostname)
+            elif self.failure_strategy == FailureStrategy.FAILURE_BUDGET and not self.budget_exceeded:
+                if self.allowed_failures is None:
+                    self.resolve_failure_budget()
+                if failures > self.allowed_failures:
+                    self.budget_exceeded = True
+                    logger.debug(
+                        f"Failure budget ({self.failure_budget}) exceeded by task '{task.name}' "
+                        f"on host '{host.name}': {failures} failures, {self.allowed_failures} allowed."
+                    )
+                    self._halt(
+                        task,
+                        host,
+                        result,
+                        headline="FAILURE BUDGET EXCEEDED: HALTING WORKFLOW",
+                        reason=(
+                            f"failure budget ({self.failure_budget}) exceeded after task "
+                            f"'{task.name}' failed on host '{host.name}'"
+                        ),
+                        details=f"{failures} host(s) failed; the budget allows {self.allowed_failures}",
+                    )
+
+    def resolve_failure_budget(self, total_hosts: int | None = None) -> None:
+        """Turn the failure budget into a number of tolerated failures.
+
+        Called automatically when the first task starts, against the inventory it
+        runs on. Callers that run the workflow over part of the inventory at a time
+        (e.g. rolling batches) call it beforehand with the full host count.
+
+        Args:
+            total_hosts: Number of hosts the budget applies to. Defaults to the
+                size of the inventory the processor has seen.
+        """
+        if total_hosts is None:
+            total_hosts = len(self.nornir.inventory.hosts) if self.nornir else 0
+        self.allowed_failures = self.failure_budget.allowed_failures(total_hosts)
+        logger.debug(
+            f"Failure budget {self.failure_budget} allows {self.allowed_failures} "
+            f"of {total_hosts} host(s) to fail"
+        )
+
+    def _halt(
+        self,
+        task: Task,
+        host: Host,
+        result: Result,
+        *,
+        headline: str,
+        reason: str,
+        details: str = "",
+    ) -> None:
+        """Cancel execution and mark every host as failed so no later task selects them."""
+        self.cancellation_token.cancel(reason)
+        if not self.nornir:
+            return
+
+        with output_lock:
+            print(f"\n{Fore.RED}{Style.BRIGHT}━━━ {headline} ━━━{Style.RESET_ALL}")
+            print(f"{Fore.RED}Task '{task.name}' failed on host '{host.name}'")
+            if result.exception:
+                error_text = mask_text(
+                    str(result.exception),
+                    reveal=not self.redaction_enabled,
+                    sensitive_names=self.sensitive_names,
+                )
+                print(f"{Fore.RED}Error: {error_text}")
+            if details:
+                print(f"{Fore.RED}{details}")
+            print(f"{Fore.RED}Cancelling hosts that have not started...")
+            print(
+                f"{Fore.RED}NOTE: Hosts already running stop at their next "
+                f"cancellation point.{Style.RESET_ALL}"
+            )
+            print()
+
+        self.nornir.data.failed_hosts.update(self.nornir.inventory.hosts)
 
     def subtask_instance_started(self, task: Task, host: Host) -> None:
-        pass
+        """Cancellation point: refuse to start subtasks once execution is cancelled.
+
+        Nornir calls this outside the task's try block, so the error unwinds the
+        parent task, which then fails with the TaskCancelledError.
+        """
+        self.cancellation_token.raise_if_cancelled(task.name, host.name)
 
     def subtask_instance_completed(self, task: Task, host: Host, result: Result) -> None:
         pass
@@ -115,25 +230,67 @@ class NornFlowFailureStrategyProcessor(Processor):
     def task_completed(self, task: Task, result: Result) -> None:
         pass
 
+    def start_shard(self, shard: Any, send: Callable[[Any], None]) -> None:
+        """Count failures across every shard of a sharded run.
+
+        The failure counter is shared with the other shards and the failure
+        budget is resolved against the whole inventory, so a 'failure-budget'
+        run halts once failures across all shards exceed it. Halting a shard
+        halts the others through the shared cancellation.
+
+        Args:
+            shard: The shard this processor runs in.
+            send: Callable delivering a message to the parent processor (unused).
+        """
+        self.failure_count = shard.failure_count
+        if self.failure_strategy == FailureStrategy.FAILURE_BUDGET:
+            self.resolve_failure_budget(shard.total_hosts)
+
+    def finish_shard(self) -> dict[str, Any]:
+        """Return this shard's failures for the parent's merge_shard_report().
+
+        Returns:
+            The shard's failure summary rows and halt flags.
+        """
+        return {
+            "errors": self._error_rows(),
+            "fail_fast_triggered": self.fail_fast_triggered,
+            "budget_exceeded": self.budget_exceeded,
+        }
+
+    def merge_shard_report(self, report: dict[str, Any]) -> None:
+        """Add a shard's failures to the final failure summary.
+
+        Args:
+            report: The shard's finish_shard() report.
+        """
+        self.shard_errors.extend(report["errors"])
+        self.fail_fast_triggered = self.fail_fast_triggered or report["fail_fast_triggered"]
+        self.budget_exceeded = self.budget_exceeded or report["budget_exceeded"]
+
+    def _error_rows(self) -> list[list[str]]:
+        """Build the [task, host, error] rows of the failure summary, with errors masked."""
+        error_table = []
+        for task_name, host_name, host_result in self.collected_errors:
+            error_msg = (
+                mask_text(
+                    str(host_result.exception),
+                    reveal=not self.redaction_enabled,
+                    sensitive_names=self.sensitive_names,
+                )
+                if host_result.exception
+                else "Unknown error"
+            )
+            error_table.append([task_name, host_name, error_msg])
+        return error_table
+
     def print_final_workflow_summary(self) -> None:
         """Print collected error summary for all strategies."""
-        if self.collected_errors:
+        error_table = self._error_rows() + self.shard_errors
+        if error_table:
             with output_lock:
                 print("\n\n")
                 print(f"{Fore.RED}{Style.BRIGHT}━━━ FAILURE SUMMARY ━━━{Style.RESET_ALL}")
                 print()
-                error_table = []
-                for task_name, host_name, host_result in self.collected_errors:
-                    error_msg = (
-                        mask_text(
-                            str(host_result.exception),
-                            reveal=not self.redaction_enabled,
-                            sensitive_names=self.sensitive_names,
-                        )
-                        if host_result.exception
-                        else "Unknown error"
-                    )
-                    error_table.append([task_name, host_name, error_msg])
-                if error_table:
-                    print(tabulate(error_table, headers=["Task", "Host", "Error"], tablefmt="simple"))
+                print(tabulate(error_table, headers=["Task", "Host", "Error"], tablefmt="simple"))
                 print()
@@ -36,6 +36,11 @@ class NornFlowHookProcessor(Processor):
     The 'context' property always returns the merged dictionary of both contexts.
     Task-specific context is set at task start and cleared at task completion.
 
+    When several tasks run at once (the 'free' execution strategy), a single
+    "current" task context is not enough. Task contexts are then registered
+    by Nornir task name with register_task_context() and looked up per task
+    (and for its subtasks, via their root task) by get_task_context().
+
     Hook Retrieval:
     ==============
     Hooks are retrieved from the current task-specific context. The processor
@@ -53,6 +58,8 @@ class NornFlowHookProcessor(Processor):
         self.workflow_context = workflow_context or {}
         # task_specific_context is ephemeral and re-set with each new task
         self.task_specific_context = {}
+        # contexts of tasks that may run concurrently, keyed by Nornir task name
+        self._task_contexts: dict[str, dict[str, Any]] = {}
 
     @property
     def workflow_context(self) -> dict[str, Any]:
@@ -109,6 +116,61 @@ class NornFlowHookProcessor(Processor):
         """
         return self.task_specific_context.get("hooks", [])
 
+    def register_task_context(self, task_name: str, value: dict[str, Any]) -> None:
+        """Register the task-specific context of a task that may run concurrently with others.
+
+        Registered contexts take precedence over task_specific_context for the
+        task with that name and are dropped when the task completes.
+
+        Args:
+            task_name: Name of the Nornir task the context belongs to.
+            value: The task-specific context containing task_model and hooks
+        """
+        self._task_contexts[task_name] = value
+        logger.debug(f"Registered task-specific context for task '{task_name}' with {len(value)} items.")
+
+    def get_task_context(self, task: Task) -> dict[str, Any]:
+        """Get the task-specific context that applies to a task.
+
+        Subtasks resolve to the context of the task they were started from.
+
+        Args:
+            task: The Nornir task (a per-host copy or a subtask)
+
+        Returns:
+            The registered context for the task, or the current task-specific context
+        """
+        if self._task_contexts:
+            root = task
+            while root.parent_task is not None:
+                root = root.parent_task
+            registered = self._task_contexts.get(root.name)
+            if registered is not None:
+                return registered
+        return self.task_specific_context
+
+    def context_for(self, task: Task) -> dict[str, Any]:
+        """Get the combined context (workflow + task-specific) for a task.
+
+        Args:
+            task: The Nornir task
+
+        Returns:
+            Merged dictionary of workflow and task-specific contexts
+        """
+        return {**self.workflow_context, **self.get_task_context(task)}
+
+    def hooks_for(self, task: Task) -> list["Hook"]:
+        """Get active hooks for a task.
+
+        Args:
+            task: The Nornir task
+
+        Returns:
+            List of Hook instances for this task
+        """
+        return self.get_task_context(task).get("hooks", [])
+
     @hook_delegator
     def task_started(self, task: Task) -> None:
         """Delegate to hooks' task_started methods."""
@@ -116,6 +178,15 @@ class NornFlowHookProcessor(Processor):
     @hook_delegator
     def task_completed(self, task: Task, result: AggregatedResult) -> None:
         """Delegate to hooks' task_completed methods."""
+        registered = self._task_contexts.pop(task.name, None)
+        task_context = self.task_specific_context if registered is None else registered
+        task_model = task_context.get("task_model")
+        if task_model is not None:
+            for hook in task_context.get("hooks", []):
+                hook.reset_execution(task_model)
+        if registered is not None:
+            logger.debug(f"Dropped registered context of task '{task.name}'.")
+            return
         self.task_specific_context = {}
         logger.debug(f"Cleared task-specific context after task '{task.name}'.")
 
@@ -0,0 +1,252 @@
+import gzip
+import json
+import shutil
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from nornir.core.inventory import Host
+from nornir.core.processor import Processor
+from nornir.core.task import MultiResult, Task
+
+from nornflow.builtins.constants import DEFAULT_JSONL_BUFFER_SIZE, SILENT_SKIP_FLAG
+from nornflow.logger import logger
+from nornflow.masking import mask_for_display
+
+
+class JsonlResultsProcessor(Processor):
+    """Stream one JSON line per (task, host) execution to a file.
+
+    Designed for large inventories: nothing is kept in memory beyond the start time
+    of hosts currently running, and lines are written through a buffered (optionally
+    gzip-compressed) stream as hosts complete. Memory use therefore stays flat
+    regardless of inventory size.
+
+    Each line is a JSON object with the following keys:
+    - task, host: task name and host name.
+    - status: 'success', 'failed' or 'skipped'.
+    - failed, changed, skipped: result flags.
+    - started_at, finished_at: ISO-8601 timestamps; duration_ms: execution time.
+    - result: the task result, masked according to the redaction settings.
+    - exception: string form of the exception, or null.
+
+    The file is opened on the first task and closed by print_final_workflow_summary(),
+    which NornFlow calls at the end of every run. In a sharded run each shard
+    writes its own file and the parent concatenates them into 'path'.
+
+    Example in nornflow.yaml:
+        ```yaml
+        processors:
+          - class: "nornflow.builtins.DefaultNornFlowProcessor"
+          - class: "nornflow.builtins.JsonlResultsProcessor"
+            args:
+              path: "results/run.jsonl.gz"
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str = "nornflow_results.jsonl",
+        *,
+        compress: bool | None = None,
+        buffer_size: int = DEFAULT_JSONL_BUFFER_SIZE,
+        include_result: bool = True,
+        redaction_enabled: bool = True,
+        sensitive_names: frozenset[str] | None = None,
+    ) -> None:
+        """Initialize the processor.
+
+        Args:
+            path: Output file path. Parent directories are created if needed.
+            compress: Write gzip-compressed output. Defaults to True when 'path'
+                ends with '.gz'.
+            buffer_size: Size in bytes of the write buffer.
+            include_result: When False, the 'result' key is omitted from every line.
+            redaction_enabled: When True, sensitive values in results are redacted.
+            sensitive_names: User-declared identifiers from 'redaction.sensitive_names'.
+        """
+        self.path = Path(path)
+        self.compress = self.path.suffix == ".gz" if compress is None else compress
+        self.buffer_size = buffer_size
+        self.include_result = include_result
+        self.redaction_enabled = redaction_enabled
+        self.sensitive_names = sensitive_names
+
+        self.lines_written = 0
+        self._start_times: dict[tuple[str, str], datetime] = {}
+        self._stream: BinaryIO | None = None
+        self._raw_stream: BinaryIO | None = None
+        self._lock = threading.Lock()
+        self._shards_merged = 0
+        self._remote_shard = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the output file is currently open."""
+        return self._stream is not None
+
+    def open(self) -> None:
+        """Open (truncate) the output file. Called automatically on the first task."""
+        with self._lock:
+            if self._stream is not None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            raw = self.path.open("wb", buffering=self.buffer_size)
+            self._raw_stream = raw
+            self._stream = gzip.GzipFile(fileobj=raw, mode="wb") if self.compress else raw
+            self.lines_written = 0
+            logger.debug(f"JsonlResultsProcessor writing results to '{self.path}'")
+
+    def flush_output(self) -> None:
+        """Push buffered lines to disk without closing the file."""
+        with self._lock:
+            if self._stream is None:
+                return
+            self._stream.flush()
+            if self._raw_stream is not self._stream:
+                self._raw_stream.flush()
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        with self._lock:
+            if self._stream is None:
+                return
+            self._stream.close()
+            if self._raw_stream is not self._stream:
+                self._raw_stream.close()
+            self._stream = None
+            self._raw_stream = None
+            self._start_times.clear()
+            logger.debug(f"JsonlResultsProcessor wrote {self.lines_written} lines to '{self.path}'")
+
+    def task_started(self, task: Task) -> None:
+        if self._stream is None:
+            self.open()
+
+    def task_completed(self, task: Task, result: MultiResult) -> None:
+        pass
+
+    def task_instance_started(self, task: Task, host: Host) -> None:
+        if host.data.get(SILENT_SKIP_FLAG, False):
+            return
+        self._start_times[(task.name, host.name)] = datetime.now()
+
+    def task_instance_completed(self, task: Task, host: Host, result: MultiResult) -> None:
+        if host.data.get(SILENT_SKIP_FLAG, False):
+            return
+
+        finish_time = datetime.now()
+        start_time = self._start_times.pop((task.name, host.name), finish_time)
+        self._write_line(self._build_record(task.name, host.name, result, start_time, finish_time))
+
+    def subtask_instance_started(self, task: Task, host: Host) -> None:
+        pass
+
+    def subtask_instance_completed(self, task: Task, host: Host, result: MultiResult) -> None:
+        pass
+
+    def print_final_workflow_summary(self) -> None:
+        """Close the output file at the end of the workflow (nothing is printed)."""
+        self.close()
+
+    def start_shard(self, shard: Any, send: Callable[[Any], None]) -> None:
+        """Write to a file of this shard's own, in a shard of a sharded run.
+
+        The parent appends every shard's file to 'path' in merge_shard_report(),
+        so a sharded run still produces a single file. When the shard runs on
+        another machine, the file's content travels in the shard's report instead.
+
+        Args:
+            shard: The shard this processor runs in.
+            send: Callable delivering a message to the parent processor (unused).
+        """
+        self.path = self.path.with_name(f".{self.path.name}.shard{shard.index}")
+        self._remote_shard = shard.remote
+
+    def finish_shard(self) -> dict[str, Any] | None:
+        """Close this shard's file and tell the parent where it is.
+
+        Returns:
+            The file path (or, for a remote shard, its content) and line count,
+            or None if nothing was written.
+        """
+        if not self.is_open:
+            return None
+        self.close()
+        if self._remote_shard:
+            data = self.path.read_bytes()
+            self.path.unlink()
+            return {"data": data, "lines": self.lines_written}
+        return {"path": str(self.path), "lines": self.lines_written}
+
+    def merge_shard_report(self, report: dict[str, Any] | None) -> None:
+        """Append a shard's file (or its content, for a remote shard) to the output file.
+
+        Shard files are deleted once appended. The first shard merged truncates
+        the output file. Compressed shard files are appended as they are: a file
+        made of several gzip members is read back as one stream.
+
+        Args:
+            report: The shard's finish_shard() report.
+        """
+        if report is None:
+            return
+        with self._lock:
+            mode = "ab" if self._shards_merged else "wb"
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open(mode) as target:
+                if "data" in report:
+                    target.write(report["data"])
+                else:
+                    with Path(report["path"]).open("rb") as source:
+                        shutil.copyfileobj(source, target, self.buffer_size)
+                    Path(report["path"]).unlink()
+            self._shards_merged += 1
+            self.lines_written += report["lines"]
+        logger.debug(f"JsonlResultsProcessor merged {report['lines']} lines from a shard")
+
+    def _build_record(
+        self, task_name: str, host_name: str, result: MultiResult, start_time: datetime, finish_time: datetime
+    ) -> dict[str, Any]:
+        """Build the JSON-serializable record for one task/host execution."""
+        skipped = bool(getattr(result, "skipped", False))
+        failed = bool(result.failed)
+        if skipped:
+            status = "skipped"
+        elif failed:
+            status = "failed"
+        else:
+            status = "success"
+
+        exception = getattr(result, "exception", None)
+        record: dict[str, Any] = {
+            "task": task_name,
+            "host": host_name,
+            "status": status,
+            "failed": failed,
+            "changed": bool(result.changed),
+            "skipped": skipped,
+            "started_at": start_time.isoformat(timespec="milliseconds"),
+            "finished_at": finish_time.isoformat(timespec="milliseconds"),
+            "duration_ms": round((finish_time - start_time).total_seconds() * 1000, 3),
+            "exception": str(exception) if exception is not None else None,
+        }
+        if self.include_result:
+            record["result"] = mask_for_display(
+                result.result,
+                reveal=not self.redaction_enabled,
+                sensitive_names=self.sensitive_names,
+            )
+        return record
+
+    def _write_line(self, record: dict[str, Any]) -> None:
+        """Serialize and append a record as one line."""
+        line = json.dumps(record, default=str, ensure_ascii=False).encode("utf-8") + b"\n"
+        with self._lock:
+            if self._stream is None:
+                logger.warning("JsonlResultsProcessor received a result while closed; dropping it")
+                return
+            self._stream.write(line)
+            self.lines_written += 1
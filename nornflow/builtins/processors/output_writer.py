@@ -0,0 +1,94 @@
+"""Background console writer used by NornFlow's output processors."""
+
+import contextlib
+import queue
+import threading
+from collections.abc import Callable
+
+from nornflow.logger import logger
+
+# Sentinel placed on the queue to stop the writer thread.
+_STOP = object()
+
+
+class AsyncOutputWriter:
+    """Run console output jobs on a dedicated thread fed by a bounded queue.
+
+    Nornir worker threads only enqueue lightweight jobs (closures over result
+    records); formatting, masking and printing happen on the writer thread.
+    Jobs run in submission order, each one while holding 'lock', so writer
+    output never interleaves with other code that prints under the same lock
+    (e.g. the 'pause' task).
+
+    The queue is bounded: when the writer falls behind, 'submit' blocks, which
+    applies back-pressure instead of buffering an unbounded amount of output.
+
+    The thread is started lazily on the first submitted job and stopped by
+    'close', after which the writer can be reused (a new thread is started on
+    the next submission).
+    """
+
+    def __init__(self, lock: threading.RLock, max_queue_size: int) -> None:
+        """Initialize the writer.
+
+        Args:
+            lock: Lock held while each job runs.
+            max_queue_size: Maximum number of pending jobs before 'submit' blocks.
+        """
+        self._lock = lock
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the writer thread is currently alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, job: Callable[[], None]) -> None:
+        """Queue an output job, starting the writer thread if needed.
+
+        Args:
+            job: Zero-argument callable performing the output.
+        """
+        if not self.is_running:
+            self._start()
+        self._queue.put(job)
+
+    def flush(self) -> None:
+        """Block until every job submitted so far has run."""
+        if self.is_running:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Drain pending jobs and stop the writer thread."""
+        with self._thread_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                self._thread = None
+                return
+            self._queue.put(_STOP)
+            thread.join()
+            self._thread = None
+
+    def _start(self) -> None:
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            # Daemon, so an interrupted run never keeps the interpreter alive.
+            self._thread = threading.Thread(target=self._run, name="nornflow-output-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is _STOP:
+                    return
+                with self._lock:
+                    job()
+            except Exception:
+                logger.exception("Output writer job failed")
+            finally:
+                with contextlib.suppress(ValueError):
+                    self._queue.task_done()
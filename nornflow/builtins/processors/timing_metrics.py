@@ -0,0 +1,176 @@
+"""Per-task, per-host execution timing collected by NornFlow's output processors."""
+
+import heapq
+import json
+import math
+import threading
+from array import array
+from pathlib import Path
+from typing import Any
+
+# Percentiles reported for every task.
+TIMING_PERCENTILES = (50, 90, 99)
+
+
+class _TaskTimings:
+    """Durations of one task, stored as a compact array parallel to the host names."""
+
+    __slots__ = ("durations_ms", "hosts", "label")
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.durations_ms = array("d")
+        self.hosts: list[str] = []
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of already sorted values.
+
+    Args:
+        sorted_values: Values in ascending order. Must not be empty.
+        percent: Percentile to compute, between 0 and 100.
+
+    Returns:
+        The smallest value such that at least 'percent' % of the values are <= it.
+    """
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class TaskTimingMetrics:
+    """Thread-safe collector of per-host durations for each task.
+
+    Durations are appended as hosts complete, from any Nornir worker thread, and
+    kept per task in an 'array' of doubles (8 bytes per host) alongside the host
+    names. Percentiles and slowest hosts are computed on demand by 'summarize'.
+
+    Tasks are identified by a key that must be unique per workflow step, so two
+    steps running the same task function keep separate statistics. Each key
+    carries a display label, which defaults to the key itself.
+
+    Example:
+        ```python
+        metrics = TaskTimingMetrics()
+        metrics.record("backup_1", "router1", 812.5, label="backup")
+        metrics.summarize(slowest=3)["backup_1"]["p90_ms"]
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, _TaskTimings] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of tasks with at least one recorded duration."""
+        return len(self._tasks)
+
+    def record(self, task_key: str, host_name: str, duration_ms: float, label: str | None = None) -> None:
+        """Record how long a task took on a host.
+
+        Args:
+            task_key: Key of the workflow step the task belongs to.
+            host_name: Name of the host.
+            duration_ms: Execution time in milliseconds.
+            label: Name to report the task under. Defaults to 'task_key'.
+        """
+        with self._lock:
+            timings = self._tasks.get(task_key)
+            if timings is None:
+                timings = self._tasks[task_key] = _TaskTimings(label or task_key)
+            timings.durations_ms.append(duration_ms)
+            timings.hosts.append(host_name)
+
+    def samples(self) -> dict[str, tuple[str, list[float], list[str]]]:
+        """Return every recorded duration, e.g. to merge them into another collector.
+
+        Returns:
+            A dict keyed by task key, in the order tasks were first seen, whose
+            values are (label, durations_ms, host_names) tuples, the two lists
+            being of equal length.
+        """
+        with self._lock:
+            return {
+                task_key: (timings.label, timings.durations_ms.tolist(), list(timings.hosts))
+                for task_key, timings in self._tasks.items()
+            }
+
+    def merge(self, samples: dict[str, tuple[str, list[float], list[str]]]) -> None:
+        """Add durations recorded by another collector.
+
+        Args:
+            samples: Output of another collector's samples().
+        """
+        with self._lock:
+            for task_key, (label, durations_ms, hosts) in samples.items():
+                timings = self._tasks.get(task_key)
+                if timings is None:
+                    timings = self._tasks[task_key] = _TaskTimings(label)
+                timings.durations_ms.extend(durations_ms)
+                timings.hosts.extend(hosts)
+
+    def clear(self) -> None:
+        """Drop every recorded duration."""
+        with self._lock:
+            self._tasks.clear()
+
+    def summarize(self, slowest: int = 5) -> dict[str, dict[str, Any]]:
+        """Compute timing statistics for every task, in the order tasks were first seen.
+
+        Args:
+            slowest: How many of the slowest hosts to list per task.
+
+        Returns:
+            A dict keyed by task key. Each value has the task's 'label', 'count',
+            'total_ms', one 'p<N>_ms' key per percentile in TIMING_PERCENTILES,
+            'max_ms', and 'slowest_hosts' (a list of {'host', 'duration_ms'} dicts,
+            slowest first).
+        """
+        with self._lock:
+            snapshot = [
+                (task_key, timings.label, timings.durations_ms.tolist(), list(timings.hosts))
+                for task_key, timings in self._tasks.items()
+            ]
+
+        summary: dict[str, dict[str, Any]] = {}
+        for task_key, label, durations, hosts in snapshot:
+            ordered = sorted(durations)
+            task_summary: dict[str, Any] = {
+                "label": label,
+                "count": len(ordered),
+                "total_ms": round(math.fsum(ordered), 3),
+            }
+            for percent in TIMING_PERCENTILES:
+                task_summary[f"p{percent}_ms"] = round(percentile(ordered, percent), 3)
+            task_summary["max_ms"] = round(ordered[-1], 3)
+            slowest_indexes = heapq.nlargest(slowest, range(len(durations)), key=durations.__getitem__)
+            task_summary["slowest_hosts"] = [
+                {"host": hosts[index], "duration_ms": round(durations[index], 3)} for index in slowest_indexes
+            ]
+            summary[task_key] = task_summary
+        return summary
+
+    def export_json(
+        self,
+        path: str | Path,
+        slowest: int = 5,
+        extra: dict[str, Any] | None = None,
+        summary: dict[str, dict[str, Any]] | None = None,
+    ) -> Path:
+        """Write the timing summary to a JSON file.
+
+        Args:
+            path: Destination file. Parent directories are created if needed.
+            slowest: How many of the slowest hosts to list per task.
+            extra: Additional top-level keys to include (e.g. workflow totals).
+            summary: An already computed summarize() result to write instead of
+                computing a new one.
+
+        Returns:
+            The path written to.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tasks = self.summarize(slowest) if summary is None else summary
+        document = {**(extra or {}), "tasks": tasks}
+        path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        return path
@@ -132,11 +132,13 @@ def pause(task: Task, msg: str = "", timer: int = 0) -> Result:
         raise ValueError(f"timer must be non-negative, got {timer}")
 
     host_label = f"[{task.host.name}]"
-    processor = None
+    processor = find_processor_by_type(task.nornir.processors, DefaultNornFlowProcessor)
+    if processor:
+        # Print queued headers and results before the prompt, not after the user answers it
+        processor.flush_output()
 
     output_lock.acquire()
     try:
-        processor = find_processor_by_type(task.nornir.processors, DefaultNornFlowProcessor)
         if processor:
             processor._pause_lock_holders.add((task.name, task.host.name))
 
@@ -1,14 +1,23 @@
+import ast
+import contextlib
+import hashlib
 import inspect
+import json
+import os
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from pydantic_serdes.utils import load_file_to_dict
 
 from nornflow.constants import (
     BUILTIN_NAMESPACE,
+    LAZY_CATALOG_SCAN_WORKERS,
     LOCAL_NAMESPACE,
     TIER_BUILTIN,
     TIER_LOCAL,
@@ -17,7 +26,7 @@ from nornflow.constants import (
 )
 from nornflow.exceptions import AssetAmbiguityError, AssetNotFoundError, CoreError, ResourceError
 from nornflow.logger import logger
-from nornflow.utils import import_module_from_path
+from nornflow.utils import FunctionNode, import_module_from_path
 
 
 def qualified_key(namespace: str, bare_name: str) -> str:
@@ -30,6 +39,241 @@ def namespace_of(reference: str) -> str:
     return reference.split(".", 1)[0]
 
 
+def _first_docstring_line(docstring: str | None, max_size: int) -> str:
+    """Return the first docstring line, truncated to max_size, or a placeholder."""
+    if not docstring or not docstring.strip():
+        return "No description available"
+    first_line = docstring.strip().split("\n", 1)[0].strip()
+    if len(first_line) > max_size:
+        first_line = first_line[: max_size - 3] + "..."
+    return first_line
+
+
+def _describe_function(node: FunctionNode, max_description_size: int) -> dict[str, Any]:
+    """Return the catalog record (name, description, parameters) for a scanned function."""
+    all_args = [*node.args.posonlyargs, *node.args.args, *node.args.kwonlyargs]
+    return {
+        "name": node.name,
+        "description": _first_docstring_line(ast.get_docstring(node), max_description_size),
+        "parameters": [arg.arg for arg in all_args],
+    }
+
+
+class CatalogIndex:
+    """Persistent, per-file cache of catalog discovery results.
+
+    Each entry stores what discovery derived from one source file (e.g. the task
+    records of a scanned module, or a workflow's description), keyed by catalog
+    name and file path. An entry is reused while the file's mtime and size are
+    unchanged; when they change, the content hash decides whether the file really
+    changed before the entry is rebuilt.
+
+    The index is a JSON file written with an atomic replace, so concurrent
+    NornFlow processes never read a partially written index. A missing, corrupt
+    or outdated index file is simply treated as empty.
+    """
+
+    version = 3
+
+    def __init__(self, path: str | Path):
+        """Load the index from 'path' if it exists.
+
+        Args:
+            path: Location of the index file.
+        """
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        """Number of cached file entries."""
+        return len(self._entries)
+
+    def _load(self) -> None:
+        try:
+            document = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable catalog index '{self.path}': {e}")
+            return
+
+        if not isinstance(document, dict) or document.get("version") != self.version:
+            logger.debug(f"Ignoring catalog index '{self.path}' written by another version")
+            return
+        self._entries = document.get("entries", {})
+
+    @staticmethod
+    def _key(catalog_name: str, file_path: Path) -> str:
+        return f"{catalog_name}:{file_path.resolve()}"
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """Return the hash used to detect content changes."""
+        return hashlib.sha256(content).hexdigest()
+
+    def lookup(self, catalog_name: str, file_path: Path) -> Any | None:
+        """Return the cached data for a file, or None if it must be rebuilt.
+
+        Args:
+            catalog_name: Name of the catalog that owns the entry.
+            file_path: The source file.
+
+        Returns:
+            The data stored by 'store', or None when missing or stale.
+        """
+        key = self._key(catalog_name, file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                self.hits += 1
+                return entry["data"]
+
+        # Touched but maybe not modified (checkout, copy): compare content before rebuilding
+        try:
+            digest = self.content_hash(file_path.read_bytes())
+        except OSError:
+            return None
+        with self._lock:
+            if digest != entry["hash"]:
+                self.misses += 1
+                return None
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            self._dirty = True
+            self.hits += 1
+            return entry["data"]
+
+    def store(self, catalog_name: str, file_path: Path, data: Any) -> None:
+        """Cache the data derived from a file.
+
+        Args:
+            catalog_name: Name of the catalog that owns the entry.
+            file_path: The source file.
+            data: JSON-serializable data derived from the file.
+        """
+        try:
+            stat = file_path.stat()
+            content = file_path.read_bytes()
+        except OSError:
+            return
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": self.content_hash(content),
+            "data": data,
+        }
+        with self._lock:
+            self._entries[self._key(catalog_name, file_path)] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the index to disk if anything changed, dropping entries of deleted files."""
+        with self._lock:
+            stale = [key for key in self._entries if not Path(key.split(":", 1)[1]).exists()]
+            for key in stale:
+                del self._entries[key]
+            if not self._dirty and not stale:
+                return
+            document = {"version": self.version, "entries": self._entries}
+            self._dirty = False
+
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(document), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write catalog index '{self.path}': {e}")
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            return
+        logger.debug(f"Saved catalog index '{self.path}' ({len(self._entries)} files)")
+
+
+def _has_postponed_annotations(tree: ast.Module) -> bool:
+    """Check if a module enables postponed evaluation of annotations (PEP 563)."""
+    return any(
+        isinstance(node, ast.ImportFrom)
+        and node.module == "__future__"
+        and any(alias.name == "annotations" for alias in node.names)
+        for node in tree.body
+    )
+
+
+def scan_module_functions(
+    file_path: Path, node_predicate: Callable[[FunctionNode], bool]
+) -> list[FunctionNode]:
+    """Parse a Python file and return its module-level functions accepted by node_predicate.
+
+    The file is parsed, not imported, so none of its code runs. Modules with
+    'from __future__ import annotations' yield nothing: their annotations are
+    strings at runtime, which is_nornir_task() and is_nornir_filter() reject, so
+    eager discovery would not register their functions either.
+
+    Args:
+        file_path: The Python file to scan.
+        node_predicate: Filter applied to each module-level function definition.
+
+    Returns:
+        The matching function definitions, in source order.
+
+    Raises:
+        CoreError: If the file can't be read or parsed.
+    """
+    try:
+        tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
+    except (OSError, SyntaxError, ValueError) as e:
+        raise CoreError(f"Failed to scan module '{file_path}': {e!s}", component="ItemDiscovery") from e
+    if _has_postponed_annotations(tree):
+        return []
+    return [
+        node
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node_predicate(node)
+    ]
+
+
+class LazyCatalogItem:
+    """Placeholder for a catalog callable whose module has not been imported yet.
+
+    Stored by CallableCatalog in lazy mode. The module is imported, and the
+    placeholder replaced with the real (possibly transformed) callable, the first
+    time the entry is looked up through the catalog.
+    """
+
+    __slots__ = ("attr_name", "module_name", "module_path", "predicate", "transform_item")
+
+    def __init__(
+        self,
+        attr_name: str,
+        module_name: str,
+        module_path: str,
+        predicate: Callable[[Any], bool] | None = None,
+        transform_item: Callable[[Any], Any] | None = None,
+    ) -> None:
+        self.attr_name = attr_name
+        self.module_name = module_name
+        self.module_path = module_path
+        self.predicate = predicate
+        self.transform_item = transform_item
+
+    def __repr__(self) -> str:
+        return f"LazyCatalogItem({self.module_path}:{self.attr_name})"
+
+
 def _apply_registration_defaults(
     kwargs: dict[str, Any],
     *,
@@ -408,19 +652,20 @@ class DiscoverableCatalog(Catalog):
                 resource_name=dir_path,
             )
 
-        total_items = 0
         files = self._get_files_to_process(path, **kwargs)
         logger.debug(f"Found {len(files)} files to process in {dir_path}")
 
-        for file_path in files:
-            items_added = self._process_file(file_path, **kwargs)
-            total_items += items_added
+        total_items = self._process_files(files, **kwargs)
 
         logger.info(
             f"Completed {self.name} discovery: {total_items} items registered from {len(files)} files"
         )
         return total_items
 
+    def _process_files(self, files: list[Path], **kwargs: Any) -> int:
+        """Process discovered files in order and return the number of items registered."""
+        return sum(self._process_file(file_path, **kwargs) for file_path in files)
+
     @abstractmethod
     def _get_files_to_process(self, dir_path: Path, **kwargs: Any) -> list[Path]:
         """Get list of files to process from a directory."""
@@ -459,7 +704,86 @@ class ClassCatalog(Catalog):
 
 
 class CallableCatalog(DiscoverableCatalog):
-    """Catalog specialized for Python callables like Nornir tasks and filters."""
+    """Catalog specialized for Python callables like Nornir tasks and filters.
+
+    Directories can be discovered lazily (see discover_items_in_dir): modules are
+    then scanned with 'ast' instead of being imported, and each entry holds a
+    LazyCatalogItem until it's looked up with resolve(), [] or get(). Only the
+    modules of items actually used are ever imported. Registration metadata
+    (names, descriptions, parameters) is available without importing anything.
+    """
+
+    def __init__(self, name: str):
+        """Initialize an empty callable catalog.
+
+        Args:
+            name: The name of this catalog.
+        """
+        super().__init__(name)
+        # Modules imported to materialize lazy entries, keyed by file path
+        self._lazy_modules: dict[str, ModuleType] = {}
+        self._lazy_lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the item stored under a qualified key, importing it first if lazy."""
+        item = super().__getitem__(key)
+        if isinstance(item, LazyCatalogItem):
+            return self._materialize(key)
+        return item
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the item stored under a qualified key, or default; imports lazy items."""
+        if not dict.__contains__(self, key):
+            return default
+        return self[key]
+
+    def is_loaded(self, key: str) -> bool:
+        """Whether the item under a qualified key is imported (always True for eager entries).
+
+        Args:
+            key: Qualified catalog key.
+
+        Returns:
+            False while the entry is still a LazyCatalogItem.
+        """
+        return not isinstance(dict.get(self, key), LazyCatalogItem)
+
+    def _materialize(self, key: str) -> Any:
+        """Import the module behind a lazy entry and replace it with the real item.
+
+        Args:
+            key: Qualified key of a LazyCatalogItem entry.
+
+        Returns:
+            The imported (and transformed, if configured) item.
+
+        Raises:
+            CoreError: If the module fails to import or no longer defines a matching item.
+        """
+        with self._lazy_lock:
+            entry = dict.__getitem__(self, key)
+            if not isinstance(entry, LazyCatalogItem):
+                # Another thread materialized it while we waited for the lock
+                return entry
+
+            module = self._lazy_modules.get(entry.module_path)
+            if module is None:
+                module = import_module_from_path(entry.module_name, entry.module_path)
+                self._lazy_modules[entry.module_path] = module
+
+            item = getattr(module, entry.attr_name, None)
+            if item is None or (entry.predicate is not None and not entry.predicate(item)):
+                raise CoreError(
+                    f"'{entry.attr_name}' in '{entry.module_path}' is not a valid {self.name} item "
+                    f"once imported, although it looked like one when the module was scanned.",
+                    component="ItemDiscovery",
+                )
+            if entry.transform_item:
+                item = entry.transform_item(item)
+
+            dict.__setitem__(self, key, item)
+            logger.debug(f"Imported lazy item '{key}' from '{entry.module_path}' in {self.name} catalog")
+            return item
 
     def register(
         self,
@@ -495,16 +819,7 @@ class CallableCatalog(DiscoverableCatalog):
 
     def _extract_description_from_callable(self, item: Any) -> str:
         """Extract description from a callable's docstring."""
-        docstring = getattr(item, "__doc__", None)
-        if not docstring:
-            return "No description available"
-        docstring = docstring.strip()
-        if not docstring:
-            return "No description available"
-        first_line = docstring.split("\n", 1)[0].strip()
-        if len(first_line) > self.max_description_size:
-            first_line = first_line[: self.max_description_size - 3] + "..."
-        return first_line
+        return _first_docstring_line(getattr(item, "__doc__", None), self.max_description_size)
 
     def register_from_module(
         self,
@@ -548,6 +863,76 @@ class CallableCatalog(DiscoverableCatalog):
         """Get Python files from a directory."""
         return [py_file for py_file in dir_path.rglob("*.py") if not py_file.name.startswith("__")]
 
+    def _process_files(self, files: list[Path], **kwargs: Any) -> int:
+        """Process discovered files, scanning them in parallel when discovery is lazy."""
+        ast_predicate = kwargs.get("ast_predicate")
+        if not kwargs.get("lazy") or ast_predicate is None:
+            return super()._process_files(files, **kwargs)
+
+        index = kwargs.get("index")
+
+        def scan(path: Path) -> list[dict[str, Any]]:
+            return self._scan_file(path, ast_predicate, index)
+
+        workers = min(LAZY_CATALOG_SCAN_WORKERS, len(files))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nornflow-catalog") as executor:
+                scans = list(executor.map(scan, files))
+        else:
+            scans = [scan(path) for path in files]
+
+        # Registration stays sequential and in file order, so the result matches eager discovery
+        return sum(
+            self._register_lazy_file(file_path, records, **kwargs)
+            for file_path, records in zip(files, scans, strict=True)
+        )
+
+    def _scan_file(
+        self,
+        file_path: Path,
+        ast_predicate: Callable[[FunctionNode], bool],
+        index: CatalogIndex | None,
+    ) -> list[dict[str, Any]]:
+        """Return the records of a module's matching functions, from the index when fresh."""
+        if index is not None:
+            cached = index.lookup(self.name, file_path)
+            if cached is not None:
+                return cached
+
+        nodes = scan_module_functions(file_path, ast_predicate)
+        records = [_describe_function(node, self.max_description_size) for node in nodes]
+        if index is not None:
+            index.store(self.name, file_path, records)
+        return records
+
+    def _register_lazy_file(self, file_path: Path, records: list[dict[str, Any]], **kwargs: Any) -> int:
+        """Register a LazyCatalogItem for each function record of a scanned file."""
+        module_name = file_path.stem
+        module_path = str(file_path)
+        register_kwargs = {key: kwargs[key] for key in ("namespace", "tier") if kwargs.get(key)}
+
+        for record in records:
+            entry = LazyCatalogItem(
+                record["name"],
+                module_name,
+                module_path,
+                predicate=kwargs.get("predicate"),
+                transform_item=kwargs.get("transform_item"),
+            )
+            self.register(
+                record["name"],
+                entry,
+                module_path=module_path,
+                module_name=module_name,
+                description=record["description"],
+                parameters=list(record["parameters"]),
+                lazy=True,
+                **register_kwargs,
+            )
+
+        logger.debug(f"Scanned file '{file_path}': {len(records)} lazy items registered")
+        return len(records)
+
     def _process_file(self, file_path: Path, **kwargs: Any) -> int:
         """Process a Python file by importing it and registering its items."""
         predicate = kwargs.get("predicate")
@@ -582,15 +967,37 @@ class CallableCatalog(DiscoverableCatalog):
         transform_item: Callable[[Any], Any] | None = None,
         namespace: str | None = None,
         tier: str | None = None,
+        *,
+        lazy: bool = False,
+        ast_predicate: Callable[[FunctionNode], bool] | None = None,
         **kwargs: Any,
     ) -> int:
-        """Discover and register items from Python modules in a directory."""
+        """Discover and register items from Python modules in a directory.
+
+        Args:
+            dir_path: Directory to scan recursively for '.py' files.
+            predicate: Filter applied to module members (to the imported item when lazy).
+            transform_item: Optional transform applied to each item before it's stored.
+            namespace: Namespace to register items under.
+            tier: Registration tier.
+            lazy: When True (and 'ast_predicate' is given), scan files with 'ast' instead
+                of importing them and defer each import until the item is looked up.
+                Only functions defined at module level are discovered in this mode.
+            ast_predicate: Filter applied to module-level function definitions when lazy.
+            **kwargs: Extra options forwarded to file processing, such as 'index' (a
+                CatalogIndex reused for lazy scans).
+
+        Returns:
+            The number of items registered.
+        """
         return super().discover_items_in_dir(
             dir_path,
             predicate=predicate,
             transform_item=transform_item,
             namespace=namespace,
             tier=tier,
+            lazy=lazy,
+            ast_predicate=ast_predicate,
             **kwargs,
         )
 
@@ -619,8 +1026,8 @@ class FileCatalog(DiscoverableCatalog):
     def register(self, name: str, item: Any, **kwargs: Any) -> Any:
         """Register a file path with description extraction from YAML."""
         if isinstance(item, Path):
-            description = self._extract_description_from_file(item)
-            kwargs.setdefault("description", description)
+            if "description" not in kwargs:
+                kwargs["description"] = self._extract_description_from_file(item)
             is_builtin = item.resolve().is_relative_to(self.nornflow_builtins_dir)
             kwargs["is_builtin"] = is_builtin
             _apply_registration_defaults(
@@ -654,6 +1061,19 @@ class FileCatalog(DiscoverableCatalog):
         except Exception:
             return "Could not load description from file"
 
+    def _indexed_description(self, file_path: Path, index: CatalogIndex | None) -> str:
+        """Return a file's description, reusing the catalog index entry when it's fresh."""
+        if index is None:
+            return self._extract_description_from_file(file_path)
+
+        cached = index.lookup(self.name, file_path)
+        if cached is not None:
+            return cached["description"]
+
+        description = self._extract_description_from_file(file_path)
+        index.store(self.name, file_path, {"description": description})
+        return description
+
     def _get_files_to_process(self, dir_path: Path, **kwargs: Any) -> list[Path]:
         """Get all files from a directory based on recursive flag."""
         recursive = kwargs.get("recursive", True)
@@ -675,6 +1095,7 @@ class FileCatalog(DiscoverableCatalog):
                 is_package=is_package,
                 namespace=namespace,
                 tier=tier,
+                description=self._indexed_description(file_path, kwargs.get("index")),
             )
             logger.debug(f"Registered file '{file_path}' in {self.name} catalog")
             return 1
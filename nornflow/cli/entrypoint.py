@@ -1,6 +1,6 @@
 import typer
 
-from nornflow.cli import init, run, show, validate
+from nornflow.cli import init, run, show, validate, worker
 
 app = typer.Typer(
     help="NornFlow is a workflow orchestration tool for Network Automation built around Nornir.",
@@ -35,6 +35,7 @@ app.command()(init.init)
 app.command()(run.run)
 app.command(context_settings={"help_option_names": ["--help"]})(show.show)
 app.command()(validate.validate)
+app.command()(worker.worker)
 
 if __name__ == "__main__":
     app()
@@ -74,3 +74,7 @@ class CLIInitError(NornFlowCLIError):
 
 class CLIValidateError(NornFlowCLIError):
     """Raised when static workflow validation fails via CLI."""
+
+
+class CLIWorkerError(NornFlowCLIError):
+    """Raised when a distributed run's worker fails via CLI."""
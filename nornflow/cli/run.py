@@ -7,18 +7,29 @@ from typing import Any
 import typer
 
 from nornflow import NornFlowBuilder
+from nornflow.batching import BatchProgress
 from nornflow.cli.exceptions import CLIRunError
 from nornflow.constants import (
+    BatchSize,
+    ExecutionStrategy,
+    FailureBudget,
     FailureStrategy,
     NORNFLOW_SPECIAL_FILTER_KEYS,
     NORNFLOW_SUPPORTED_YAML_EXTENSIONS,
+    OutputMode,
     REDACTION_FULL_DISABLED_WARNING,
     REDACTION_LOGS_DISABLED_WARNING,
     REDACTION_TERMINAL_DISABLED_WARNING,
 )
 from nornflow.exceptions import NornFlowError
 from nornflow.logger import logger
-from nornflow.utils import normalize_failure_strategy
+from nornflow.utils import (
+    normalize_batch_size,
+    normalize_execution_strategy,
+    normalize_failure_budget,
+    normalize_failure_strategy,
+    normalize_shards,
+)
 
 app = typer.Typer(help="Run NornFlow tasks and workflows")
 
@@ -291,7 +302,100 @@ def parse_failure_strategy(value: str | None) -> FailureStrategy | None:
     return normalize_failure_strategy(value, CLIRunError)
 
 
-def get_nornflow_builder(
+def parse_failure_budget(value: str | None) -> FailureBudget | None:
+    """
+    Parse a string into a FailureBudget.
+
+    Args:
+        value: A number of hosts (e.g. '5') or a percentage of hosts (e.g. '10%').
+
+    Returns:
+        FailureBudget or None if not provided.
+
+    Raises:
+        CLIRunError: If the value is invalid.
+    """
+    if not value:
+        return None
+
+    return normalize_failure_budget(value, CLIRunError)
+
+
+def parse_batch_size(value: str | None) -> BatchSize | None:
+    """
+    Parse a string into a BatchSize.
+
+    Args:
+        value: A number of hosts (e.g. '5') or a percentage of hosts (e.g. '10%').
+
+    Returns:
+        BatchSize or None if not provided.
+
+    Raises:
+        CLIRunError: If the value is invalid.
+    """
+    if not value:
+        return None
+
+    return normalize_batch_size(value, CLIRunError)
+
+
+def parse_execution_strategy(value: str | None) -> ExecutionStrategy | None:
+    """
+    Parse a string into an ExecutionStrategy enum value.
+
+    Args:
+        value: String representing the execution strategy (case-insensitive).
+
+    Returns:
+        ExecutionStrategy enum value or None if not provided.
+
+    Raises:
+        CLIRunError: If the value is invalid.
+    """
+    if not value:
+        return None
+
+    return normalize_execution_strategy(value, CLIRunError)
+
+
+def parse_shards(value: str | None) -> int | None:
+    """
+    Parse a string into a number of shards.
+
+    Args:
+        value: A number of worker processes, or 'auto' for one per CPU core.
+
+    Returns:
+        The number of shards or None if not provided.
+
+    Raises:
+        CLIRunError: If the value is invalid.
+    """
+    if not value:
+        return None
+
+    return normalize_shards(value, CLIRunError)
+
+
+def confirm_next_batch(progress: BatchProgress) -> bool:
+    """
+    Batch gate asking the user whether to continue a rolling execution.
+
+    Args:
+        progress: Progress reported for the batch that just completed.
+
+    Returns:
+        True to start the next batch, False to abort the rollout.
+    """
+    return typer.confirm(
+        f"Continue with batch {progress.number + 1}/{progress.total} "
+        f"({progress.remaining_hosts} host(s) remaining)?",
+        default=not progress.failed_hosts,
+    )
+
+
+def get_nornflow_builder(  # noqa: PLR0912
     target: str,
     args: dict[str, Any],
     inventory_filters: dict[str, Any],
@@ -301,6 +405,13 @@ def get_nornflow_builder(
     failure_strategy: FailureStrategy | None = None,
     dry_run: bool = False,
     no_redact: bool = False,
+    output_mode: OutputMode | None = None,
+    failure_budget: str | None = None,
+    batch_size: str | None = None,
+    batch_confirm: bool = False,
+    execution_strategy: str | None = None,
+    shards: str | None = None,
+    distributed: str | None = None,
 ) -> NornFlowBuilder:
     """
     Build the workflow using the provided target, arguments, inventory filters, and dry-run option.
@@ -315,6 +426,14 @@ def get_nornflow_builder(
         failure_strategy (FailureStrategy): Failure strategy with highest precedence.
         dry_run (bool): Whether to perform a dry run.
         no_redact (bool): Whether to disable output redaction for terminal display only.
+        output_mode (OutputMode): Which per-host task results are printed to the console.
+        failure_budget (str): Failure budget with highest precedence (e.g. '5' or '10%').
+            Implies the 'failure-budget' strategy when no failure strategy is given.
+        batch_size (str): Roll the workflow out in serial batches of this size (e.g. '5' or '10%').
+        batch_confirm (bool): Whether to ask for confirmation before each batch after the first.
+        execution_strategy (str): How tasks are scheduled across hosts ('linear' or 'free').
+        shards (str): Number of worker processes to split the inventory across, or 'auto'.
+        distributed (str): Address to coordinate a distributed run on (e.g. 'tcp://0.0.0.0:7300').
 
     Returns:
         NornFlowBuilder: The builder instance with the configured workflow.
@@ -338,10 +457,37 @@ def get_nornflow_builder(
     if inventory_filters:
         builder.with_filters(inventory_filters)
 
+    # Add failure budget if specified; on its own it selects the failure-budget strategy
+    parsed_failure_budget = parse_failure_budget(failure_budget)
+    if parsed_failure_budget:
+        builder.with_failure_budget(parsed_failure_budget)
+        failure_strategy = failure_strategy or FailureStrategy.FAILURE_BUDGET
+
     # Add failure strategy if specified
     if failure_strategy:
         builder.with_failure_strategy(failure_strategy)
 
+    # Add batch size and confirmation gate if specified
+    parsed_batch_size = parse_batch_size(batch_size)
+    if parsed_batch_size:
+        builder.with_batch_size(parsed_batch_size)
+    if batch_confirm:
+        builder.with_batch_gate(confirm_next_batch)
+
+    # Add execution strategy if specified
+    parsed_execution_strategy = parse_execution_strategy(execution_strategy)
+    if parsed_execution_strategy:
+        builder.with_execution_strategy(parsed_execution_strategy)
+
+    # Add shards if specified
+    parsed_shards = parse_shards(shards)
+    if parsed_shards:
+        builder.with_shards(parsed_shards)
+
+    # Coordinate a distributed run if an address is specified
+    if distributed:
+        builder.with_distributed(distributed)
+
     # Add dry_run if specified
     if dry_run:
         builder.with_kwargs(dry_run=dry_run)
@@ -349,6 +495,9 @@ def get_nornflow_builder(
     if no_redact:
         builder.with_kwargs(no_redact=True)
 
+    if output_mode:
+        builder.with_kwargs(output_mode=output_mode)
+
     if any(target.endswith(ext) for ext in NORNFLOW_SUPPORTED_YAML_EXTENSIONS):
         builder.with_workflow_reference(target)
     else:
@@ -428,16 +577,73 @@ FAILURE_STRATEGY_OPTION = typer.Option(
     "-f",
     help="Failure handling strategy. "
     "Options: 'skip-failed' (default, skip failed hosts), 'fail-fast' (stop on first error), "
-    "'run-all' (run all tasks, report failures at end). "
+    "'run-all' (run all tasks, report failures at end), "
+    "'failure-budget' (skip failed hosts, stop once --failure-budget is exceeded). "
     "Both hyphen and underscore variations are accepted (e.g., 'fail-fast' or 'fail_fast').",
 )
 
+FAILURE_BUDGET_OPTION = typer.Option(
+    None,
+    "--failure-budget",
+    help="Failed hosts tolerated before the workflow halts, as a count (e.g. '5') or a percentage "
+    "of the inventory (e.g. '10%'). Implies '--failure-strategy failure-budget' unless another "
+    "strategy is given.",
+)
+
+BATCH_SIZE_OPTION = typer.Option(
+    None,
+    "--batch-size",
+    "-b",
+    help="Roll the workflow out in serial batches: run every task over one batch of hosts before "
+    "starting the next. Given as a count (e.g. '5') or a percentage of the inventory (e.g. '10%').",
+)
+
+BATCH_CONFIRM_OPTION = typer.Option(
+    False,
+    "--batch-confirm",
+    help="Ask for confirmation before starting each batch after the first [default: False]",
+)
+
+EXECUTION_STRATEGY_OPTION = typer.Option(
+    None,
+    "--execution-strategy",
+    help="How tasks are scheduled across hosts. "
+    "Options: 'linear' (default, each task runs on every host before the next task starts), "
+    "'free' (each host runs the whole workflow at its own pace).",
+)
+
+SHARDS_OPTION = typer.Option(
+    None,
+    "--shards",
+    help="Split the inventory across this many worker processes, or 'auto' for one per CPU core. "
+    "Each process runs the workflow over its share of the hosts and the results are merged into "
+    "a single summary.",
+)
+
+DISTRIBUTED_OPTION = typer.Option(
+    None,
+    "--distributed",
+    help="Coordinate a distributed run: listen on this address (e.g. 'tcp://0.0.0.0:7300' or "
+    "'unix:///tmp/nornflow.sock') and hand batches of hosts to workers started with 'nornflow worker'. "
+    "Every node needs the same secret in the NORNFLOW_DISTRIBUTED_KEY environment variable.",
+)
+
 NO_REDACT_OPTION = typer.Option(
     False,
     "--no-redact",
     help="Disable terminal output redaction. Log redaction follows settings. Use with caution.",
 )
 
+OUTPUT_OPTION = typer.Option(
+    None,
+    "--output",
+    "-o",
+    case_sensitive=False,
+    help="Which per-host task results to print. "
+    "Options: 'full' (default, every host), 'failures-only' (failed hosts only), "
+    "'changed-only' (changed or failed hosts), 'summary' (execution summary only).",
+)
+
 
 # TODO: Eventually, decommission the legacy options.
 @app.command()
@@ -451,8 +657,15 @@ def run(  # noqa: PLR0912
     processors: str | None = PROCESSORS_OPTION,
     vars: str | None = VARS_OPTION,
     failure_strategy: str | None = FAILURE_STRATEGY_OPTION,
+    failure_budget: str | None = FAILURE_BUDGET_OPTION,
+    batch_size: str | None = BATCH_SIZE_OPTION,
+    batch_confirm: bool = BATCH_CONFIRM_OPTION,
+    execution_strategy: str | None = EXECUTION_STRATEGY_OPTION,
+    shards: str | None = SHARDS_OPTION,
+    distributed: str | None = DISTRIBUTED_OPTION,
     dry_run: bool = DRY_RUN_OPTION,
     no_redact: bool = NO_REDACT_OPTION,
+    output: OutputMode | None = OUTPUT_OPTION,
 ) -> None:
     """
     Runs either a cataloged task or workflow - for workflows, the '.yaml'/'.yml' extension must be included.
@@ -515,6 +728,13 @@ def run(  # noqa: PLR0912
             parsed_failure_strategy,
             dry_run,
             no_redact,
+            output,
+            failure_budget,
+            batch_size,
+            batch_confirm,
+            execution_strategy,
+            shards,
+            distributed,
         )
 
         nornflow = builder.build()
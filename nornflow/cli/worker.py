@@ -0,0 +1,56 @@
+"""CLI command running a worker of a distributed run."""
+
+import typer
+
+from nornflow.cli.exceptions import CLIWorkerError
+from nornflow.distributed import DistributedWorker, get_transport
+from nornflow.exceptions import NornFlowError
+from nornflow.logger import logger
+from nornflow.settings import NornFlowSettings
+
+app = typer.Typer()
+
+
+@app.command()
+def worker(
+    ctx: typer.Context,
+    address: str = typer.Argument(
+        ..., help="Address of the coordinator, e.g. 'tcp://coordinator:7300' or 'unix:///tmp/nornflow.sock'"
+    ),
+    name: str | None = typer.Option(
+        None, "--name", help="Name the coordinator knows this worker by [default: the host name]"
+    ),
+    wait: float | None = typer.Option(
+        None,
+        "--wait",
+        help="Seconds to keep trying to reach a coordinator that is not listening yet [default: one attempt]",
+    ),
+) -> None:
+    """
+    Runs batches of hosts for a distributed run started with 'nornflow run --distributed'.
+    """
+    try:
+        settings = NornFlowSettings.load(ctx.obj.get("settings") or None)
+        batches = DistributedWorker(
+            get_transport(address),
+            nornflow_settings=settings,
+            name=name,
+            connect_timeout=wait,
+        ).run()
+        typer.secho(f"Worker finished after running {batches} batch(es).", fg=typer.colors.GREEN)
+
+    except NornFlowError as e:
+        CLIWorkerError(
+            message=f"NornFlow error while running as a worker of {address}: {e}",
+            original_exception=e,
+        ).show()
+        raise typer.Exit(code=102)  # noqa: B904
+
+    except Exception as e:
+        logger.exception(f"Unexpected error while running as a worker of {address}: {e}")
+        CLIWorkerError(
+            message=f"Unexpected error while running as a worker of {address}: {e}",
+            hint="This may be a bug. Please report it if the issue persists.",
+            original_exception=e,
+        ).show()
+        raise typer.Exit(code=105)  # noqa: B904
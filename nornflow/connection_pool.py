@@ -0,0 +1,273 @@
+"""Connection pooling: keeping device sessions open from one workflow run to the next."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+from nornir.core.inventory import Host
+
+from nornflow.constants import DEFAULT_POOL_IDLE_TIMEOUT, DEFAULT_POOL_MAX_IDLE_SESSIONS
+from nornflow.exceptions import CoreError
+from nornflow.logger import logger
+
+# Decides whether a pooled connection can still be used: receives the host name
+# and the Nornir connection plugin instance.
+HealthCheck = Callable[[str, Any], bool]
+
+
+class PoolKey(NamedTuple):
+    """
+    Identity of a pooled connection.
+
+    Attributes:
+        host: Name of the host.
+        plugin: Name of the connection plugin, e.g. 'netmiko'.
+        fingerprint: Digest of the connection parameters (hostname, port,
+            credentials, platform, extras), so a connection is never reused
+            after the inventory changed how the host is reached.
+    """
+
+    host: str
+    plugin: str
+    fingerprint: str
+
+
+class PoolStats(NamedTuple):
+    """
+    Counters of a connection pool since it was created.
+
+    Attributes:
+        reused: Connections handed back to a run.
+        returned: Connections given back to the pool by a run.
+        closed_idle: Connections closed after staying unused longer than the idle timeout.
+        closed_unhealthy: Connections closed because their health check failed.
+        closed_over_cap: Connections closed to stay within the idle session cap.
+    """
+
+    reused: int
+    returned: int
+    closed_idle: int
+    closed_unhealthy: int
+    closed_over_cap: int
+
+
+def is_alive(host_name: str, plugin: Any) -> bool:
+    """
+    Default health check, asking the underlying library whether the session is alive.
+
+    Uses the liveness check of the wrapped connection when it has one: 'is_alive()'
+    (Netmiko, NAPALM, which returns a dict) or 'isalive()' (Scrapli). Connections
+    without one are assumed to be alive.
+
+    Args:
+        host_name: Name of the host the connection belongs to.
+        plugin: The Nornir connection plugin instance.
+
+    Returns:
+        Whether the connection can be reused.
+    """
+    connection = getattr(plugin, "connection", None)
+    for name in ("is_alive", "isalive"):
+        check = getattr(connection, name, None)
+        if callable(check):
+            result = check()
+            return bool(result.get("is_alive")) if isinstance(result, dict) else bool(result)
+    return True
+
+
+def connection_key(host: Host, plugin: str) -> PoolKey:
+    """Return the pool key of a host's connection through 'plugin'."""
+    params = host.get_connection_parameters(plugin)
+    identity = repr(
+        (params.hostname, params.port, params.username, params.password, params.platform, params.extras)
+    )
+    return PoolKey(host.name, plugin, hashlib.sha256(identity.encode()).hexdigest())
+
+
+class ConnectionPool:
+    """
+    Keeps device connections open across workflow runs in a long-lived process.
+
+    NornFlow normally closes every connection when a run ends, so a service
+    running workflow after workflow against the same devices pays the SSH or
+    NETCONF setup every time. Given to NornFlow (constructor 'connection_pool'
+    argument or NornFlowBuilder.with_connection_pool), a pool takes the
+    connections over at the end of a run instead of closing them, and hands
+    them back to the hosts of the next run before its first task.
+
+    Connections are keyed by host, connection plugin and connection parameters.
+    A connection belongs to one run at a time: runs sharing a pool concurrently
+    each open their own connections to a host the other run holds. Before being
+    handed out, a connection is:
+    - closed if it stayed unused for more than 'idle_timeout' seconds;
+    - checked with 'health_check', and closed if found dead.
+    At most 'max_idle_sessions' idle connections are kept; the least recently
+    used ones are closed first. The cap only applies to connections waiting in
+    the pool: connections held by running workflows are not counted or limited.
+
+    The pool is thread safe. Sharded and distributed runs open their own
+    connections in their worker processes and do not use it.
+
+    Args:
+        idle_timeout: Seconds a connection may stay unused in the pool.
+        max_idle_sessions: Maximum number of idle connections kept open.
+        health_check: Decides whether a pooled connection can be reused. Defaults
+            to is_alive().
+
+    Raises:
+        CoreError: If 'idle_timeout' is negative or 'max_idle_sessions' is lower than 1.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+        max_idle_sessions: int = DEFAULT_POOL_MAX_IDLE_SESSIONS,
+        health_check: HealthCheck = is_alive,
+    ) -> None:
+        if idle_timeout < 0:
+            raise CoreError(
+                f"idle_timeout cannot be negative, got {idle_timeout}", component="ConnectionPool"
+            )
+        if max_idle_sessions < 1:
+            raise CoreError(
+                f"max_idle_sessions must be at least 1, got {max_idle_sessions}", component="ConnectionPool"
+            )
+        self.idle_timeout = idle_timeout
+        self.max_idle_sessions = max_idle_sessions
+        self.health_check = health_check
+        # Least recently returned first: (connection plugin instance, time it was returned)
+        self._idle: OrderedDict[PoolKey, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(PoolStats._fields, 0)
+
+    def __len__(self) -> int:
+        """Number of idle connections in the pool."""
+        return len(self._idle)
+
+    @property
+    def stats(self) -> PoolStats:
+        """Counters of reused, returned and closed connections."""
+        return PoolStats(**self._stats)
+
+    def checkout(self, hosts: Iterable[Host]) -> int:
+        """
+        Attach the pooled connections of 'hosts' to them, ready for the next run.
+
+        Args:
+            hosts: Hosts about to run a workflow.
+
+        Returns:
+            The number of connections handed out.
+        """
+        self.prune()
+        hosts = list(hosts)
+        with self._lock:
+            if not self._idle:
+                return 0
+            by_host: dict[str, list[PoolKey]] = {}
+            for key in self._idle:
+                by_host.setdefault(key.host, []).append(key)
+            claimed = [
+                (host, key, self._idle.pop(key)[0])
+                for host in hosts
+                for key in by_host.get(host.name, ())
+                if key.plugin not in host.connections and connection_key(host, key.plugin) == key
+            ]
+
+        reused = 0
+        for host, key, plugin in claimed:
+            if self._healthy(key, plugin):
+                host.connections[key.plugin] = plugin
+                reused += 1
+            else:
+                self._close(key, plugin, "closed_unhealthy")
+        self._count("reused", reused)
+        logger.debug(f"Connection pool handed out {reused} connection(s)")
+        return reused
+
+    def checkin(self, hosts: Iterable[Host]) -> int:
+        """
+        Take over the open connections of 'hosts' instead of closing them.
+
+        Args:
+            hosts: Hosts whose run has ended.
+
+        Returns:
+            The number of connections taken over.
+        """
+        now = time.monotonic()
+        duplicates = []
+        over_cap = []
+        returned = 0
+        with self._lock:
+            for host in hosts:
+                for plugin_name in list(host.connections):
+                    plugin = host.connections.pop(plugin_name)
+                    key = connection_key(host, plugin_name)
+                    if key in self._idle:  # a concurrent run returned one first
+                        duplicates.append((key, self._idle.pop(key)[0]))
+                    self._idle[key] = (plugin, now)
+                    returned += 1
+            while len(self._idle) > self.max_idle_sessions:
+                key, (plugin, _) = self._idle.popitem(last=False)
+                over_cap.append((key, plugin))
+        for key, plugin in duplicates:
+            self._close(key, plugin, None)
+        for key, plugin in over_cap:
+            self._close(key, plugin, "closed_over_cap")
+        self._count("returned", returned)
+        logger.debug(f"Connection pool took over {returned} connection(s), holding {len(self)}")
+        return returned
+
+    def prune(self) -> int:
+        """
+        Close the connections that stayed unused longer than the idle timeout.
+
+        Called by checkout(). Services with long pauses between runs can call it
+        periodically to release sessions sooner.
+
+        Returns:
+            The number of connections closed.
+        """
+        deadline = time.monotonic() - self.idle_timeout
+        with self._lock:
+            expired = [(key, plugin) for key, (plugin, since) in self._idle.items() if since < deadline]
+            for key, _ in expired:
+                del self._idle[key]
+        for key, plugin in expired:
+            self._close(key, plugin, "closed_idle")
+        return len(expired)
+
+    def close(self) -> None:
+        """Close every idle connection in the pool."""
+        with self._lock:
+            idle = [(key, plugin) for key, (plugin, _) in self._idle.items()]
+            self._idle.clear()
+        for key, plugin in idle:
+            self._close(key, plugin, None)
+
+    def _healthy(self, key: PoolKey, plugin: Any) -> bool:
+        """Run the health check, treating any error as a dead connection."""
+        try:
+            return self.health_check(key.host, plugin)
+        except Exception as e:
+            logger.debug(f"Health check of the {key.plugin} connection to '{key.host}' failed: {e}")
+            return False
+
+    def _close(self, key: PoolKey, plugin: Any, reason: str | None) -> None:
+        """Close a connection the pool let go of, counting why."""
+        if reason:
+            self._count(reason)
+        logger.debug(f"Closing pooled {key.plugin} connection to '{key.host}' ({reason or 'released'})")
+        try:
+            plugin.close()
+        except Exception as e:
+            logger.warning(f"Failed to close the {key.plugin} connection to '{key.host}': {e}")
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
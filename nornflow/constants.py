@@ -1,5 +1,7 @@
+import math
 import re
 from enum import Enum
+from typing import NamedTuple
 
 try:
     # Python 3.11+ provides StrEnum
@@ -34,11 +36,16 @@ class FailureStrategy(StrEnum):
         RUN_ALL: All tasks are executed on all hosts regardless of failures.
             Errors are collected and reported at the end. Useful for diagnostic
             or audit workflows where comprehensive results are needed.
+
+        FAILURE_BUDGET: Behaves like SKIP_FAILED until more hosts have failed
+            than the configured FailureBudget tolerates, then halts the workflow
+            like FAIL_FAST. Useful for canary-style rollouts.
     """
 
     SKIP_FAILED = "skip-failed"
     FAIL_FAST = "fail-fast"
     RUN_ALL = "run-all"
+    FAILURE_BUDGET = "failure-budget"
 
     @classmethod
     def _missing_(cls, value: object) -> "FailureStrategy | None":
@@ -52,6 +59,167 @@ class FailureStrategy(StrEnum):
         return None
 
 
+class ExecutionStrategy(StrEnum):
+    """
+    Defines how NornFlow schedules the workflow's tasks across hosts.
+
+    Attributes:
+        LINEAR: Each task runs over every host before the next task starts, so
+            the slowest host of a task holds every other host back. This is
+            the default and matches Nornir's own behavior.
+
+        FREE: Each host runs the whole task list on its own worker, starting
+            its next task as soon as its previous one finishes. Fast hosts
+            finish the workflow without waiting on slow ones. Hooks, variables
+            and failure strategies still apply per host.
+    """
+
+    LINEAR = "linear"
+    FREE = "free"
+
+    @classmethod
+    def _missing_(cls, value: object) -> "ExecutionStrategy | None":
+        """Match values case-insensitively."""
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            for member in cls:
+                if member.value == normalized:
+                    return member
+        return None
+
+
+# Hosts run concurrently by the 'free' execution strategy when the Nornir runner does not say.
+DEFAULT_PIPELINE_WORKERS = 20
+
+# Hosts kept in flight at once by the asyncio runner unless 'max_concurrency' is configured.
+DEFAULT_ASYNC_CONCURRENCY = 1000
+
+# Shard count meaning "one worker process per CPU core".
+SHARDS_AUTO = "auto"
+
+# Hosts per batch handed to a worker of a distributed run.
+DEFAULT_DISTRIBUTED_BATCH_SIZE = 50
+
+# Port a distributed run's coordinator listens on when a 'tcp://' address has none.
+DEFAULT_DISTRIBUTED_PORT = 7300
+
+# Environment variable holding the secret shared by a distributed run's coordinator and workers.
+DISTRIBUTED_KEY_ENV = "NORNFLOW_DISTRIBUTED_KEY"
+
+# Seconds a distributed run's coordinator waits for a worker while no worker is connected.
+DEFAULT_DISTRIBUTED_WORKER_TIMEOUT = 600.0
+
+# Seconds a peer connecting to a distributed run's coordinator has to complete authentication.
+DISTRIBUTED_HANDSHAKE_TIMEOUT = 10.0
+
+# Seconds a pooled connection may stay unused before the pool closes it.
+DEFAULT_POOL_IDLE_TIMEOUT = 300.0
+
+# Idle connections a connection pool keeps open at most.
+DEFAULT_POOL_MAX_IDLE_SESSIONS = 100
+
+# Inventories the inventory cache keeps (one per distinct inventory configuration).
+DEFAULT_INVENTORY_CACHE_SIZE = 4
+
+# Compiled Jinja2 templates kept by Jinja2Service (least recently used dropped first).
+DEFAULT_TEMPLATE_CACHE_SIZE = 4096
+
+
+class FailureBudget(NamedTuple):
+    """
+    Failures tolerated by the FAILURE_BUDGET strategy before the workflow halts.
+
+    Failures are counted across the whole workflow and compared against the
+    number of hosts in the (filtered) inventory. When both limits are set, the
+    stricter one applies.
+
+    Attributes:
+        max_failures: Maximum number of failed hosts tolerated.
+        max_fail_percentage: Maximum percentage (0-100) of failed hosts tolerated.
+    """
+
+    max_failures: int | None = None
+    max_fail_percentage: float | None = None
+
+    def allowed_failures(self, total_hosts: int) -> int:
+        """Return how many failed hosts are tolerated out of 'total_hosts'."""
+        limits = []
+        if self.max_failures is not None:
+            limits.append(self.max_failures)
+        if self.max_fail_percentage is not None:
+            limits.append(math.floor(self.max_fail_percentage * total_hosts / 100))
+        return min(limits) if limits else total_hosts
+
+    def __str__(self) -> str:
+        parts = []
+        if self.max_failures is not None:
+            parts.append(f"{self.max_failures} host(s)")
+        if self.max_fail_percentage is not None:
+            parts.append(f"{self.max_fail_percentage:g}%")
+        return " or ".join(parts) or "unlimited"
+
+
+class BatchSize(NamedTuple):
+    """
+    Size of each batch when a workflow is rolled out in serial batches.
+
+    Exactly one of the fields is set. A percentage is resolved against the number
+    of hosts in the (filtered) inventory and rounded up, so every batch holds at
+    least one host.
+
+    Attributes:
+        hosts: Number of hosts per batch.
+        percentage: Percentage (0-100] of the inventory per batch.
+    """
+
+    hosts: int | None = None
+    percentage: float | None = None
+
+    def hosts_per_batch(self, total_hosts: int) -> int:
+        """Return how many hosts go in each batch out of 'total_hosts'."""
+        if self.hosts is not None:
+            return self.hosts
+        return max(1, math.ceil((self.percentage or 100) * total_hosts / 100))
+
+    def __str__(self) -> str:
+        if self.hosts is not None:
+            return f"{self.hosts} host(s)"
+        return f"{self.percentage:g}%"
+
+
+class OutputMode(StrEnum):
+    """
+    Defines which per-host task results are printed to the console.
+
+    Execution statistics and the final summary are always printed; the mode
+    only controls the per-host result blocks.
+
+    Attributes:
+        FULL: Print a result block for every host and task (default).
+        FAILURES_ONLY: Print result blocks only for failed hosts.
+        CHANGED_ONLY: Print result blocks only for hosts that changed or failed.
+        SUMMARY: Print no per-host result blocks, only the execution summary.
+    """
+
+    FULL = "full"
+    FAILURES_ONLY = "failures-only"
+    CHANGED_ONLY = "changed-only"
+    SUMMARY = "summary"
+
+    @classmethod
+    def _missing_(cls, value: object) -> "OutputMode | None":
+        """Handle underscore/hyphen variations for flexibility."""
+        if isinstance(value, str):
+            normalized = value.lower().replace("_", "-")
+            for member in cls:
+                if member.value == normalized:
+                    return member
+        return None
+
+
+# Maximum number of threads scanning task/filter modules during lazy catalog discovery
+LAZY_CATALOG_SCAN_WORKERS = 8
+
 # Special inventory filter keys that use NornFlow provided custom filter functions
 NORNFLOW_SPECIAL_FILTER_KEYS = ["hosts", "groups"]
 
@@ -78,7 +246,20 @@ NORNFLOW_SETTINGS_OPTIONAL = {
     "processors": [],
     "vars_dir": NORNFLOW_DEFAULT_VARS_DIR,
     "failure_strategy": FailureStrategy.SKIP_FAILED,
+    "failure_budget": None,
+    "execution_strategy": ExecutionStrategy.LINEAR,
     "dry_run": False,
+    "batch_size": None,
+    "batch_pause": None,
+    "shards": None,
+    "distributed_worker_timeout": DEFAULT_DISTRIBUTED_WORKER_TIMEOUT,
+    "cancel_grace_period": None,
+    "lazy_catalogs": False,
+    "catalog_index_file": None,
+    "inventory_cache": False,
+    "template_cache_size": DEFAULT_TEMPLATE_CACHE_SIZE,
+    "template_bytecode_cache_dir": None,
+    "native_templates": False,
     "logger": NORNFLOW_DEFAULT_LOGGER,
     "redaction": NORNFLOW_DEFAULT_REDACTION,
 }
@@ -93,6 +274,7 @@ NORNFLOW_INVALID_INIT_KWARGS = (
     "local_hooks",
     "local_j2_filters",
     "packages",
+    "catalog_index_file",
     "logger",
     # 'redaction' is settings-only; use '--no-redact' / 'no_redact=True' to disable terminal masking per run
     "redaction",
@@ -0,0 +1,36 @@
+"""
+Distributed execution: running one workflow across several machines.
+
+A NornFlow run started with a 'distributed' address becomes the coordinator:
+it loads and filters the inventory, then hands batches of hosts to workers
+started with 'nornflow worker' on other machines, each with a copy of the same
+NornFlow project. Output, failures, runtime variables and processor reports
+flow back to the coordinator, which prints the summary and returns the exit
+code as if the whole run had happened on it.
+
+Coordinator and workers talk through a Transport. SocketTransport covers TCP
+('tcp://host:port') and Unix socket ('unix:///path') addresses; other schemes
+can be added with register_transport().
+"""
+
+from nornflow.distributed.coordinator import DistributedCoordinator
+from nornflow.distributed.transport import (
+    Channel,
+    get_transport,
+    register_transport,
+    SocketTransport,
+    Transport,
+)
+from nornflow.distributed.worker import DistributedWorker, RemoteCounter, RemoteFlag
+
+__all__ = [
+    "Channel",
+    "DistributedCoordinator",
+    "DistributedWorker",
+    "RemoteCounter",
+    "RemoteFlag",
+    "SocketTransport",
+    "Transport",
+    "get_transport",
+    "register_transport",
+]
@@ -0,0 +1,264 @@
+"""Coordinator side of a distributed run."""
+
+import queue
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+from nornflow.constants import DEFAULT_DISTRIBUTED_BATCH_SIZE, DEFAULT_DISTRIBUTED_WORKER_TIMEOUT
+from nornflow.distributed.transport import Channel, Transport
+from nornflow.logger import logger
+from nornflow.runners.cancellation import CancellationToken
+from nornflow.sharding import SHARD_POLL_INTERVAL, ShardMessageHandler
+
+if TYPE_CHECKING:
+    from nornflow.models import WorkflowModel
+
+
+class DistributedCoordinator:
+    """
+    Hands out host batches to workers on other machines and collects their results.
+
+    Workers connect through the transport and each receives the run's options
+    and workflow, then one batch of hosts at a time: a worker that finishes a
+    batch gets the next one, so faster machines run more batches. Each batch
+    runs on the worker like a shard of a sharded run (see nornflow.sharding),
+    with the worker's own copy of the NornFlow project.
+
+    Like ShardCoordinator, it relays processor messages while batches run and
+    keeps each batch's final report. It also keeps the failure count of the
+    whole run, sending the total to every worker whenever it changes, and
+    relays halts: once any worker (or the coordinator) halts, every worker is
+    told to halt and no further batch is handed out.
+
+    Messages from workers are tuples whose first item is their kind:
+    - ('hello', name): a worker connected;
+    - ('message', batch, (processor_index, message)): processor message;
+    - ('done', batch, report) / ('error', batch, traceback): batch finished;
+    - ('failure', count): failures recorded by the worker;
+    - ('halt', reason): the worker's execution was cancelled.
+    Messages to workers are ('setup', options), ('batch', number, hosts),
+    ('failures', total), ('halt', reason) and ('stop',).
+
+    Args:
+        transport: Transport workers connect through.
+        host_names: Names of the hosts to run the workflow on.
+        nornflow_kwargs: Arguments for the workers' NornFlow constructor, besides
+            their own settings.
+        workflow: The assembled workflow.
+        workflow_path: Path of the workflow file, if loaded from one.
+        cancellation_token: The coordinator's token. Cancelling it halts every worker.
+        hosts_per_batch: Maximum number of hosts in a batch.
+        worker_timeout: Seconds to wait for a worker while batches are left and no
+            worker is connected, or None to wait indefinitely.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        host_names: list[str],
+        *,
+        nornflow_kwargs: dict[str, Any],
+        workflow: "WorkflowModel",
+        workflow_path: Path | None,
+        cancellation_token: CancellationToken,
+        hosts_per_batch: int = DEFAULT_DISTRIBUTED_BATCH_SIZE,
+        worker_timeout: float | None = DEFAULT_DISTRIBUTED_WORKER_TIMEOUT,
+    ) -> None:
+        self.transport = transport
+        self.batches = [
+            tuple(host_names[start : start + hosts_per_batch])
+            for start in range(0, len(host_names), hosts_per_batch)
+        ]
+        self.nornflow_kwargs = nornflow_kwargs
+        self.workflow = workflow
+        self.workflow_path = workflow_path
+        self.cancellation_token = cancellation_token
+        self.worker_timeout = worker_timeout
+        self.failure_count = 0
+        self.reports: dict[int, dict[str, Any]] = {}
+        self.errors: dict[int, str] = {}
+        self.unrun_hosts: list[str] = []
+        self.workers: dict[str, int] = {}
+        self._halted = False
+        self._pending: deque[int] = deque()
+        self._assigned: dict[Channel, int] = {}
+        self._names: dict[Channel, str] = {}
+
+    def run(self, on_message: ShardMessageHandler) -> None:
+        """
+        Run every batch to completion, waiting for workers to connect as needed.
+
+        Processor messages are handed to 'on_message' in the calling thread as they
+        arrive. Final reports end up in 'reports' and errors of batches that failed,
+        or whose worker disconnected, in 'errors', both keyed by batch number.
+        Hosts of batches never handed out because execution halted end up in
+        'unrun_hosts'. If no worker is connected for 'worker_timeout' seconds while
+        batches are left, the run stops and each of those batches gets an error.
+
+        Args:
+            on_message: Callback receiving (processor_index, message).
+        """
+        events: queue.Queue = queue.Queue()
+        self._pending = deque(range(1, len(self.batches) + 1))
+
+        def _halt_on_cancel() -> None:
+            events.put((None, ("halt", self.cancellation_token.reason or "execution cancelled")))
+
+        self.transport.listen()
+        logger.info(f"Waiting for workers on {self.transport.address} to run {len(self.batches)} batch(es)")
+        threading.Thread(
+            target=self._accept, args=(events,), name="nornflow-coordinator-accept", daemon=True
+        ).start()
+        self.cancellation_token.on_cancel(_halt_on_cancel)
+        idle_since: float | None = time.monotonic()
+        try:
+            while (self._pending and not self._halted) or self._assigned:
+                if self._names:
+                    idle_since = None
+                elif idle_since is None:
+                    idle_since = time.monotonic()
+                elif self.worker_timeout is not None and time.monotonic() - idle_since >= self.worker_timeout:
+                    self._give_up_waiting()
+                    break
+                try:
+                    channel, message = events.get(timeout=SHARD_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                self._handle(channel, message, on_message)
+        finally:
+            self.cancellation_token.remove_callback(_halt_on_cancel)
+            self.transport.close()
+            self._stop_workers(events)
+
+        for index in self._pending:
+            self.unrun_hosts.extend(self.batches[index - 1])
+        if self.unrun_hosts:
+            logger.warning(f"{len(self.unrun_hosts)} host(s) were not run because execution halted")
+        if self._halted:
+            self.cancellation_token.cancel("execution halted by a worker")
+
+    def _handle(self, channel: Channel | None, message: tuple, on_message: ShardMessageHandler) -> None:
+        """Act on one message from a worker (or on a halt of the coordinator's own token)."""
+        kind = message[0]
+        if kind == "connected":
+            self._names[channel] = "<unknown>"
+        elif kind == "hello":
+            self._names[channel] = message[1]
+            self.workers.setdefault(message[1], 0)
+            logger.info(f"Worker '{message[1]}' connected")
+            self._send(channel, ("setup", self._setup()))
+            self._assign(channel)
+        elif kind == "message":
+            on_message(*message[2])
+        elif kind in ("done", "error"):
+            index = self._assigned.pop(channel)
+            if kind == "done":
+                self.reports[index] = message[2]
+                logger.info(f"Batch {index} completed by worker '{self._names[channel]}'")
+            else:
+                self.errors[index] = message[2]
+                logger.error(f"Batch {index} failed on worker '{self._names[channel]}':\n{message[2]}")
+            self._assign(channel)
+        elif kind == "failure":
+            self.failure_count += message[1]
+            self._broadcast(("failures", self.failure_count))
+        elif kind == "halt":
+            self._halt(message[1])
+        elif kind == "lost":
+            self._names.pop(channel, None)
+            if channel in self._assigned:
+                index = self._assigned.pop(channel)
+                self.errors[index] = "worker disconnected before the batch completed"
+                logger.error(f"Batch {index}: {self.errors[index]}")
+
+    def _give_up_waiting(self) -> None:
+        """Record an error for every batch left once no worker connected within the timeout."""
+        error = f"no worker connected within {self.worker_timeout:g} seconds"
+        logger.error(f"{len(self._pending)} batch(es) were not run: {error}")
+        while self._pending:
+            self.errors[self._pending.popleft()] = error
+
+    def _stop_workers(self, events: queue.Queue) -> None:
+        """Tell every connected worker to stop, including those that connected after the last batch."""
+        while True:
+            try:
+                channel, message = events.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "connected":
+                self._names[channel] = "<unknown>"
+        for channel in list(self._names):
+            self._send(channel, ("stop",))
+            channel.close()
+
+    def _accept(self, events: queue.Queue) -> None:
+        """Accept worker connections, reading each worker's messages in a thread of its own."""
+        while (channel := self.transport.accept()) is not None:
+            events.put((channel, ("connected",)))
+            threading.Thread(
+                target=self._read, args=(channel, events), name="nornflow-coordinator-read", daemon=True
+            ).start()
+
+    @staticmethod
+    def _read(channel: Channel, events: queue.Queue) -> None:
+        """Queue a worker's messages until it disconnects."""
+        while True:
+            try:
+                message = channel.recv()
+            except EOFError:
+                events.put((channel, ("lost",)))
+                return
+            events.put((channel, message))
+
+    def _setup(self) -> dict[str, Any]:
+        """Return what a worker needs before running its first batch."""
+        return {
+            "nornflow_kwargs": self.nornflow_kwargs,
+            "workflow": self.workflow,
+            "workflow_path": self.workflow_path,
+            "total_hosts": sum(len(batch) for batch in self.batches),
+            "batches": len(self.batches),
+            "failure_count": self.failure_count,
+            "halted": self._halted,
+        }
+
+    def _assign(self, channel: Channel) -> None:
+        """Hand the next batch to a worker, or tell it to stop when none is left."""
+        if self._halted or not self._pending:
+            self._send(channel, ("stop",))
+            return
+        index = self._pending.popleft()
+        self._assigned[channel] = index
+        self.workers[self._names[channel]] += 1
+        logger.info(f"Batch {index}/{len(self.batches)} handed to worker '{self._names[channel]}'")
+        if not self._send(channel, ("batch", index, self.batches[index - 1])):
+            self._assigned.pop(channel)
+            self._pending.appendleft(index)
+
+    def _halt(self, reason: str) -> None:
+        """Stop handing out batches and halt every worker."""
+        if self._halted:
+            return
+        self._halted = True
+        logger.warning(f"Halting every worker: {reason}")
+        self._broadcast(("halt", reason))
+
+    def _broadcast(self, message: Any) -> None:
+        """Send a message to every connected worker."""
+        for channel in list(self._names):
+            self._send(channel, message)
+
+    @staticmethod
+    def _send(channel: Channel, message: Any) -> bool:
+        """Send a message to a worker, returning whether it could be sent.
+
+        A worker that cannot be reached is reported as lost by its reader thread.
+        """
+        try:
+            channel.send(message)
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,347 @@
+"""Transports connecting the coordinator of a distributed run to its workers."""
+
+import os
+import queue
+import socket
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import answer_challenge, Client, Connection, deliver_challenge, Listener
+from typing import Any
+from urllib.parse import urlsplit
+
+from nornflow.constants import DEFAULT_DISTRIBUTED_PORT, DISTRIBUTED_HANDSHAKE_TIMEOUT, DISTRIBUTED_KEY_ENV
+from nornflow.exceptions import CoreError
+from nornflow.logger import logger
+
+# Builds a transport from an address URL and the shared secret.
+TransportFactory = Callable[[str, bytes], "Transport"]
+
+
+def _shutdown(connection: Connection) -> None:
+    """Shut a connection's socket down, making a recv() blocked in another thread return.
+
+    socket.socket(fileno=...) detects the family (TCP or Unix) of the socket; it is
+    detached afterwards so the connection keeps owning the descriptor.
+    """
+    try:
+        sock = socket.socket(fileno=connection.fileno())
+    except OSError:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    finally:
+        sock.detach()
+
+
+class Channel(ABC):
+    """
+    Two-way connection between the coordinator and one worker.
+
+    Messages are picklable Python objects, delivered whole and in order.
+    send() may be called from several threads at once.
+    """
+
+    @abstractmethod
+    def send(self, message: Any) -> None:
+        """Send a message to the other end.
+
+        Raises:
+            OSError: If the other end has gone away.
+        """
+
+    @abstractmethod
+    def recv(self) -> Any:
+        """Block until the next message arrives and return it.
+
+        Raises:
+            EOFError: Once the other end has gone away or the channel was closed.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the channel."""
+
+
+class Transport(ABC):
+    """
+    How the coordinator and the workers of a distributed run reach each other.
+
+    The coordinator calls listen(), then accept() for every worker; workers call
+    connect(). Implementations must authenticate peers: messages are pickled, so
+    anyone who can connect can run code on the other end.
+    """
+
+    @property
+    @abstractmethod
+    def address(self) -> str:
+        """Address workers connect to, for display."""
+
+    @abstractmethod
+    def listen(self) -> None:
+        """Start accepting worker connections (coordinator side)."""
+
+    @abstractmethod
+    def accept(self) -> Channel | None:
+        """Block until a worker connects and return its channel.
+
+        Returns:
+            The worker's channel, or None once the transport was closed.
+        """
+
+    @abstractmethod
+    def connect(self) -> Channel:
+        """Connect to the coordinator (worker side).
+
+        Raises:
+            OSError: If the coordinator cannot be reached.
+            CoreError: If the coordinator refused the connection.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop accepting connections. A blocked accept() returns None."""
+
+
+class ConnectionChannel(Channel):
+    """Channel over a multiprocessing Connection."""
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+        self._send_lock = threading.Lock()
+
+    def send(self, message: Any) -> None:
+        with self._send_lock:
+            self._connection.send(message)
+
+    def recv(self) -> Any:
+        try:
+            return self._connection.recv()
+        except OSError as e:  # closed locally while receiving
+            raise EOFError(str(e)) from e
+
+    def close(self) -> None:
+        # Shutting the socket down first makes a recv() blocked in another thread
+        # see the end of the stream rather than a handle closed under its feet.
+        _shutdown(self._connection)
+        self._connection.close()
+
+
+class SocketTransport(Transport):
+    """
+    Transport over a TCP or Unix domain socket.
+
+    Built on multiprocessing.connection: peers prove they know the shared
+    'authkey' with an HMAC challenge before any message is exchanged. Messages
+    are not encrypted, so use it on trusted networks or through a tunnel.
+
+    Each connection is authenticated in a thread of its own, so a peer that
+    connects and then stays silent (a port scan, a load balancer's health check)
+    does not hold up other workers. Peers that have not completed the challenge
+    within 'handshake_timeout' seconds are disconnected.
+
+    Args:
+        address: A (host, port) tuple for TCP, or a filesystem path for a Unix socket.
+        authkey: Secret shared by the coordinator and every worker.
+        handshake_timeout: Seconds a connecting peer has to authenticate.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int] | str,
+        *,
+        authkey: bytes,
+        handshake_timeout: float = DISTRIBUTED_HANDSHAKE_TIMEOUT,
+    ) -> None:
+        self._address = address
+        self._authkey = authkey
+        self.handshake_timeout = handshake_timeout
+        self._listener: Listener | None = None
+        self._accepted: queue.Queue[ConnectionChannel | None] = queue.Queue()
+        self._closed = False
+
+    @classmethod
+    def from_url(cls, url: str, authkey: bytes) -> "SocketTransport":
+        """Build a transport from a 'tcp://host:port' or 'unix:///path' URL.
+
+        Args:
+            url: The address URL. The port defaults to DEFAULT_DISTRIBUTED_PORT.
+            authkey: Secret shared by the coordinator and every worker.
+
+        Returns:
+            The transport.
+
+        Raises:
+            CoreError: If the URL is not a valid TCP or Unix socket address.
+        """
+        parts = urlsplit(url)
+        if parts.scheme == "unix" and parts.path:
+            return cls(parts.path, authkey=authkey)
+        if parts.scheme == "tcp" and parts.hostname:
+            try:
+                port = DEFAULT_DISTRIBUTED_PORT if parts.port is None else parts.port
+            except ValueError as e:
+                raise CoreError(f"Invalid port in address '{url}'.", component="Distributed") from e
+            return cls((parts.hostname, port), authkey=authkey)
+        raise CoreError(
+            f"Invalid address '{url}'. Use 'tcp://host:port' or 'unix:///path/to/socket'.",
+            component="Distributed",
+        )
+
+    @property
+    def address(self) -> str:
+        address = self._listener.address if self._listener is not None else self._address
+        if isinstance(address, str):
+            return f"unix://{address}"
+        host, port = address
+        return f"tcp://{host}:{port}"
+
+    def listen(self) -> None:
+        # No authkey: the listener would authenticate inline, one peer at a time
+        self._listener = Listener(self._address)
+        # With port 0 the operating system picks the port; connect() must use it
+        self._address = self._listener.address
+        self._accepted = queue.Queue()
+        self._closed = False
+        threading.Thread(
+            target=self._accept_connections, name="nornflow-transport-accept", daemon=True
+        ).start()
+
+    def accept(self) -> Channel | None:
+        channel = self._accepted.get()
+        if channel is None:
+            self._accepted.put(None)  # later calls return None as well
+        return channel
+
+    def _accept_connections(self) -> None:
+        """Accept connections until closed, authenticating each in a thread of its own."""
+        while True:
+            try:
+                connection = self._listener.accept()
+            except OSError:  # listener closed
+                if self._closed:
+                    break
+                continue
+            if self._closed:
+                connection.close()
+                break
+            threading.Thread(
+                target=self._authenticate,
+                args=(connection,),
+                name="nornflow-transport-handshake",
+                daemon=True,
+            ).start()
+        self._accepted.put(None)
+
+    def _authenticate(self, connection: Connection) -> None:
+        """Run the HMAC challenge with a new peer, queueing its channel for accept() if it passes."""
+        expired = threading.Event()
+
+        def _expire() -> None:
+            expired.set()
+            _shutdown(connection)
+
+        timer = threading.Timer(self.handshake_timeout, _expire)
+        timer.daemon = True
+        timer.start()
+        authenticated = False
+        try:
+            deliver_challenge(connection, self._authkey)
+            answer_challenge(connection, self._authkey)
+            authenticated = True
+        except AuthenticationError:
+            logger.warning("Rejected a worker connection: the shared secrets differ")
+        except (OSError, EOFError):  # peer gone during the handshake
+            pass
+        finally:
+            timer.cancel()
+            timer.join()
+        if expired.is_set():
+            logger.warning(
+                f"Dropped a connection that did not authenticate within {self.handshake_timeout:g} seconds"
+            )
+        if not authenticated or expired.is_set() or self._closed:
+            connection.close()
+            return
+        self._accepted.put(ConnectionChannel(connection))
+
+    def connect(self) -> Channel:
+        try:
+            return ConnectionChannel(Client(self._address, authkey=self._authkey))
+        except AuthenticationError as e:
+            raise CoreError(
+                f"The coordinator at {self.address} refused the connection: the shared secrets differ.",
+                component="Distributed",
+            ) from e
+
+    def close(self) -> None:
+        if self._listener is None or self._closed:
+            return
+        self._closed = True
+        # Closing a listening socket does not wake a thread blocked in accept();
+        # connecting to it does.
+        try:
+            if isinstance(self._address, str):
+                with socket.socket(socket.AF_UNIX) as wake_up:
+                    wake_up.settimeout(1)
+                    wake_up.connect(self._address)
+            else:
+                socket.create_connection(self._address, timeout=1).close()
+        except OSError:
+            pass
+        self._listener.close()
+
+
+TRANSPORTS: dict[str, TransportFactory] = {
+    "tcp": SocketTransport.from_url,
+    "unix": SocketTransport.from_url,
+}
+
+
+def register_transport(scheme: str, factory: TransportFactory) -> None:
+    """Make get_transport() build transports for addresses with the given URL scheme.
+
+    Args:
+        scheme: URL scheme, e.g. 'tls'.
+        factory: Callable receiving the address URL and the shared secret.
+    """
+    TRANSPORTS[scheme] = factory
+
+
+def get_transport(address: "str | Transport", authkey: bytes | str | None = None) -> Transport:
+    """Build the transport for a distributed run's address.
+
+    Args:
+        address: An address URL such as 'tcp://0.0.0.0:7300' or 'unix:///run/nornflow.sock',
+            or a ready-made Transport, which is returned unchanged.
+        authkey: Secret shared by the coordinator and every worker. Read from the
+            NORNFLOW_DISTRIBUTED_KEY environment variable when omitted.
+
+    Returns:
+        The transport.
+
+    Raises:
+        CoreError: If the URL scheme is unknown or no secret is available.
+    """
+    if isinstance(address, Transport):
+        return address
+
+    scheme = urlsplit(address).scheme
+    factory = TRANSPORTS.get(scheme)
+    if factory is None:
+        raise CoreError(
+            f"Unknown transport '{scheme}' in address '{address}'. Known: {', '.join(sorted(TRANSPORTS))}.",
+            component="Distributed",
+        )
+
+    authkey = authkey or os.environ.get(DISTRIBUTED_KEY_ENV)
+    if not authkey:
+        raise CoreError(
+            f"A distributed run needs a secret shared by the coordinator and its workers. "
+            f"Set the {DISTRIBUTED_KEY_ENV} environment variable on every node.",
+            component="Distributed",
+        )
+    return factory(address, authkey.encode() if isinstance(authkey, str) else authkey)
@@ -0,0 +1,212 @@
+"""Worker side of a distributed run."""
+
+import queue
+import socket
+import threading
+import time
+from typing import Any
+
+from nornflow.distributed.transport import Channel, Transport
+from nornflow.exceptions import CoreError
+from nornflow.logger import logger
+from nornflow.settings import NornFlowSettings
+from nornflow.sharding import run_shard, Shard, SHARD_POLL_INTERVAL
+
+# Seconds between attempts to reach a coordinator that is not listening yet.
+CONNECT_RETRY_INTERVAL = 1.0
+
+
+class RemoteCounter:
+    """Failure counter of a distributed run, as seen from a worker.
+
+    Drop-in replacement for SharedCounter. Increments are sent to the
+    coordinator, which adds up those of every worker and sends the total back,
+    so failures on other workers are seen one network round trip later.
+    """
+
+    def __init__(self, channel: Channel, value: int = 0) -> None:
+        self._channel = channel
+        self._value = value
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        """The current count."""
+        return self._value
+
+    def increment(self, amount: int = 1) -> int:
+        """Add 'amount' to the counter, tell the coordinator and return the new value."""
+        with self._lock:
+            self._value += amount
+            value = self._value
+        self._channel.send(("failure", amount))
+        return value
+
+    def update(self, total: int) -> None:
+        """Take in the total counted by the coordinator."""
+        with self._lock:
+            self._value = max(self._value, total)
+
+
+class RemoteFlag:
+    """Halt flag of a distributed run, as seen from a worker.
+
+    Drop-in replacement for SharedFlag. Setting it tells the coordinator, which
+    halts the other workers; halts started elsewhere are marked by the worker
+    when the coordinator relays them.
+    """
+
+    def __init__(self, channel: Channel) -> None:
+        self._channel = channel
+        self._event = threading.Event()
+
+    def is_set(self) -> bool:
+        """Whether the run was halted."""
+        return self._event.is_set()
+
+    def set(self) -> None:
+        """Halt the run on every worker."""
+        if not self._event.is_set():
+            self._event.set()
+            self._channel.send(("halt", "execution halted by a worker"))
+
+    def mark(self) -> None:
+        """Record a halt relayed by the coordinator."""
+        self._event.set()
+
+
+class _ChannelEvents:
+    """Event sink handing a shard's events to the coordinator, in place of a multiprocessing queue."""
+
+    def __init__(self, channel: Channel) -> None:
+        self._channel = channel
+
+    def put(self, event: tuple[str, int, Any]) -> None:
+        self._channel.send(event)
+
+
+class DistributedWorker:
+    """
+    Runs batches of hosts handed out by the coordinator of a distributed run.
+
+    The worker connects to the coordinator, receives the run's options and
+    workflow, then runs one batch of hosts at a time until the coordinator
+    tells it to stop. Each batch runs like a shard of a sharded run: a NornFlow
+    is built from the worker's own settings and the run's options, so every
+    worker needs the same NornFlow project (tasks, filters, hooks, inventory)
+    as the coordinator. Output, failures and runtime variables are sent back
+    to the coordinator.
+
+    Args:
+        transport: Transport to reach the coordinator through.
+        nornflow_settings: Settings of the worker's NornFlow project. Loaded the
+            usual way (NORNFLOW_SETTINGS or ./nornflow.yaml) when omitted.
+        name: Name the coordinator knows the worker by. Defaults to the host name.
+        connect_timeout: Seconds to keep trying to reach a coordinator that is not
+            listening yet. Only one attempt is made when None.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        *,
+        nornflow_settings: NornFlowSettings | None = None,
+        name: str | None = None,
+        connect_timeout: float | None = None,
+    ) -> None:
+        self.transport = transport
+        self.nornflow_settings = nornflow_settings
+        self.name = name or socket.gethostname()
+        self.connect_timeout = connect_timeout
+        self.batches_run = 0
+
+    def run(self) -> int:
+        """
+        Run batches until the coordinator has none left.
+
+        Returns:
+            The number of batches run.
+
+        Raises:
+            CoreError: If the coordinator cannot be reached or goes away before
+                the run's options arrive.
+        """
+        channel = self._connect()
+        inbox: queue.Queue = queue.Queue()
+        try:
+            channel.send(("hello", self.name))
+            _, setup = channel.recv()
+        except (OSError, EOFError) as e:
+            channel.close()
+            raise CoreError(
+                f"Lost the coordinator at {self.transport.address}: {e}", component="Distributed"
+            ) from e
+
+        failure_count = RemoteCounter(channel, setup["failure_count"])
+        halt = RemoteFlag(channel)
+        if setup["halted"]:
+            halt.mark()
+        threading.Thread(
+            target=self._read,
+            args=(channel, inbox, failure_count, halt),
+            name="nornflow-worker-read",
+            daemon=True,
+        ).start()
+
+        settings = self.nornflow_settings or NornFlowSettings.load()
+        nornflow_kwargs = {**setup["nornflow_kwargs"], "nornflow_settings": settings}
+        logger.info(f"Worker '{self.name}' connected to {self.transport.address}")
+        try:
+            while (message := inbox.get())[0] == "batch":
+                _, index, hosts = message
+                logger.info(f"Running batch {index}/{setup['batches']} over {len(hosts)} host(s)")
+                run_shard(
+                    Shard(
+                        index=index,
+                        count=setup["batches"],
+                        hosts=hosts,
+                        total_hosts=setup["total_hosts"],
+                        nornflow_kwargs=nornflow_kwargs,
+                        workflow=setup["workflow"],
+                        workflow_path=setup["workflow_path"],
+                        failure_count=failure_count,
+                        _events=_ChannelEvents(channel),
+                        _halt=halt,
+                        remote=True,
+                    )
+                )
+                self.batches_run += 1
+        finally:
+            channel.close()
+        logger.info(f"Worker '{self.name}' ran {self.batches_run} batch(es)")
+        return self.batches_run
+
+    def _connect(self) -> Channel:
+        """Connect to the coordinator, retrying until 'connect_timeout' expires."""
+        deadline = time.monotonic() + (self.connect_timeout or 0)
+        while True:
+            try:
+                return self.transport.connect()
+            except OSError as e:
+                if time.monotonic() >= deadline:
+                    raise CoreError(
+                        f"Cannot reach the coordinator at {self.transport.address}: {e}",
+                        component="Distributed",
+                    ) from e
+            time.sleep(min(CONNECT_RETRY_INTERVAL, max(deadline - time.monotonic(), SHARD_POLL_INTERVAL)))
+
+    @staticmethod
+    def _read(channel: Channel, inbox: queue.Queue, failure_count: RemoteCounter, halt: RemoteFlag) -> None:
+        """Apply the coordinator's failure totals and halts, queueing every other message."""
+        while True:
+            try:
+                message = channel.recv()
+            except EOFError:
+                inbox.put(("stop",))
+                return
+            if message[0] == "failures":
+                failure_count.update(message[1])
+            elif message[0] == "halt":
+                halt.mark()
+            else:
+                inbox.put(message)
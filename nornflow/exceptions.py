@@ -153,6 +153,14 @@ class TaskError(WorkflowError):
         super().__init__(message, task_name=task_name, **kwargs)
 
 
+class TaskCancelledError(TaskError):
+    """Raised when a task stops (or never starts) on a host because execution was cancelled."""
+
+    def __init__(self, message: str = "", task_name: str = "", host_name: str = "", **kwargs):
+        self.host_name = host_name
+        super().__init__(message, task_name=task_name, **kwargs)
+
+
 class WorkflowValidationError(WorkflowError):
     """Raised when static workflow validation finds one or more task-level problems."""
 
@@ -116,6 +116,17 @@ class Hook:
         self._execution_count[task_model_id] = 1
         return True
 
+    def reset_execution(self, task_model: "TaskModel") -> None:
+        """Forget that the hook executed for a task model.
+
+        Lets a run_once_per_task hook execute again the next time the same task
+        runs, e.g. for the next batch of a rolling execution.
+
+        Args:
+            task_model: The task model whose execution is forgotten.
+        """
+        self._execution_count.pop(id(task_model), None)
+
     def task_started(self, task: Task) -> None:
         """Called when task starts (before any host).
 
@@ -4,7 +4,7 @@ from nornir.core.inventory import Host
 from nornir.core.task import Task
 
 from nornflow.hooks.exceptions import HookError, HookValidationError
-from nornflow.j2 import Jinja2Service
+from nornflow.j2 import Condition, Jinja2Service
 from nornflow.j2.exceptions import TemplateValidationError
 from nornflow.logger import logger
 
@@ -37,6 +37,12 @@ class Jinja2ResolvableMixin:
         implementations should validate empty strings if their specific use case
         requires it, as some hooks may legitimately accept empty strings.
 
+    Conditions:
+        With as_bool=True, a Jinja2 value is compiled once into a Condition (see
+        Jinja2Service.build_condition) and kept by the hook instance. Values made of a
+        single '{{ expression }}' are then evaluated per host straight to a bool,
+        without rendering a string and converting it back.
+
     Important:
         Only call get_resolved_value() inside lifecycle methods where the execution
         context has been populated by the framework. When calling from task_instance_started(),
@@ -142,6 +148,10 @@ class Jinja2ResolvableMixin:
         if self._is_jinja2_expression(self.value):
             if not host:
                 host = self._extract_host_from_task(task)
+            if as_bool:
+                result = self._resolve_condition(host)
+                logger.debug(f"Evaluated Jinja2 condition for hook '{self.hook_name}' on host '{host.name}'.")
+                return result
             resolved = self._resolve_jinja2(self.value, host)
             logger.debug(f"Resolved Jinja2 value for hook '{self.hook_name}' on host '{host.name}'.")
         else:
@@ -204,7 +214,29 @@ class Jinja2ResolvableMixin:
         if not vars_manager:
             raise HookError(f"{self.hook_name or 'Hook'}: Variables manager not available in context.")
 
-        return vars_manager.resolve_string(value, host.name)
+        # Hooks parse their values from strings, whatever the native_templates setting
+        return vars_manager.resolve_string(value, host.name, native=False)
+
+    def _resolve_condition(self, host: Host) -> bool:
+        """Evaluate self.value as a condition, compiling it on first use.
+
+        Args:
+            host: The host to evaluate for.
+
+        Returns:
+            The truth value of the condition.
+
+        Raises:
+            HookError: If vars_manager not available in context.
+        """
+        vars_manager = self.context.get("vars_manager")
+        if not vars_manager:
+            raise HookError(f"{self.hook_name or 'Hook'}: Variables manager not available in context.")
+
+        condition: Condition | None = getattr(self, "_condition", None)
+        if condition is None or condition.source != self.value:
+            condition = self._condition = self.jinja2.build_condition(self.value)
+        return vars_manager.resolve_condition(condition, host.name)
 
     def _to_bool(self, value: Any) -> bool:
         """Convert a value to boolean.
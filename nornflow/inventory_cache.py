@@ -0,0 +1,184 @@
+"""Inventory caching: loading a Nornir inventory once for every run in the same process."""
+
+import inspect
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from nornir.core.configuration import Config
+from nornir.core.inventory import Host, Hosts, Inventory, ParentGroups
+from nornir.core.plugins.inventory import InventoryPluginRegister
+from nornir.init_nornir import load_inventory
+
+from nornflow.constants import DEFAULT_INVENTORY_CACHE_SIZE
+from nornflow.logger import logger
+
+# Connection attributes a Host may inherit from its groups and defaults.
+HOST_ATTRIBUTES = ("hostname", "port", "username", "password", "platform")
+
+# Modification time and size of a file, or None when it does not exist.
+FileStamp = tuple[int, int] | None
+
+
+def file_stamp(path: str) -> FileStamp:
+    """Return the modification time and size of 'path', or None if it does not exist."""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def inventory_files(config: Config) -> tuple[str, ...]:
+    """
+    Return the absolute paths of the files an inventory plugin may read.
+
+    These are the string values of the plugin's options, together with the
+    defaults of the options the config leaves out (e.g. SimpleInventory's
+    'hosts.yaml'). Values that are not file paths are harmless: they simply
+    never exist.
+
+    Args:
+        config: The Nornir configuration.
+
+    Returns:
+        The candidate paths, sorted.
+    """
+    options: dict[str, Any] = {}
+    try:
+        InventoryPluginRegister.auto_register()
+        plugin = InventoryPluginRegister.get_plugin(config.inventory.plugin)
+        options = {
+            name: parameter.default
+            for name, parameter in inspect.signature(plugin).parameters.items()
+            if parameter.default is not inspect.Parameter.empty
+        }
+    except Exception as e:  # unknown plugin: load_inventory reports it
+        logger.debug(f"Cannot inspect inventory plugin '{config.inventory.plugin}': {e}")
+    options.update(config.inventory.options or {})
+    return tuple(
+        sorted({str(Path(value).resolve()) for value in options.values() if isinstance(value, str | Path)})
+    )
+
+
+class InventoryCache:
+    """
+    Nornir inventories kept for later runs in the same process.
+
+    Every NornFlow run builds its own Nornir object, which normally loads the
+    inventory from scratch: with tens of thousands of hosts, parsing the
+    inventory files dominates the start of the run. With the 'inventory_cache'
+    setting enabled, the inventory is loaded once and handed to every later run
+    whose Nornir config has the same inventory section. Each run then filters it
+    as usual.
+
+    A cached inventory is reloaded when any of its files (the inventory plugin's
+    file options, e.g. SimpleInventory's host, group and defaults files) is
+    created, deleted, or has its modification time or size changed. Inventories
+    built from other sources (databases, APIs) are only reloaded when the
+    inventory section of the config changes, or when the cache is cleared.
+
+    Every run gets its own copy of the cached hosts, with their own connections
+    and a copy of their data, so concurrent runs neither close nor take over each
+    other's sessions, and host flags or data set by one run stay in that run.
+    Only the groups and defaults are shared between runs.
+
+    Args:
+        max_entries: Number of inventories kept; the least recently used is dropped first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_INVENTORY_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[dict[str, FileStamp], Inventory]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached inventories."""
+        return len(self._entries)
+
+    def load(self, config: Config) -> Inventory:
+        """
+        Return the inventory for 'config', loading it only if it is not cached or is stale.
+
+        Args:
+            config: The Nornir configuration.
+
+        Returns:
+            A per-run copy of the inventory, with its transform function already applied.
+        """
+        files = inventory_files(config)
+        key = repr(
+            (
+                config.inventory.plugin,
+                sorted((config.inventory.options or {}).items()),
+                config.inventory.transform_function,
+                sorted((config.inventory.transform_function_options or {}).items()),
+                files,
+            )
+        )
+        stamps = {path: file_stamp(path) for path in files}
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamps:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                inventory = entry[1]
+            else:
+                inventory = None
+                self.misses += 1
+
+        if inventory is not None:
+            logger.info(f"Reusing the cached inventory of {len(inventory.hosts)} hosts")
+            return self._copy_inventory(inventory)
+
+        logger.info("Loading the inventory" + (" (files changed since cached)" if entry is not None else ""))
+        inventory = load_inventory(config)
+        with self._lock:
+            self._entries[key] = (stamps, inventory)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return self._copy_inventory(inventory)
+
+    def clear(self) -> None:
+        """Drop every cached inventory, so the next run loads it again."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _copy_inventory(inventory: Inventory) -> Inventory:
+        """
+        Return a copy of 'inventory' for one run.
+
+        Hosts are new objects with an empty 'connections' dict and a shallow copy
+        of their data; groups and defaults are shared with the cached inventory.
+
+        Args:
+            inventory: The cached inventory.
+
+        Returns:
+            The copy.
+        """
+        hosts = Hosts(
+            {
+                name: Host(
+                    name=host.name,
+                    # Host's attribute lookup falls back on groups and defaults;
+                    # copy the host's own values only
+                    **{attribute: object.__getattribute__(host, attribute) for attribute in HOST_ATTRIBUTES},
+                    groups=ParentGroups(host.groups),
+                    data=dict(host.data),
+                    connection_options=dict(host.connection_options),
+                    defaults=host.defaults,
+                )
+                for name, host in inventory.hosts.items()
+            }
+        )
+        return Inventory(hosts=hosts, groups=inventory.groups, defaults=inventory.defaults)
+
+
+# Inventory cache shared by every NornFlow run in the process with 'inventory_cache' enabled.
+INVENTORY_CACHE = InventoryCache()
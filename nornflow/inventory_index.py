@@ -0,0 +1,165 @@
+"""Inventory indexes: selecting hosts by name, group, platform or data without scanning."""
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from nornir.core.inventory import Host, Hosts, Inventory
+
+from nornflow.logger import logger
+
+# Computes the names of the hosts a filter function selects, from an InventoryIndex
+# and the filter's parameters. Returns None when it cannot for these parameters, in
+# which case the filter function runs against every host as usual.
+IndexedSelector = Callable[..., frozenset[str] | None]
+
+# Filter functions with an index fast path: filter function -> selector
+INDEXED_FILTERS: dict[Callable, IndexedSelector] = {}
+
+
+def register_indexed_filter(filter_func: Callable, selector: IndexedSelector) -> None:
+    """
+    Give an inventory filter function an index fast path.
+
+    When 'filter_func' is applied through NornirManager, 'selector' is called with
+    the InventoryIndex of the inventory and the filter parameters instead of
+    calling 'filter_func' for every host. It must select exactly the hosts
+    'filter_func' would. For example, a custom filter on a data key:
+
+        def site(host: Host, site: str) -> bool:
+            return host.get("site") == site
+
+        register_indexed_filter(site, lambda index, site: index.with_data("site", site))
+
+    Args:
+        filter_func: The filter function.
+        selector: Computes the selected host names (see IndexedSelector).
+    """
+    INDEXED_FILTERS[filter_func] = selector
+
+
+def get_selector(filter_kwargs: dict[str, Any]) -> IndexedSelector | None:
+    """Return the index fast path of the filter described by 'filter_kwargs', if it has one."""
+    filter_func = filter_kwargs.get("filter_obj") or filter_kwargs.get("filter_func")
+    try:
+        return INDEXED_FILTERS.get(filter_func)
+    except TypeError:  # unhashable filter object
+        return None
+
+
+def matches_filter(host: Host, filter_kwargs: dict[str, Any]) -> bool:
+    """Evaluate one set of Nornir filter arguments against a host, as Inventory.filter does."""
+    kwargs = dict(filter_kwargs)
+    filter_obj = kwargs.pop("filter_obj", None)
+    filter_func = filter_obj or kwargs.pop("filter_func", None)
+    kwargs.pop("filter_func", None)
+    if filter_func:
+        return bool(filter_func(host, **kwargs))
+    return all(host.get(key) == value for key, value in kwargs.items())
+
+
+def matches_all_filters(host: Host, filters: tuple[dict[str, Any], ...]) -> bool:
+    """Nornir filter function combining several sets of filter arguments with AND logic."""
+    return all(matches_filter(host, filter_kwargs) for filter_kwargs in filters)
+
+
+class InventoryIndex:
+    """
+    Lookup tables over the hosts of an inventory.
+
+    Nornir filters an inventory by calling the filter function for every host.
+    The index lets filters with a fast path (see register_indexed_filter) select
+    their hosts with set operations instead, and narrow an inventory to a few
+    named hosts (e.g. a batch) without going through the rest.
+
+    The position of every host is recorded up front. The other tables are built
+    on first use, in one pass over the hosts each, and then kept:
+    - groups: hosts by direct parent group, as the builtin 'groups' filter matches;
+    - platforms: hosts by platform (including the one inherited from groups/defaults);
+    - data keys: hosts by the value of host.get(key), one table per key.
+
+    The tables reflect the hosts when they were built: an index is meant for the
+    filtering done before a run, not to track changes tasks make to hosts.
+
+    Args:
+        inventory: The inventory to index.
+    """
+
+    def __init__(self, inventory: Inventory) -> None:
+        self.inventory = inventory
+        self._positions = {name: position for position, name in enumerate(inventory.hosts)}
+        self._groups: dict[str, frozenset[str]] | None = None
+        self._platforms: dict[str | None, frozenset[str]] | None = None
+        # Per data key; None when a value is unhashable and the key cannot be indexed
+        self._data: dict[str, dict[Hashable, frozenset[str]] | None] = {}
+
+    def __len__(self) -> int:
+        """Number of hosts in the indexed inventory."""
+        return len(self._positions)
+
+    @property
+    def names(self) -> frozenset[str]:
+        """Names of all the hosts."""
+        return frozenset(self._positions)
+
+    def named(self, names: Iterable[str]) -> frozenset[str]:
+        """Return the names among 'names' that are hosts of the inventory."""
+        return frozenset(name for name in names if name in self._positions)
+
+    def in_groups(self, groups: Iterable[str]) -> frozenset[str]:
+        """Return the hosts that have any of 'groups' as a direct parent group."""
+        if self._groups is None:
+            members: dict[str, set[str]] = {}
+            for name, host in self.inventory.hosts.items():
+                for group in host.groups:
+                    members.setdefault(group.name, set()).add(name)
+            self._groups = {group: frozenset(names) for group, names in members.items()}
+        return frozenset().union(*(self._groups.get(group, ()) for group in groups))
+
+    def with_platforms(self, platforms: Iterable[str | None]) -> frozenset[str]:
+        """Return the hosts whose platform is any of 'platforms'."""
+        if self._platforms is None:
+            self._platforms = self._group_by(lambda host: host.platform)
+        return frozenset().union(*(self._platforms.get(platform, ()) for platform in platforms))
+
+    def with_data(self, key: str, value: Any) -> frozenset[str] | None:
+        """
+        Return the hosts for which host.get(key) equals 'value'.
+
+        Returns:
+            The host names, or None if 'value' or any of the hosts' values for
+            'key' is unhashable, so the key cannot be looked up in a table.
+        """
+        if key not in self._data:
+            try:
+                self._data[key] = self._group_by(lambda host: host.get(key))
+            except TypeError:
+                logger.debug(f"Inventory data key '{key}' has unhashable values and is not indexed")
+                self._data[key] = None
+        table = self._data[key]
+        if table is None:
+            return None
+        try:
+            return table.get(value, frozenset())
+        except TypeError:  # unhashable value
+            return None
+
+    def hosts(self, names: Iterable[str] | None = None) -> Hosts:
+        """
+        Return the hosts named in 'names', in inventory order.
+
+        Args:
+            names: Names of the hosts to return; unknown names are ignored. All
+                hosts when None.
+        """
+        hosts = self.inventory.hosts
+        if names is None:
+            return Hosts(hosts)
+        selected = sorted(self.named(names), key=self._positions.__getitem__)
+        return Hosts({name: hosts[name] for name in selected})
+
+    def _group_by(self, value_of: Callable[[Host], Any]) -> dict[Any, frozenset[str]]:
+        """Build a table of host names by the value 'value_of' returns for each host."""
+        table: dict[Any, set[str]] = {}
+        for name, host in self.inventory.hosts.items():
+            table.setdefault(value_of(host), set()).add(name)
+        return {value: frozenset(names) for value, names in table.items()}
@@ -5,13 +5,17 @@ including environment caching, template compilation, and standardized
 resolution methods.
 """
 
+from nornflow.j2.condition import Condition
 from nornflow.j2.constants import JINJA2_MARKERS
 from nornflow.j2.core import Jinja2Service
 from nornflow.j2.exceptions import TemplateError, TemplateValidationError
+from nornflow.j2.render_plan import RenderPlan
 
 __all__ = [
     "JINJA2_MARKERS",
+    "Condition",
     "Jinja2Service",
+    "RenderPlan",
     "TemplateError",
     "TemplateValidationError",
 ]
@@ -0,0 +1,65 @@
+"""Precompiled boolean conditions.
+
+Hook conditions such as "{{ host.platform == 'ios' }}" are evaluated for every host.
+Rendering them as templates produces a string that is then parsed back into a bool.
+A Condition compiles a template made of a single expression once, with Jinja2's
+compile_expression, and evaluates it straight to a Python value for each host.
+"""
+
+from typing import Any, TYPE_CHECKING
+
+from jinja2.environment import TemplateExpression
+
+if TYPE_CHECKING:
+    from nornflow.j2.core import Jinja2Service
+
+
+class Condition:
+    """Reusable, precompiled boolean condition.
+
+    Evaluating a condition gives the same result as rendering its source and
+    converting the output with 'Jinja2Service.to_bool'. Sources made of exactly one
+    '{{ expression }}' block take the fast path: the expression value is used
+    directly when it is a bool, and only other values are converted through their
+    string form. Any other source (text around the expression, statements, whitespace
+    control) is rendered as a template.
+    """
+
+    __slots__ = ("_expression", "_jinja2", "source")
+
+    def __init__(self, source: str, jinja2_service: "Jinja2Service") -> None:
+        """Compile 'source'.
+
+        Args:
+            source: The condition template.
+            jinja2_service: The service used to compile and evaluate it.
+        """
+        self.source = source
+        self._jinja2 = jinja2_service
+        self._expression: TemplateExpression | None = jinja2_service.compile_expression(source)
+
+    @property
+    def is_expression(self) -> bool:
+        """Whether the condition is evaluated as an expression instead of rendered."""
+        return self._expression is not None
+
+    def evaluate(self, context: dict[str, Any], error_context: str = "") -> bool:
+        """Evaluate the condition against a context.
+
+        Args:
+            context: Variables for resolution.
+            error_context: Description for error messages.
+
+        Returns:
+            The truth value of the condition.
+
+        Raises:
+            TemplateError: If evaluation fails.
+        """
+        if self._expression is None:
+            return self._jinja2.to_bool(self._jinja2.resolve_string(self.source, context, error_context))
+
+        value = self._jinja2.evaluate_expression(self._expression, self.source, context, error_context)
+        if isinstance(value, bool):
+            return value
+        return self._jinja2.to_bool(str(value))
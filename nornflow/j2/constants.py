@@ -1,5 +1,7 @@
 """Jinja2-related constants for NornFlow."""
 
+import re
+
 # Template markers for detecting Jinja2 templates - all opening variations
 JINJA2_MARKERS = [
     "{{",  # Standard variable output
@@ -10,6 +12,20 @@ JINJA2_MARKERS = [
     "{#-",  # Comment with left whitespace control
 ]
 
+# A template made of exactly one '{{ expression }}' block, without whitespace control
+# or any other markup, capturing the expression. See Jinja2Service.compile_expression.
+SINGLE_EXPRESSION_PATTERN = re.compile(
+    r"\{\{(?![-+])((?:(?!\{\{|\}\}|\{%|%\}|\{#|#\}).)*?)(?<![-+])\}\}", re.DOTALL
+)
+
+# Context variable holding the current host's namespace ('{{ host.name }}'); templates
+# reading it are rendered for every host even in a RenderPlan.
+HOST_NAMESPACE_VAR = "host"
+
+# Filters and globals whose output can differ between renders with the same variables.
+# Templates using them are never treated as host-invariant (see Jinja2Service.find_template_variables).
+NON_DETERMINISTIC_J2_NAMES = frozenset({"random", "random_choice", "lipsum"})
+
 # Lower case string values that evaluate to True when converting to boolean.
 # This provides a centralized reference point to avoid ambiguity across the codebase.
 TRUTHY_STRING_VALUES = ("true", "yes", "1", "on", "ok", "y", "t", "enabled")
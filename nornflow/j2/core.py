@@ -1,25 +1,60 @@
-from functools import lru_cache
 from threading import Lock
-from typing import Any
-
-from jinja2 import Environment, StrictUndefined, TemplateSyntaxError, UndefinedError
+from typing import Any, NoReturn
+
+from jinja2 import (
+    Environment,
+    meta,
+    nodes,
+    StrictUndefined,
+    Template,
+    TemplateSyntaxError,
+    Undefined,
+    UndefinedError,
+)
+from jinja2.environment import TemplateExpression
+from jinja2.filters import FILTERS as JINJA2_BUILTIN_FILTERS
+from jinja2.nativetypes import NativeEnvironment
+from jinja2.tests import TESTS as JINJA2_BUILTIN_TESTS
 
 from nornflow.builtins.jinja2_filters import ALL_BUILTIN_J2_FILTERS
 from nornflow.catalogs import CallableCatalog
 from nornflow.constants import (
     BUILTIN_NAMESPACE,
+    DEFAULT_TEMPLATE_CACHE_SIZE,
     LOCAL_NAMESPACE,
     TIER_BUILTIN,
     TIER_LOCAL,
     TIER_PACKAGE,
 )
-from nornflow.j2.constants import JINJA2_MARKERS, TRUTHY_STRING_VALUES
+from nornflow.j2.condition import Condition
+from nornflow.j2.constants import (
+    JINJA2_MARKERS,
+    NON_DETERMINISTIC_J2_NAMES,
+    SINGLE_EXPRESSION_PATTERN,
+    TRUTHY_STRING_VALUES,
+)
 from nornflow.j2.exceptions import Jinja2ServiceError, TemplateError, TemplateValidationError
+from nornflow.j2.render_plan import RenderPlan
+from nornflow.j2.template_cache import (
+    filters_fingerprint,
+    filters_signature,
+    TemplateBytecodeCache,
+    TemplateCache,
+    TemplateCacheStats,
+)
 from nornflow.logger import logger
 from nornflow.packages import PackageLoader
 from nornflow.settings import NornFlowSettings
 from nornflow.utils import is_public_callable
 
+# Builtin filters and tests (Jinja2's and NornFlow's) whose output depends only on their arguments
+DETERMINISTIC_BUILTIN_FILTERS = frozenset(
+    func
+    for name, func in (*JINJA2_BUILTIN_FILTERS.items(), *ALL_BUILTIN_J2_FILTERS.items())
+    if name not in NON_DETERMINISTIC_J2_NAMES
+)
+DETERMINISTIC_BUILTIN_TESTS = frozenset(JINJA2_BUILTIN_TESTS.values())
+
 
 class Jinja2Service:
     """Centralized Jinja2 management for NornFlow.
@@ -33,6 +68,7 @@ class Jinja2Service:
     - Offers standardized resolution methods
     - Centralizes error handling
     - Supports registration of custom filters from external directories
+    - Optionally renders templates to native Python values (see compile_template)
     - Assembles and exposes a shared catalog of J2 filters (built-ins + custom)
     """
 
@@ -56,6 +92,10 @@ class Jinja2Service:
         )
 
         instance._j2_filters_catalog = CallableCatalog("j2_filters")  # noqa: SLF001
+        instance._template_cache = TemplateCache(DEFAULT_TEMPLATE_CACHE_SIZE)  # noqa: SLF001
+        instance._bytecode_cache = None  # noqa: SLF001
+        instance._native_environment = None  # noqa: SLF001
+        instance._filters_signature = ""  # noqa: SLF001
 
         # Add ALL_BUILTIN_J2_FILTERS to instances j2_filters_catalog
         for name, func in ALL_BUILTIN_J2_FILTERS.items():
@@ -85,6 +125,14 @@ class Jinja2Service:
         instance.environment.filters.clear()
         instance.environment.filters.update(filters)
 
+        # Templates compiled against the previous filters must not be served anymore
+        fingerprint = filters_fingerprint(filters)
+        cache = instance._template_cache  # noqa: SLF001
+        if cache.fingerprint != fingerprint:
+            cache.clear()
+            cache.fingerprint = fingerprint
+        instance._filters_signature = filters_signature(instance.environment)  # noqa: SLF001
+
     @classmethod
     def reset(cls) -> None:
         """Clear the singleton so the next use rebuilds environment and catalogs.
@@ -94,7 +142,7 @@ class Jinja2Service:
         """
         with cls._lock:
             if cls._instance is not None:
-                cls._instance.compile_template.cache_clear()
+                cls._instance._template_cache.clear()  # noqa: SLF001
             cls._instance = None
             cls._initialized = False
 
@@ -106,9 +154,16 @@ class Jinja2Service:
 
         Registers j2_filters from local directories first, then from packages.
         Rebuilds the singleton on each call so filter catalogs do not leak between
-        successive 'NornFlow' initializations in the same process.
+        successive 'NornFlow' initializations in the same process. The compiled
+        templates of the previous singleton are kept when the resulting filters
+        are the same (see _adopt_template_cache), and the cache is sized from the
+        'template_cache_size' setting. Templates missing from it are loaded from the
+        'template_bytecode_cache_dir' directory, when set, before being compiled.
         """
-        cls.reset()
+        with cls._lock:
+            previous = cls._instance
+            cls._instance = None
+            cls._initialized = False
         locations = [(LOCAL_NAMESPACE, str(path), TIER_LOCAL) for path in settings.local_j2_filters]
         if package_loader:
             locations.extend(
@@ -117,6 +172,29 @@ class Jinja2Service:
             )
 
         cls.register_custom_filters(locations)
+        instance = cls()
+        instance._adopt_template_cache(previous, settings.template_cache_size)
+        if settings.template_bytecode_cache_dir:
+            instance._bytecode_cache = TemplateBytecodeCache(settings.template_bytecode_cache_dir)
+
+    def _adopt_template_cache(self, previous: "Jinja2Service | None", max_size: int) -> None:
+        """Take over the template cache of the previous singleton, emptied if its filters differ.
+
+        Args:
+            previous: The singleton this one replaces, if any.
+            max_size: Maximum number of compiled templates to keep.
+        """
+        if previous is not None:
+            # The same cache object is kept either way, so its counters span re-initializations
+            cache = previous._template_cache  # noqa: SLF001
+            fingerprint = self._template_cache.fingerprint
+            if cache.fingerprint == fingerprint:
+                logger.debug(f"Keeping {len(cache)} compiled template(s): Jinja2 filters unchanged")
+            else:
+                cache.clear()
+                cache.fingerprint = fingerprint
+            self._template_cache = cache
+        self._template_cache.resize(max_size)
 
     @classmethod
     def register_custom_filters(
@@ -199,15 +277,42 @@ class Jinja2Service:
             raise Jinja2ServiceError(f"Expected Environment instance, got {type(value).__name__}")
         self._environment = value
 
-    # @lru_cache is safe here despite B019: as a singleton, only one instance exists,
-    # so no risk of accumulating references that prevent garbage collection. Templates
-    # are cached for the app's lifetime anyway, aligning with singleton behavior.
-    @lru_cache(maxsize=256)  # noqa: B019
-    def compile_template(self, template_str: str) -> Any:
+    @property
+    def native_environment(self) -> NativeEnvironment:
+        """Get the Jinja2 environment rendering templates to native Python values.
+
+        Created on first use with the same options as 'environment', and shares its
+        filters, so filters registered later apply to both.
+        """
+        native = self._native_environment
+        if native is None or native.filters is not self._environment.filters:
+            native = NativeEnvironment(
+                undefined=self._environment.undefined,
+                extensions=list(self._environment.extensions),
+                autoescape=False,
+            )
+            native.filters = self._environment.filters
+            self._native_environment = native
+        return native
+
+    @property
+    def template_cache_stats(self) -> TemplateCacheStats:
+        """Hits, misses, evictions and size of the compiled template cache."""
+        return self._template_cache.stats
+
+    def compile_template(self, template_str: str, native: bool = False) -> Any:
         """Compile and cache a template string.
 
+        Compiled templates are kept in a least-recently-used cache whose size is
+        the 'template_cache_size' setting.
+
         Args:
             template_str: The template string to compile
+            native: Compile with 'native_environment', so rendering returns Python
+                values (e.g. an int or a list) instead of a string. Rendering a
+                template made of a single expression returns the expression's value;
+                other output is parsed with ast.literal_eval when it is a Python
+                literal, and returned as a string otherwise (see jinja2.nativetypes).
 
         Returns:
             Compiled Template object
@@ -215,24 +320,41 @@ class Jinja2Service:
         Raises:
             TemplateValidationError: If template has syntax errors
         """
+        if native:
+            return self._template_cache.get(template_str, self._compile_native, key=(template_str, "native"))
+        return self._template_cache.get(template_str, self._compile)
+
+    def _compile_native(self, template_str: str) -> Template:
+        """Compile a template string for native rendering."""
+        return self._compile(template_str, self.native_environment)
+
+    def _compile(self, template_str: str, environment: Environment | None = None) -> Template:
+        """Compile a template string, loading its code from the bytecode cache if one is set."""
+        environment = environment or self._environment
         try:
-            compiled = self._environment.from_string(template_str)
+            if self._bytecode_cache is None:
+                compiled = environment.from_string(template_str)
+            else:
+                compiled = self._bytecode_cache.compile(environment, template_str, self._filters_signature)
             logger.debug(f"Compiled template (length={len(template_str)})")
             return compiled
         except Exception as e:
             logger.exception(f"Unexpected error compiling template (length={len(template_str)}): {e}")
             raise TemplateValidationError(f"Template compilation failed: {e}", template=template_str) from e
 
-    def resolve_string(self, template_str: str, context: dict[str, Any], error_context: str = "") -> str:
+    def resolve_string(
+        self, template_str: str, context: dict[str, Any], error_context: str = "", native: bool = False
+    ) -> Any:
         """Resolve a Jinja2 template string.
 
         Args:
             template_str: The template string to resolve
             context: Variables for resolution
             error_context: Description for error messages
+            native: Return a native Python value instead of a string (see compile_template)
 
         Returns:
-            Resolved string
+            Resolved string, or the native value when 'native' is True
 
         Raises:
             TemplateError: If resolution fails
@@ -246,22 +368,186 @@ class Jinja2Service:
             return template_str
 
         try:
-            template = self.compile_template(template_str)
-            result = template.render(context)
-            logger.debug(f"Resolved template: input_len={len(template_str)}, output_len={len(result)}")
+            template = self.compile_template(template_str, native)
+            result = self._render(template, context)
+            logger.debug(
+                f"Resolved template: input_len={len(template_str)}, "
+                f"output={f'len {len(result)}' if isinstance(result, str) else type(result).__name__}"
+            )
             return result
-        except UndefinedError as e:
-            context_info = f" ({error_context})" if error_context else ""
-            raise TemplateError(f"Undefined variable in template{context_info}: {e}") from e
-        except TemplateSyntaxError as e:
-            context_info = f" ({error_context})" if error_context else ""
-            raise TemplateError(f"Template syntax error{context_info}: {e}") from e
         except Exception as e:
-            context_info = f" ({error_context})" if error_context else ""
-            logger.exception(
-                f"Unexpected error resolving template (length={len(template_str)}){context_info}: {e}"
-            )
-            raise TemplateError(f"Template rendering error{context_info}: {e}") from e
+            self._raise_template_error(e, template_str, error_context)
+
+    def render_compiled(
+        self, template: Template, template_str: str, context: dict[str, Any], error_context: str = ""
+    ) -> Any:
+        """Render an already compiled template, with the same error handling as resolve_string.
+
+        Args:
+            template: The compiled Template object
+            template_str: The template source, used for error messages
+            context: Variables for resolution
+            error_context: Description for error messages
+
+        Returns:
+            Resolved string, or a native value for a template compiled with native=True
+
+        Raises:
+            TemplateError: If rendering fails
+        """
+        try:
+            return self._render(template, context)
+        except Exception as e:
+            self._raise_template_error(e, template_str, error_context)
+
+    @staticmethod
+    def _render(template: Template, context: dict[str, Any]) -> Any:
+        """Render a template, failing on an undefined native value as string rendering would."""
+        result = template.render(context)
+        if isinstance(result, Undefined):
+            # A native template made of a single undefined variable returns it unrendered
+            result = str(result)
+        return result
+
+    def compile_expression(self, template_str: str) -> TemplateExpression | None:
+        """Compile a template made of a single '{{ expression }}' into a callable expression.
+
+        The expression returns the Python value of the expression instead of rendering
+        it to a string. Undefined variables fail when the value is used, as they would
+        when rendering.
+
+        Args:
+            template_str: The template string to compile
+
+        Returns:
+            The compiled expression, or None when the template is anything else (text
+            around the expression, statements, whitespace control) or the expression
+            does not compile. Such templates can only be rendered.
+        """
+        match = SINGLE_EXPRESSION_PATTERN.fullmatch(template_str)
+        if match is None:
+            return None
+        try:
+            return self._environment.compile_expression(match.group(1), undefined_to_none=False)
+        except TemplateSyntaxError:
+            return None
+
+    def evaluate_expression(
+        self,
+        expression: TemplateExpression,
+        template_str: str,
+        context: dict[str, Any],
+        error_context: str = "",
+    ) -> Any:
+        """Evaluate a compiled expression, with the same error handling as resolve_string.
+
+        Args:
+            expression: The compiled expression (see compile_expression)
+            template_str: The template source, used for error messages
+            context: Variables for resolution
+            error_context: Description for error messages
+
+        Returns:
+            The value of the expression
+
+        Raises:
+            TemplateError: If evaluation fails or the value is undefined
+        """
+        try:
+            value = expression(context)
+            if isinstance(value, Undefined):
+                # Raises for StrictUndefined, like rendering the template would
+                value = str(value)
+            return value
+        except Exception as e:
+            self._raise_template_error(e, template_str, error_context)
+
+    def find_template_variables(self, template_str: str) -> frozenset[str] | None:
+        """Return the variables whose values determine a template's output.
+
+        The variables are the names the template reads from its context, found with
+        Jinja2's meta.find_undeclared_variables. Rendering the template twice with the
+        same values for them gives the same output only if everything else it calls is
+        deterministic, so None is returned when it uses:
+        - a filter or test other than the Jinja2 and NornFlow builtins (custom filters
+          may read anything, e.g. the current host);
+        - a filter that receives the whole context (e.g. 'is_set', 'map', 'select');
+        - a non-deterministic filter or global (see NON_DETERMINISTIC_J2_NAMES).
+
+        Args:
+            template_str: The template string to analyze
+
+        Returns:
+            The variable names, or None if the output may depend on more than them
+            (including when the template does not parse).
+        """
+        try:
+            ast = self._environment.parse(template_str)
+        except TemplateSyntaxError:
+            return None
+
+        for node in ast.find_all((nodes.Filter, nodes.Test)):
+            if node.name in NON_DETERMINISTIC_J2_NAMES:
+                return None
+            if isinstance(node, nodes.Filter):
+                func = self._environment.filters.get(node.name)
+                builtins = DETERMINISTIC_BUILTIN_FILTERS
+            else:
+                func = self._environment.tests.get(node.name)
+                builtins = DETERMINISTIC_BUILTIN_TESTS
+            pass_arg = getattr(func, "jinja_pass_arg", None)
+            if func not in builtins or getattr(pass_arg, "name", None) == "context":
+                return None
+
+        # Globals such as 'lipsum' are not reported as undeclared variables
+        if any(node.name in NON_DETERMINISTIC_J2_NAMES for node in ast.find_all(nodes.Name)):
+            return None
+        return frozenset(meta.find_undeclared_variables(ast))
+
+    def build_condition(self, template_str: str) -> Condition:
+        """Compile a condition template into a reusable Condition.
+
+        Args:
+            template_str: The condition template
+
+        Returns:
+            A Condition evaluating the template to a bool without rendering it, when
+            the template is a single expression.
+        """
+        return Condition(template_str, self)
+
+    def build_render_plan(self, data: Any, native: bool = False) -> RenderPlan:
+        """Compile the templates in a data structure into a reusable RenderPlan.
+
+        Args:
+            data: Data structure to analyze
+            native: Render template leaves to native Python values (see compile_template)
+
+        Returns:
+            A RenderPlan that resolves 'data' with one pass over its template leaves.
+        """
+        return RenderPlan(data, self, native)
+
+    def _raise_template_error(self, error: Exception, template_str: str, error_context: str) -> NoReturn:
+        """Translate a Jinja2 failure into a NornFlow TemplateError.
+
+        Args:
+            error: The exception raised while compiling or rendering
+            template_str: The template source being resolved
+            error_context: Description for error messages
+
+        Raises:
+            TemplateError: Always.
+        """
+        context_info = f" ({error_context})" if error_context else ""
+        if isinstance(error, UndefinedError):
+            raise TemplateError(f"Undefined variable in template{context_info}: {error}") from error
+        if isinstance(error, TemplateSyntaxError):
+            raise TemplateError(f"Template syntax error{context_info}: {error}") from error
+        logger.exception(
+            f"Unexpected error resolving template (length={len(template_str)}){context_info}: {error}"
+        )
+        raise TemplateError(f"Template rendering error{context_info}: {error}") from error
 
     def resolve_to_bool(self, value: Any, context: dict[str, Any]) -> bool:
         """Resolve a value to boolean, handling templates and literals.
@@ -286,18 +572,21 @@ class Jinja2Service:
 
         return bool(value)
 
-    def resolve_data(self, data: Any, context: dict[str, Any], error_context: str = "") -> Any:
+    def resolve_data(
+        self, data: Any, context: dict[str, Any], error_context: str = "", native: bool = False
+    ) -> Any:
         """Recursively resolve templates in data structures.
 
         Args:
             data: Data structure to process
             context: Variables for resolution
             error_context: Description for error messages
+            native: Resolve templates to native Python values (see compile_template)
 
         Returns:
             Data with all templates resolved
         """
-        result = self._render_data_recursive_impl(data, context, error_context)
+        result = self._render_data_recursive_impl(data, context, error_context, native)
         logger.debug(f"Resolved data structure with {len(str(data)) if data else 0} chars.")
         return result
 
@@ -342,26 +631,32 @@ class Jinja2Service:
             return value.lower() in TRUTHY_STRING_VALUES
         return bool(value)
 
-    def _render_data_recursive_impl(self, data: Any, context: dict[str, Any], error_context: str) -> Any:
+    def _render_data_recursive_impl(
+        self, data: Any, context: dict[str, Any], error_context: str, native: bool = False
+    ) -> Any:
         """Implementation of recursive data rendering.
 
         Args:
             data: The data to process
             context: Variables for rendering
             error_context: Description for error messages
+            native: Resolve templates to native Python values
 
         Returns:
             The processed data
         """
         if isinstance(data, str):
             if self.is_template(data):
-                return self.resolve_string(data, context, error_context)
+                return self.resolve_string(data, context, error_context, native)
             return data
         if isinstance(data, dict):
-            return {k: self._render_data_recursive_impl(v, context, error_context) for k, v in data.items()}
+            return {
+                k: self._render_data_recursive_impl(v, context, error_context, native)
+                for k, v in data.items()
+            }
         # Handle both lists and tuples, and normalize to list.
         # This preserves behavior where YAML-defined lists remain lists,
         # even if converted to tuples for internal use (e.g., hashability).
         if isinstance(data, (list, tuple)):
-            return [self._render_data_recursive_impl(item, context, error_context) for item in data]
+            return [self._render_data_recursive_impl(item, context, error_context, native) for item in data]
         return data
@@ -0,0 +1,218 @@
+"""Precompiled render plans for templated data structures.
+
+A RenderPlan analyzes a data structure (typically a task's arguments) once, compiling
+every template leaf and remembering where it lives. Resolving the plan for a host then
+renders only those leaves and copies only the containers on the path to them, instead
+of walking and rebuilding the whole structure for every host.
+
+Templates that only read variables shared by all hosts (e.g. CLI, inline workflow or
+default vars) are also rendered once and reused: a plan remembers the last output of
+such a template along with the variable values it was rendered with, and reuses it for
+a host whose context holds the very same values.
+"""
+
+from typing import Any, TYPE_CHECKING
+
+from jinja2 import Template
+
+from nornflow.j2.constants import HOST_NAMESPACE_VAR
+from nornflow.j2.exceptions import TemplateError
+
+if TYPE_CHECKING:
+    from nornflow.j2.core import Jinja2Service
+
+
+# Stands for a variable missing from a context when comparing variable values
+_MISSING = object()
+
+# Native render outputs that can be handed to several hosts without copying
+_IMMUTABLE_OUTPUTS = (str, int, float, bool, type(None))
+
+
+class _TemplateLeaf:
+    """A template string found in the planned data, with its compiled Template."""
+
+    __slots__ = ("last_render", "source", "template", "variables")
+
+    def __init__(self, source: str, template: Template | None, variables: tuple[str, ...] | None) -> None:
+        self.source = source
+        # None when compilation failed; the error is then raised per host at render time,
+        # exactly as it would be without a plan.
+        self.template = template
+        # The variables that determine the output, when it does not depend on the host
+        # (see Jinja2Service.find_template_variables); None when it must always be rendered.
+        self.variables = variables
+        # (values of 'variables', output) of the last render, replaced as a whole so
+        # concurrent renders always see a consistent pair
+        self.last_render: tuple[tuple[Any, ...], Any] | None = None
+
+
+class _ContainerNode:
+    """A dict or list holding at least one template leaf somewhere below it."""
+
+    __slots__ = ("dynamic_children", "skeleton")
+
+    def __init__(self, skeleton: dict | list, dynamic_children: list[tuple[Any, "_PlanNode"]]) -> None:
+        self.skeleton = skeleton
+        self.dynamic_children = dynamic_children
+
+
+_PlanNode = _TemplateLeaf | _ContainerNode
+
+
+class RenderPlan:
+    """Reusable, precompiled resolution plan for a data structure.
+
+    The plan normalizes the data the same way 'Jinja2Service.resolve_data' does (dicts
+    become plain dicts, tuples become lists) and compiles each template leaf once.
+    Rendering produces a structure equal to what 'resolve_data' would return, but:
+    - Non-string leaves and template-free subtrees are shared between renders, not copied.
+    - Only dicts/lists that contain templates are shallow-copied per render.
+    - No substring scans for Jinja2 markers happen at render time.
+    - Host-invariant templates are rendered once while the variables they read keep the
+      same values (compared by identity), instead of once per host.
+
+    The top-level container is always fresh, but nested template-free subtrees are
+    shared, so callers must not mutate them in place.
+
+    A native plan renders its template leaves to Python values (see
+    'Jinja2Service.compile_template'). Host-invariant outputs are then only reused when
+    they are immutable, so hosts never share a rendered list or dict.
+    """
+
+    __slots__ = ("_host_invariant_count", "_jinja2", "_native", "_root", "_template_count")
+
+    def __init__(self, data: Any, jinja2_service: "Jinja2Service", native: bool = False) -> None:
+        """Analyze 'data' and compile its templates.
+
+        Args:
+            data: The data structure to plan.
+            jinja2_service: The service used to detect and compile templates.
+            native: Render template leaves to native Python values instead of strings.
+        """
+        self._jinja2 = jinja2_service
+        self._native = native
+        self._template_count = 0
+        self._host_invariant_count = 0
+        self._root = self._plan(data)
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the planned data contains no templates at all."""
+        return self._template_count == 0
+
+    @property
+    def template_count(self) -> int:
+        """Number of template leaves in the planned data."""
+        return self._template_count
+
+    @property
+    def is_native(self) -> bool:
+        """Whether template leaves render to native Python values."""
+        return self._native
+
+    @property
+    def host_invariant_count(self) -> int:
+        """Number of template leaves whose output does not depend on the host."""
+        return self._host_invariant_count
+
+    def render(self, context: dict[str, Any], error_context: str = "") -> Any:
+        """Render the plan against a context.
+
+        Args:
+            context: Variables for resolution.
+            error_context: Description for error messages.
+
+        Returns:
+            The resolved data structure.
+
+        Raises:
+            TemplateError: If any template leaf fails to render.
+        """
+        rendered = self._render_node(self._root, context, error_context)
+        if rendered is self._root and isinstance(rendered, (dict, list)):
+            # The top level is always a fresh container so callers (and processors
+            # adding keys to task.params) never mutate state shared between renders.
+            return rendered.copy()
+        return rendered
+
+    def _plan(self, data: Any) -> Any:
+        """Build the plan node (or static value) for 'data'."""
+        if isinstance(data, str):
+            if not self._jinja2.is_template(data):
+                return data
+            return self._plan_template(data)
+
+        if isinstance(data, dict):
+            items = [(key, self._plan(value)) for key, value in data.items()]
+        elif isinstance(data, (list, tuple)):
+            items = [(index, self._plan(value)) for index, value in enumerate(data)]
+        else:
+            return data
+
+        dynamic_children = [
+            (key, node) for key, node in items if isinstance(node, (_TemplateLeaf, _ContainerNode))
+        ]
+        if isinstance(data, dict):
+            skeleton: dict | list = {key: self._static_value(node) for key, node in items}
+        else:
+            skeleton = [self._static_value(node) for _, node in items]
+
+        if not dynamic_children:
+            return skeleton
+        return _ContainerNode(skeleton, dynamic_children)
+
+    def _plan_template(self, source: str) -> _TemplateLeaf:
+        """Compile a template leaf and find out whether its output depends on the host."""
+        self._template_count += 1
+        try:
+            template = self._jinja2.compile_template(source, self._native)
+        except TemplateError:
+            return _TemplateLeaf(source, None, None)
+
+        variables = self._jinja2.find_template_variables(source)
+        if variables is None or HOST_NAMESPACE_VAR in variables:
+            return _TemplateLeaf(source, template, None)
+        self._host_invariant_count += 1
+        return _TemplateLeaf(source, template, tuple(sorted(variables)))
+
+    @staticmethod
+    def _static_value(node: Any) -> Any:
+        """Value stored in a skeleton slot; dynamic slots are overwritten on render."""
+        if isinstance(node, _ContainerNode):
+            return node.skeleton
+        if isinstance(node, _TemplateLeaf):
+            return node.source
+        return node
+
+    def _render_node(self, node: Any, context: dict[str, Any], error_context: str) -> Any:
+        """Render a single plan node."""
+        if isinstance(node, _TemplateLeaf):
+            if node.template is None:
+                # Re-raises the compilation failure with the usual error handling
+                return self._jinja2.resolve_string(node.source, context, error_context, self._native)
+            if node.variables is None:
+                return self._jinja2.render_compiled(node.template, node.source, context, error_context)
+            return self._render_invariant(node, context, error_context)
+
+        if isinstance(node, _ContainerNode):
+            rendered = node.skeleton.copy()
+            for key, child in node.dynamic_children:
+                rendered[key] = self._render_node(child, context, error_context)
+            return rendered
+
+        return node
+
+    def _render_invariant(self, leaf: _TemplateLeaf, context: dict[str, Any], error_context: str) -> Any:
+        """Render a host-invariant leaf, reusing the last output if its variables are unchanged."""
+        values = tuple(context.get(name, _MISSING) for name in leaf.variables)
+        last_render = leaf.last_render
+        if last_render is not None and all(
+            value is last_value for value, last_value in zip(values, last_render[0], strict=True)
+        ):
+            return last_render[1]
+
+        rendered = self._jinja2.render_compiled(leaf.template, leaf.source, context, error_context)
+        if isinstance(rendered, _IMMUTABLE_OUTPUTS):
+            leaf.last_render = (values, rendered)
+        return rendered
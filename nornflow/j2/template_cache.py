@@ -0,0 +1,286 @@
+"""Caches of compiled Jinja2 templates: in memory (least recently used) and on disk."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import jinja2
+from jinja2 import Environment, FileSystemBytecodeCache, Template
+
+from nornflow.j2.exceptions import Jinja2ServiceError
+from nornflow.logger import logger
+
+
+class TemplateCacheStats(NamedTuple):
+    """
+    Counters of a template cache.
+
+    Attributes:
+        hits: Compilations served from the cache.
+        misses: Templates compiled because they were not cached.
+        evictions: Templates dropped to stay within the cache size.
+        size: Templates currently cached.
+        max_size: Maximum number of templates kept.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+def filters_fingerprint(filters: Mapping[str, Any]) -> str:
+    """
+    Return a digest identifying a set of Jinja2 filters.
+
+    Filters are identified by name, qualified name and bytecode, so the digest
+    survives re-importing the same filter modules but changes when a filter is
+    added, removed, renamed or its code is edited. Callables without bytecode
+    (classes, partials, builtins) are identified by object identity.
+
+    Args:
+        filters: The filters of a Jinja2 environment.
+
+    Returns:
+        A hex digest.
+    """
+    parts = []
+    for name, func in sorted(filters.items()):
+        code = getattr(func, "__code__", None)
+        identity = hash(code) if code is not None else id(func)
+        parts.append(
+            f"{name}={getattr(func, '__module__', '')}.{getattr(func, '__qualname__', '')}:{identity}"
+        )
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+# Environment options the code Jinja2 generates for a template depends on
+CODE_GENERATION_OPTIONS = (
+    "block_start_string",
+    "block_end_string",
+    "variable_start_string",
+    "variable_end_string",
+    "comment_start_string",
+    "comment_end_string",
+    "line_statement_prefix",
+    "line_comment_prefix",
+    "trim_blocks",
+    "lstrip_blocks",
+    "newline_sequence",
+    "keep_trailing_newline",
+    "autoescape",
+    "finalize",
+    "optimized",
+    "is_async",
+)
+
+
+def _describe(value: Any) -> str:
+    """Describe an option value the same way in every process (callables by qualified name)."""
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', '')}"
+    return repr(value)
+
+
+def filters_signature(environment: Environment) -> str:
+    """
+    Return a digest of what the code Jinja2 generates depends on, stable across processes.
+
+    Compiled templates look their filters and tests up by name when rendering, so
+    the code generated for a template depends on their names (and on the context,
+    environment or eval context each asks to be passed), not on their code. The
+    Jinja2 version, the environment's extensions and undefined type, and its
+    syntax and output options (see CODE_GENERATION_OPTIONS) are included too.
+    Unlike filters_fingerprint(), the digest does not use object identities or
+    hash(), so it can key a cache shared between processes.
+
+    Args:
+        environment: The Jinja2 environment templates are compiled with.
+
+    Returns:
+        A hex digest.
+    """
+    parts = [
+        jinja2.__version__,
+        environment.undefined.__qualname__,
+        *sorted(environment.extensions),
+    ]
+    parts.extend(f"{option}={_describe(getattr(environment, option))}" for option in CODE_GENERATION_OPTIONS)
+    for kind, functions in (("filter", environment.filters), ("test", environment.tests)):
+        for name, func in sorted(functions.items()):
+            pass_arg = getattr(func, "jinja_pass_arg", None)
+            parts.append(f"{kind}:{name}={_describe(func)}:{pass_arg}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class TemplateCache:
+    """
+    Compiled templates keyed by their source, dropping the least recently used.
+
+    Compiled templates call the filters of the environment that compiled them,
+    so the cache is tied to a filters fingerprint (see filters_fingerprint()):
+    Jinja2Service hands the cache over to its next environment only when the
+    fingerprint is the same, and clears it otherwise.
+
+    The cache is thread safe. A size of 0 disables caching: every template is
+    compiled on use.
+
+    Args:
+        max_size: Maximum number of templates kept.
+
+    Raises:
+        Jinja2ServiceError: If 'max_size' is negative.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._templates: OrderedDict[Hashable, Template] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.fingerprint: str | None = None
+        self.max_size = 0
+        self.resize(max_size)
+
+    def __len__(self) -> int:
+        """Number of cached templates."""
+        return len(self._templates)
+
+    @property
+    def stats(self) -> TemplateCacheStats:
+        """Hits, misses and evictions since the cache was created, with its current size."""
+        return TemplateCacheStats(self._hits, self._misses, self._evictions, len(self), self.max_size)
+
+    def get(
+        self, source: str, compile_template: Callable[[str], Template], key: Hashable | None = None
+    ) -> Template:
+        """
+        Return the compiled template for 'source', compiling and caching it on a miss.
+
+        Args:
+            source: The template source.
+            compile_template: Compiles a source; its errors propagate and nothing is cached.
+            key: Cache key, 'source' by default. Templates compiled differently from the
+                same source (e.g. for native rendering) must use distinct keys.
+
+        Returns:
+            The compiled template.
+        """
+        if key is None:
+            key = source
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self._hits += 1
+                return template
+            self._misses += 1
+
+        template = compile_template(source)
+        with self._lock:
+            if self.max_size:
+                self._templates[key] = template
+                self._evict()
+        return template
+
+    def resize(self, max_size: int) -> None:
+        """
+        Change the maximum number of templates kept, evicting the excess.
+
+        Raises:
+            Jinja2ServiceError: If 'max_size' is negative.
+        """
+        if max_size < 0:
+            raise Jinja2ServiceError(f"Template cache size cannot be negative, got {max_size}")
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every cached template. The counters are kept."""
+        with self._lock:
+            self._templates.clear()
+
+    def _evict(self) -> None:
+        """Drop the least recently used templates over the size limit. Must hold the lock."""
+        while len(self._templates) > self.max_size:
+            self._templates.popitem(last=False)
+            self._evictions += 1
+
+
+class TemplateBytecodeCache:
+    """
+    Compiled template code kept on disk, so later processes skip Jinja2's parser and code generator.
+
+    Entries are Jinja2 bytecode cache files (see jinja2.FileSystemBytecodeCache),
+    one per template source, environment class (native environments generate
+    different code) and filters signature (see filters_signature()).
+    Jinja2 discards files written by another Python version. The cache is best
+    effort: unreadable, corrupt or unwritable files only cost a compilation.
+
+    Args:
+        directory: Directory of the cache files, created if missing.
+
+    Raises:
+        Jinja2ServiceError: If the directory cannot be created.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise Jinja2ServiceError(f"Cannot create template bytecode cache directory: {e}") from e
+        self._bytecode_cache = FileSystemBytecodeCache(str(self.directory), "nornflow-%s.cache")
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, environment: Environment, source: str, signature: str) -> Template:
+        """
+        Return 'source' compiled with 'environment', loading its code from disk when cached.
+
+        Args:
+            environment: The environment to compile with.
+            source: The template source.
+            signature: filters_signature() of 'environment'.
+
+        Returns:
+            The template.
+
+        Raises:
+            TemplateSyntaxError: If 'source' is not a valid template.
+        """
+        environment_class = type(environment)
+        name = hashlib.sha256(
+            f"{environment_class.__module__}.{environment_class.__qualname__}\n{source}".encode()
+        ).hexdigest()
+        try:
+            bucket = self._bytecode_cache.get_bucket(environment, signature, name, source)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable template bytecode cache entry: {e}")
+            bucket = None
+
+        if bucket is not None and bucket.code is not None:
+            with self._lock:
+                self.hits += 1
+            code = bucket.code
+        else:
+            with self._lock:
+                self.misses += 1
+            code = environment.compile(source)
+            if bucket is not None:
+                bucket.code = code
+                try:
+                    self._bytecode_cache.set_bucket(bucket)
+                except OSError as e:
+                    logger.debug(f"Could not write template bytecode cache entry: {e}")
+        return environment.template_class.from_code(environment, code, environment.make_globals(None))
+
+    def clear(self) -> None:
+        """Delete every cache file."""
+        self._bytecode_cache.clear()
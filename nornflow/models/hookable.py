@@ -105,19 +105,25 @@ class HookableModel(NornFlowBaseModel, ABC):
         return {} if self.args is None else dict(self.args)
 
     def validate_hooks_and_set_task_context(
-        self, nornir_manager: NornirManager, vars_manager: NornFlowVariablesManager, task_func: Callable
+        self,
+        nornir_manager: NornirManager,
+        vars_manager: NornFlowVariablesManager,
+        task_func: Callable,
+        task_name: str | None = None,
     ) -> None:
         """Validate hooks and set task-specific context in the hook processor.
 
         This method:
         1. Validates hooks
         2. Gets/caches the hook processor reference (once per HookableModel lifecycle)
-        3. Sets task-specific context on the processor
+        3. Sets task-specific context on the processor, or registers it under
+           'task_name' when given (tasks that may run concurrently with others)
 
         Args:
             nornir_manager: The Nornir manager instance.
             vars_manager: The variables manager instance.
             task_func: The task function that will be executed.
+            task_name: Name of the Nornir task to register the context for.
 
         Raises:
             ProcessorError: If hooks are configured but hook processor cannot be retrieved.
@@ -138,4 +144,7 @@ class HookableModel(NornFlowBaseModel, ABC):
             "task_model": self,
             "hooks": hooks,
         }
-        self._hook_processor_cache.task_specific_context = task_context
+        if task_name is not None:
+            self._hook_processor_cache.register_task_context(task_name, task_context)
+        else:
+            self._hook_processor_cache.task_specific_context = task_context
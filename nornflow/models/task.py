@@ -1,7 +1,8 @@
 from collections.abc import Callable
 from typing import Any, ClassVar
 
-from nornir.core.task import AggregatedResult
+from nornir.core.exceptions import PluginNotRegistered
+from nornir.core.task import AggregatedResult, Task
 from pydantic import field_validator
 from pydantic_serdes.custom_collections import HashableDict
 from pydantic_serdes.utils import convert_to_hashable
@@ -12,6 +13,7 @@ from nornflow.logger import logger
 from nornflow.models import HookableModel
 from nornflow.models.validators import run_post_creation_task_validation
 from nornflow.nornir_manager import NornirManager
+from nornflow.runners.async_runner import AsyncioRunner, is_async_task, sync_task
 from nornflow.vars.manager import NornFlowVariablesManager
 
 
@@ -80,21 +82,25 @@ class TaskModel(HookableModel):
         run_post_creation_task_validation(new_task)
         return new_task
 
-    def run(
-        self,
-        nornir_manager: NornirManager,
-        vars_manager: NornFlowVariablesManager,
-        tasks_catalog: CallableCatalog | dict[str, Callable],
-    ) -> AggregatedResult:
-        """Execute the task using the provided managers and tasks catalog."""
-        logger.info(f"Starting execution of task '{self.canonical_id}'")
+    def resolve_task_func(self, tasks_catalog: CallableCatalog | dict[str, Callable]) -> Callable:
+        """Look up the task function for this task in the tasks catalog.
+
+        Args:
+            tasks_catalog: Catalog of available task functions.
+
+        Returns:
+            The task function.
+
+        Raises:
+            TaskError: If the task is not in the catalog or its name is ambiguous.
+        """
         try:
             if isinstance(tasks_catalog, CallableCatalog):
-                task_func = tasks_catalog.resolve(self.name)
-            else:
-                task_func = tasks_catalog.get(self.name)
-                if not task_func:
-                    raise AssetNotFoundError(self.name, "tasks")
+                return tasks_catalog.resolve(self.name)
+            task_func = tasks_catalog.get(self.name)
+            if not task_func:
+                raise AssetNotFoundError(self.name, "tasks")
+            return task_func
         except AssetAmbiguityError as exc:
             raise TaskError(
                 f"Task '{self.name}' is ambiguous in tasks catalog. "
@@ -108,6 +114,58 @@ class TaskModel(HookableModel):
                 task_name=self.name,
             ) from exc
 
+    def prepare(
+        self,
+        nornir_manager: NornirManager,
+        vars_manager: NornFlowVariablesManager,
+        tasks_catalog: CallableCatalog | dict[str, Callable],
+        name: str | None = None,
+    ) -> Task:
+        """Build the Nornir task for this model without running it.
+
+        Used when hosts are dispatched per task by NornFlow itself rather than by
+        Nornir.run() (the 'free' execution strategy). Hooks are validated and the
+        task context is registered under the Nornir task name, so it stays
+        available while other tasks run at the same time.
+
+        Args:
+            nornir_manager: The Nornir manager instance.
+            vars_manager: The variables manager instance.
+            tasks_catalog: Catalog of available task functions.
+            name: Nornir task name. Defaults to the task function name.
+
+        Returns:
+            The Nornir task, ready to be copied and started per host.
+        """
+        task_func = self.resolve_task_func(tasks_catalog)
+        if is_async_task(task_func):
+            # Hosts are started from worker threads, never from an event loop
+            task_func = sync_task(task_func)
+        nornir = nornir_manager.nornir
+        task = Task(
+            task_func,
+            nornir,
+            global_dry_run=nornir.data.dry_run,
+            processors=nornir.processors,
+            name=name,
+            **self.get_task_args(),
+        )
+        self.validate_hooks_and_set_task_context(nornir_manager, vars_manager, task_func, task_name=task.name)
+        return task
+
+    def run(
+        self,
+        nornir_manager: NornirManager,
+        vars_manager: NornFlowVariablesManager,
+        tasks_catalog: CallableCatalog | dict[str, Callable],
+    ) -> AggregatedResult:
+        """Execute the task using the provided managers and tasks catalog."""
+        logger.info(f"Starting execution of task '{self.canonical_id}'")
+        task_func = self.resolve_task_func(tasks_catalog)
+        if is_async_task(task_func) and not self._runs_on_event_loop(nornir_manager):
+            logger.debug(f"Running coroutine task '{self.canonical_id}' on its own event loop per host")
+            task_func = sync_task(task_func)
+
         task_args = self.get_task_args()
         logger.debug(f"Task '{self.canonical_id}' prepared with args: {list(task_args.keys())}")
 
@@ -116,3 +174,11 @@ class TaskModel(HookableModel):
         result = nornir_manager.nornir.run(task=task_func, **task_args)
         logger.info(f"Task '{self.canonical_id}' execution completed")
         return result
+
+    @staticmethod
+    def _runs_on_event_loop(nornir_manager: NornirManager) -> bool:
+        """Whether the Nornir runner awaits coroutine task functions itself."""
+        try:
+            return isinstance(nornir_manager.nornir.runner, AsyncioRunner)
+        except PluginNotRegistered:
+            return False
@@ -7,11 +7,16 @@ from pydantic_serdes.custom_collections import HashableDict, OneToMany
 from pydantic_serdes.utils import convert_to_hashable
 
 from nornflow.blueprints import BlueprintExpander
-from nornflow.constants import FailureStrategy
+from nornflow.constants import BatchSize, ExecutionStrategy, FailureBudget, FailureStrategy
 from nornflow.exceptions import WorkflowError
 from nornflow.logger import logger
 from nornflow.models import NornFlowBaseModel, TaskModel
-from nornflow.utils import normalize_failure_strategy
+from nornflow.utils import (
+    normalize_batch_size,
+    normalize_execution_strategy,
+    normalize_failure_budget,
+    normalize_failure_strategy,
+)
 
 
 class WorkflowModel(NornFlowBaseModel):
@@ -26,6 +31,9 @@ class WorkflowModel(NornFlowBaseModel):
     dry_run: bool | None = None
     vars: HashableDict[str, Any] | None = None
     failure_strategy: FailureStrategy | None = None
+    failure_budget: FailureBudget | None = None
+    batch_size: BatchSize | None = None
+    execution_strategy: ExecutionStrategy | None = None
 
     @classmethod
     def create(cls, dict_args: dict[str, Any], *args: Any, **kwargs: Any) -> "WorkflowModel":
@@ -111,6 +119,60 @@ class WorkflowModel(NornFlowBaseModel):
         """
         return normalize_failure_strategy(v, WorkflowError)
 
+    @field_validator("failure_budget", mode="before")
+    @classmethod
+    def validate_failure_budget(cls, v: Any) -> FailureBudget | None:
+        """
+        Validate and convert failure_budget to a FailureBudget.
+
+        Args:
+            v (Any): An integer, a percentage string (e.g. '10%') or a mapping with
+                'max_failures' and/or 'max_fail_percentage'.
+
+        Returns:
+            FailureBudget | None: The validated failure budget.
+
+        Raises:
+            WorkflowError: If the value is invalid.
+        """
+        return normalize_failure_budget(v, WorkflowError)
+
+    @field_validator("batch_size", mode="before")
+    @classmethod
+    def validate_batch_size(cls, v: Any) -> BatchSize | None:
+        """
+        Validate and convert batch_size to a BatchSize.
+
+        Args:
+            v (Any): A host count or a percentage string (e.g. '10%').
+
+        Returns:
+            BatchSize | None: The validated batch size.
+
+        Raises:
+            WorkflowError: If the value is invalid.
+        """
+        return normalize_batch_size(v, WorkflowError)
+
+    @field_validator("execution_strategy", mode="before")
+    @classmethod
+    def validate_execution_strategy(cls, v: Any) -> ExecutionStrategy | None:
+        """
+        Validate and convert execution_strategy string to enum, case-insensitively.
+
+        Args:
+            v (Any): The execution_strategy value to validate.
+
+        Returns:
+            ExecutionStrategy | None: The validated ExecutionStrategy enum.
+
+        Raises:
+            WorkflowError: If the value is invalid.
+        """
+        if v is None:
+            return None
+        return normalize_execution_strategy(v, WorkflowError)
+
     @field_validator("inventory_filters", mode="before")
     def validate_inventory_filters(
         cls, v: HashableDict[str, Any] | None  # noqa: N805
@@ -158,3 +220,4 @@ class WorkflowModel(NornFlowBaseModel):
                 converted to hashable equivalents.
         """
         return convert_to_hashable(v)
+
@@ -1,20 +1,32 @@
+from collections import Counter
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from nornir.core.exceptions import PluginNotRegistered
+from nornir.plugins.runners import ThreadedRunner
 from pydantic_serdes.utils import load_file_to_dict
 
+from nornflow.batching import BatchGate, BatchProgress, count_batches, in_batch
 from nornflow.builtins import DefaultNornFlowProcessor, filters as builtin_filters, tasks as builtin_tasks
 from nornflow.builtins.processors import NornFlowFailureStrategyProcessor, NornFlowHookProcessor
-from nornflow.catalogs import CallableCatalog, ClassCatalog, FileCatalog
+from nornflow.catalogs import CallableCatalog, CatalogIndex, ClassCatalog, FileCatalog
+from nornflow.connection_pool import ConnectionPool
 from nornflow.constants import (
+    BatchSize,
     BUILTIN_NAMESPACE,
+    DEFAULT_PIPELINE_WORKERS,
+    ExecutionStrategy,
+    FailureBudget,
     FailureStrategy,
     LOCAL_NAMESPACE,
     NORNFLOW_INVALID_INIT_KWARGS,
+    OutputMode,
     TIER_BUILTIN,
     TIER_LOCAL,
     TIER_PACKAGE,
 )
+from nornflow.distributed import DistributedCoordinator, get_transport, Transport
 from nornflow.exceptions import (
     AssetAmbiguityError,
     AssetNotFoundError,
@@ -31,18 +43,29 @@ from nornflow.exceptions import (
 )
 from nornflow.hooks.base import HOOKS_CATALOG
 from nornflow.hooks.context import reset_hook_registration, set_hook_registration
+from nornflow.inventory_cache import INVENTORY_CACHE
 from nornflow.j2 import Jinja2Service
 from nornflow.logger import logger
 from nornflow.models import WorkflowModel
 from nornflow.nornir_manager import NornirManager
 from nornflow.packages import PackageLoader
+from nornflow.runners import AsyncioRunner, CancellableThreadedRunner, CancellationToken, HostPipeline
 from nornflow.settings import NornFlowSettings
+from nornflow.sharding import partition_hosts, picklable, Shard, ShardCoordinator
 from nornflow.utils import (
     import_modules_recursively,
     is_nornir_filter,
+    is_nornir_filter_node,
     is_nornir_task,
+    is_nornir_task_node,
     is_yaml_file,
     load_processor,
+    normalize_batch_size,
+    normalize_execution_strategy,
+    normalize_failure_budget,
+    normalize_shards,
+    print_batch_completed,
+    print_batch_started,
     print_workflow_overview,
     process_filter,
 )
@@ -104,6 +127,14 @@ class NornFlow:
         failure_strategy: FailureStrategy | None = None,
         dry_run: bool | None = None,
         no_redact: bool = False,
+        output_mode: OutputMode | str | None = None,
+        failure_budget: FailureBudget | str | int | dict[str, Any] | None = None,
+        batch_size: BatchSize | str | int | None = None,
+        batch_gate: BatchGate | None = None,
+        execution_strategy: ExecutionStrategy | str | None = None,
+        shards: int | str | None = None,
+        distributed: Transport | str | None = None,
+        connection_pool: ConnectionPool | None = None,
         **kwargs: Any,
     ):
         """
@@ -129,6 +160,32 @@ class NornFlow:
             no_redact: When True, disable terminal output redaction for this session.
                 Log redaction is unaffected and follows 'redaction.logs_enabled' in
                 settings.
+            output_mode: Which per-host task results the console output processors
+                print (see OutputMode). Defaults to 'full'.
+            failure_budget: Failure budget with highest precedence, used by the
+                'failure-budget' strategy. Accepts a FailureBudget, a host count, a
+                percentage string (e.g. '10%') or a mapping (see FailureBudget).
+            batch_size: Batch size with highest precedence. When set, the workflow is
+                rolled out in serial batches: every task runs over one batch of hosts
+                before the next batch starts. Accepts a BatchSize, a host count or a
+                percentage string (e.g. '10%').
+            batch_gate: Callable invoked between batches with a BatchProgress.
+                Returning False aborts the rollout before the next batch.
+            execution_strategy: Execution strategy with highest precedence. 'free' lets
+                each host run the whole task list at its own pace instead of waiting
+                for every host to finish each task (see ExecutionStrategy).
+            shards: Number of worker processes with highest precedence, or 'auto' for
+                one per CPU core. With more than one, the filtered inventory is split
+                across that many processes, each running the workflow over its share
+                of the hosts, and the results are merged into a single summary.
+            distributed: Address (e.g. 'tcp://0.0.0.0:7300') or Transport to coordinate
+                a distributed run on. The filtered inventory is handed out in batches
+                to workers started with 'nornflow worker' on other machines, and
+                their results are merged into a single summary.
+            connection_pool: Pool keeping device connections open between runs. When
+                given, connections are handed over to the pool at the end of the run
+                instead of being closed, and the pool's connections to the inventory's
+                hosts are reused by the next run sharing it.
             **kwargs: Additional keyword arguments passed to NornFlowSettings
 
         Raises:
@@ -138,7 +195,22 @@ class NornFlow:
             logger.info("Initializing NornFlow instance")
             self._validate_init_kwargs(kwargs)
             self._initialize_settings(nornflow_settings, kwargs)
-            self._initialize_instance_vars(vars, filters, failure_strategy, dry_run, no_redact, processors)
+            self._initialize_instance_vars(
+                vars,
+                filters,
+                failure_strategy,
+                failure_budget,
+                batch_size,
+                batch_gate,
+                execution_strategy,
+                shards,
+                distributed,
+                connection_pool,
+                dry_run,
+                no_redact,
+                output_mode,
+                processors,
+            )
 
             logger.set_execution_context(
                 execution_name="loading",
@@ -180,8 +252,16 @@ class NornFlow:
         vars: dict[str, Any] | None,
         filters: dict[str, Any] | None,
         failure_strategy: FailureStrategy | None,
+        failure_budget: FailureBudget | str | int | dict[str, Any] | None,
+        batch_size: BatchSize | str | int | None,
+        batch_gate: BatchGate | None,
+        execution_strategy: ExecutionStrategy | str | None,
+        shards: int | str | None,
+        distributed: Transport | str | None,
+        connection_pool: ConnectionPool | None,
         dry_run: bool | None,
         no_redact: bool,
+        output_mode: OutputMode | str | None,
         processors: list[dict[str, Any]] | None,
     ) -> None:
         """
@@ -198,14 +278,26 @@ class NornFlow:
         self._vars = vars or {}
         self._filters = filters or {}
         self._failure_strategy = failure_strategy
+        self._failure_budget = normalize_failure_budget(failure_budget, CoreError)
+        self._batch_size = normalize_batch_size(batch_size, CoreError)
+        self._batch_gate = batch_gate
+        self._execution_strategy = (
+            normalize_execution_strategy(execution_strategy, CoreError) if execution_strategy else None
+        )
+        self._shards = normalize_shards(shards, CoreError)
+        self._distributed = get_transport(distributed) if distributed else None
+        self._connection_pool = connection_pool
         self._dry_run = dry_run
         self._no_redact = no_redact
+        self._output_mode = OutputMode(output_mode) if output_mode else None
         self._processors = processors
+        self._processor_configs = processors
         self._workflow = None
         self._workflow_path = None
         self._nornir_configs = None
         self._nornir_manager = None
         self._package_loader = None
+        self._catalog_index = None
         self._var_processor = None
         self._failure_strategy_processor = None
         self._hook_processor = None
@@ -222,11 +314,18 @@ class NornFlow:
     def _initialize_catalogs(self) -> None:
         """Initialize and load catalogs."""
         logger.debug("Initializing catalogs")
+        if self.settings.catalog_index_file:
+            self._catalog_index = CatalogIndex(self.settings.catalog_index_file)
         self._load_tasks_catalog()
         self._load_filters_catalog()
         self._load_workflows_catalog()
         self._load_blueprints_catalog()
         self._load_hooks_catalog()
+        if self._catalog_index is not None:
+            logger.debug(
+                f"Catalog index: {self._catalog_index.hits} hits, {self._catalog_index.misses} misses"
+            )
+            self._catalog_index.save()
         # Note: j2_filters_catalog is handled by Jinja2Service
         # and doesn't need a separate load method.
 
@@ -267,6 +366,7 @@ class NornFlow:
 
         self._nornir_manager = NornirManager(
             nornir_settings=self.nornir_config_file,
+            shared_inventory_cache=INVENTORY_CACHE if self.settings.inventory_cache else None,
             **self._nornir_configs,
         )
 
@@ -304,6 +404,7 @@ class NornFlow:
                 DefaultNornFlowProcessor(
                     redaction_enabled=self.redaction_enabled,
                     sensitive_names=self.redaction_sensitive_names,
+                    output_mode=self.output_mode,
                 )
             ]
             return
@@ -313,6 +414,7 @@ class NornFlow:
             for processor_config in processors_list:
                 processor = load_processor(processor_config)
                 self._sync_processor_redaction(processor)
+                self._sync_processor_output_mode(processor)
                 self._processors.append(processor)
         except ProcessorError as err:
             raise InitializationError(f"Failed to load processor: {err}") from err
@@ -501,6 +603,222 @@ class NornFlow:
         self._failure_strategy = value
         self._failure_strategy_processor = None
 
+    @property
+    def failure_budget(self) -> FailureBudget | None:
+        """
+        Get the effective failure budget based on precedence chain.
+
+        Only used by the 'failure-budget' failure strategy.
+
+        Precedence (highest to lowest):
+        1. Failure budget passed to the NornFlow constructor
+        2. Workflow failure budget
+        3. Settings failure budget
+
+        Returns:
+            FailureBudget | None: The effective failure budget, if any.
+        """
+        if self._failure_budget:
+            return self._failure_budget
+        if self.workflow and self.workflow.failure_budget:
+            return self.workflow.failure_budget
+        return self.settings.failure_budget
+
+    @failure_budget.setter
+    def failure_budget(self, value: FailureBudget | str | int | dict[str, Any] | None) -> None:
+        """
+        Set the failure budget override.
+
+        Args:
+            value: A FailureBudget or any value accepted by normalize_failure_budget.
+
+        Raises:
+            CoreError: If value is not a valid failure budget.
+        """
+        self._failure_budget = normalize_failure_budget(value, CoreError)
+        self._failure_strategy_processor = None
+
+    def _strategy_failure_budget(self) -> FailureBudget | None:
+        """Return the failure budget when the effective strategy uses one, else None."""
+        if self.failure_strategy == FailureStrategy.FAILURE_BUDGET:
+            return self.failure_budget
+        return None
+
+    @property
+    def batch_size(self) -> BatchSize | None:
+        """
+        Get the effective batch size based on precedence chain.
+
+        When set, the workflow is rolled out in serial batches instead of running
+        each task over the whole inventory at once.
+
+        Precedence (highest to lowest):
+        1. Batch size passed to the NornFlow constructor
+        2. Workflow batch size
+        3. Settings batch size
+
+        Returns:
+            BatchSize | None: The effective batch size, or None to run unbatched.
+        """
+        if self._batch_size:
+            return self._batch_size
+        if self.workflow and self.workflow.batch_size:
+            return self.workflow.batch_size
+        return self.settings.batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: BatchSize | str | int | None) -> None:
+        """
+        Set the batch size override.
+
+        Args:
+            value: A BatchSize or any value accepted by normalize_batch_size.
+
+        Raises:
+            CoreError: If value is not a valid batch size.
+        """
+        self._batch_size = normalize_batch_size(value, CoreError)
+
+    @property
+    def batch_gate(self) -> BatchGate | None:
+        """
+        Get the callable deciding whether a rollout continues after each batch.
+
+        Returns:
+            BatchGate | None: The gate, or None to always continue.
+        """
+        return self._batch_gate
+
+    @batch_gate.setter
+    def batch_gate(self, value: BatchGate | None) -> None:
+        """
+        Set the callable deciding whether a rollout continues after each batch.
+
+        Args:
+            value: Callable receiving a BatchProgress and returning False to abort,
+                or None to always continue.
+
+        Raises:
+            CoreError: If value is neither callable nor None.
+        """
+        if value is not None and not callable(value):
+            raise CoreError(f"Batch gate must be callable, got {type(value).__name__}", component="NornFlow")
+        self._batch_gate = value
+
+    @property
+    def execution_strategy(self) -> ExecutionStrategy:
+        """
+        Get the effective execution strategy based on precedence chain.
+
+        Precedence (highest to lowest):
+        1. Execution strategy passed to the NornFlow constructor
+        2. Workflow execution strategy
+        3. Settings execution strategy
+
+        Returns:
+            ExecutionStrategy: The effective execution strategy.
+        """
+        if self._execution_strategy:
+            return self._execution_strategy
+        if self.workflow and self.workflow.execution_strategy:
+            return self.workflow.execution_strategy
+        return self.settings.execution_strategy
+
+    @execution_strategy.setter
+    def execution_strategy(self, value: ExecutionStrategy | str | None) -> None:
+        """
+        Set the execution strategy override.
+
+        Args:
+            value: ExecutionStrategy enum value or its string form, or None to clear it.
+
+        Raises:
+            CoreError: If value is not a valid execution strategy.
+        """
+        self._execution_strategy = normalize_execution_strategy(value, CoreError) if value else None
+
+    @property
+    def shards(self) -> int | None:
+        """
+        Get the effective number of shards based on precedence chain.
+
+        With more than one shard, the workflow runs in that many worker processes,
+        each over its share of the filtered inventory.
+
+        Precedence (highest to lowest):
+        1. Shards passed to the NornFlow constructor
+        2. Settings shards
+
+        Returns:
+            int | None: The effective number of shards, or None to run in-process.
+        """
+        return self._shards or self.settings.shards
+
+    @shards.setter
+    def shards(self, value: int | str | None) -> None:
+        """
+        Set the shards override.
+
+        Args:
+            value: A number of worker processes, 'auto' for one per CPU core, or None
+                to clear it.
+
+        Raises:
+            CoreError: If value is not a valid shard count.
+        """
+        self._shards = normalize_shards(value, CoreError)
+
+    @property
+    def distributed(self) -> Transport | None:
+        """
+        Get the transport workers of a distributed run connect through.
+
+        Returns:
+            Transport | None: The transport, or None when the run is not distributed.
+        """
+        return self._distributed
+
+    @distributed.setter
+    def distributed(self, value: Transport | str | None) -> None:
+        """
+        Set the address or transport to coordinate a distributed run on.
+
+        Args:
+            value: An address URL (e.g. 'tcp://0.0.0.0:7300'), a Transport, or None
+                to run on this machine only.
+
+        Raises:
+            CoreError: If the address is invalid or no shared secret is configured.
+        """
+        self._distributed = get_transport(value) if value else None
+
+    @property
+    def connection_pool(self) -> ConnectionPool | None:
+        """
+        Get the pool keeping device connections open between runs.
+
+        Returns:
+            ConnectionPool | None: The pool, or None when connections are closed after each run.
+        """
+        return self._connection_pool
+
+    @connection_pool.setter
+    def connection_pool(self, value: ConnectionPool | None) -> None:
+        """
+        Set the pool keeping device connections open between runs.
+
+        Args:
+            value: The pool, or None to close connections after each run.
+
+        Raises:
+            CoreError: If value is neither a ConnectionPool nor None.
+        """
+        if value is not None and not isinstance(value, ConnectionPool):
+            raise CoreError(
+                f"Connection pool must be a ConnectionPool, got {type(value).__name__}", component="NornFlow"
+            )
+        self._connection_pool = value
+
     @property
     def dry_run(self) -> bool:
         """
@@ -560,6 +878,27 @@ class NornFlow:
         if hasattr(processor, "sensitive_names"):
             processor.sensitive_names = self.redaction_sensitive_names
 
+    @property
+    def output_mode(self) -> OutputMode:
+        """Which per-host task results console output processors print for this session.
+
+        Returns:
+            The mode passed to the constructor, or OutputMode.FULL when none was given.
+        """
+        return self._output_mode or OutputMode.FULL
+
+    def _sync_processor_output_mode(self, processor: Any) -> None:
+        """Apply the session output mode to a processor that supports it.
+
+        Only an explicitly requested mode (e.g. '--output') is applied, so an
+        'output_mode' given in a processor's own 'args' is kept otherwise.
+
+        Args:
+            processor: A Nornir processor instance, if it exposes an 'output_mode' attribute.
+        """
+        if self._output_mode is not None and hasattr(processor, "output_mode"):
+            processor.output_mode = self.output_mode
+
     @property
     def var_processor(self) -> NornFlowVariableProcessor | None:
         """
@@ -589,9 +928,24 @@ class NornFlow:
                 self.failure_strategy,
                 redaction_enabled=self.redaction_enabled,
                 sensitive_names=self.redaction_sensitive_names,
+                failure_budget=self._strategy_failure_budget(),
             )
         return self._failure_strategy_processor
 
+    @property
+    def cancellation_token(self) -> CancellationToken:
+        """
+        Get the token cancelled when FAIL_FAST halts the workflow.
+
+        The token is owned by the failure strategy processor and shared with the
+        runner installed by _apply_runner. Every run() starts with a new failure
+        strategy processor, and so with a new token.
+
+        Returns:
+            CancellationToken: The cancellation token for the current run.
+        """
+        return self.failure_strategy_processor.cancellation_token
+
     @property
     def hook_processor(self) -> NornFlowHookProcessor:
         """
@@ -835,6 +1189,7 @@ class NornFlow:
         locations: list[tuple[str, str, str]] | None = None,
         recursive: bool = False,
         check_empty: bool = False,
+        ast_predicate: Any = None,
     ) -> Any:
         """
         Generic method to load a catalog with common logic for discovery and error handling.
@@ -849,6 +1204,11 @@ class NornFlow:
             locations: List of (namespace, directory_path, tier) tuples to scan.
             recursive: Whether to scan directories recursively (for FileCatalog).
             check_empty: Whether to raise an error if the catalog ends up empty.
+            ast_predicate: AST counterpart of 'predicate' (for CallableCatalog). When given
+                and the 'lazy_catalogs' setting is on, modules are scanned instead of
+                imported, and only imported when one of their items is resolved.
+                Scan results (and file catalog descriptions) are reused from the
+                catalog index when 'catalog_index_file' is set.
 
         Returns:
             The loaded catalog instance.
@@ -886,6 +1246,7 @@ class NornFlow:
                         is_package=is_package,
                         namespace=namespace,
                         tier=tier,
+                        index=self._catalog_index,
                     )
                 else:
                     catalog.discover_items_in_dir(
@@ -894,6 +1255,9 @@ class NornFlow:
                         transform_item=transform_item,
                         namespace=namespace,
                         tier=tier,
+                        lazy=self.settings.lazy_catalogs,
+                        ast_predicate=ast_predicate,
+                        index=self._catalog_index,
                     )
             except Exception as e:
                 logger.exception(f"Error loading {name} from {dir_path}: {e!s}")
@@ -955,6 +1319,7 @@ class NornFlow:
             predicate=is_nornir_task,
             locations=self._build_catalog_locations("tasks", self.settings.local_tasks),
             check_empty=True,
+            ast_predicate=is_nornir_task_node,
         )
 
     def _load_filters_catalog(self) -> None:
@@ -966,6 +1331,7 @@ class NornFlow:
             predicate=is_nornir_filter,
             transform_item=process_filter,
             locations=self._build_catalog_locations("filters", self.settings.local_filters),
+            ast_predicate=is_nornir_filter_node,
         )
 
     def _load_workflows_catalog(self) -> None:
@@ -1048,12 +1414,12 @@ class NornFlow:
             )
 
     def _apply_filters(self) -> None:
-        """Apply inventory filters to the Nornir manager."""
+        """Apply inventory filters to the Nornir manager, all in one pass."""
         logger.debug("Applying inventory filters")
         filter_kwargs_list = self._get_filtering_kwargs()
 
-        for filter_kwargs in filter_kwargs_list:
-            self.nornir_manager.apply_filters(**filter_kwargs)
+        if filter_kwargs_list:
+            self.nornir_manager.apply_filter_chain(filter_kwargs_list)
 
     def _get_filtering_kwargs(self) -> list[dict[str, Any]]:
         """
@@ -1195,6 +1561,7 @@ class NornFlow:
             inline_workflow_vars=dict(self.workflow.vars) if self.workflow.vars else {},
             workflow_path=self.workflow_path,
             workflow_roots=self.settings.local_workflows,
+            native_templates=self.settings.native_templates,
         )
 
     def _apply_processors(self) -> None:
@@ -1236,6 +1603,7 @@ class NornFlow:
                 for processor_config in self.workflow.processors:
                     processor = load_processor(dict(processor_config))
                     self._sync_processor_redaction(processor)
+                    self._sync_processor_output_mode(processor)
                     workflow_processors.append(processor)
 
                 if workflow_processors:
@@ -1249,32 +1617,458 @@ class NornFlow:
 
         self.nornir_manager.apply_processors(all_processors)
 
+    def _apply_runner(self) -> None:
+        """
+        Replace Nornir's ThreadedRunner with a CancellableThreadedRunner.
+
+        The replacement keeps the configured 'num_workers' and observes
+        cancellation_token, so a FAIL_FAST failure stops dispatching queued hosts
+        instead of letting each of them be started and skipped. An AsyncioRunner is
+        rebuilt with its configured options to observe the same token. Any other
+        runner configured in the Nornir config file is left untouched.
+        """
+        try:
+            runner = self.nornir_manager.nornir.runner
+        except PluginNotRegistered:
+            return
+        if isinstance(runner, AsyncioRunner):
+            self.nornir_manager.apply_runner(
+                AsyncioRunner(
+                    runner.num_workers,
+                    max_concurrency=runner.max_concurrency,
+                    cancellation_token=self.cancellation_token,
+                    grace_period=self.settings.cancel_grace_period,
+                )
+            )
+            return
+        if type(runner) is not ThreadedRunner:
+            logger.debug(f"Keeping configured runner {type(runner).__name__}")
+            return
+
+        self.nornir_manager.apply_runner(
+            CancellableThreadedRunner(
+                runner.num_workers,
+                cancellation_token=self.cancellation_token,
+                grace_period=self.settings.cancel_grace_period,
+            )
+        )
+
     def _orchestrate_execution(self) -> None:
         """Orchestrate the execution of workflow tasks in sequence."""
         logger.info("Starting workflow execution")
+        # Sharded and distributed runs connect to devices from their worker processes
+        in_process = not self.distributed and self._shard_count() == 1
+        self.nornir_manager.connection_pool = self.connection_pool if in_process else None
         with self.nornir_manager:
-            for task in self.workflow.tasks:
-                self.nornir_manager.set_dry_run(self.dry_run)
+            if self.distributed:
+                self._orchestrate_distributed(self.distributed)
+            elif self._shard_count() > 1:
+                self._orchestrate_shards(self._shard_count())
+            elif self.batch_size:
+                self._orchestrate_batches(self.batch_size)
+            else:
+                self._run_workflow_tasks()
+
+    def _shard_count(self) -> int:
+        """Return how many worker processes the current inventory is split across (1 when unsharded)."""
+        return min(self.shards or 1, len(self.nornir_manager.nornir.inventory.hosts)) or 1
 
-                task.run(
-                    nornir_manager=self.nornir_manager,
-                    vars_manager=self.var_processor.vars_manager,
-                    tasks_catalog=self.tasks_catalog,
+    def _check_sharding(self) -> None:
+        """
+        Reject options that a sharded or distributed run cannot honor.
+
+        Raises:
+            CoreError: If more than one shard, or a distributed run, is combined with
+                a batch size, or if a distributed run is also sharded.
+        """
+        if self.distributed and (self.shards or 1) > 1:
+            raise CoreError(
+                "A distributed run cannot also be sharded: the coordinator hands out the hosts. "
+                "Use either 'shards' or 'distributed'.",
+                component="NornFlow",
+            )
+        if self.distributed and self.batch_size:
+            raise CoreError(
+                "A distributed run cannot be combined with a batch size: workers run their batches "
+                "concurrently. Use either 'distributed' or 'batch_size'.",
+                component="NornFlow",
+            )
+        if (self.shards or 1) > 1 and self.batch_size:
+            raise CoreError(
+                "Sharded execution cannot be combined with a batch size: each shard would roll out "
+                "its own batches. Use either 'shards' or 'batch_size'.",
+                component="NornFlow",
+            )
+
+    def _orchestrate_shards(self, shards: int) -> None:
+        """
+        Run the workflow in several worker processes, each over part of the inventory.
+
+        The filtered inventory is dealt across 'shards' worker processes by
+        partition_hosts. Each worker rebuilds NornFlow from this instance's
+        constructor arguments, with its own Nornir inventory and processor chain,
+        and runs the workflow over its hosts (see _run_shard). While the shards
+        run, their processors relay messages (e.g. output to print) to the
+        processor at the same position in this instance's chain. Once they are
+        done, each shard's failed hosts, runtime variables and processor reports
+        are merged here, so the summary and return code cover the whole run.
+
+        A halting failure strategy halts every shard, with the failure budget
+        counted across all of them.
+
+        Args:
+            shards: Number of worker processes.
+
+        Raises:
+            CoreError: If a shard failed or its worker process died.
+        """
+        partitions = partition_hosts(list(self.nornir_manager.nornir.inventory.hosts), shards)
+        coordinator = ShardCoordinator(
+            partitions,
+            nornflow_kwargs=self._shard_nornflow_kwargs(),
+            workflow=self.workflow,
+            workflow_path=self.workflow_path,
+            cancellation_token=self.cancellation_token,
+        )
+        logger.info(f"Running the workflow in {len(partitions)} shards")
+        coordinator.run(self._receive_shard_message)
+
+        for index in sorted(coordinator.reports):
+            self._merge_shard_report(coordinator.reports[index])
+
+        if coordinator.errors:
+            index, error = min(coordinator.errors.items())
+            raise CoreError(
+                f"{len(coordinator.errors)} of {len(partitions)} shard(s) did not complete. "
+                f"Shard {index}: {error.strip().splitlines()[-1]}",
+                component="NornFlow",
+            )
+
+    def _orchestrate_distributed(self, transport: Transport) -> None:
+        """
+        Coordinate a distributed run: hand the filtered inventory to workers on other machines.
+
+        The hosts are split into batches that DistributedCoordinator hands out to
+        the workers connecting through 'transport', one batch per worker at a time.
+        Workers build their NornFlow from their own settings and this instance's
+        run options, so every machine needs the same NornFlow project. Output is
+        relayed, and reports are merged, exactly as for shards (see
+        _orchestrate_shards), so the summary and return code cover the whole run.
+
+        A halting failure strategy halts every worker, with the failure budget
+        counted across all of them. Hosts of batches that were never handed out
+        because execution halted count as failed, like hosts cancelled before
+        they started in a single-machine run.
+
+        The coordinator gives up once no worker has been connected for the
+        'distributed_worker_timeout' setting's seconds while batches are left.
+
+        Args:
+            transport: Transport workers connect through.
+
+        Raises:
+            CoreError: If a batch failed, its worker disconnected, or no worker
+                connected in time to run it.
+        """
+        nornflow_kwargs = self._shard_nornflow_kwargs()
+        # Workers use the settings of their own copy of the project
+        del nornflow_kwargs["nornflow_settings"]
+        coordinator = DistributedCoordinator(
+            transport,
+            list(self.nornir_manager.nornir.inventory.hosts),
+            nornflow_kwargs=nornflow_kwargs,
+            workflow=self.workflow,
+            workflow_path=self.workflow_path,
+            cancellation_token=self.cancellation_token,
+            worker_timeout=self.settings.distributed_worker_timeout,
+        )
+        coordinator.run(self._receive_shard_message)
+
+        for index in sorted(coordinator.reports):
+            self._merge_shard_report(coordinator.reports[index])
+        self.nornir_manager.nornir.data.failed_hosts.update(coordinator.unrun_hosts)
+        logger.info(
+            "Batches run per worker: "
+            + ", ".join(f"{name}={count}" for name, count in coordinator.workers.items())
+        )
+
+        if coordinator.errors:
+            index, error = min(coordinator.errors.items())
+            raise CoreError(
+                f"{len(coordinator.errors)} of {len(coordinator.batches)} batch(es) did not complete. "
+                f"Batch {index}: {error.strip().splitlines()[-1]}",
+                component="NornFlow",
+            )
+
+    def _shard_nornflow_kwargs(self) -> dict[str, Any]:
+        """Return the constructor arguments shard workers rebuild this instance from."""
+        return {
+            "nornflow_settings": self.settings,
+            "processors": self._processor_configs,
+            "vars": self._vars,
+            "filters": self._filters,
+            "failure_strategy": self._failure_strategy,
+            "failure_budget": self._failure_budget,
+            "execution_strategy": self._execution_strategy,
+            "dry_run": self._dry_run,
+            "no_redact": self._no_redact,
+            "output_mode": self._output_mode,
+        }
+
+    def _receive_shard_message(self, processor_index: int, message: Any) -> None:
+        """Hand a message sent by a shard's processor to the processor at the same position here."""
+        processor = self.nornir_manager.nornir.processors[processor_index]
+        if hasattr(processor, "receive_shard_message"):
+            processor.receive_shard_message(message)
+
+    def _merge_shard_report(self, report: dict[str, Any]) -> None:
+        """Merge a shard's failed hosts, runtime variables and processor reports into this instance."""
+        self.nornir_manager.nornir.data.failed_hosts.update(report["failed_hosts"])
+
+        vars_manager = self.var_processor.vars_manager
+        for host_name, runtime_vars in report["runtime_vars"].items():
+            vars_manager.get_device_context(host_name).runtime_vars.update(runtime_vars)
+
+        processors = self.nornir_manager.nornir.processors
+        for index, processor_report in report["processors"].items():
+            if hasattr(processors[index], "merge_shard_report"):
+                processors[index].merge_shard_report(processor_report)
+
+    def _run_shard(self, shard: Shard) -> dict[str, Any]:
+        """
+        Run the workflow as one shard of a sharded run, inside its worker process.
+
+        Mirrors run() over the shard's hosts, without the overview and summary,
+        which the parent prints for the whole run. Processors with a start_shard()
+        method are told they run in a shard before the first task, and the report
+        returned by their finish_shard() is merged into the parent's processor at
+        the same position. Other processors print their summary here.
+
+        Runtime variables that cannot be pickled stay in the shard.
+
+        Args:
+            shard: The shard to run.
+
+        Returns:
+            The shard's report: failed hosts, runtime variables per host and
+            processor reports keyed by position in the processor chain.
+        """
+        self._workflow = shard.workflow
+        self._workflow_path = shard.workflow_path
+        log_name = self._workflow.name.replace(" ", "_")
+        logger.update_execution_context(execution_name=f"{log_name}_shard{shard.index}")
+        logger.info(f"Running shard {shard.index}/{shard.count} over {len(shard.hosts)} host(s)")
+
+        self._check_tasks()
+        self._initialize_nornir()
+        self.nornir_manager.apply_filters(filter_func=in_batch, batch_hosts=frozenset(shard.hosts))
+        self._apply_processors()
+        self._apply_runner()
+        shard.link(self.cancellation_token)
+
+        processors = self.nornir_manager.nornir.processors
+        for index, processor in enumerate(processors):
+            if hasattr(processor, "start_shard"):
+                processor.start_shard(shard, partial(shard.post, index))
+        try:
+            with self.nornir_manager:
+                self._run_workflow_tasks()
+        finally:
+            self._flush_processor_output()
+
+        vars_manager = self.var_processor.vars_manager
+        runtime_vars = {}
+        for host_name in shard.hosts:
+            host_vars = vars_manager.get_device_context(host_name).runtime_vars
+            runtime_vars[host_name] = {name: value for name, value in host_vars.items() if picklable(value)}
+            for name in host_vars.keys() - runtime_vars[host_name].keys():
+                logger.warning(f"Runtime variable '{name}' of host '{host_name}' cannot leave its shard")
+
+        processor_reports = {}
+        for index, processor in enumerate(processors):
+            if hasattr(processor, "finish_shard"):
+                processor_reports[index] = processor.finish_shard()
+            elif hasattr(processor, "print_final_workflow_summary"):
+                processor.print_final_workflow_summary()
+
+        return {
+            "failed_hosts": set(self.nornir_manager.nornir.data.failed_hosts),
+            "runtime_vars": runtime_vars,
+            "processors": processor_reports,
+        }
+
+    def _run_workflow_tasks(self) -> None:
+        """Run every workflow task, in order, over the current inventory."""
+        if self.execution_strategy == ExecutionStrategy.FREE:
+            self._run_workflow_pipelined()
+            return
+
+        for task in self.workflow.tasks:
+            if self.cancellation_token.cancelled:
+                logger.info(f"Execution cancelled; not starting task '{task.name}' or any later task")
+                break
+            self.nornir_manager.set_dry_run(self.dry_run)
+
+            task.run(
+                nornir_manager=self.nornir_manager,
+                vars_manager=self.var_processor.vars_manager,
+                tasks_catalog=self.tasks_catalog,
+            )
+
+    def _run_workflow_pipelined(self) -> None:
+        """
+        Run the workflow with the 'free' execution strategy.
+
+        Every task is prepared up front and handed to a HostPipeline, which lets
+        each host run the whole task list without waiting for the other hosts.
+        Tasks sharing a task function are named after their canonical id, so
+        processors can tell their concurrent runs apart.
+        """
+        if self.cancellation_token.cancelled:
+            logger.info("Execution cancelled; not starting the workflow tasks")
+            return
+        self.nornir_manager.set_dry_run(self.dry_run)
+
+        workflow_tasks = self.workflow.tasks
+        function_names = [task.resolve_task_func(self.tasks_catalog).__name__ for task in workflow_tasks]
+        name_counts = Counter(function_names)
+        pipeline_tasks = [
+            task.prepare(
+                nornir_manager=self.nornir_manager,
+                vars_manager=self.var_processor.vars_manager,
+                tasks_catalog=self.tasks_catalog,
+                name=task.canonical_id if name_counts[function_name] > 1 else None,
+            )
+            for task, function_name in zip(workflow_tasks, function_names, strict=True)
+        ]
+
+        nornir = self.nornir_manager.nornir
+        try:
+            num_workers = nornir.runner.num_workers
+        except (AttributeError, PluginNotRegistered):
+            num_workers = DEFAULT_PIPELINE_WORKERS
+        logger.info(f"Running {len(pipeline_tasks)} task(s) host by host with {num_workers} worker(s)")
+        HostPipeline(
+            nornir,
+            pipeline_tasks,
+            num_workers=num_workers,
+            cancellation_token=self.cancellation_token,
+            stop_on_failure=self.failure_strategy != FailureStrategy.RUN_ALL,
+        ).run()
+
+    def _orchestrate_batches(self, batch_size: BatchSize) -> None:
+        """
+        Roll the workflow out in serial batches.
+
+        The filtered inventory is carved into batches by NornirManager.iter_batches
+        and the full task list runs over each batch before the next one starts.
+        Between batches the rollout waits 'batch_pause' seconds and then consults
+        batch_gate, so a bad change can be stopped before it reaches the rest of
+        the inventory. A halting failure strategy (fail-fast, failure-budget) also
+        stops the rollout, with the failure budget measured against the whole
+        inventory rather than a single batch.
+
+        Args:
+            batch_size: The effective batch size.
+        """
+        total_hosts = len(self.nornir_manager.nornir.inventory.hosts)
+        hosts_per_batch = batch_size.hosts_per_batch(total_hosts)
+        total_batches = count_batches(total_hosts, hosts_per_batch)
+        if self.failure_strategy == FailureStrategy.FAILURE_BUDGET:
+            self.failure_strategy_processor.resolve_failure_budget(total_hosts)
+        # Processors would otherwise count the hosts of the first batch only
+        for processor in self.nornir_manager.nornir.processors:
+            if hasattr(processor, "total_hosts"):
+                processor.total_hosts = total_hosts
+
+        remaining_hosts = total_hosts
+        for number, batch in enumerate(self.nornir_manager.iter_batches(hosts_per_batch), start=1):
+            logger.info(f"Starting batch {number}/{total_batches} with {len(batch)} host(s)")
+            print_batch_started(number, total_batches, batch)
+            self.failure_strategy_processor.failed_host_names.clear()
+            self._run_workflow_tasks()
+
+            # RUN_ALL resets Nornir's failed_hosts before every task, so hosts that
+            # failed an earlier task of the batch are only known to the processor
+            failed_hosts = self.nornir_manager.nornir.data.failed_hosts
+            failed_hosts = failed_hosts | self.failure_strategy_processor.failed_host_names
+            remaining_hosts -= len(batch)
+            progress = BatchProgress(
+                number=number,
+                total=total_batches,
+                hosts=batch,
+                failed_hosts=tuple(host for host in batch if host in failed_hosts),
+                remaining_hosts=remaining_hosts,
+            )
+            self._flush_processor_output()
+            print_batch_completed(progress)
+            logger.info(
+                f"Batch {number}/{total_batches} completed with {len(progress.failed_hosts)} failed host(s)"
+            )
+
+            if number == total_batches:
+                break
+            if self.cancellation_token.cancelled:
+                logger.info(f"Execution cancelled; not starting the remaining {remaining_hosts} host(s)")
+                break
+            if not self._pass_batch_gate(progress):
+                logger.warning(
+                    f"Rollout aborted after batch {number}/{total_batches}; "
+                    f"{remaining_hosts} host(s) were not run"
                 )
+                break
+
+    def _pass_batch_gate(self, progress: BatchProgress) -> bool:
+        """
+        Pause between batches and ask batch_gate whether the rollout continues.
+
+        The pause returns early if execution is cancelled in the meantime.
+
+        Args:
+            progress: Progress reported for the batch that just completed.
+
+        Returns:
+            bool: True to start the next batch, False to abort the rollout.
+        """
+        pause = self.settings.batch_pause
+        if pause and self.cancellation_token.wait(pause):
+            return False
+        if self.batch_gate is None:
+            return True
+        return bool(self.batch_gate(progress))
 
     def _print_workflow_overview(self) -> None:
         """Print the workflow overview before execution."""
+        hosts_count = len(self.nornir_manager.nornir.inventory.hosts)
+        batch_size = self.batch_size
+        batches_count = 0
+        if batch_size:
+            batches_count = count_batches(hosts_count, batch_size.hosts_per_batch(hosts_count))
         print_workflow_overview(
             workflow_model=self.workflow,
             effective_dry_run=self.dry_run,
-            hosts_count=len(self.nornir_manager.nornir.inventory.hosts),
+            hosts_count=hosts_count,
             inventory_filters=self.filters or self.workflow.inventory_filters or {},
             vars_manager=self.var_processor.vars_manager,
             failure_strategy=self.failure_strategy,
             redaction_enabled=self.redaction_enabled,
             sensitive_names=self.redaction_sensitive_names,
+            failure_budget=self._strategy_failure_budget(),
+            batch_size=batch_size,
+            batches_count=batches_count,
+            execution_strategy=self.execution_strategy,
+            shards=self._shard_count(),
+            distributed=self.distributed.address if self.distributed else None,
         )
 
+    def _flush_processor_output(self) -> None:
+        """
+        Wait for processors with asynchronous output to print everything queued so far.
+        """
+        for processor in self.nornir_manager.nornir.processors:
+            if hasattr(processor, "flush_output"):
+                processor.flush_output()
+
     def _print_workflow_summary(self) -> None:
         """
         Print the final workflow summary by invoking summary methods on processors.
@@ -1353,9 +2147,15 @@ class NornFlow:
         4. Applies inventory filters
         5. Sets up variable management
         6. Configures processors
-        7. Executes tasks in sequence
-        8. Calls print_final_workflow_summary on processors that support it
-        9. Returns exit code based on execution results
+        7. Installs a cancellable runner (see _apply_runner)
+        8. Executes tasks in sequence, stopping early once execution is cancelled.
+           With a batch size, the full task list runs over one batch of hosts at a
+           time (see _orchestrate_batches). With several shards, the inventory is
+           split across worker processes whose results are merged back here (see
+           _orchestrate_shards). In a distributed run, batches of hosts are handed
+           to workers on other machines instead (see _orchestrate_distributed)
+        9. Calls print_final_workflow_summary on processors that support it
+        10. Returns exit code based on execution results
 
         Exit Codes:
         - 0: Success (all tasks passed)
@@ -1376,10 +2176,19 @@ class NornFlow:
             )
 
         self._check_tasks()
+        self._check_sharding()
+        # A token cancelled by an earlier run (e.g. a FAIL_FAST halt) must not stop
+        # this one; the processor's failure counts and errors are per run as well
+        self._failure_strategy_processor = None
         self._initialize_nornir()
         self._apply_filters()
         self._apply_processors()
+        self._apply_runner()
         self._print_workflow_overview()
-        self._orchestrate_execution()
+        try:
+            self._orchestrate_execution()
+        finally:
+            # Print results still queued by asynchronous processors even if execution aborts
+            self._flush_processor_output()
         self._print_workflow_summary()
         return self._get_return_code()
@@ -1,12 +1,23 @@
+import copy
+from collections.abc import Iterator
 from typing import Any
 
 from nornir import InitNornir
 from nornir.core import Nornir
+from nornir.core.configuration import Config
+from nornir.core.inventory import Hosts, Inventory
+from nornir.core.plugins.connections import ConnectionPluginRegister
 from nornir.core.processor import Processor
+from nornir.core.state import GlobalState
+from nornir.init_nornir import load_runner
 from typing_extensions import Self
 
+from nornflow.batching import in_batch
+from nornflow.connection_pool import ConnectionPool
 from nornflow.constants import NORNFLOW_SETTINGS_OPTIONAL
 from nornflow.exceptions import CoreError, ProcessorError
+from nornflow.inventory_cache import InventoryCache
+from nornflow.inventory_index import get_selector, InventoryIndex, matches_all_filters
 from nornflow.logger import logger
 from nornflow.utils import find_processor_by_type
 
@@ -23,20 +34,33 @@ class NornirManager:
     - Creating and initializing Nornir objects from configuration files
     - Applying inventory filters (both direct attribute and function-based)
     - Managing processor application to Nornir instances
-    - Properly managing connection lifecycle through context manager support
+    - Properly managing connection lifecycle through context manager support,
+      optionally keeping connections open between runs in a ConnectionPool
 
     The filtering system supports:
     - Direct attribute filtering on any host property
     - Custom filter functions with flexible parameter passing
     - Sequential application of multiple filters with AND logic
+    - Index fast paths (see InventoryIndex) for filters that register one, such
+      as the builtin 'hosts' and 'groups' filters and batch selection
     """
 
-    def __init__(self, nornir_settings: str, **kwargs):
+    def __init__(
+        self,
+        nornir_settings: str,
+        connection_pool: ConnectionPool | None = None,
+        shared_inventory_cache: InventoryCache | None = None,
+        **kwargs,
+    ):
         """
         Initialize the NornirManager with a Nornir configuration.
 
         Args:
             nornir_settings: Path to Nornir config file (YAML)
+            connection_pool: Pool that hands connections to the hosts on entering
+                the context manager and takes them back instead of closing them.
+            shared_inventory_cache: Cache to take the inventory from, instead of
+                loading it again when an earlier run already did.
             **kwargs: Additional arguments to pass to InitNornir
         """
         logger.info("Initializing NornirManager")
@@ -48,21 +72,56 @@ class NornirManager:
         # Store settings
         self.nornir_settings = nornir_settings
         self.kwargs = kwargs
+        self.connection_pool = connection_pool
+        self._inventory_index: InventoryIndex | None = None
 
         # Create regular Nornir instance
-        self.nornir = InitNornir(
-            config_file=self.nornir_settings,
-            **kwargs,
-        )
+        if shared_inventory_cache is None:
+            self.nornir = InitNornir(
+                config_file=self.nornir_settings,
+                **kwargs,
+            )
+        else:
+            self.nornir = self._init_nornir_with_cached_inventory(shared_inventory_cache)
         logger.info("NornirManager initialized")
 
+    def _init_nornir_with_cached_inventory(self, inventory_cache: InventoryCache) -> Nornir:
+        """
+        Build the Nornir instance like InitNornir does, taking the inventory from a cache.
+
+        The configuration, runner and global state are built fresh for every
+        manager; only the (expensive to load) inventory is shared.
+
+        Args:
+            inventory_cache: Cache to take the inventory from.
+
+        Returns:
+            Nornir: The Nornir instance.
+        """
+        kwargs = dict(self.kwargs)
+        dry_run = kwargs.pop("dry_run", False)
+        ConnectionPluginRegister.auto_register()
+        config = Config.from_file(self.nornir_settings, **kwargs)
+        config.logging.configure()
+        return Nornir(
+            inventory=inventory_cache.load(config),
+            runner=load_runner(config),
+            config=config,
+            data=GlobalState(dry_run=dry_run),
+        )
+
     def __enter__(self) -> Self:
         """
         Enter the context manager protocol.
 
+        With a connection pool, the pooled connections of the inventory's hosts
+        are handed to them, so tasks reuse them instead of connecting again.
+
         Returns:
             self: The NornirManager instance for use in the context block
         """
+        if self.connection_pool is not None:
+            self.connection_pool.checkout(self.nornir.inventory.hosts.values())
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -85,8 +144,13 @@ class NornirManager:
         Close all Nornir connections to prevent resources from hanging.
 
         This implementation silently closes connections without producing
-        task output to keep the user interface clean.
+        task output to keep the user interface clean. With a connection pool,
+        the connections are handed over to the pool instead of being closed.
         """
+        if self.connection_pool is not None and hasattr(self, "nornir"):
+            self.connection_pool.checkin(self.nornir.inventory.hosts.values())
+            logger.info("Returned Nornir connections to the connection pool")
+            return
         logger.info("Closing Nornir connections")
         if hasattr(self, "nornir"):
             # Store original processors
@@ -100,8 +164,9 @@ class NornirManager:
                 # Close connections
                 self.nornir.close_connections(on_good=True, on_failed=True)
             finally:
-                # Restore processors
-                self.nornir.processors = original_processors
+                # Restore processors in place: filtered Nornir objects (e.g. batches)
+                # share the same Processors list with the inventory they came from
+                self.nornir.processors.extend(original_processors)
                 logger.debug("Restored original processors after connection closure")
         logger.info("Closed Nornir connections")
 
@@ -119,6 +184,19 @@ class NornirManager:
                 removed_keys.append(key)
         logger.debug(f"Removed NornFlow settings from kwargs: {removed_keys}")
 
+    @property
+    def inventory_index(self) -> InventoryIndex:
+        """
+        Index of the current inventory, built on first use.
+
+        A new index is built whenever the inventory was replaced, e.g. by
+        filtering; narrowing to batches and back reuses the same one.
+        """
+        inventory = self.nornir.inventory
+        if self._inventory_index is None or self._inventory_index.inventory is not inventory:
+            self._inventory_index = InventoryIndex(inventory)
+        return self._inventory_index
+
     def apply_filters(self, **kwargs) -> Nornir:
         """
         Apply filters to the Nornir inventory.
@@ -141,11 +219,102 @@ class NornirManager:
         logger.debug(f"Applying filters with kwargs: {kwargs}")
         if not kwargs:
             raise ProcessorError("No filters informed.")
+        return self.apply_filter_chain([kwargs])
+
+    def apply_filter_chain(self, filters: list[dict[str, Any]]) -> Nornir:
+        """
+        Apply several filters at once, keeping the hosts that pass all of them.
+
+        Filters with an index fast path (see register_indexed_filter) select their
+        hosts from the inventory index, and their selections are intersected.
+        The other filters are then evaluated together, in a single pass over the
+        hosts left, instead of one Nornir filter (and inventory copy) per filter.
+        A single filter without a fast path is handed to Nornir's filter method
+        unchanged.
+
+        Args:
+            filters: Filter criteria, each as accepted by apply_filters.
+
+        Returns:
+            Nornir: The filtered Nornir instance
+
+        Raises:
+            ProcessorError: If no filters are provided
+        """
+        if not filters or not all(filters):
+            raise ProcessorError("No filters informed.")
 
-        self.nornir = self.nornir.filter(**kwargs)
-        logger.debug(f"Filtered Nornir inventory now has {len(self.nornir.inventory.hosts)} hosts")
+        selected: frozenset[str] | None = None
+        remaining = []
+        for filter_kwargs in filters:
+            selector = get_selector(filter_kwargs)
+            names = None
+            if selector is not None:
+                params = {k: v for k, v in filter_kwargs.items() if k not in {"filter_func", "filter_obj"}}
+                names = selector(self.inventory_index, **params)
+            if names is None:
+                remaining.append(filter_kwargs)
+            else:
+                selected = names if selected is None else selected & names
+
+        nornir = self.nornir if selected is None else self._narrow(self.inventory_index.hosts(selected))
+        if len(remaining) == 1:
+            nornir = nornir.filter(**remaining[0])
+        elif remaining:
+            nornir = nornir.filter(filter_func=matches_all_filters, filters=tuple(remaining))
+        self.nornir = nornir
+        logger.debug(
+            f"Filtered Nornir inventory now has {len(self.nornir.inventory.hosts)} hosts "
+            f"({len(filters) - len(remaining)} of {len(filters)} filter(s) served by the index)"
+        )
         return self.nornir
 
+    def _narrow(self, hosts: Hosts) -> Nornir:
+        """Return a copy of the Nornir instance whose inventory only has 'hosts', as Nornir.filter does."""
+        inventory = self.nornir.inventory
+        narrowed = copy.copy(self.nornir)
+        narrowed.inventory = Inventory(hosts=hosts, groups=inventory.groups, defaults=inventory.defaults)
+        return narrowed
+
+    def iter_batches(self, hosts_per_batch: int) -> Iterator[tuple[str, ...]]:
+        """
+        Narrow the inventory to successive batches of hosts.
+
+        The current (already filtered) inventory is split into consecutive batches
+        of at most 'hosts_per_batch' hosts, in inventory order. For each batch the
+        inventory is carved with apply_filters, so everything run through
+        self.nornir while the batch is active only targets its hosts. Connections
+        opened by a batch are closed before the next one starts, and the full
+        inventory is restored once iteration ends (or is abandoned).
+
+        Args:
+            hosts_per_batch: Maximum number of hosts per batch.
+
+        Yields:
+            The names of the hosts in the active batch.
+
+        Raises:
+            CoreError: If hosts_per_batch is lower than 1.
+        """
+        if hosts_per_batch < 1:
+            raise CoreError(
+                f"hosts_per_batch must be at least 1, got {hosts_per_batch}", component="NornirManager"
+            )
+        full_nornir = self.nornir
+        host_names = list(full_nornir.inventory.hosts)
+        logger.debug(f"Splitting {len(host_names)} hosts into batches of {hosts_per_batch}")
+        try:
+            for start in range(0, len(host_names), hosts_per_batch):
+                batch = tuple(host_names[start : start + hosts_per_batch])
+                self.nornir = full_nornir
+                self.apply_filters(filter_func=in_batch, batch_hosts=frozenset(batch))
+                try:
+                    yield batch
+                finally:
+                    self.close_connections()
+        finally:
+            self.nornir = full_nornir
+
     def apply_processors(self, processors: list[Processor]) -> Nornir:
         """
         Apply processors to the Nornir instance.
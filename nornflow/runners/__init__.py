@@ -0,0 +1,32 @@
+"""
+NornFlow runners and cooperative cancellation.
+
+Runners decide how a Nornir task is dispatched across hosts. NornFlow swaps
+Nornir's default ThreadedRunner for CancellableThreadedRunner so a FAIL_FAST
+failure stops queued host work immediately. AsyncioRunner, registered as the
+'asyncio' Nornir runner plugin, drives hosts from an event loop and runs
+coroutine task functions natively. HostPipeline runs the 'free' execution
+strategy, where each host moves through the task list at its own pace.
+"""
+
+from nornir.core.plugins.runners import RunnersPluginRegister
+
+from nornflow.runners.async_runner import AsyncioRunner, run_async, start_async
+from nornflow.runners.cancellation import CancellationToken, get_cancellation_token, raise_if_cancelled
+from nornflow.runners.pipeline import HostPipeline
+from nornflow.runners.threaded import CancellableThreadedRunner
+
+# Also declared as a 'nornir.plugins.runners' entry point; registering here makes
+# the plugin available even when the package metadata is not installed.
+RunnersPluginRegister.register("asyncio", AsyncioRunner)
+
+__all__ = [
+    "AsyncioRunner",
+    "CancellableThreadedRunner",
+    "CancellationToken",
+    "HostPipeline",
+    "get_cancellation_token",
+    "raise_if_cancelled",
+    "run_async",
+    "start_async",
+]
@@ -0,0 +1,266 @@
+"""Asyncio runner driving thousands of hosts from a single event loop."""
+
+import asyncio
+import inspect
+import logging
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Any
+
+from nornir.core.exceptions import NornirSubTaskError
+from nornir.core.inventory import Host
+from nornir.core.task import AggregatedResult, DEFAULT_SEVERITY_LEVEL, MultiResult, Result, Task
+
+from nornflow.constants import DEFAULT_ASYNC_CONCURRENCY
+from nornflow.logger import logger
+from nornflow.runners.cancellation import CancellationToken
+from nornflow.runners.threaded import cancelled_result
+
+
+def is_async_task(func: Callable) -> bool:
+    """Whether a task function, possibly wrapped by decorators, is a coroutine function."""
+    return inspect.iscoroutinefunction(inspect.unwrap(func))
+
+
+def sync_task(func: Callable) -> Callable:
+    """Wrap a coroutine task function so thread-based runners can run it.
+
+    Each call runs the coroutine to completion on its own event loop, in the
+    worker thread that calls it.
+
+    Args:
+        func: The coroutine task function.
+
+    Returns:
+        A regular task function with the same name, docstring and signature.
+    """
+
+    @wraps(func)
+    def wrapper(task: Task, **kwargs: Any) -> Any:
+        return asyncio.run(func(task, **kwargs))
+
+    return wrapper
+
+
+async def start_async(task: Task, host: Host) -> MultiResult:
+    """Async counterpart of Task.start().
+
+    Runs the task for one host with the same processor notifications and result
+    handling as Task.start(), awaiting the task function when it returns an
+    awaitable. Task functions may be coroutine functions or regular functions
+    wrapped by hooks around a coroutine function.
+
+    Args:
+        task: The task to run. Like Task.start(), it is bound to the host.
+        host: Host to run the task on.
+
+    Returns:
+        The results of the task and its subtasks.
+    """
+    task.host = host
+    if task.parent_task is not None:
+        task.processors.subtask_instance_started(task, host)
+    else:
+        task.processors.task_instance_started(task, host)
+
+    try:
+        logger.debug(f"Host '{host.name}': running task '{task.name}'")
+        result = task.task(task, **task.params)
+        if inspect.isawaitable(result):
+            result = await result
+        if not isinstance(result, Result):
+            result = Result(host=host, result=result)
+    except NornirSubTaskError as e:
+        tb = traceback.format_exc()
+        logger.error(f"Host '{host.name}': task '{task.name}' failed with traceback:\n{tb}")
+        result = Result(host, exception=e, result=str(e), failed=True)
+    except Exception as e:
+        tb = traceback.format_exc()
+        logger.error(f"Host '{host.name}': task '{task.name}' failed with traceback:\n{tb}")
+        result = Result(host, exception=e, result=tb, failed=True)
+
+    result.name = task.name
+    if result.severity_level == DEFAULT_SEVERITY_LEVEL:
+        result.severity_level = logging.ERROR if result.failed else task.severity_level
+    task.results.insert(0, result)
+
+    if task.parent_task is not None:
+        task.processors.subtask_instance_completed(task, host, task.results)
+    else:
+        task.processors.task_instance_completed(task, host, task.results)
+    return task.results
+
+
+async def run_async(task: Task, func: Callable, **kwargs: Any) -> MultiResult:
+    """Async counterpart of Task.run(), for calling subtasks from coroutine tasks.
+
+    Example:
+        ```python
+        async def deploy(task: Task) -> Result:
+            await run_async(task, push_config)
+            await run_async(task, verify_config)
+            return Result(host=task.host)
+        ```
+
+    Args:
+        task: The running parent task.
+        func: Task function to run as a subtask, coroutine or not.
+        **kwargs: Arguments for the subtask, as with Task.run().
+
+    Returns:
+        The results of the subtask.
+
+    Raises:
+        NornirSubTaskError: If the subtask failed.
+    """
+    kwargs.setdefault("severity_level", task.severity_level)
+    subtask = Task(
+        func,
+        task.nornir,
+        global_dry_run=task.global_dry_run,
+        processors=task.processors,
+        parent_task=task,
+        **kwargs,
+    )
+    result = await start_async(subtask, task.host)
+    task.results.append(result[0] if len(result) == 1 else result)
+    if result.failed:
+        raise NornirSubTaskError(task=subtask, result=result)
+    return result
+
+
+class AsyncioRunner:
+    """Nornir runner scheduling hosts on an asyncio event loop.
+
+    Thread-based runners need one thread per concurrent host, which caps
+    concurrency at a few hundred hosts per process. This runner keeps up to
+    'max_concurrency' hosts in flight on a single event loop instead:
+    - coroutine task functions (including those wrapped by hooks) run on the
+      loop, so thousands of device sessions can wait on I/O concurrently;
+    - regular task functions run on a pool of 'num_workers' threads, so every
+      existing task keeps working.
+
+    Processors, hooks and variable resolution run as usual around every host.
+    Each host runs in its own asyncio task, so per-host state kept in context
+    variables (like the current host of NornirHostProxy) stays separate.
+
+    Once the cancellation token is cancelled, hosts that have not started are
+    never started, and hosts already running are awaited for up to
+    'grace_period' seconds (forever when None). Coroutine tasks still running
+    after that are cancelled; threads running regular tasks are abandoned and
+    their results discarded. Hosts that did not complete are reported with a
+    failed Result whose exception is a TaskCancelledError.
+
+    Select it in the Nornir config file:
+        ```yaml
+        runner:
+          plugin: asyncio
+          options:
+            max_concurrency: 2000
+            num_workers: 20
+        ```
+
+    Args:
+        num_workers: Threads running regular (non-coroutine) task functions.
+        max_concurrency: Maximum number of hosts in flight at once.
+        cancellation_token: Token to observe. A private token is created if omitted.
+        grace_period: Seconds to wait for in-flight hosts after cancellation.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 20,
+        *,
+        max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+        cancellation_token: CancellationToken | None = None,
+        grace_period: float | None = None,
+    ) -> None:
+        self.num_workers = num_workers
+        self.max_concurrency = max_concurrency
+        self.cancellation_token = cancellation_token or CancellationToken()
+        self.grace_period = grace_period
+
+    def run(self, task: Task, hosts: list[Host]) -> AggregatedResult:
+        """Run a task over the given hosts.
+
+        The event loop lives for the duration of the call. When the calling thread
+        already runs an event loop (e.g. in a notebook), the runner's loop is
+        driven from a helper thread instead.
+
+        Args:
+            task: The task to run.
+            hosts: Hosts to run it on.
+
+        Returns:
+            The aggregated results, keyed by host name in the order of 'hosts'.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._run(task, hosts))
+        with ThreadPoolExecutor(1) as executor:
+            return executor.submit(asyncio.run, self._run(task, hosts)).result()
+
+    async def _run(self, task: Task, hosts: list[Host]) -> AggregatedResult:
+        token = self.cancellation_token
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        executor = ThreadPoolExecutor(self.num_workers)
+        started: set[str] = set()
+        abandoned = False
+
+        # Resolved on cancellation so the wait below wakes up without polling.
+        # Token callbacks run in the thread that cancels, hence call_soon_threadsafe.
+        wake_up = loop.create_future()
+
+        def _resolve() -> None:
+            if not wake_up.done():
+                wake_up.set_result(None)
+
+        def _wake() -> None:
+            loop.call_soon_threadsafe(_resolve)
+
+        async def _run_host(host: Host) -> MultiResult:
+            async with semaphore:
+                if token.cancelled:
+                    return cancelled_result(task, host, token)
+                started.add(host.name)
+                host_task = task.copy()
+                if is_async_task(host_task.task):
+                    return await start_async(host_task, host)
+                return await loop.run_in_executor(executor, host_task.start, host)
+
+        token.on_cancel(_wake)
+        jobs = {host.name: asyncio.create_task(_run_host(host)) for host in hosts}
+        try:
+            all_done = asyncio.ensure_future(asyncio.wait(jobs.values())) if jobs else None
+            if all_done is not None:
+                await asyncio.wait([all_done, wake_up], return_when=asyncio.FIRST_COMPLETED)
+            if all_done is not None and not all_done.done():
+                all_done.cancel()
+                _, not_done = await asyncio.wait(jobs.values(), timeout=self.grace_period)
+                abandoned = bool(not_done)
+                for job in not_done:
+                    job.cancel()
+                if not_done:
+                    await asyncio.wait(not_done)
+                    logger.warning(
+                        f"Abandoned {len(not_done)} host(s) still running task '{task.name}' "
+                        f"after the {self.grace_period}s cancellation grace period"
+                    )
+                if len(started) < len(hosts):
+                    logger.info(
+                        f"Cancelled task '{task.name}' on {len(hosts) - len(started)} host(s) "
+                        "that had not started"
+                    )
+        finally:
+            token.remove_callback(_wake)
+            executor.shutdown(wait=not abandoned, cancel_futures=True)
+
+        aggregated = AggregatedResult(task.name)
+        for host in hosts:
+            job = jobs[host.name]
+            aggregated[host.name] = cancelled_result(task, host, token) if job.cancelled() else job.result()
+        return aggregated
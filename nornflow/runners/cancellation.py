@@ -0,0 +1,166 @@
+"""Cooperative cancellation shared by NornFlow's runners, processors and tasks."""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from nornflow.exceptions import TaskCancelledError
+from nornflow.logger import logger
+
+
+class CancellationToken:
+    """Thread-safe, one-shot signal that execution should stop.
+
+    The token is cancelled once (e.g. by NornFlowFailureStrategyProcessor when a
+    FAIL_FAST failure is detected) and observed by everything else:
+    - CancellableThreadedRunner stops submitting hosts and cancels queued ones.
+    - NornFlowFailureStrategyProcessor refuses to start new subtasks.
+    - Task code can poll 'cancelled' / 'raise_if_cancelled()' between steps, or
+      register an 'on_cancel' callback to interrupt blocking work.
+
+    Example:
+        ```python
+        token = CancellationToken()
+        token.on_cancel(lambda: print("stopping"))
+        token.cancel("task 'backup' failed on 'router1'")
+        token.cancelled  # True
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], Any]] = []
+        self.reason = ""
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "") -> bool:
+        """Request cancellation and run the registered callbacks.
+
+        Args:
+            reason: Human-readable reason, included in TaskCancelledError messages.
+
+        Returns:
+            True if this call cancelled the token, False if it was already cancelled.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        logger.debug(f"Cancellation requested: {reason or 'no reason given'}")
+        for callback in callbacks:
+            self._run_callback(callback)
+        return True
+
+    def on_cancel(self, callback: Callable[[], Any]) -> None:
+        """Register a callback to run once when the token is cancelled.
+
+        The callback runs in the thread that calls 'cancel', or immediately in the
+        calling thread if the token is already cancelled. Exceptions raised by
+        callbacks are logged and otherwise ignored.
+
+        Args:
+            callback: Zero-argument callable.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        self._run_callback(callback)
+
+    def remove_callback(self, callback: Callable[[], Any]) -> None:
+        """Unregister a callback previously passed to 'on_cancel' (no-op if absent)."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the token is cancelled or the timeout expires.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever.
+
+        Returns:
+            True if the token is cancelled.
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self, task_name: str = "", host_name: str = "") -> None:
+        """Raise TaskCancelledError if cancellation has been requested.
+
+        Args:
+            task_name: Task name to include in the error.
+            host_name: Host name to include in the error.
+
+        Raises:
+            TaskCancelledError: If the token is cancelled.
+        """
+        if self._event.is_set():
+            raise cancelled_error(self, task_name, host_name)
+
+    def _run_callback(self, callback: Callable[[], Any]) -> None:
+        try:
+            callback()
+        except Exception:
+            logger.exception("Cancellation callback failed")
+
+
+def cancelled_error(token: CancellationToken, task_name: str, host_name: str) -> TaskCancelledError:
+    """Build the TaskCancelledError reported for a host whose work was cancelled."""
+    where = f" on host '{host_name}'" if host_name else ""
+    reason = f": {token.reason}" if token.reason else ""
+    return TaskCancelledError(f"Execution cancelled{where}{reason}", task_name=task_name, host_name=host_name)
+
+
+def get_cancellation_token(task: Any) -> CancellationToken | None:
+    """Return the cancellation token governing a running Nornir task, if any.
+
+    The token is looked up on the task's processors (NornFlow's failure strategy
+    processor owns it), so it is available to any task started by NornFlow,
+    regardless of the runner in use.
+
+    Args:
+        task: The Nornir Task passed to a task function.
+
+    Returns:
+        The CancellationToken, or None when the task runs outside NornFlow.
+    """
+    for processor in getattr(task, "processors", None) or []:
+        token = getattr(processor, "cancellation_token", None)
+        if isinstance(token, CancellationToken):
+            return token
+    return None
+
+
+def raise_if_cancelled(task: Any) -> None:
+    """Cooperative cancellation point for task functions.
+
+    Call it between long-running steps so a FAIL_FAST failure elsewhere stops this
+    host promptly instead of letting it run to completion.
+
+    Example:
+        ```python
+        def upgrade(task: Task) -> Result:
+            task.run(copy_image)
+            raise_if_cancelled(task)
+            task.run(reload_device)
+            ...
+        ```
+
+    Args:
+        task: The Nornir Task passed to the task function.
+
+    Raises:
+        TaskCancelledError: If execution has been cancelled.
+    """
+    token = get_cancellation_token(task)
+    if token is not None:
+        host = getattr(task, "host", None)
+        token.raise_if_cancelled(task.name, host.name if host is not None else "")
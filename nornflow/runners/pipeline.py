@@ -0,0 +1,160 @@
+"""Host-pipelined execution: each host runs the whole task list on its own."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from nornir.core import Nornir
+from nornir.core.inventory import Host
+from nornir.core.task import AggregatedResult, Task
+
+from nornflow.builtins.constants import SILENT_SKIP_FLAG
+from nornflow.logger import logger
+from nornflow.runners.cancellation import CancellationToken
+from nornflow.runners.threaded import cancelled_result
+
+
+class _Stage:
+    """Bookkeeping for one task of the pipeline."""
+
+    def __init__(self, task: Task, hosts_count: int) -> None:
+        self.task = task
+        self.lock = threading.Lock()
+        self.started = False
+        self.pending = hosts_count
+        self.results = AggregatedResult(task.name)
+
+
+class HostPipeline:
+    """Run a list of tasks so that every host moves through it at its own pace.
+
+    Nornir.run() is a barrier: a task only starts once every host has finished
+    the previous one, so one slow host holds the whole inventory back. Here each
+    host gets a worker and runs its own chain of tasks, starting its next task as
+    soon as its previous one finishes.
+
+    Processors still see the usual lifecycle for every task:
+    - task_started fires once, when the first host reaches the task;
+    - task_instance_started/completed fire per host, as with Nornir.run();
+    - task_completed fires once every host has run the task or dropped out
+      before it, with the results of the hosts that ran it. Tasks complete in
+      workflow order.
+
+    A host that fails drops out of the rest of its chain unless
+    'stop_on_failure' is False, and hosts already in the inventory's
+    failed_hosts are not run, mirroring Nornir.run(). Once the cancellation
+    token is cancelled hosts stop before their next task; those that had
+    reached an already started task are reported as cancelled for it.
+
+    Args:
+        nornir: Nornir object whose inventory, processors and shared data are used.
+        tasks: Tasks to run, in order. Their names must be unique.
+        num_workers: Maximum number of hosts running concurrently.
+        cancellation_token: Token to observe. A private token is created if omitted.
+        stop_on_failure: Whether a failed host skips its remaining tasks.
+    """
+
+    def __init__(
+        self,
+        nornir: Nornir,
+        tasks: list[Task],
+        *,
+        num_workers: int = 20,
+        cancellation_token: CancellationToken | None = None,
+        stop_on_failure: bool = True,
+    ) -> None:
+        self.nornir = nornir
+        self.tasks = tasks
+        self.num_workers = num_workers
+        self.cancellation_token = cancellation_token or CancellationToken()
+        self.stop_on_failure = stop_on_failure
+        self._stages: list[_Stage] = []
+        self._completion_lock = threading.Lock()
+        self._next_completion = 0
+
+    def run(self) -> list[AggregatedResult]:
+        """Run every task over every host of the inventory.
+
+        Returns:
+            The aggregated results of each task, in task order.
+        """
+        hosts = list(self.nornir.inventory.hosts.values())
+        self._stages = [_Stage(task, len(hosts)) for task in self.tasks]
+        self._next_completion = 0
+        if not hosts:
+            self._complete_ready_stages()
+            return [stage.results for stage in self._stages]
+
+        with ThreadPoolExecutor(self.num_workers) as executor:
+            futures = [executor.submit(self._run_host, host) for host in hosts]
+        for future in futures:
+            future.result()
+
+        return [stage.results for stage in self._stages]
+
+    def _run_host(self, host: Host) -> None:
+        """Run the task chain of one host, then release the tasks it did not reach."""
+        token = self.cancellation_token
+        failed_hosts = self.nornir.data.failed_hosts
+        reached = 0
+        try:
+            for stage in self._stages:
+                if token.cancelled:
+                    if stage.started:
+                        stage.results[host.name] = cancelled_result(stage.task, host, token)
+                    break
+                if self.stop_on_failure and host.name in failed_hosts:
+                    break
+
+                self._start(stage)
+                result = stage.task.copy().start(host)
+                host.data.pop(SILENT_SKIP_FLAG, None)
+                stage.results[host.name] = result
+                if result.failed:
+                    failed_hosts.add(host.name)
+
+                reached += 1
+                self._release(stage)
+        finally:
+            for stage in self._stages[reached:]:
+                self._release(stage)
+
+    def _start(self, stage: _Stage) -> None:
+        """Notify processors that a task started, the first time a host reaches it."""
+        if stage.started:
+            return
+        with stage.lock:
+            if not stage.started:
+                stage.task.processors.task_started(stage.task)
+                stage.started = True
+
+    def _release(self, stage: _Stage) -> None:
+        """Record that a host is done with a task; complete it once every host is."""
+        with stage.lock:
+            stage.pending -= 1
+            if stage.pending:
+                return
+        self._complete_ready_stages()
+
+    def _complete_ready_stages(self) -> None:
+        """Complete, in task order, every task no host is still due to run."""
+        with self._completion_lock:
+            while self._next_completion < len(self._stages):
+                stage = self._stages[self._next_completion]
+                if stage.pending:
+                    return
+                self._complete(stage)
+                self._next_completion += 1
+
+    def _complete(self, stage: _Stage) -> None:
+        """Notify processors that a task completed.
+
+        A task no host reached is still started and completed with no results,
+        as Nornir.run() does for a task with no hosts left to run on, unless the
+        run was cancelled.
+        """
+        if not stage.started:
+            if self.cancellation_token.cancelled:
+                return
+            self._start(stage)
+        logger.debug(f"Task '{stage.task.name}' completed on {len(stage.results)} host(s)")
+        stage.task.processors.task_completed(stage.task, stage.results)
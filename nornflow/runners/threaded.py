@@ -0,0 +1,141 @@
+"""Thread pool runner that honours a CancellationToken."""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from nornir.core.inventory import Host
+from nornir.core.task import AggregatedResult, MultiResult, Result, Task
+
+from nornflow.logger import logger
+from nornflow.runners.cancellation import CancellationToken, cancelled_error
+
+
+def cancelled_result(task: Task, host: Host, token: CancellationToken) -> MultiResult:
+    """Build the failed result reported for a host whose work was cancelled."""
+    exception = cancelled_error(token, task.name, host.name)
+    result = MultiResult(task.name)
+    result.append(Result(host, name=task.name, result=str(exception), exception=exception, failed=True))
+    return result
+
+
+class CancellableThreadedRunner:
+    """Drop-in replacement for Nornir's ThreadedRunner that stops on cancellation.
+
+    Nornir's ThreadedRunner submits one future per host up front, so after a
+    FAIL_FAST failure every queued host is still dispatched. This runner instead
+    keeps at most 'num_workers' hosts in flight and only submits the next host
+    once a worker is free and the token is not cancelled. Once cancelled:
+    - hosts not yet submitted are never started;
+    - workers re-check the token before starting a host;
+    - hosts already running are awaited for up to 'grace_period' seconds (forever
+      when None). Hosts still running after that are abandoned: their threads
+      finish in the background and their results are discarded.
+
+    Hosts that did not complete are reported with a failed Result whose exception
+    is a TaskCancelledError. Processors are not notified for hosts that never
+    started.
+
+    Args:
+        num_workers: Maximum number of hosts running concurrently.
+        cancellation_token: Token to observe. A private token is created if omitted.
+        grace_period: Seconds to wait for in-flight hosts after cancellation.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 20,
+        *,
+        cancellation_token: CancellationToken | None = None,
+        grace_period: float | None = None,
+    ) -> None:
+        self.num_workers = num_workers
+        self.cancellation_token = cancellation_token or CancellationToken()
+        self.grace_period = grace_period
+
+    def run(self, task: Task, hosts: list[Host]) -> AggregatedResult:
+        """Run a task over the given hosts.
+
+        Args:
+            task: The task to run.
+            hosts: Hosts to run it on.
+
+        Returns:
+            The aggregated results, keyed by host name in the order of 'hosts'.
+        """
+        token = self.cancellation_token
+        results: dict[str, MultiResult] = {}
+        remaining = deque(hosts)
+        in_flight: dict[Future, Host] = {}
+        abandoned = False
+
+        # Resolved on cancellation so the wait below wakes up without polling.
+        wake_up: Future = Future()
+
+        def _wake() -> None:
+            if not wake_up.done():
+                wake_up.set_result(None)
+
+        token.on_cancel(_wake)
+        executor = ThreadPoolExecutor(self.num_workers)
+        try:
+            while remaining or in_flight:
+                while remaining and len(in_flight) < self.num_workers and not token.cancelled:
+                    host = remaining.popleft()
+                    in_flight[executor.submit(self._start_host, task, host)] = host
+                if token.cancelled:
+                    break
+                done, _ = wait([*in_flight, wake_up], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future is not wake_up:
+                        results[in_flight.pop(future).name] = future.result()
+
+            abandoned = self._finish_cancelled(task, in_flight, remaining, results)
+        finally:
+            token.remove_callback(_wake)
+            executor.shutdown(wait=not abandoned, cancel_futures=True)
+
+        aggregated = AggregatedResult(task.name)
+        for host in hosts:
+            aggregated[host.name] = results[host.name]
+        return aggregated
+
+    def _finish_cancelled(
+        self,
+        task: Task,
+        in_flight: dict[Future, Host],
+        remaining: deque[Host],
+        results: dict[str, MultiResult],
+    ) -> bool:
+        """Collect the results of a cancelled run into 'results'.
+
+        Hosts in flight are awaited for up to 'grace_period' seconds; those still
+        running after that, and hosts never started, get a cancelled result.
+
+        Returns:
+            True if hosts were abandoned while still running.
+        """
+        token = self.cancellation_token
+        abandoned = False
+        if in_flight:
+            done, not_done = wait(in_flight, timeout=self.grace_period)
+            abandoned = bool(not_done)
+            for future, host in in_flight.items():
+                if future in done:
+                    results[host.name] = future.result()
+                else:
+                    results[host.name] = cancelled_result(task, host, token)
+            if abandoned:
+                logger.warning(
+                    f"Abandoned {len(not_done)} host(s) still running task '{task.name}' "
+                    f"after the {self.grace_period}s cancellation grace period"
+                )
+        if remaining:
+            logger.info(f"Cancelled task '{task.name}' on {len(remaining)} host(s) that had not started")
+            for host in remaining:
+                results[host.name] = cancelled_result(task, host, token)
+        return abandoned
+
+    def _start_host(self, task: Task, host: Host) -> MultiResult:
+        if self.cancellation_token.cancelled:
+            return cancelled_result(task, host, self.cancellation_token)
+        return task.copy().start(host)
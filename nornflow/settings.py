@@ -12,6 +12,11 @@ from pydantic_settings import (
 )
 
 from nornflow.constants import (
+    BatchSize,
+    DEFAULT_DISTRIBUTED_WORKER_TIMEOUT,
+    DEFAULT_TEMPLATE_CACHE_SIZE,
+    ExecutionStrategy,
+    FailureBudget,
     FailureStrategy,
     NORNFLOW_DEFAULT_BLUEPRINTS_DIR,
     NORNFLOW_DEFAULT_FILTERS_DIR,
@@ -26,6 +31,12 @@ from nornflow.constants import (
 from nornflow.exceptions import SettingsError
 from nornflow.logger import logger
 from nornflow.packages import PackageDescriptor
+from nornflow.utils import (
+    normalize_batch_size,
+    normalize_execution_strategy,
+    normalize_failure_budget,
+    normalize_shards,
+)
 
 _ENV_EXCLUDED_FIELDS: frozenset[str] = frozenset({"packages"})
 
@@ -180,7 +191,63 @@ class NornFlowSettings(BaseSettings):
     failure_strategy: FailureStrategy = Field(
         default=FailureStrategy.SKIP_FAILED, description="Strategy for handling task failures"
     )
+    failure_budget: FailureBudget | None = Field(
+        default=None,
+        description="Failed hosts tolerated by the 'failure-budget' strategy (e.g. 5 or '10%')",
+    )
+    execution_strategy: ExecutionStrategy = Field(
+        default=ExecutionStrategy.LINEAR,
+        description="How tasks are scheduled across hosts ('linear' or 'free')",
+    )
     dry_run: bool = Field(default=False, description="Whether to run in dry-run mode")
+    batch_size: BatchSize | None = Field(
+        default=None,
+        description="Roll workflows out in serial batches of this many hosts (e.g. 5 or '10%')",
+    )
+    batch_pause: float | None = Field(
+        default=None,
+        ge=0,
+        description="Seconds to pause between batches of a rolling execution",
+    )
+    shards: int | None = Field(
+        default=None,
+        description="Worker processes the inventory is split across (e.g. 4 or 'auto')",
+    )
+    distributed_worker_timeout: float | None = Field(
+        default=DEFAULT_DISTRIBUTED_WORKER_TIMEOUT,
+        gt=0,
+        description="Seconds a distributed run waits while no worker is connected (unbounded when null)",
+    )
+    cancel_grace_period: float | None = Field(
+        default=None,
+        ge=0,
+        description="Seconds to wait for running hosts after execution is cancelled (unbounded when unset)",
+    )
+    lazy_catalogs: bool = Field(
+        default=False,
+        description="Scan task and filter modules without importing them until a workflow uses them",
+    )
+    catalog_index_file: str | None = Field(
+        default=None,
+        description="Path of a file caching catalog discovery results between runs (disabled when unset)",
+    )
+    inventory_cache: bool = Field(
+        default=False,
+        description="Keep the loaded Nornir inventory for later runs in the same process",
+    )
+    template_cache_size: int = Field(
+        default=DEFAULT_TEMPLATE_CACHE_SIZE,
+        ge=0,
+        description="Compiled Jinja2 templates kept in memory (0 disables the cache)",
+    )
+    template_bytecode_cache_dir: str | None = Field(
+        default=None,
+        description="Directory keeping compiled Jinja2 template code between runs (disabled when unset)",
+    )
+    native_templates: bool = Field(
+        default=False,
+        description="Render task args templates to native Python values instead of strings",
+    )
     logger: dict[str, Any] = Field(
         default_factory=lambda: {**NORNFLOW_DEFAULT_LOGGER}, description="Logger configuration dictionary"
     )
@@ -264,6 +331,30 @@ class NornFlowSettings(BaseSettings):
                     ) from e
         return v
 
+    @field_validator("failure_budget", mode="before")
+    @classmethod
+    def validate_failure_budget(cls, v: Any) -> FailureBudget | None:
+        """Convert an integer, percentage string or mapping to a FailureBudget."""
+        return normalize_failure_budget(v, SettingsError)
+
+    @field_validator("execution_strategy", mode="before")
+    @classmethod
+    def validate_execution_strategy(cls, v: Any) -> ExecutionStrategy:
+        """Convert string to ExecutionStrategy enum."""
+        return normalize_execution_strategy(v, SettingsError)
+
+    @field_validator("batch_size", mode="before")
+    @classmethod
+    def validate_batch_size(cls, v: Any) -> BatchSize | None:
+        """Convert a host count or percentage string to a BatchSize."""
+        return normalize_batch_size(v, SettingsError)
+
+    @field_validator("shards", mode="before")
+    @classmethod
+    def validate_shards(cls, v: Any) -> int | None:
+        """Convert a process count or 'auto' to a number of shards."""
+        return normalize_shards(v, SettingsError)
+
     @field_validator("logger", mode="before")
     @classmethod
     def validate_logger(cls, v: Any) -> dict[str, Any]:
@@ -341,6 +432,10 @@ class NornFlowSettings(BaseSettings):
         self._resolve_path_field("vars_dir", None, base_dir)
         self._resolve_path_field("nornir_config_file", None, base_dir)
         self._resolve_path_field("logger", "directory", base_dir)
+        if self.catalog_index_file:
+            self._resolve_path_field("catalog_index_file", None, base_dir)
+        if self.template_bytecode_cache_dir:
+            self._resolve_path_field("template_bytecode_cache_dir", None, base_dir)
 
         return self
 
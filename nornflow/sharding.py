@@ -0,0 +1,359 @@
+"""Sharded execution: running a workflow over the inventory in several worker processes."""
+
+import multiprocessing
+import pickle
+import threading
+import traceback
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from queue import Empty
+from typing import Any, TYPE_CHECKING
+
+from nornflow.logger import logger
+from nornflow.runners.cancellation import CancellationToken
+
+if TYPE_CHECKING:
+    from nornflow.models import WorkflowModel
+
+# Seconds between checks for dead workers (parent) and for halts started elsewhere (shards).
+SHARD_POLL_INTERVAL = 0.2
+
+# Called by the parent with (processor_index, message) for each message a shard's processor posts.
+ShardMessageHandler = Callable[[int, Any], None]
+
+
+def partition_hosts(host_names: list[str], shards: int) -> list[tuple[str, ...]]:
+    """
+    Split host names into at most 'shards' non-empty partitions of near-equal size.
+
+    Hosts are dealt round-robin, so hosts that sit next to each other in the
+    inventory (often the same site or role) are spread across shards.
+
+    Args:
+        host_names: Host names, in inventory order.
+        shards: Maximum number of partitions.
+
+    Returns:
+        The partitions, each keeping inventory order.
+    """
+    count = min(shards, len(host_names))
+    return [tuple(host_names[index::count]) for index in range(count)]
+
+
+def picklable(value: Any) -> bool:
+    """Whether a value can be sent from a shard to the parent process."""
+    try:
+        pickle.dumps(value)
+    except Exception:  # any pickling failure means the value stays in the shard
+        return False
+    return True
+
+
+class SharedCounter:
+    """Integer counter shared by every process of a sharded run.
+
+    Drop-in replacement for AtomicCounter, backed by a multiprocessing Value, so
+    failures counted in one shard count against the failure budget of all of them.
+    """
+
+    def __init__(self, value: int = 0, *, context: Any = None) -> None:
+        self._value = (context or multiprocessing).Value("q", value)
+
+    @property
+    def value(self) -> int:
+        """The current count."""
+        return self._value.value
+
+    def increment(self, amount: int = 1) -> int:
+        """Add 'amount' to the counter and return the new value."""
+        with self._value.get_lock():
+            self._value.value += amount
+            return self._value.value
+
+    def reset(self, value: int = 0) -> None:
+        """Set the counter back to 'value'."""
+        with self._value.get_lock():
+            self._value.value = value
+
+
+class SharedFlag:
+    """Boolean flag shared by every process of a sharded run.
+
+    Polled rather than waited on: a multiprocessing Event whose waiters exit
+    while waiting blocks every later set() forever, and shards routinely finish
+    while others are still running.
+    """
+
+    def __init__(self, *, context: Any = None) -> None:
+        self._value = (context or multiprocessing).Value("b", 0, lock=False)
+
+    def is_set(self) -> bool:
+        """Whether the flag was set."""
+        return bool(self._value.value)
+
+    def set(self) -> None:
+        """Set the flag."""
+        self._value.value = 1
+
+
+@dataclass
+class Shard:
+    """
+    One worker process of a sharded run, as seen from inside that process.
+
+    Carries what the worker needs to rebuild NornFlow (constructor arguments and
+    the assembled workflow), the hosts it runs on, and the channels it shares
+    with the parent and the other shards.
+
+    Attributes:
+        index: 1-based number of the shard.
+        count: Total number of shards.
+        hosts: Names of the hosts this shard runs on.
+        total_hosts: Number of hosts across every shard.
+        nornflow_kwargs: Arguments for the worker's NornFlow constructor.
+        workflow: The workflow, already assembled by the parent.
+        workflow_path: Path of the workflow file, if loaded from one.
+        failure_count: Failures counted across every shard.
+        remote: Whether the shard runs on another machine than the parent, so its
+            files cannot be read by the parent.
+    """
+
+    index: int
+    count: int
+    hosts: tuple[str, ...]
+    total_hosts: int
+    nornflow_kwargs: dict[str, Any]
+    workflow: "WorkflowModel"
+    workflow_path: Path | None
+    failure_count: SharedCounter
+    _events: Any = field(repr=False)
+    _halt: SharedFlag = field(repr=False)
+    remote: bool = False
+    _unlinked: threading.Event | None = field(default=None, repr=False)
+
+    def post(self, processor_index: int, message: Any) -> None:
+        """Send a processor message to the matching processor of the parent.
+
+        Args:
+            processor_index: Position of the sending processor in the processor chain.
+            message: Picklable payload, handled by the parent processor's
+                receive_shard_message().
+        """
+        self._events.put(("message", self.index, (processor_index, message)))
+
+    def link(self, token: CancellationToken) -> None:
+        """Tie a shard's cancellation token to every other shard.
+
+        Cancelling 'token' halts the other shards, and a halt started anywhere
+        else cancels 'token', until the shard reports with done() or fail().
+
+        Args:
+            token: The shard's cancellation token.
+        """
+        token.on_cancel(self._halt.set)
+        unlinked = self._unlinked = threading.Event()
+
+        def _watch() -> None:
+            while not token.wait(SHARD_POLL_INTERVAL) and not unlinked.is_set():
+                if self._halt.is_set():
+                    token.cancel("execution halted by another shard")
+
+        threading.Thread(target=_watch, name=f"nornflow-shard-{self.index}-halt", daemon=True).start()
+
+    def done(self, report: dict[str, Any]) -> None:
+        """Hand the shard's final report to the parent."""
+        self._unlink()
+        self._events.put(("done", self.index, report))
+
+    def fail(self, error: str) -> None:
+        """Tell the parent the shard could not run the workflow."""
+        self._unlink()
+        self._events.put(("error", self.index, error))
+
+    def _unlink(self) -> None:
+        """Stop watching for halts started elsewhere (see link())."""
+        if self._unlinked is not None:
+            self._unlinked.set()
+
+
+def run_shard(shard: Shard) -> None:
+    """
+    Entry point of a shard worker process.
+
+    Builds a NornFlow from the shard's constructor arguments, runs the workflow
+    over the shard's hosts and reports back to the parent. Errors are reported
+    rather than raised, so the parent can tell a failed shard from a dead one.
+
+    Args:
+        shard: The shard to run.
+    """
+    from nornflow.nornflow import NornFlow  # noqa: PLC0415 - importing at module level would be circular
+
+    try:
+        nornflow = NornFlow(**shard.nornflow_kwargs)
+        report = nornflow._run_shard(shard)  # noqa: SLF001
+    except BaseException:  # anything escaping a worker must reach the parent
+        shard.fail(traceback.format_exc())
+        return
+    shard.done(report)
+
+
+class ShardCoordinator:
+    """
+    Parent side of a sharded run: starts the workers and collects their events.
+
+    Workers are started with the 'spawn' method, so every shard builds its own
+    NornFlow, Nornir inventory and processor chain from scratch instead of
+    inheriting the parent's threads and locks. They share with the parent:
+    - an event queue, carrying processor messages (e.g. output to print) while
+      the shard runs, then its final report;
+    - a halt flag, set when any shard (or the parent) cancels execution, which
+      cancels every other shard;
+    - a failure counter, so the failure budget applies across all shards.
+
+    Args:
+        partitions: Host names of each shard.
+        nornflow_kwargs: Arguments for the workers' NornFlow constructor.
+        workflow: The assembled workflow.
+        workflow_path: Path of the workflow file, if loaded from one.
+        cancellation_token: The parent's token. Cancelling it halts every shard.
+    """
+
+    def __init__(
+        self,
+        partitions: list[tuple[str, ...]],
+        *,
+        nornflow_kwargs: dict[str, Any],
+        workflow: "WorkflowModel",
+        workflow_path: Path | None,
+        cancellation_token: CancellationToken,
+    ) -> None:
+        self.partitions = partitions
+        self.nornflow_kwargs = nornflow_kwargs
+        self.workflow = workflow
+        self.workflow_path = workflow_path
+        self.cancellation_token = cancellation_token
+        self._context = multiprocessing.get_context("spawn")
+        self.failure_count = SharedCounter(context=self._context)
+        self.reports: dict[int, dict[str, Any]] = {}
+        self.errors: dict[int, str] = {}
+
+    def run(self, on_message: ShardMessageHandler) -> None:
+        """
+        Run every shard to completion.
+
+        Processor messages are handed to 'on_message' in the parent's thread as
+        they arrive. Final reports end up in 'reports' and errors of shards that
+        failed or died in 'errors', both keyed by shard index.
+
+        Args:
+            on_message: Callback receiving (processor_index, message).
+        """
+        events = self._context.Queue()
+        halt = SharedFlag(context=self._context)
+        total_hosts = sum(len(hosts) for hosts in self.partitions)
+        processes = {}
+        for index, hosts in enumerate(self.partitions, start=1):
+            shard = Shard(
+                index=index,
+                count=len(self.partitions),
+                hosts=hosts,
+                total_hosts=total_hosts,
+                nornflow_kwargs=self.nornflow_kwargs,
+                workflow=self.workflow,
+                workflow_path=self.workflow_path,
+                failure_count=self.failure_count,
+                _events=events,
+                _halt=halt,
+            )
+            processes[index] = self._context.Process(
+                target=run_shard, args=(shard,), name=f"nornflow-shard-{index}"
+            )
+
+        self.cancellation_token.on_cancel(halt.set)
+        try:
+            for index, process in processes.items():
+                process.start()
+                logger.info(
+                    f"Started shard {index}/{len(processes)} with {len(self.partitions[index - 1])} host(s)"
+                )
+            self._collect(events, processes, on_message)
+        finally:
+            self.cancellation_token.remove_callback(halt.set)
+            for process in processes.values():
+                if process.pid is None:
+                    continue
+                process.join(SHARD_POLL_INTERVAL)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+
+        if halt.is_set():
+            self.cancellation_token.cancel("execution halted by a shard")
+
+    def _collect(
+        self,
+        events: Any,
+        processes: dict[int, multiprocessing.process.BaseProcess],
+        on_message: ShardMessageHandler,
+    ) -> None:
+        """Consume shard events until every shard has reported or died."""
+        pending = set(processes)
+        while pending:
+            try:
+                kind, index, payload = events.get(timeout=SHARD_POLL_INTERVAL)
+            except Empty:
+                self._reap(events, processes, on_message, pending)
+                continue
+            self._handle_event(kind, index, payload, on_message, pending)
+
+    def _reap(
+        self,
+        events: Any,
+        processes: dict[int, multiprocessing.process.BaseProcess],
+        on_message: ShardMessageHandler,
+        pending: set[int],
+    ) -> None:
+        """
+        Record an error for pending shards whose process exited without reporting.
+
+        A shard can exit with code 0 and no report, e.g. when its report could not
+        be pickled (the queue drops it in its feeder thread) or a task called
+        os._exit(0). Events a shard sent before exiting are drained first.
+        """
+        exited = [index for index in sorted(pending) if processes[index].exitcode is not None]
+        if not exited:
+            return
+        while True:
+            try:
+                kind, index, payload = events.get_nowait()
+            except Empty:
+                break
+            self._handle_event(kind, index, payload, on_message, pending)
+
+        for index in exited:
+            if index not in pending:
+                continue
+            exitcode = processes[index].exitcode
+            if exitcode:
+                self.errors[index] = f"worker process exited with code {exitcode}"
+            else:
+                self.errors[index] = "worker process exited without reporting"
+            logger.error(f"Shard {index} died: {self.errors[index]}")
+            pending.discard(index)
+
+    def _handle_event(
+        self, kind: str, index: int, payload: Any, on_message: ShardMessageHandler, pending: set[int]
+    ) -> None:
+        """Handle one shard event, marking the shard as reported on 'done' or 'error'."""
+        if kind == "message":
+            on_message(*payload)
+        elif kind == "done":
+            self.reports[index] = payload
+            pending.discard(index)
+            logger.info(f"Shard {index} completed")
+        elif kind == "error":
+            self.errors[index] = payload
+            pending.discard(index)
+            logger.error(f"Shard {index} failed:\n{payload}")
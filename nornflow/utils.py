@@ -1,6 +1,9 @@
+import ast
 import hashlib
 import importlib
 import inspect
+import os
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from types import ModuleType
@@ -20,11 +23,16 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from nornflow.batching import BatchProgress
 from nornflow.constants import (
+    BatchSize,
+    ExecutionStrategy,
+    FailureBudget,
     FailureStrategy,
     JINJA_PATTERN,
     NORNFLOW_SUPPORTED_YAML_EXTENSIONS,
     REDACTED,
+    SHARDS_AUTO,
 )
 from nornflow.exceptions import (
     CoreError,
@@ -109,6 +117,226 @@ def normalize_failure_strategy(
     )
 
 
+def normalize_execution_strategy(
+    value: str | ExecutionStrategy, exception_class: type[Exception]
+) -> ExecutionStrategy:
+    """
+    Normalize and convert an execution strategy value to an ExecutionStrategy enum.
+
+    Args:
+        value: The value to normalize (string or pre-validated enum).
+        exception_class: The exception class to raise on invalid input.
+
+    Returns:
+        The normalized ExecutionStrategy enum.
+
+    Raises:
+        exception_class: If the value is invalid or of unsupported type.
+    """
+    if isinstance(value, ExecutionStrategy):
+        return value
+    if isinstance(value, str):
+        try:
+            return ExecutionStrategy(value)
+        except ValueError as e:
+            valid_options = [e.value for e in ExecutionStrategy]
+            raise exception_class(
+                f"Invalid execution strategy '{value}'. Valid options: {', '.join(valid_options)}"
+            ) from e
+    raise exception_class(
+        f"Invalid execution strategy type '{type(value).__name__}'. "
+        "Must be a string or ExecutionStrategy enum."
+    )
+
+
+def _parse_budget_limit(key: str, value: Any, exception_class: type[Exception]) -> int | float:
+    """Validate one FailureBudget limit, coercing strings to numbers."""
+    if isinstance(value, str):
+        text = value.strip().rstrip("%") if key == "max_fail_percentage" else value.strip()
+        try:
+            value = float(text) if key == "max_fail_percentage" else int(text)
+        except ValueError as e:
+            raise exception_class(f"Invalid failure budget {key} '{value}'. Must be a number.") from e
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        raise exception_class(
+            f"Invalid failure budget {key} type '{type(value).__name__}'. Must be a number."
+        )
+    if key == "max_failures":
+        if value != int(value) or value < 0:
+            raise exception_class(
+                f"Invalid failure budget max_failures '{value}'. Must be a non-negative integer."
+            )
+        return int(value)
+    if not 0 <= value <= 100:  # noqa: PLR2004
+        raise exception_class(
+            f"Invalid failure budget max_fail_percentage '{value}'. Must be between 0 and 100."
+        )
+    return float(value)
+
+
+def normalize_failure_budget(
+    value: str | int | dict[str, Any] | FailureBudget | None, exception_class: type[Exception]
+) -> FailureBudget | None:
+    """
+    Normalize and convert a failure budget value to a FailureBudget.
+
+    Accepted forms:
+    - An integer or integer string (e.g. 5 or "5"): maximum number of failed hosts.
+    - A percentage string (e.g. "10%"): maximum percentage of failed hosts.
+    - A dict with 'max_failures' and/or 'max_fail_percentage' keys.
+
+    Args:
+        value: The value to normalize. None is returned unchanged.
+        exception_class: The exception class to raise on invalid input.
+
+    Returns:
+        The normalized FailureBudget, or None.
+
+    Raises:
+        exception_class: If the value is invalid or of unsupported type.
+    """
+    if value is None or isinstance(value, FailureBudget):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        key = "max_fail_percentage" if text.endswith("%") else "max_failures"
+        return FailureBudget(**{key: _parse_budget_limit(key, text, exception_class)})
+    if isinstance(value, int) and not isinstance(value, bool):
+        return FailureBudget(max_failures=_parse_budget_limit("max_failures", value, exception_class))
+    if isinstance(value, dict):
+        unknown = set(value) - set(FailureBudget._fields)
+        if unknown:
+            raise exception_class(
+                f"Invalid failure budget keys: {', '.join(sorted(unknown))}. "
+                f"Valid keys: {', '.join(FailureBudget._fields)}"
+            )
+        limits = {
+            key: _parse_budget_limit(key, limit, exception_class)
+            for key, limit in value.items()
+            if limit is not None
+        }
+        if not limits:
+            raise exception_class("Failure budget must set 'max_failures' and/or 'max_fail_percentage'.")
+        return FailureBudget(**limits)
+    raise exception_class(
+        f"Invalid failure budget type '{type(value).__name__}'. "
+        "Must be an integer, a percentage string (e.g. '10%') or a mapping."
+    )
+
+
+def normalize_batch_size(
+    value: str | int | BatchSize | None, exception_class: type[Exception]
+) -> BatchSize | None:
+    """
+    Normalize and convert a batch size value to a BatchSize.
+
+    Accepted forms:
+    - A positive integer or integer string (e.g. 5 or "5"): hosts per batch.
+    - A percentage string (e.g. "10%"): percentage of the inventory per batch.
+
+    Args:
+        value: The value to normalize. None is returned unchanged.
+        exception_class: The exception class to raise on invalid input.
+
+    Returns:
+        The normalized BatchSize, or None.
+
+    Raises:
+        exception_class: If the value is invalid or of unsupported type.
+    """
+    if value is None or isinstance(value, BatchSize):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            number = float(text[:-1]) if text.endswith("%") else int(text)
+        except ValueError as e:
+            raise exception_class(
+                f"Invalid batch size '{value}'. Must be a number of hosts or a percentage (e.g. '10%')."
+            ) from e
+        if text.endswith("%"):
+            if not 0 < number <= 100:  # noqa: PLR2004
+                raise exception_class(f"Invalid batch size '{value}'. Must be between 0% and 100%.")
+            return BatchSize(percentage=number)
+        value = number
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise exception_class(
+            f"Invalid batch size type '{type(value).__name__}'. "
+            "Must be an integer or a percentage string (e.g. '10%')."
+        )
+    if value < 1:
+        raise exception_class(f"Invalid batch size '{value}'. Must be at least 1 host.")
+    return BatchSize(hosts=value)
+
+
+def normalize_shards(value: int | str | None, exception_class: type[Exception]) -> int | None:
+    """
+    Normalize a shard count.
+
+    Accepted forms:
+    - A positive integer or integer string (e.g. 4 or "4"): number of worker processes.
+    - "auto": one worker process per CPU core.
+
+    Args:
+        value: The value to normalize. None is returned unchanged.
+        exception_class: The exception class to raise on invalid input.
+
+    Returns:
+        The number of shards, or None.
+
+    Raises:
+        exception_class: If the value is invalid or of unsupported type.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text == SHARDS_AUTO:
+            return os.cpu_count() or 1
+        if not text.isdigit():
+            raise exception_class(
+                f"Invalid shard count '{value}'. Use a positive integer or '{SHARDS_AUTO}'."
+            )
+        value = int(text)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise exception_class(
+            f"Invalid shard count type '{type(value).__name__}'. Must be an integer or '{SHARDS_AUTO}'."
+        )
+    if value < 1:
+        raise exception_class(f"Shard count must be at least 1, got {value}")
+    return value
+
+
+class AtomicCounter:
+    """Thread-safe integer counter with constant-time increments.
+
+    Used by processors to count events reported concurrently by Nornir worker
+    threads, where a plain 'count += 1' could lose updates.
+    """
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self, value: int = 0) -> None:
+        self._value = value
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        """The current count."""
+        return self._value
+
+    def increment(self, amount: int = 1) -> int:
+        """Add 'amount' to the counter and return the new value."""
+        with self._lock:
+            self._value += amount
+            return self._value
+
+    def reset(self, value: int = 0) -> None:
+        """Set the counter back to 'value'."""
+        with self._lock:
+            self._value = value
+
+
 def import_module_from_path(module_name: str, module_path: str | Path) -> ModuleType:
     """
     Import a module from a given file path.
@@ -273,6 +501,86 @@ def is_nornir_filter(attr: Callable) -> bool:
         return False
 
 
+def _annotation_name(annotation: ast.expr | None) -> str | None:
+    """
+    Return the bare type name used in an annotation AST node.
+
+    Handles plain names ('Task'), dotted names ('task.Task') and subscripted types
+    ('Literal[True]' -> 'Literal'). String annotations are not matched, mirroring
+    is_nornir_task() and is_nornir_filter(), which compare against the real types.
+
+    Args:
+        annotation: The annotation node, or None when unannotated.
+
+    Returns:
+        The bare type name, or None if it can't be determined statically.
+    """
+    if isinstance(annotation, ast.Name):
+        return annotation.id
+    if isinstance(annotation, ast.Attribute):
+        return annotation.attr
+    if isinstance(annotation, ast.Subscript):
+        return _annotation_name(annotation.value)
+    return None
+
+
+# Module-level function definitions, as found by catalog scans.
+FunctionNode = ast.FunctionDef | ast.AsyncFunctionDef
+
+
+def is_nornir_task_node(node: FunctionNode) -> bool:
+    """
+    Check, without importing its module, if a function definition looks like a Nornir task.
+
+    AST counterpart of is_nornir_task(), matching annotations by type name: a public
+    function with a parameter annotated as Task that returns Result, MultiResult or
+    AggregatedResult. Coroutine functions ('async def') qualify too.
+
+    Args:
+        node: A module-level function definition.
+
+    Returns:
+        True if the definition matches the Nornir task criteria.
+    """
+    if node.name.startswith("_"):
+        return False
+
+    all_args = [*node.args.posonlyargs, *node.args.args, *node.args.kwonlyargs]
+    has_task_param = any(_annotation_name(arg.annotation) == "Task" for arg in all_args)
+    result_type_names = {result_type.__name__ for result_type in NORNIR_RESULT_TYPES}
+    return has_task_param and _annotation_name(node.returns) in result_type_names
+
+
+def is_nornir_filter_node(node: FunctionNode) -> bool:
+    """
+    Check, without importing its module, if a function definition looks like a Nornir filter.
+
+    AST counterpart of is_nornir_filter(): a public function whose first parameter
+    is annotated as Host and whose return type is bool or Literal[True/False].
+    Coroutine functions never qualify: Nornir calls filters synchronously.
+
+    Args:
+        node: A module-level function definition.
+
+    Returns:
+        True if the definition matches the Nornir filter criteria.
+    """
+    if isinstance(node, ast.AsyncFunctionDef) or node.name.startswith("_"):
+        return False
+
+    params = [*node.args.posonlyargs, *node.args.args]
+    if not params or _annotation_name(params[0].annotation) != "Host":
+        return False
+
+    returns = node.returns
+    if _annotation_name(returns) == "bool":
+        return True
+    if isinstance(returns, ast.Subscript) and _annotation_name(returns.value) == "Literal":
+        values = returns.slice.elts if isinstance(returns.slice, ast.Tuple) else [returns.slice]
+        return all(isinstance(value, ast.Constant) and isinstance(value.value, bool) for value in values)
+    return False
+
+
 def process_filter(attr: Callable) -> tuple[Callable, list[str]]:
     """
     Process a filter function to extract its parameters.
@@ -497,6 +805,12 @@ def print_workflow_overview(
     *,
     redaction_enabled: bool = True,
     sensitive_names: frozenset[str] | None = None,
+    failure_budget: FailureBudget | None = None,
+    batch_size: BatchSize | None = None,
+    batches_count: int = 0,
+    execution_strategy: ExecutionStrategy | None = None,
+    shards: int = 1,
+    distributed: str | None = None,
 ) -> None:
     """
     Print a comprehensive workflow overview before execution using Rich.
@@ -510,6 +824,12 @@ def print_workflow_overview(
         vars_manager: Variables manager for assembly-time vars.
         redaction_enabled: When False, sensitive variable values are shown in plain text.
         sensitive_names: User-declared identifiers from 'redaction.sensitive_names'.
+        failure_budget: Failures tolerated by the 'failure-budget' strategy.
+        batch_size: Batch size when the workflow is rolled out in serial batches.
+        batches_count: Number of batches the inventory is split into.
+        execution_strategy: How tasks are scheduled across hosts. Shown only when not linear.
+        shards: Number of worker processes the inventory is split across. Shown only when above 1.
+        distributed: Address workers of a distributed run connect to, if any.
     """
     console = Console()
 
@@ -531,6 +851,16 @@ def print_workflow_overview(
         "Failure Strategy",
         failure_strategy.value.replace("_", "-") if failure_strategy else "None",
     )
+    if failure_strategy == FailureStrategy.FAILURE_BUDGET and failure_budget:
+        table.add_row("Failure Budget", str(failure_budget))
+    if batch_size:
+        table.add_row("Batch Size", f"{batch_size} ({batches_count} batch(es))")
+    if execution_strategy and execution_strategy != ExecutionStrategy.LINEAR:
+        table.add_row("Execution Strategy", execution_strategy.value)
+    if shards > 1:
+        table.add_row("Shards", f"{shards} worker processes")
+    if distributed:
+        table.add_row("Distributed", f"workers connect to {distributed}")
 
     elements: list[Any] = [table]
     elements.extend(
@@ -551,6 +881,36 @@ def print_workflow_overview(
     console.print(panel)
 
 
+def print_batch_started(number: int, total: int, hosts: tuple[str, ...]) -> None:
+    """
+    Print a separator announcing the batch about to run in a rolling execution.
+
+    Args:
+        number: 1-based number of the batch.
+        total: Total number of batches.
+        hosts: Names of the hosts in the batch.
+    """
+    Console().rule(Text(f"Batch {number}/{total} - {len(hosts)} host(s)", style="bold cyan"), style="cyan")
+
+
+def print_batch_completed(progress: BatchProgress) -> None:
+    """
+    Print the outcome of a batch that just completed in a rolling execution.
+
+    Args:
+        progress: Progress reported for the completed batch.
+    """
+    style = "bold red" if progress.failed_hosts else "bold green"
+    message = (
+        f"Batch {progress.number}/{progress.total} completed: "
+        f"{len(progress.hosts) - len(progress.failed_hosts)} succeeded, "
+        f"{len(progress.failed_hosts)} failed, {progress.remaining_hosts} host(s) remaining"
+    )
+    if progress.failed_hosts:
+        message += f" (failed: {', '.join(progress.failed_hosts)})"
+    Console().print(Text(message, style=style))
+
+
 def get_file_content_hash(file_path: Path) -> str:
     """
     Generate a stable hash from file content for identity comparison.
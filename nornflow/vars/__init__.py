@@ -12,9 +12,10 @@ from nornflow.vars.context import NornFlowDeviceContext
 from nornflow.vars.exceptions import VariableError
 from nornflow.vars.manager import NornFlowVariablesManager
 from nornflow.vars.processors import NornFlowVariableProcessor
-from nornflow.vars.proxy import NornirHostProxy
+from nornflow.vars.proxy import BoundHostProxy, NornirHostProxy
 
 __all__ = [
+    "BoundHostProxy",
     "NornFlowDeviceContext",
     "NornFlowVariableProcessor",
     "NornFlowVariablesManager",
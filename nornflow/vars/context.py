@@ -1,8 +1,64 @@
+from collections.abc import Callable
 from typing import Any, ClassVar
 
+from typing_extensions import Self
+
 from nornflow.logger import logger
 
 
+class _TrackedDict(dict):
+    """
+    Dictionary that reports every mutation through a callback.
+
+    Used for the per-device runtime variables so that the device context can
+    invalidate its cached flat context whenever a runtime variable is set,
+    updated or removed, regardless of whether the change goes through
+    NornFlowVariablesManager or directly through 'runtime_vars[...] = ...'.
+    """
+
+    def __init__(self, on_change: Callable[[], None], *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._on_change = on_change
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._on_change()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._on_change()
+
+    def __ior__(self, other: Any) -> Self:
+        super().update(other)
+        self._on_change()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._on_change()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        value = super().setdefault(key, default)
+        self._on_change()
+        return value
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._on_change()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self._on_change()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._on_change()
+
+
 class NornFlowDeviceContext:
     """
     Maintains an isolated variable context for a specific device's NornFlow Variables.
@@ -24,6 +80,13 @@ class NornFlowDeviceContext:
     2. Complete isolation between devices during parallel execution.
     3. Variable access methods that enforce the documented precedence order.
     4. Support for device-specific runtime variables.
+    5. A cached flat context that is only rebuilt when runtime variables, a device
+       override layer, or the shared state change.
+
+    The flat context is versioned: the shared layers are merged once per
+    'initialize_shared_state' call, and each device keeps its own merged view
+    until one of its layers is modified. Repeated lookups and template
+    resolutions for the same device therefore do no merging or copying.
     """
 
     _initial_cli_vars: ClassVar[dict[str, Any]] = {}
@@ -32,6 +95,10 @@ class NornFlowDeviceContext:
     _initial_default_vars: ClassVar[dict[str, Any]] = {}
     _initial_env_vars: ClassVar[dict[str, Any]] = {}
     _shared_state_initialized: ClassVar[bool] = False
+    # Merged view of the five shared layers, rebuilt only by initialize_shared_state.
+    _shared_flat_context: ClassVar[dict[str, Any]] = {}
+    # Bumped on every initialize_shared_state call to invalidate device-level caches.
+    _shared_state_version: ClassVar[int] = 0
 
     @classmethod
     def initialize_shared_state(
@@ -62,6 +129,18 @@ class NornFlowDeviceContext:
         cls._initial_domain_vars = domain_vars.copy()
         cls._initial_default_vars = default_vars.copy()
         cls._initial_env_vars = env_vars.copy()
+
+        shared_flat_context: dict[str, Any] = {}
+        for layer in (
+            cls._initial_env_vars,
+            cls._initial_default_vars,
+            cls._initial_domain_vars,
+            cls._initial_workflow_inline_vars,
+            cls._initial_cli_vars,
+        ):
+            shared_flat_context.update(layer)
+        cls._shared_flat_context = shared_flat_context
+        cls._shared_state_version += 1
         cls._shared_state_initialized = True
         logger.info("NornFlowDeviceContext shared state initialized.")
 
@@ -89,7 +168,36 @@ class NornFlowDeviceContext:
         self._default_overrides: dict[str, Any] = {}
         self._env_overrides: dict[str, Any] = {}
 
-        self.runtime_vars: dict[str, Any] = {}
+        self._local_version = 0
+        self._runtime_vars: _TrackedDict = _TrackedDict(self._invalidate_flat_context)
+        self._flat_context: dict[str, Any] | None = None
+        self._flat_context_version: tuple[int, int] | None = None
+
+    def _invalidate_flat_context(self) -> None:
+        """Mark the cached flat context as stale after a device-level change."""
+        self._local_version += 1
+
+    @property
+    def version(self) -> tuple[int, int]:
+        """
+        Get the version of this device's variable context.
+
+        The version changes whenever the shared state is re-initialized or any
+        device-level layer (runtime variables or overrides) is modified, so it can
+        be used as a cheap cache key for anything derived from the flat context.
+        """
+        return (self._shared_state_version, self._local_version)
+
+    @property
+    def runtime_vars(self) -> dict[str, Any]:
+        """Get the device-specific runtime variables (highest precedence)."""
+        return self._runtime_vars
+
+    @runtime_vars.setter
+    def runtime_vars(self, value: dict[str, Any]) -> None:
+        """Replace all runtime variables for this device."""
+        self._runtime_vars = _TrackedDict(self._invalidate_flat_context, value or {})
+        self._invalidate_flat_context()
 
     @property
     def cli_vars(self) -> dict[str, Any]:
@@ -105,6 +213,7 @@ class NornFlowDeviceContext:
     def cli_vars(self, value: dict[str, Any]) -> None:
         """Set all CLI variables as overrides for this device."""
         self._cli_overrides = value.copy() if value else {}
+        self._invalidate_flat_context()
 
     @property
     def workflow_inline_vars(self) -> dict[str, Any]:
@@ -120,6 +229,7 @@ class NornFlowDeviceContext:
     def workflow_inline_vars(self, value: dict[str, Any]) -> None:
         """Set all inline workflow variables as overrides for this device."""
         self._workflow_inline_overrides = value.copy() if value else {}
+        self._invalidate_flat_context()
 
     @property
     def domain_vars(self) -> dict[str, Any]:
@@ -135,6 +245,7 @@ class NornFlowDeviceContext:
     def domain_vars(self, value: dict[str, Any]) -> None:
         """Set all domain variables as overrides for this device."""
         self._domain_overrides = value.copy() if value else {}
+        self._invalidate_flat_context()
 
     @property
     def default_vars(self) -> dict[str, Any]:
@@ -150,6 +261,7 @@ class NornFlowDeviceContext:
     def default_vars(self, value: dict[str, Any]) -> None:
         """Set all default variables as overrides for this device."""
         self._default_overrides = value.copy() if value else {}
+        self._invalidate_flat_context()
 
     @property
     def env_vars(self) -> dict[str, Any]:
@@ -165,6 +277,7 @@ class NornFlowDeviceContext:
     def env_vars(self, value: dict[str, Any]) -> None:
         """Set all environment variables as overrides for this device."""
         self._env_overrides = value.copy() if value else {}
+        self._invalidate_flat_context()
 
     def _build_precedence_layers(self) -> list[dict[str, Any]]:
         """
@@ -199,16 +312,36 @@ class NornFlowDeviceContext:
         is needed. This does not include 'host.' or 'global.' namespace variables,
         which are handled by other components.
 
+        The returned dictionary is cached and shared between calls until the context
+        version changes, so callers MUST treat it as read-only.
+
         Returns:
             A dictionary representing the flattened variable context for this device,
             respecting the defined precedence order from environment variables
             (lowest) to runtime variables (highest).
         """
-        precedence_layers = self._build_precedence_layers()
-
-        flat_context = {}
-        for layer in precedence_layers:
-            flat_context.update(layer)
-
+        version = self.version
+        if self._flat_context is not None and self._flat_context_version == version:
+            return self._flat_context
+
+        if self._has_overrides():
+            flat_context: dict[str, Any] = {}
+            for layer in self._build_precedence_layers():
+                flat_context.update(layer)
+        else:
+            flat_context = {**self._shared_flat_context, **self._runtime_vars}
+
+        self._flat_context = flat_context
+        self._flat_context_version = version
         logger.debug(f"Built flat context for host '{self.host_name}' with {len(flat_context)} variables.")
         return flat_context
+
+    def _has_overrides(self) -> bool:
+        """Check whether any shared layer has device-specific overrides."""
+        return bool(
+            self._cli_overrides
+            or self._workflow_inline_overrides
+            or self._domain_overrides
+            or self._default_overrides
+            or self._env_overrides
+        )
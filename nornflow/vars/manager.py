@@ -5,7 +5,8 @@ from typing import Any
 import yaml
 from pydantic_serdes.utils import load_file_to_dict
 
-from nornflow.j2 import Jinja2Service
+from nornflow.j2 import Condition, Jinja2Service, RenderPlan
+from nornflow.j2.constants import HOST_NAMESPACE_VAR
 from nornflow.j2.exceptions import TemplateError
 from nornflow.logger import logger
 from nornflow.vars.constants import (
@@ -26,7 +27,9 @@ class HostNamespace:
     within Jinja2 templates.
 
     This class acts as a proxy to the NornirHostProxy, ensuring that attribute
-    access (e.g., {{ host.name }}) is correctly routed to the current host's data.
+    access (e.g., {{ host.name }}) is correctly routed to this namespace's host.
+    Lookups go through a proxy bound to that host, so no shared "current host"
+    state is touched and concurrent renders for different hosts cannot interfere.
     """
 
     def __init__(self, vars_manager: "NornFlowVariablesManager", host_name: str):
@@ -39,7 +42,11 @@ class HostNamespace:
         """
         self._vars_manager = vars_manager
         self._host_name = host_name
-        self._proxy = vars_manager.nornir_host_proxy
+
+    @property
+    def _proxy(self) -> NornirHostProxy:
+        """Get the manager's current NornirHostProxy (looked up on access, never captured)."""
+        return self._vars_manager.nornir_host_proxy
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -58,9 +65,7 @@ class HostNamespace:
             VariableError: If the attribute is not found in the host's inventory.
         """
         try:
-            # Ensure the NornirHostProxy is targeting the correct host for this access
-            self._proxy.current_host_name = self._host_name
-            return getattr(self._proxy, name)
+            return getattr(self._proxy.get_host_proxy(self._host_name), name)
         except AttributeError as err:
             # Raise a more NornFlow-specific error for clarity in logs/exceptions
             raise VariableError(
@@ -98,7 +103,7 @@ class VariableLookupContext(dict):
 
         # Make the 'host.' namespace available in the Jinja2 context
         # e.g., {{ host.name }}
-        self["host"] = HostNamespace(vars_manager, host_name)
+        self[HOST_NAMESPACE_VAR] = HostNamespace(vars_manager, host_name)
 
 
 class NornFlowVariablesManager:
@@ -127,6 +132,8 @@ class NornFlowVariablesManager:
         inline_workflow_vars: dict[str, Any] | None = None,
         workflow_path: Path | None = None,
         workflow_roots: list[str] | None = None,
+        *,
+        native_templates: bool = False,
     ) -> None:
         """
         Initializes the NornFlowVariablesManager.
@@ -145,6 +152,8 @@ class NornFlowVariablesManager:
                            variables.
             workflow_roots: A list of root directory paths where workflows are stored.
                             Used in conjunction with `workflow_path` to determine the domain.
+            native_templates: Whether task args templates render to native Python values
+                              (see Jinja2Service.resolve_string) instead of strings.
 
         Raises:
             VariableError: If `vars_dir` exists but is not a directory.
@@ -155,6 +164,7 @@ class NornFlowVariablesManager:
 
         self.workflow_path = workflow_path
         self.workflow_roots = [Path(root) for root in (workflow_roots or [])]
+        self.native_templates = native_templates
 
         self._default_vars: dict[str, Any] = {}
         self._domain_vars: dict[str, Any] = {}  # Loaded based on workflow_path
@@ -182,6 +192,9 @@ class NornFlowVariablesManager:
 
         self.jinja2 = Jinja2Service()
         self._device_contexts: dict[str, NornFlowDeviceContext] = {}
+        # host_name -> (flat context it was built from, lookup context). Reused as long as the
+        # device context keeps returning the same cached flat context object.
+        self._lookup_contexts: dict[str, tuple[dict[str, Any], VariableLookupContext]] = {}
         logger.debug(f"Initialized NornFlowVariablesManager with vars_dir: {self.vars_dir}")
 
     @property
@@ -356,6 +369,37 @@ class NornFlowVariablesManager:
             self._device_contexts[host_name] = NornFlowDeviceContext(host_name=host_name)
         return self._device_contexts[host_name]
 
+    def _get_lookup_context(
+        self, host_name: str, additional_vars: dict[str, Any] | None = None
+    ) -> VariableLookupContext:
+        """
+        Get the Jinja2 lookup context for a host.
+
+        Without 'additional_vars' the context is cached per host and only rebuilt when
+        the device's flat context changes (new runtime variable, override, or shared
+        state re-initialization), so repeated resolutions do no merging or copying.
+
+        Args:
+            host_name: The name of the host for which to build the context.
+            additional_vars: Optional variables with the highest precedence for this
+                             resolution only. Bypasses the cache.
+
+        Returns:
+            The VariableLookupContext for the host.
+        """
+        flat_context = self.get_device_context(host_name).get_flat_context()
+
+        if additional_vars:
+            return VariableLookupContext(self, host_name, {**flat_context, **additional_vars})
+
+        cached = self._lookup_contexts.get(host_name)
+        if cached is not None and cached[0] is flat_context:
+            return cached[1]
+
+        context = VariableLookupContext(self, host_name, flat_context)
+        self._lookup_contexts[host_name] = (flat_context, context)
+        return context
+
     def set_runtime_variable(self, name: str, value: Any, host_name: str) -> None:
         """
         Sets a runtime variable for a specific host.
@@ -411,8 +455,12 @@ class NornFlowVariablesManager:
         )
 
     def resolve_string(
-        self, template_str: str, host_name: str, additional_vars: dict[str, Any] | None = None
-    ) -> str:
+        self,
+        template_str: str,
+        host_name: str,
+        additional_vars: dict[str, Any] | None = None,
+        native: bool | None = None,
+    ) -> Any:
         """
         Resolves a Jinja2 template string using variables for a specific host.
 
@@ -423,9 +471,12 @@ class NornFlowVariablesManager:
             host_name: The name of the host for which to resolve the template.
             additional_vars: Optional dictionary of variables to add to the Jinja2
                              context with the highest precedence for this resolution.
+            native: Render to a native Python value instead of a string.
+                    Defaults to the manager's 'native_templates'.
 
         Returns:
-            The resolved string. Returns input if not a string or no Jinja2 markers.
+            The resolved string (or native value). Returns input if not a string or no
+            Jinja2 markers.
 
         Raises:
             TemplateError: If template resolution fails or host_name is missing.
@@ -434,21 +485,19 @@ class NornFlowVariablesManager:
             raise TemplateError(f"Host name not provided for template resolution: {template_str}")
 
         try:
-            device_ctx = self.get_device_context(host_name)
-            nornflow_default_vars = device_ctx.get_flat_context()
-
-            resolution_context_dict = nornflow_default_vars.copy()
-            if additional_vars:
-                resolution_context_dict.update(additional_vars)
-
-            context = VariableLookupContext(self, host_name, resolution_context_dict)
+            context = self._get_lookup_context(host_name, additional_vars)
 
+            if native is None:
+                native = self.native_templates
             result = self.jinja2.resolve_string(
-                template_str, context, error_context=f"variable resolution for host {host_name}"
+                template_str,
+                context,
+                error_context=f"variable resolution for host {host_name}",
+                native=native,
             )
             logger.debug(
                 f"Resolved template string for host '{host_name}': "
-                f"'{template_str}' -> length: '{len(result)}'"
+                f"'{template_str}' -> {type(result).__name__}"
             )
             return result
         except TemplateError as e:
@@ -460,12 +509,17 @@ class NornFlowVariablesManager:
             )
             raise TemplateError(f"Template rendering error in '{template_str}': {e}") from e
 
-    def resolve_data(self, data: Any, host_name: str, additional_vars: dict[str, Any] | None = None) -> Any:
+    def resolve_plan(
+        self, plan: RenderPlan, host_name: str, additional_vars: dict[str, Any] | None = None
+    ) -> Any:
         """
-        Recursively resolve Jinja2 templates in nested data structures.
+        Resolve a precompiled RenderPlan for a specific host.
+
+        Produces the same result as 'resolve_data' on the data the plan was built from,
+        but only renders the plan's template leaves instead of walking the whole structure.
 
         Args:
-            data: The data structure to resolve (dict, list, string, etc.).
+            plan: The RenderPlan to resolve (see 'Jinja2Service.build_render_plan').
             host_name: The name of the host for which to resolve variables.
             additional_vars: Additional variables to include in the context.
 
@@ -476,17 +530,84 @@ class NornFlowVariablesManager:
             raise TemplateError("Host name not provided for data resolution")
 
         try:
-            device_ctx = self.get_device_context(host_name)
-            nornflow_default_vars = device_ctx.get_flat_context()
+            context = self._get_lookup_context(host_name, additional_vars)
+            result = plan.render(context, error_context=f"data resolution for host {host_name}")
+            logger.debug(f"Resolved render plan for host '{host_name}'.")
+            return result
+        except TemplateError as e:
+            logger.error(f"Template error resolving data for host '{host_name}': {e}")
+            raise
+        except Exception as e:
+            logger.exception(f"Unexpected error resolving data for host '{host_name}': {e}")
+            raise TemplateError(f"Data resolution error: {e}") from e
+
+    def resolve_condition(
+        self, condition: Condition, host_name: str, additional_vars: dict[str, Any] | None = None
+    ) -> bool:
+        """
+        Evaluate a precompiled Condition for a specific host.
 
-            resolution_context_dict = nornflow_default_vars.copy()
-            if additional_vars:
-                resolution_context_dict.update(additional_vars)
+        Produces the same result as converting 'resolve_string' of the condition's
+        source to a bool, without rendering single-expression conditions to a string.
+
+        Args:
+            condition: The Condition to evaluate (see 'Jinja2Service.build_condition').
+            host_name: The name of the host for which to evaluate the condition.
+            additional_vars: Additional variables to include in the context.
 
-            context = VariableLookupContext(self, host_name, resolution_context_dict)
+        Returns:
+            The truth value of the condition for the host.
+
+        Raises:
+            TemplateError: If evaluation fails or host_name is missing.
+        """
+        if not host_name:
+            raise TemplateError(f"Host name not provided for condition evaluation: {condition.source}")
+
+        try:
+            context = self._get_lookup_context(host_name, additional_vars)
+            return condition.evaluate(context, error_context=f"condition evaluation for host {host_name}")
+        except TemplateError as e:
+            logger.error(
+                f"Template error evaluating condition '{condition.source}' for host '{host_name}': {e}"
+            )
+            raise
+        except Exception as e:
+            logger.exception(
+                f"Unexpected error evaluating condition '{condition.source}' for host '{host_name}': {e}"
+            )
+            raise TemplateError(f"Condition evaluation error in '{condition.source}': {e}") from e
+
+    def resolve_data(
+        self,
+        data: Any,
+        host_name: str,
+        additional_vars: dict[str, Any] | None = None,
+        native: bool | None = None,
+    ) -> Any:
+        """
+        Recursively resolve Jinja2 templates in nested data structures.
+
+        Args:
+            data: The data structure to resolve (dict, list, string, etc.).
+            host_name: The name of the host for which to resolve variables.
+            additional_vars: Additional variables to include in the context.
+            native: Render templates to native Python values instead of strings.
+                    Defaults to the manager's 'native_templates'.
+
+        Returns:
+            The data structure with all templates resolved.
+        """
+        if not host_name:
+            raise TemplateError("Host name not provided for data resolution")
+
+        try:
+            context = self._get_lookup_context(host_name, additional_vars)
 
+            if native is None:
+                native = self.native_templates
             result = self.jinja2.resolve_data(
-                data, context, error_context=f"data resolution for host {host_name}"
+                data, context, error_context=f"data resolution for host {host_name}", native=native
             )
             logger.debug(f"Resolved data structure for host '{host_name}'.")
             return result
@@ -19,6 +19,7 @@ Processing Modes:
 - **Deferred**: Templates stored and resolved just-in-time via resolve_deferred_params()
 
 The processor automatically selects the appropriate mode based on hook declarations.
+The mode is decided once per task in task_started() and reused for every host.
 
 Example deferred flow:
 1. Hook declares requires_deferred_templates = True
@@ -29,6 +30,13 @@ Example deferred flow:
 
 This is particularly useful for hooks that require evaluating Jinja2 template inputs
 BEFORE anything else is evaluated by the Jinja2 Environment in the same task execution.
+
+Render Plans
+============
+
+In both modes, task parameters are resolved through a RenderPlan compiled once in
+task_started(): every template leaf is compiled up front and each host only renders
+those leaves, while template-free parts of the parameters are shared between hosts.
 """
 
 from typing import Any
@@ -37,10 +45,34 @@ from nornir.core.inventory import Host
 from nornir.core.processor import Processor
 from nornir.core.task import MultiResult, Task
 
+from nornflow.builtins.processors.hook_processor import NornFlowHookProcessor
+from nornflow.j2 import RenderPlan
 from nornflow.logger import logger
 from nornflow.vars.manager import NornFlowVariablesManager
 
 
+class _TaskVariableState:
+    """Variable-processing state shared by all host instances of one task.
+
+    Built once in task_started(), so per-host callbacks only perform dictionary
+    lookups keyed by host name instead of rescanning hooks or hashing tuple keys.
+    """
+
+    __slots__ = ("deferred_params", "planned_params", "render_plan", "requires_deferred_templates")
+
+    def __init__(
+        self,
+        requires_deferred_templates: bool,
+        planned_params: dict[str, Any] | None = None,
+        render_plan: RenderPlan | None = None,
+    ) -> None:
+        self.requires_deferred_templates = requires_deferred_templates
+        self.planned_params = planned_params
+        self.render_plan = render_plan
+        # host name -> the host's original (unresolved) params
+        self.deferred_params: dict[str, dict[str, Any]] = {}
+
+
 class NornFlowVariableProcessor(Processor):
     """
     Processor responsible for managing NornFlow's variable context and template resolution.
@@ -65,25 +97,98 @@ class NornFlowVariableProcessor(Processor):
             vars_manager: Variable manager for template resolution and context management.
         """
         self.vars_manager = vars_manager
-        self._deferred_params: dict[tuple[str, str], dict[str, Any]] = {}
+        self._task_states: dict[str, _TaskVariableState] = {}
 
     def task_started(self, task: Task) -> None:
-        """Called when a task starts globally. Sets up Nornir object reference."""
+        """Called when a task starts globally.
+
+        Sets up the Nornir object reference and computes the task's processing mode
+        and render plan once, for all hosts.
+        """
         if hasattr(task, "nornir") and task.nornir:
             self.vars_manager.nornir_host_proxy.nornir = task.nornir
             logger.debug(f"Nornir object set on NornirHostProxy via task '{task.name}'.")
 
+        self._task_states[task.name] = state = self._build_task_state(task)
+        logger.debug(
+            f"Task '{task.name}' uses {'deferred' if state.requires_deferred_templates else 'immediate'} "
+            "template processing."
+        )
+
+    def requires_deferred_templates(self, task: Task) -> bool:
+        """Whether template resolution is deferred for this task.
+
+        The answer is computed once per task in task_started() and cached.
+
+        Args:
+            task: The Nornir task (or any of its per-host copies).
+
+        Returns:
+            True if any hook of the task requires deferred templates, False otherwise.
+        """
+        return self._get_task_state(task).requires_deferred_templates
+
+    def _build_task_state(self, task: Task) -> _TaskVariableState:
+        """Compute the per-task processing mode and render plan."""
+        state = _TaskVariableState(self._requires_deferred_templates(task))
+        if task.params:
+            state.planned_params = dict(task.params)
+            state.render_plan = self.vars_manager.jinja2.build_render_plan(
+                task.params, native=self.vars_manager.native_templates
+            )
+            logger.debug(
+                f"Built render plan for task '{task.name}' ({state.render_plan.template_count} templates)."
+            )
+        return state
+
+    def _get_task_state(self, task: Task) -> _TaskVariableState:
+        """Return the task's state, building it if task_started() was not seen for it."""
+        state = self._task_states.get(task.name)
+        if state is None:
+            state = self._task_states.setdefault(
+                task.name, _TaskVariableState(self._requires_deferred_templates(task))
+            )
+        return state
+
+    def _get_render_plan(self, state: _TaskVariableState, params: dict[str, Any]) -> RenderPlan | None:
+        """Return the task's render plan if it still describes 'params'.
+
+        Per-host params are shallow copies of the params seen in task_started(), so a
+        top-level identity check is enough to detect params changed in the meantime.
+        """
+        planned_params = state.planned_params
+        if planned_params is None:
+            return None
+        if len(planned_params) != len(params) or any(
+            key not in params or params[key] is not value for key, value in planned_params.items()
+        ):
+            return None
+        return state.render_plan
+
+    def _resolve_params(self, state: _TaskVariableState, params: dict[str, Any], host_name: str) -> Any:
+        """Resolve task params for a host, using the render plan when possible."""
+        plan = self._get_render_plan(state, params)
+        if plan is not None:
+            return self.vars_manager.resolve_plan(plan, host_name)
+        return self.vars_manager.resolve_data(params, host_name)
+
     def _requires_deferred_templates(self, task: Task) -> bool:
         """Check if any hook for this task requires deferred template processing.
 
         Uses capability discovery to detect hooks that declare requires_deferred_templates = True.
+        Called once per task; use requires_deferred_templates() for the cached answer.
 
         Returns:
             True if any hook requires deferred templates, False otherwise.
         """
         for processor in task.nornir.processors:
             if hasattr(processor, "task_hooks"):
-                for hook in processor.task_hooks:
+                hooks = (
+                    processor.hooks_for(task)
+                    if isinstance(processor, NornFlowHookProcessor)
+                    else processor.task_hooks
+                )
+                for hook in hooks:
                     if getattr(hook, "requires_deferred_templates", False):
                         return True
         return False
@@ -100,13 +205,14 @@ class NornFlowVariableProcessor(Processor):
             logger.debug(f"Set current_host_name to '{host.name}' for task '{task.name}'.")
 
             if task.params:
-                if self._requires_deferred_templates(task):
-                    key = (task.name, host.name)
-                    self._deferred_params[key] = task.params.copy()
+                state = self._get_task_state(task)
+                if state.requires_deferred_templates:
+                    # task.params is this host's own copy; keep it instead of copying again
+                    state.deferred_params[host.name] = task.params
                     task.params = {}
                     logger.debug(f"Deferred template processing for '{host.name}' in task '{task.name}'")
                 else:
-                    processed_params = self.vars_manager.resolve_data(task.params, host.name)
+                    processed_params = self._resolve_params(state, task.params, host.name)
                     task.params = processed_params
                     logger.debug(f"Processed task.params for task '{task.name}' on host '{host.name}'")
 
@@ -122,23 +228,24 @@ class NornFlowVariableProcessor(Processor):
         Returns:
             Resolved parameters dict if deferred params exist, None otherwise.
         """
-        key = (task.name, host.name)
+        state = self._task_states.get(task.name)
+        if state is None:
+            return None
 
-        if key not in self._deferred_params:
+        original_params = state.deferred_params.pop(host.name, None)
+        if original_params is None:
             return None
 
         try:
             if self.vars_manager.nornir_host_proxy.current_host_name != host.name:
                 self.vars_manager.nornir_host_proxy.current_host_name = host.name
 
-            original_params = self._deferred_params.pop(key)
-            resolved_params = self.vars_manager.resolve_data(original_params, host.name)
+            resolved_params = self._resolve_params(state, original_params, host.name)
             logger.debug(f"Resolved templates for '{host.name}' in task '{task.name}'")
             return resolved_params
 
         except Exception:
             logger.exception(f"Error resolving deferred params for task '{task.name}' on host '{host.name}'")
-            self._deferred_params.pop(key, None)
             raise
 
     def task_instance_completed(self, task: Task, host: Host, result: MultiResult) -> None:
@@ -146,12 +253,13 @@ class NornFlowVariableProcessor(Processor):
         self.vars_manager.nornir_host_proxy.current_host_name = None
         logger.debug(f"Cleared current_host_name after task '{task.name}' on host '{host.name}'.")
 
-        key = (task.name, host.name)
-        if key in self._deferred_params:
-            self._deferred_params.pop(key)
+        state = self._task_states.get(task.name)
+        if state is not None:
+            state.deferred_params.pop(host.name, None)
 
     def task_completed(self, task: Task, result: MultiResult) -> None:
-        pass
+        """Drop the task's per-task state."""
+        self._task_states.pop(task.name, None)
 
     def subtask_started(self, task: Task, host: Host) -> None:
         pass
@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from typing import Any
 
 from nornir.core import Nornir
@@ -7,6 +8,79 @@ from nornflow.logger import logger
 from nornflow.vars.exceptions import VariableError
 
 
+def _lookup_host_value(host: Host, name: str) -> Any:
+    """
+    Retrieve a value from a Nornir host, following NornFlow's documented
+    precedence for the `host.` namespace:
+    1. Direct host attributes (e.g., name, platform, data).
+    2. Keys within the `host.data` dictionary (which is already fully resolved
+       by Nornir, including group and default data).
+
+    Args:
+        host: The Nornir Host to read from.
+        name: The name of the attribute or data key.
+
+    Returns:
+        The value if found.
+
+    Raises:
+        VariableError: If the name is not found.
+    """
+    # Host.get() covers direct attributes, data, and inheritance.
+    value = host.get(name)
+    if value is None:
+        raise VariableError(f"Attribute or key '{name}' not found in host '{host.name}'.")
+    return value
+
+
+class BoundHostProxy:
+    """
+    Read-only proxy bound to a single Nornir host.
+
+    Unlike `NornirHostProxy`, which tracks a "current" host, a bound proxy always
+    resolves against the host it was created for. This makes it safe to share
+    between worker threads: rendering `{{ host.name }}` for one device can never
+    observe another device's inventory, regardless of how the runner interleaves
+    hosts. Instances are obtained through `NornirHostProxy.get_host_proxy()`.
+    """
+
+    __slots__ = ("_host",)
+
+    def __init__(self, host: Host) -> None:
+        """
+        Initialize the proxy for a given host.
+
+        Args:
+            host: The Nornir Host this proxy resolves against.
+        """
+        self._host = host
+
+    @property
+    def current_host(self) -> Host:
+        """Get the Nornir Host object this proxy is bound to."""
+        return self._host
+
+    @property
+    def current_host_name(self) -> str:
+        """Get the name of the host this proxy is bound to."""
+        return self._host.name
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Retrieves an attribute or data key from the bound Nornir host.
+
+        Args:
+            name: The name of the attribute or data key to retrieve.
+
+        Returns:
+            The value of the attribute/key from the host's inventory.
+
+        Raises:
+            VariableError: If the attribute/key is not found.
+        """
+        return _lookup_host_value(self._host, name)
+
+
 class NornirHostProxy:
     """
     Read-only proxy object for accessing Nornir inventory variables for the current host
@@ -20,12 +94,29 @@ class NornirHostProxy:
     The 'NornFlowVariableProcessor' is responsible for setting the 'current_host_name'
     and 'nornir' instance on this proxy before it's used for variable resolution
     within a task context. This proxy itself does not modify Nornir inventory.
+
+    The current host is tracked in a context variable, so concurrent workers of Nornir's
+    threaded runner, and hosts sharing the event loop of the asyncio runner, never
+    overwrite each other's host. Template rendering does not rely on the
+    current host at all: it uses `get_host_proxy()`, which returns a `BoundHostProxy`
+    tied to one specific host.
     """
 
     def __init__(self) -> None:
         """Initialize the proxy with no current host or Nornir instance."""
-        self._current_host: Host | None = None
+        self._host_var: ContextVar[Host | None] = ContextVar("nornir_host_proxy_host", default=None)
         self._nornir: Nornir | None = None
+        self._bound_proxies: dict[str, BoundHostProxy] = {}
+
+    @property
+    def _current_host(self) -> Host | None:
+        """Get the current host for the calling thread or asyncio task."""
+        return self._host_var.get()
+
+    @_current_host.setter
+    def _current_host(self, host: Host | None) -> None:
+        """Set the current host for the calling thread or asyncio task."""
+        self._host_var.set(host)
 
     @property
     def current_host(self) -> Host | None:
@@ -44,7 +135,9 @@ class NornirHostProxy:
 
     @nornir.setter
     def nornir(self, nornir_instance: Nornir | None) -> None:
-        """Set the Nornir instance."""
+        """Set the Nornir instance, discarding proxies bound to the previous inventory."""
+        if nornir_instance is not self._nornir:
+            self._bound_proxies = {}
         self._nornir = nornir_instance
 
     @property
@@ -81,13 +174,43 @@ class NornirHostProxy:
             )
             self.current_host = None
 
+    def get_host_proxy(self, host_name: str) -> BoundHostProxy:
+        """
+        Get a proxy bound to a specific host of the current Nornir inventory.
+
+        Bound proxies are created once per host and reused until a different Nornir
+        instance is assigned to this proxy.
+
+        Args:
+            host_name: The name of the host to bind to.
+
+        Returns:
+            The BoundHostProxy for the requested host.
+
+        Raises:
+            VariableError: If no Nornir instance is set.
+            VariableError: If the host is not found in the inventory.
+        """
+        bound = self._bound_proxies.get(host_name)
+        if bound is not None:
+            return bound
+
+        if not self._nornir:
+            raise VariableError("NornirHostProxy: Nornir instance not set. Cannot resolve host variables.")
+
+        host = self._nornir.inventory.hosts.get(host_name)
+        if host is None:
+            raise VariableError(f"NornirHostProxy: Host '{host_name}' not found in Nornir inventory.")
+
+        # setdefault keeps a single instance per host if two workers race here
+        return self._bound_proxies.setdefault(host_name, BoundHostProxy(host))
+
     def __getattr__(self, name: str) -> Any:
         """
         Dynamically retrieves an attribute or data key from the current Nornir host.
 
-        This method is called for attribute access like `proxy.some_attribute` or
-        `{{ host.some_attribute }}` in Jinja2 templates. It follows NornFlow's
-        documented precedence for the `host.` namespace:
+        This method is called for attribute access like `proxy.some_attribute`. It
+        follows NornFlow's documented precedence for the `host.` namespace:
         1. Direct attributes of the Nornir `Host` object.
         2. Keys within the `Host.data` dictionary.
 
@@ -113,11 +236,8 @@ class NornirHostProxy:
 
     def _get_host_value(self, name: str) -> Any:
         """
-        Retrieves a value from the current host, following NornFlow's documented
-        precedence for the `host.` namespace:
-        1. Direct host attributes (e.g., name, platform, data).
-        2. Keys within the `host.data` dictionary (which is already fully resolved
-           by Nornir, including group and default data).
+        Retrieves a value from the current host. See `_lookup_host_value` for the
+        precedence rules.
 
         Args:
             name: The name of the attribute or data key.
@@ -127,15 +247,12 @@ class NornirHostProxy:
 
         Raises:
             VariableError: If `self._current_host` is not set
-                (safeguard, shouldbe caught by `__getattr__`).
+                (safeguard, should be caught by `__getattr__`).
             VariableError: If the name is not found.
         """
-        if not self._current_host:
+        current_host = self._current_host
+        if not current_host:
             # This check is a safeguard; __getattr__ should prevent calls if _current_host is None.
             raise VariableError("NornirHostProxy: _get_host_value called with no current host.")
 
-        # Try to retrieve 'name' using Host.get(), which covers direct attributes, data, and inheritance.
-        value = self._current_host.get(name)
-        if value is None:
-            raise VariableError(f"Attribute or key '{name}' not found in host '{self._current_host.name}'.")
-        return value
+        return _lookup_host_value(current_host, name)
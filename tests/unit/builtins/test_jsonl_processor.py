@@ -0,0 +1,133 @@
+import gzip
+import json
+
+import pytest
+from nornir.core import Nornir
+from nornir.core.inventory import Defaults, Groups, Host, Hosts, Inventory
+from nornir.core.task import Result, Task
+from nornir.plugins.runners import ThreadedRunner
+
+from nornflow.builtins import JsonlResultsProcessor
+from nornflow.builtins.constants import SILENT_SKIP_FLAG
+from nornflow.cli.run import parse_processors
+from nornflow.masking import REDACTED
+from nornflow.utils import load_processor
+
+NUM_HOSTS = 200
+
+
+def _report(task: Task) -> Result:
+    if task.host.name.endswith("7"):
+        raise RuntimeError(f"boom on {task.host.name}")
+    return Result(host=task.host, result={"name": task.host.name, "password": "hunter2"}, changed=True)
+
+
+@pytest.fixture()
+def nornir() -> Nornir:
+    hosts = Hosts({f"dev{i:03d}": Host(name=f"dev{i:03d}") for i in range(NUM_HOSTS)})
+    inventory = Inventory(hosts=hosts, groups=Groups(), defaults=Defaults())
+    return Nornir(inventory=inventory, runner=ThreadedRunner(num_workers=20))
+
+
+def _read_lines(path, compressed=False):
+    opener = gzip.open if compressed else open
+    with opener(path, "rt", encoding="utf-8") as stream:
+        return [json.loads(line) for line in stream]
+
+
+class TestJsonlResultsProcessor:
+    def test_writes_one_line_per_task_and_host(self, tmp_path, nornir):
+        path = tmp_path / "out" / "results.jsonl"
+        processor = JsonlResultsProcessor(path=str(path))
+
+        nornir.with_processors([processor]).run(task=_report)
+        processor.print_final_workflow_summary()
+
+        lines = _read_lines(path)
+        assert len(lines) == NUM_HOSTS
+        assert processor.lines_written == NUM_HOSTS
+        assert {line["host"] for line in lines} == set(nornir.inventory.hosts)
+        by_host = {line["host"]: line for line in lines}
+
+        ok = by_host["dev000"]
+        assert ok["task"] == "_report"
+        assert ok["status"] == "success"
+        assert ok["changed"] is True
+        assert ok["exception"] is None
+        assert ok["duration_ms"] >= 0
+        assert ok["result"] == {"name": "dev000", "password": REDACTED}
+
+        failed = by_host["dev007"]
+        assert failed["status"] == "failed"
+        assert failed["failed"] is True
+        assert "boom on dev007" in failed["exception"]
+
+    def test_gzip_is_inferred_from_suffix(self, tmp_path, nornir):
+        path = tmp_path / "results.jsonl.gz"
+        processor = JsonlResultsProcessor(path=str(path))
+
+        nornir.with_processors([processor]).run(task=_report)
+        processor.close()
+
+        assert processor.compress is True
+        assert len(_read_lines(path, compressed=True)) == NUM_HOSTS
+
+    def test_redaction_disabled_and_result_excluded(self, tmp_path, nornir):
+        revealed = tmp_path / "revealed.jsonl"
+        no_result = tmp_path / "no_result.jsonl"
+        processors = [
+            JsonlResultsProcessor(path=str(revealed), redaction_enabled=False),
+            JsonlResultsProcessor(path=str(no_result), include_result=False),
+        ]
+
+        nornir.with_processors(processors).run(task=_report)
+        for processor in processors:
+            processor.close()
+
+        assert _read_lines(revealed)[0]["result"]["password"] == "hunter2"
+        assert "result" not in _read_lines(no_result)[0]
+
+    def test_silent_skipped_hosts_are_not_written(self, tmp_path, nornir):
+        path = tmp_path / "results.jsonl"
+        nornir.inventory.hosts["dev001"].data[SILENT_SKIP_FLAG] = True
+        processor = JsonlResultsProcessor(path=str(path))
+
+        nornir.with_processors([processor]).run(task=_report)
+        processor.close()
+
+        hosts = {line["host"] for line in _read_lines(path)}
+        assert "dev001" not in hosts
+        assert len(hosts) == NUM_HOSTS - 1
+
+    def test_flush_output_makes_lines_readable_before_close(self, tmp_path, nornir):
+        path = tmp_path / "results.jsonl"
+        processor = JsonlResultsProcessor(path=str(path))
+
+        nornir.with_processors([processor]).run(task=_report)
+        processor.flush_output()
+
+        assert len(_read_lines(path)) == NUM_HOSTS
+        processor.close()
+        assert not processor.is_open
+
+    def test_reopening_truncates_previous_run(self, tmp_path, nornir):
+        path = tmp_path / "results.jsonl"
+        processor = JsonlResultsProcessor(path=str(path))
+        with_processor = nornir.with_processors([processor])
+
+        with_processor.run(task=_report)
+        processor.close()
+        with_processor.run(task=_report, on_failed=True)
+        processor.close()
+
+        assert len(_read_lines(path)) == NUM_HOSTS
+
+    def test_loadable_from_cli_processors_string(self, tmp_path):
+        path = tmp_path / "cli.jsonl.gz"
+        configs = parse_processors(f"class='nornflow.builtins.JsonlResultsProcessor',args={{'path': '{path}'}}")
+
+        processor = load_processor(configs[0])
+
+        assert isinstance(processor, JsonlResultsProcessor)
+        assert processor.path == path
+        assert processor.compress is True
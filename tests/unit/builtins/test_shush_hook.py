@@ -246,8 +246,8 @@ class TestShushHook:
         """Test get_resolved_value with Jinja2 expression that evaluates to True."""
         hook = ShushHook("{{ true }}")
         
-        # Configure vars_manager to return "true" string when resolving
-        mock_vars_manager.resolve_string.return_value = "true"
+        # Evaluate the hook's condition against an empty context
+        mock_vars_manager.resolve_condition.side_effect = lambda condition, host_name: condition.evaluate({})
         
         # Configure hook context
         hook._current_context = {"vars_manager": mock_vars_manager}
@@ -260,14 +260,16 @@ class TestShushHook:
         result = hook.get_resolved_value(mock_task, as_bool=True, default=False)
         
         assert result is True
-        mock_vars_manager.resolve_string.assert_called_with("{{ true }}", "test_host")
+        condition, host_name = mock_vars_manager.resolve_condition.call_args.args
+        assert (condition.source, host_name) == ("{{ true }}", "test_host")
+        assert condition.is_expression
 
     def test_get_resolved_value_with_jinja2_expression_false(self, mock_task, mock_vars_manager):
         """Test get_resolved_value with Jinja2 expression that evaluates to False."""
         hook = ShushHook("{{ false }}")
         
-        # Configure vars_manager to return "false" string when resolving
-        mock_vars_manager.resolve_string.return_value = "false"
+        # Evaluate the hook's condition against an empty context
+        mock_vars_manager.resolve_condition.side_effect = lambda condition, host_name: condition.evaluate({})
         
         # Configure hook context
         hook._current_context = {"vars_manager": mock_vars_manager}
@@ -280,7 +282,9 @@ class TestShushHook:
         result = hook.get_resolved_value(mock_task, as_bool=True, default=False)
         
         assert result is False
-        mock_vars_manager.resolve_string.assert_called_with("{{ false }}", "test_host")
+        condition, host_name = mock_vars_manager.resolve_condition.call_args.args
+        assert (condition.source, host_name) == ("{{ false }}", "test_host")
+        assert condition.is_expression
 
     def test_hook_with_truthy_non_boolean_values(self):
         """Test hook handles truthy non-boolean values correctly."""
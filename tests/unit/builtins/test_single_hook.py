@@ -108,13 +108,13 @@ class TestSingleHook:
         mock_host = MagicMock()
         mock_host.name = "host1"
         mock_task.nornir.inventory.hosts = {"host1": mock_host}
-        mock_vars_manager.resolve_string.return_value = "true"
+        mock_vars_manager.resolve_condition.return_value = True
         hook._current_context = {"vars_manager": mock_vars_manager}
 
         hook.task_started(mock_task)
 
         assert hook._active is True
-        mock_vars_manager.resolve_string.assert_called_once()
+        mock_vars_manager.resolve_condition.assert_called_once()
 
     def test_task_instance_started_sets_delegate(self, mock_host):
         """Test task_instance_started designates the first host as delegate."""
@@ -1,11 +1,12 @@
 import builtins
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 from nornir.core.task import Result
 
-from nornflow.builtins.processors.default_processor import DefaultNornFlowProcessor
+from nornflow.builtins.processors.default_processor import DefaultNornFlowProcessor, output_lock
 from nornflow.builtins.tasks import _countdown, _prompt_enter, echo, pause, write_file
 from nornflow.builtins.tasks import set as set_task
 
@@ -138,6 +139,28 @@ class TestPauseTask:
 
         mock_lock.release.assert_not_called()
 
+    def test_pause_flushes_queued_output_before_prompting(self, pause_task):
+        """Output queued on the async writer is printed before the pause prompt."""
+        processor = DefaultNornFlowProcessor(async_output=True)
+        pause_task.nornir.processors = [processor]
+        printed = []
+
+        def queued_result(index):
+            time.sleep(0.01)
+            printed.append(f"RESULT {index}")
+
+        for index in range(3):
+            processor._emit(lambda index=index: queued_result(index))
+        try:
+            with patch("builtins.input", side_effect=lambda prompt: printed.append(prompt)):
+                pause(pause_task)
+        finally:
+            processor._pause_lock_holders.discard(("pause_task", "router1"))
+            output_lock.release()
+            processor.flush_output()
+
+        assert printed == ["RESULT 0", "RESULT 1", "RESULT 2", "[router1] Press Enter to continue..."]
+
     def test_pause_releases_lock_when_no_processor(self, pause_task):
         """When no processor is found, pause releases output_lock itself."""
         mock_lock = MagicMock()
@@ -0,0 +1,83 @@
+import json
+import threading
+
+import pytest
+
+from nornflow.builtins.processors.timing_metrics import TaskTimingMetrics, percentile
+
+
+class TestPercentile:
+    @pytest.mark.parametrize(
+        ("percent", "expected"),
+        [(50, 5.0), (90, 9.0), (99, 10.0), (100, 10.0), (0, 1.0)],
+    )
+    def test_nearest_rank(self, percent, expected):
+        values = [float(v) for v in range(1, 11)]
+
+        assert percentile(values, percent) == expected
+
+    def test_single_value(self):
+        assert percentile([42.0], 99) == 42.0
+
+
+class TestTaskTimingMetrics:
+    def test_summary_per_task(self):
+        metrics = TaskTimingMetrics()
+        for index in range(1, 101):
+            metrics.record("backup", f"r{index}", float(index))
+        metrics.record("ping", "r1", 3.0)
+
+        summary = metrics.summarize(slowest=3)
+
+        assert list(summary) == ["backup", "ping"]
+        backup = summary["backup"]
+        assert backup["count"] == 100
+        assert backup["total_ms"] == 5050.0
+        assert (backup["p50_ms"], backup["p90_ms"], backup["p99_ms"], backup["max_ms"]) == (50, 90, 99, 100)
+        assert backup["slowest_hosts"] == [
+            {"host": "r100", "duration_ms": 100.0},
+            {"host": "r99", "duration_ms": 99.0},
+            {"host": "r98", "duration_ms": 98.0},
+        ]
+        assert summary["ping"]["slowest_hosts"] == [{"host": "r1", "duration_ms": 3.0}]
+
+    def test_slowest_zero_lists_no_hosts(self):
+        metrics = TaskTimingMetrics()
+        metrics.record("backup", "r1", 1.0)
+
+        assert metrics.summarize(slowest=0)["backup"]["slowest_hosts"] == []
+
+    def test_empty_and_clear(self):
+        metrics = TaskTimingMetrics()
+        assert metrics.summarize() == {}
+
+        metrics.record("backup", "r1", 1.0)
+        assert len(metrics) == 1
+        metrics.clear()
+        assert len(metrics) == 0
+
+    def test_concurrent_records_are_not_lost(self):
+        metrics = TaskTimingMetrics()
+
+        def worker(offset):
+            for index in range(500):
+                metrics.record("backup", f"h{offset}-{index}", float(index))
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.summarize()["backup"]["count"] == 4000
+
+    def test_export_json(self, tmp_path):
+        metrics = TaskTimingMetrics()
+        metrics.record("backup", "r1", 12.5)
+        path = tmp_path / "reports" / "timing.json"
+
+        written = metrics.export_json(path, extra={"duration_ms": 20.0})
+
+        document = json.loads(written.read_text())
+        assert document["duration_ms"] == 20.0
+        assert document["tasks"]["backup"]["max_ms"] == 12.5
@@ -7,6 +7,10 @@ from nornflow.cli.exceptions import CLIRunError
 from nornflow.cli.run import (
     csv_to_list,
     get_nornflow_builder,
+    confirm_next_batch,
+    parse_batch_size,
+    parse_execution_strategy,
+    parse_failure_budget,
     parse_failure_strategy,
     parse_inventory_filters,
     parse_key_value_pairs,
@@ -16,7 +20,8 @@ from nornflow.cli.run import (
     process_value,
     run,
 )
-from nornflow.constants import FailureStrategy
+from nornflow.batching import BatchProgress
+from nornflow.constants import BatchSize, ExecutionStrategy, FailureBudget, FailureStrategy, OutputMode
 from tests.unit.core.test_processors_utils import TestProcessor, TestProcessor2
 
 
@@ -321,6 +326,85 @@ class TestFailureStrategyParsing:
             parse_failure_strategy("invalid-strategy")
 
 
+class TestFailureBudgetParsing:
+    """Test failure budget parsing."""
+
+    def test_parse_failure_budget_valid(self):
+        assert parse_failure_budget("3") == FailureBudget(max_failures=3)
+        assert parse_failure_budget("10%") == FailureBudget(max_fail_percentage=10.0)
+
+    def test_parse_failure_budget_none(self):
+        assert parse_failure_budget(None) is None
+        assert parse_failure_budget("") is None
+
+    def test_parse_failure_budget_invalid(self):
+        with pytest.raises(CLIRunError):
+            parse_failure_budget("lots")
+
+
+class TestBatchOptions:
+    """Test rolling execution (--batch-size / --batch-confirm) options."""
+
+    def test_parse_batch_size(self):
+        assert parse_batch_size("4") == BatchSize(hosts=4)
+        assert parse_batch_size("25%") == BatchSize(percentage=25.0)
+        assert parse_batch_size(None) is None
+
+    def test_parse_batch_size_invalid(self):
+        with pytest.raises(CLIRunError):
+            parse_batch_size("0")
+
+    @patch("nornflow.cli.run.typer.confirm", return_value=False)
+    def test_confirm_next_batch_defaults_to_no_after_failures(self, mock_confirm):
+        progress = BatchProgress(number=1, total=3, hosts=("r1", "r2"), failed_hosts=("r2",), remaining_hosts=4)
+
+        assert confirm_next_batch(progress) is False
+        assert "batch 2/3" in mock_confirm.call_args.args[0]
+        assert mock_confirm.call_args.kwargs["default"] is False
+
+    @patch("nornflow.cli.run.NornFlowBuilder")
+    def test_get_nornflow_builder_with_batches(self, mock_builder_cls):
+        mock_builder = MagicMock()
+        mock_builder_cls.return_value = mock_builder
+
+        get_nornflow_builder("test_task", None, None, "", batch_size="10%", batch_confirm=True)
+
+        mock_builder.with_batch_size.assert_called_once_with(BatchSize(percentage=10.0))
+        mock_builder.with_batch_gate.assert_called_once_with(confirm_next_batch)
+
+    @patch("nornflow.cli.run.NornFlowBuilder")
+    def test_get_nornflow_builder_without_batches(self, mock_builder_cls):
+        mock_builder = MagicMock()
+        mock_builder_cls.return_value = mock_builder
+
+        get_nornflow_builder("test_task", None, None, "")
+
+        mock_builder.with_batch_size.assert_not_called()
+        mock_builder.with_batch_gate.assert_not_called()
+
+
+class TestExecutionStrategyOption:
+    """Test the --execution-strategy option."""
+
+    def test_parse_execution_strategy(self):
+        assert parse_execution_strategy("free") == ExecutionStrategy.FREE
+        assert parse_execution_strategy("Linear") == ExecutionStrategy.LINEAR
+        assert parse_execution_strategy(None) is None
+
+    def test_parse_execution_strategy_invalid(self):
+        with pytest.raises(CLIRunError):
+            parse_execution_strategy("parallel")
+
+    @patch("nornflow.cli.run.NornFlowBuilder")
+    def test_get_nornflow_builder_with_execution_strategy(self, mock_builder_cls):
+        mock_builder = MagicMock()
+        mock_builder_cls.return_value = mock_builder
+
+        get_nornflow_builder("test_task", None, None, "", execution_strategy="free")
+
+        mock_builder.with_execution_strategy.assert_called_once_with(ExecutionStrategy.FREE)
+
+
 class TestNornflowBuilderIntegration:
     """Test integration of CLI arguments with NornFlowBuilder."""
 
@@ -460,6 +544,50 @@ class TestNornflowBuilderIntegration:
         # Verify failure strategy was passed to builder
         mock_builder.with_failure_strategy.assert_called_once_with(FailureStrategy.RUN_ALL)
 
+    @patch("nornflow.cli.run.NornFlowBuilder")
+    def test_get_nornflow_builder_failure_budget_implies_strategy(self, mock_builder_cls):
+        """Test that --failure-budget alone selects the failure-budget strategy."""
+        mock_builder = MagicMock()
+        mock_builder_cls.return_value = mock_builder
+
+        get_nornflow_builder("test_task", None, None, "", failure_budget="10%")
+
+        mock_builder.with_failure_budget.assert_called_once_with(FailureBudget(max_fail_percentage=10.0))
+        mock_builder.with_failure_strategy.assert_called_once_with(FailureStrategy.FAILURE_BUDGET)
+
+    @patch("nornflow.cli.run.NornFlowBuilder")
+    def test_get_nornflow_builder_failure_budget_keeps_explicit_strategy(self, mock_builder_cls):
+        """Test that an explicit --failure-strategy is not overridden by --failure-budget."""
+        mock_builder = MagicMock()
+        mock_builder_cls.return_value = mock_builder
+
+        get_nornflow_builder(
+            "test_task", None, None, "", failure_strategy=FailureStrategy.RUN_ALL, failure_budget="2"
+        )
+
+        mock_builder.with_failure_budget.assert_called_once_with(FailureBudget(max_failures=2))
+        mock_builder.with_failure_strategy.assert_called_once_with(FailureStrategy.RUN_ALL)
+
+    @patch("nornflow.cli.run.NornFlowBuilder")
+    def test_get_nornflow_builder_with_output_mode(self, mock_builder_cls):
+        """Test that the output mode is passed to NornFlow as a kwarg."""
+        mock_builder = MagicMock()
+        mock_builder_cls.return_value = mock_builder
+
+        get_nornflow_builder("test_task", None, None, "", output_mode=OutputMode.FAILURES_ONLY)
+
+        mock_builder.with_kwargs.assert_called_once_with(output_mode=OutputMode.FAILURES_ONLY)
+
+    @patch("nornflow.cli.run.NornFlowBuilder")
+    def test_get_nornflow_builder_without_output_mode(self, mock_builder_cls):
+        """Test that no output mode kwarg is set when the option is omitted."""
+        mock_builder = MagicMock()
+        mock_builder_cls.return_value = mock_builder
+
+        get_nornflow_builder("test_task", None, None, "")
+
+        mock_builder.with_kwargs.assert_not_called()
+
     @patch("nornflow.cli.run.NornFlowBuilder")
     def test_get_nornflow_builder_no_settings(self, mock_builder_cls):
         """Test building without settings file."""
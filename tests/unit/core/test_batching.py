@@ -0,0 +1,270 @@
+"""Tests for rolling (batched) workflow execution."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from nornir.core import Nornir
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.plugins.runners import SerialRunner
+
+from nornflow import NornFlow
+from nornflow.batching import BatchProgress, count_batches
+from nornflow.builtins.processors import DefaultNornFlowProcessor, NornFlowFailureStrategyProcessor
+from nornflow.constants import BatchSize, FailureBudget, FailureStrategy
+from nornflow.exceptions import CoreError
+from nornflow.models import WorkflowModel
+from nornflow.nornir_manager import NornirManager
+from nornflow.settings import NornFlowSettings
+
+
+def make_manager(host_count):
+    hosts = Hosts({f"r{index}": Host(f"r{index}") for index in range(1, host_count + 1)})
+    manager = NornirManager.__new__(NornirManager)
+    manager.connection_pool = None
+    manager._inventory_index = None
+    manager.nornir = Nornir(inventory=Inventory(hosts=hosts), runner=SerialRunner())
+    return manager
+
+
+def make_task(name, seen, fail_on=()):
+    """Workflow task double recording the hosts it runs on and failing some of them."""
+    task = MagicMock()
+    task.name = name
+
+    def run(nornir_manager, **kwargs):
+        hosts = list(nornir_manager.nornir.inventory.hosts)
+        seen.append((name, hosts))
+        nornir_manager.nornir.data.failed_hosts.update(host for host in hosts if host in fail_on)
+
+    task.run.side_effect = run
+    return task
+
+
+def make_nornflow(host_count, tasks, *, strategy=FailureStrategy.SKIP_FAILED, budget=None, **settings):
+    nornflow = NornFlow.__new__(NornFlow)
+    nornflow._settings = NornFlowSettings(nornir_config_file="mock_config.yaml", **settings)
+    nornflow._failure_strategy = strategy
+    nornflow._failure_budget = budget
+    nornflow._failure_strategy_processor = None
+    nornflow._redaction_sensitive_names = frozenset()
+    nornflow._no_redact = False
+    nornflow._batch_size = None
+    nornflow._batch_gate = None
+    nornflow._shards = None
+    nornflow._distributed = None
+    nornflow._connection_pool = None
+    nornflow._execution_strategy = None
+    nornflow._dry_run = False
+    nornflow._workflow = MagicMock(spec=WorkflowModel)
+    nornflow._workflow.tasks = tasks
+    nornflow._workflow.batch_size = None
+    nornflow._workflow.execution_strategy = None
+    nornflow._workflow.failure_strategy = None
+    nornflow._workflow.failure_budget = None
+    nornflow._var_processor = MagicMock()
+    nornflow._tasks_catalog = MagicMock()
+    nornflow._nornir_manager = make_manager(host_count)
+    return nornflow
+
+
+class TestCountBatches:
+    @pytest.mark.parametrize(
+        ("total_hosts", "hosts_per_batch", "expected"),
+        [(10, 3, 4), (9, 3, 3), (1, 5, 1), (0, 5, 0)],
+    )
+    def test_count_batches(self, total_hosts, hosts_per_batch, expected):
+        assert count_batches(total_hosts, hosts_per_batch) == expected
+
+
+class TestNornirManagerIterBatches:
+    def test_batches_follow_inventory_order(self):
+        manager = make_manager(5)
+        seen = []
+
+        for batch in manager.iter_batches(2):
+            seen.append((batch, list(manager.nornir.inventory.hosts)))
+
+        assert seen == [
+            (("r1", "r2"), ["r1", "r2"]),
+            (("r3", "r4"), ["r3", "r4"]),
+            (("r5",), ["r5"]),
+        ]
+
+    def test_full_inventory_restored_after_iteration(self):
+        manager = make_manager(3)
+        full_nornir = manager.nornir
+
+        for _ in manager.iter_batches(2):
+            pass
+
+        assert manager.nornir is full_nornir
+
+    def test_full_inventory_restored_when_abandoned(self):
+        manager = make_manager(4)
+        full_nornir = manager.nornir
+
+        for _ in manager.iter_batches(1):
+            break
+
+        assert manager.nornir is full_nornir
+        assert len(manager.nornir.inventory.hosts) == 4
+
+    def test_batches_share_processors_and_state(self):
+        manager = make_manager(2)
+        processor = MagicMock()
+        manager.nornir = manager.nornir.with_processors([processor])
+        full_nornir = manager.nornir
+
+        for batch in manager.iter_batches(1):
+            assert manager.nornir.processors == [processor]
+            manager.nornir.data.failed_hosts.add(batch[0])
+
+        assert full_nornir.processors == [processor]
+        assert full_nornir.data.failed_hosts == {"r1", "r2"}
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(CoreError):
+            next(make_manager(2).iter_batches(0))
+
+
+class TestRollingExecution:
+    def test_unbatched_runs_each_task_over_full_inventory(self):
+        seen = []
+        nornflow = make_nornflow(3, [make_task("a", seen), make_task("b", seen)])
+
+        nornflow._orchestrate_execution()
+
+        assert seen == [("a", ["r1", "r2", "r3"]), ("b", ["r1", "r2", "r3"])]
+
+    def test_full_task_list_runs_per_batch(self):
+        seen = []
+        nornflow = make_nornflow(5, [make_task("a", seen), make_task("b", seen)])
+        nornflow.batch_size = "40%"
+
+        nornflow._orchestrate_execution()
+
+        assert seen == [
+            ("a", ["r1", "r2"]),
+            ("b", ["r1", "r2"]),
+            ("a", ["r3", "r4"]),
+            ("b", ["r3", "r4"]),
+            ("a", ["r5"]),
+            ("b", ["r5"]),
+        ]
+        assert len(nornflow.nornir_manager.nornir.inventory.hosts) == 5
+
+    def test_batch_size_precedence(self):
+        nornflow = make_nornflow(1, [], batch_size=10)
+        assert nornflow.batch_size == BatchSize(hosts=10)
+
+        nornflow._workflow.batch_size = BatchSize(hosts=5)
+        assert nornflow.batch_size == BatchSize(hosts=5)
+
+        nornflow.batch_size = 2
+        assert nornflow.batch_size == BatchSize(hosts=2)
+
+    def test_gate_receives_progress_and_can_abort(self):
+        seen = []
+        progress_reports = []
+        nornflow = make_nornflow(6, [make_task("a", seen, fail_on={"r2"})])
+        nornflow.batch_size = 2
+        nornflow.batch_gate = lambda progress: progress_reports.append(progress) or not progress.failed_hosts
+
+        nornflow._orchestrate_execution()
+
+        assert seen == [("a", ["r1", "r2"])]
+        assert progress_reports == [
+            BatchProgress(number=1, total=3, hosts=("r1", "r2"), failed_hosts=("r2",), remaining_hosts=4)
+        ]
+
+    def test_run_all_reports_hosts_failing_any_task_of_the_batch(self):
+        progress_reports = []
+        nornflow = make_nornflow(4, [], strategy=FailureStrategy.RUN_ALL)
+        processor = nornflow.failure_strategy_processor
+
+        def make_run_all_task(name, fail_on):
+            task = MagicMock()
+            task.name = name
+
+            def run(nornir_manager, **kwargs):
+                nornir = nornir_manager.nornir
+                processor.nornir = nornir
+                processor.task_started(task)
+                for host_name in nornir.inventory.hosts:
+                    if host_name in fail_on:
+                        nornir.data.failed_hosts.add(host_name)
+                        result = MagicMock(failed=True, exception=RuntimeError("boom"))
+                        processor.task_instance_completed(task, nornir.inventory.hosts[host_name], result)
+
+            task.run.side_effect = run
+            return task
+
+        nornflow._workflow.tasks = [make_run_all_task("a", {"r1", "r3"}), make_run_all_task("b", set())]
+        nornflow.batch_size = 2
+        nornflow.batch_gate = lambda progress: progress_reports.append(progress) or True
+
+        nornflow._orchestrate_execution()
+
+        assert progress_reports[0].failed_hosts == ("r1",)
+
+    def test_processors_count_the_whole_inventory(self):
+        nornflow = make_nornflow(5, [make_task("a", [])])
+        nornflow.batch_size = 2
+        processor = DefaultNornFlowProcessor(async_output=False)
+        nornflow.nornir_manager.nornir.processors.append(processor)
+
+        nornflow._orchestrate_execution()
+
+        assert processor.metrics_report()["total_hosts"] == 5
+
+    def test_gate_not_called_after_last_batch(self):
+        gate = MagicMock(return_value=True)
+        nornflow = make_nornflow(4, [make_task("a", [])])
+        nornflow.batch_size = 2
+        nornflow.batch_gate = gate
+
+        nornflow._orchestrate_execution()
+
+        assert gate.call_count == 1
+
+    def test_invalid_gate(self):
+        nornflow = make_nornflow(1, [])
+        with pytest.raises(CoreError):
+            nornflow.batch_gate = "yes"
+
+    def test_cancellation_stops_remaining_batches(self):
+        seen = []
+        nornflow = make_nornflow(4, [make_task("a", seen)], strategy=FailureStrategy.FAIL_FAST)
+        nornflow.batch_size = 2
+        nornflow._workflow.tasks[0].run.side_effect = lambda **kwargs: (
+            seen.append(list(kwargs["nornir_manager"].nornir.inventory.hosts)),
+            nornflow.cancellation_token.cancel("boom"),
+        )
+
+        nornflow._orchestrate_execution()
+
+        assert seen == [["r1", "r2"]]
+
+    def test_pause_between_batches_is_interrupted_by_cancellation(self):
+        nornflow = make_nornflow(4, [make_task("a", [])], batch_pause=30)
+        nornflow.batch_size = 2
+        nornflow.batch_gate = MagicMock(return_value=True)
+        nornflow.cancellation_token.cancel()
+
+        assert nornflow._pass_batch_gate(MagicMock()) is False
+        nornflow.batch_gate.assert_not_called()
+
+    def test_failure_budget_measured_against_whole_inventory(self):
+        nornflow = make_nornflow(
+            10,
+            [make_task("a", [])],
+            strategy=FailureStrategy.FAILURE_BUDGET,
+            budget=FailureBudget(max_fail_percentage=20),
+        )
+        nornflow.batch_size = 2
+
+        nornflow._orchestrate_execution()
+
+        processor = nornflow.failure_strategy_processor
+        assert isinstance(processor, NornFlowFailureStrategyProcessor)
+        assert processor.allowed_failures == 2
@@ -6,7 +6,13 @@ from unittest.mock import patch
 import pytest
 
 from nornflow.builtins.tasks import set as builtin_set_task
-from nornflow.catalogs import CallableCatalog, ClassCatalog, FileCatalog
+from nornflow.catalogs import (
+    CallableCatalog,
+    CatalogIndex,
+    ClassCatalog,
+    FileCatalog,
+    scan_module_functions,
+)
 from nornflow.constants import (
     BUILTIN_NAMESPACE,
     LOCAL_NAMESPACE,
@@ -438,3 +444,324 @@ class TestCallableCatalogRegisterFromModule:
 
         result = catalog.get_sources_by_module()
         assert sorted(result["pkg.a"]) == ["local.t1", "local.t2"]
+
+
+LAZY_TASKS_SOURCE = '''
+import sys
+
+from nornir.core.task import Result, Task
+
+sys.modules.setdefault("lazy_probe_imports", []).append(__name__)
+
+
+def backup(task: Task, path: str = "/tmp") -> Result:
+    """Back up the device config."""
+    return Result(host=task.host, result=path)
+
+
+def restore(task: Task, *, dry: bool = False) -> Result:
+    return Result(host=task.host)
+
+
+def quoted(task: "Task") -> "Result":
+    return Result(host=task.host)
+
+
+def _private(task: Task) -> Result:
+    return Result(host=task.host)
+
+
+def helper(value: int) -> int:
+    return value
+'''
+
+LAZY_FILTERS_SOURCE = '''
+from typing import Literal
+
+from nornir.core.inventory import Host
+
+
+def by_site(host: Host, site: str) -> bool:
+    """Filter hosts by site."""
+    return host.data.get("site") == site
+
+
+def always(host: Host) -> Literal[True]:
+    return True
+
+
+def not_a_filter(host: Host) -> Literal["yes"]:
+    return "yes"
+'''
+
+
+class TestLazyCallableCatalog:
+    """Tests for AST-scanned, import-on-lookup discovery."""
+
+    @pytest.fixture
+    def tasks_dir(self, tmp_path):
+        (tmp_path / "lazy_tasks_mod.py").write_text(LAZY_TASKS_SOURCE)
+        return tmp_path
+
+    @pytest.fixture(autouse=True)
+    def clear_probe(self):
+        import sys
+
+        sys.modules.pop("lazy_probe_imports", None)
+        yield
+        sys.modules.pop("lazy_probe_imports", None)
+
+    def _discover(self, directory, ast_predicate=None, **kwargs):
+        from nornflow.utils import is_nornir_task, is_nornir_task_node
+
+        catalog = CallableCatalog(name="tasks")
+        catalog.discover_items_in_dir(
+            str(directory),
+            predicate=kwargs.pop("predicate", is_nornir_task),
+            namespace=LOCAL_NAMESPACE,
+            tier=TIER_LOCAL,
+            lazy=True,
+            ast_predicate=ast_predicate or is_nornir_task_node,
+            **kwargs,
+        )
+        catalog.finalize_package_tier()
+        return catalog
+
+    def test_scan_registers_without_importing(self, tasks_dir):
+        import sys
+
+        catalog = self._discover(tasks_dir)
+
+        assert sorted(catalog.keys()) == ["local.backup", "local.restore"]
+        assert "lazy_probe_imports" not in sys.modules
+        assert not catalog.is_loaded("local.backup")
+        assert catalog.sources["local.backup"]["description"] == "Back up the device config."
+        assert catalog.sources["local.backup"]["parameters"] == ["task", "path"]
+        assert catalog.sources["local.restore"]["parameters"] == ["task", "dry"]
+        assert catalog.sources["local.restore"]["description"] == "No description available"
+
+    def test_resolve_imports_module_once(self, tasks_dir):
+        import sys
+
+        catalog = self._discover(tasks_dir)
+
+        backup = catalog.resolve("backup")
+        restore = catalog.resolve("local.restore")
+
+        assert callable(backup) and backup.__name__ == "backup"
+        assert restore.__name__ == "restore"
+        assert sys.modules["lazy_probe_imports"] == ["lazy_tasks_mod"]
+        assert catalog.is_loaded("local.backup")
+        assert catalog.resolve("backup") is backup
+
+    def test_get_materializes_and_defaults(self, tasks_dir):
+        catalog = self._discover(tasks_dir)
+
+        assert catalog.get("local.backup").__name__ == "backup"
+        assert catalog.get("local.missing", "default") == "default"
+
+    def test_mismatch_after_import_raises(self, tasks_dir):
+        catalog = self._discover(tasks_dir, predicate=lambda item: False)
+
+        with pytest.raises(CoreError, match="not a valid tasks item"):
+            catalog.resolve("backup")
+
+    def test_import_error_deferred_until_resolve(self, tmp_path):
+        (tmp_path / "broken.py").write_text(
+            "from nornir.core.task import Result, Task\n"
+            "raise RuntimeError('boom')\n"
+            "def broken(task: Task) -> Result: ...\n"
+        )
+        catalog = self._discover(tmp_path)
+
+        assert "broken" in catalog
+        with pytest.raises(CoreError, match="boom"):
+            catalog.resolve("broken")
+
+    def test_coroutine_tasks_are_discovered(self, tmp_path):
+        from nornflow.utils import is_nornir_filter_node
+
+        (tmp_path / "async_tasks_mod.py").write_text(
+            "from nornir.core.inventory import Host\n"
+            "from nornir.core.task import Result, Task\n"
+            "async def gather(task: Task) -> Result: ...\n"
+            "async def by_site(host: Host) -> bool: ...\n"
+        )
+
+        assert list(self._discover(tmp_path).keys()) == ["local.gather"]
+        assert len(self._discover(tmp_path, ast_predicate=is_nornir_filter_node)) == 0
+
+    def test_postponed_annotations_match_eager_discovery(self, tmp_path):
+        from nornflow.utils import is_nornir_task
+
+        (tmp_path / "future_tasks_mod.py").write_text(
+            "from __future__ import annotations\n"
+            "from nornir.core.task import Result, Task\n"
+            "def deferred(task: Task) -> Result: ...\n"
+        )
+        eager = CallableCatalog(name="tasks")
+        eager.discover_items_in_dir(
+            str(tmp_path), predicate=is_nornir_task, namespace=LOCAL_NAMESPACE, tier=TIER_LOCAL
+        )
+
+        assert len(eager) == 0
+        assert len(self._discover(tmp_path)) == 0
+
+    def test_syntax_error_fails_discovery(self, tmp_path):
+        (tmp_path / "bad.py").write_text("def broken(:\n")
+
+        with pytest.raises(CoreError, match="Failed to scan module"):
+            self._discover(tmp_path)
+
+    def test_filters_are_transformed_on_resolve(self, tmp_path):
+        from nornflow.utils import is_nornir_filter, is_nornir_filter_node, process_filter
+
+        (tmp_path / "lazy_filters_mod.py").write_text(LAZY_FILTERS_SOURCE)
+        catalog = self._discover(
+            tmp_path,
+            ast_predicate=is_nornir_filter_node,
+            predicate=is_nornir_filter,
+            transform_item=process_filter,
+        )
+
+        assert sorted(catalog.keys()) == ["local.always", "local.by_site"]
+        func, params = catalog.resolve("by_site")
+        assert func.__name__ == "by_site"
+        assert params == ["site"]
+
+    def test_many_files_scanned_in_parallel_keep_file_order(self, tmp_path):
+        from nornflow.utils import is_nornir_task_node
+
+        for index in range(20):
+            (tmp_path / f"mod_{index:02d}.py").write_text(
+                "from nornir.core.task import Result, Task\n"
+                f"def task_{index:02d}(task: Task) -> Result: ...\n"
+            )
+
+        with patch("nornflow.catalogs.scan_module_functions", wraps=scan_module_functions) as scan:
+            catalog = self._discover(tmp_path, ast_predicate=is_nornir_task_node)
+
+        assert scan.call_count == 20
+        assert len(catalog) == 20
+
+
+class TestCatalogIndex:
+    """Tests for the persistent per-file discovery cache."""
+
+    def test_store_save_and_reload(self, tmp_path):
+        source = tmp_path / "mod.py"
+        source.write_text("x = 1\n")
+        index_path = tmp_path / "cache" / "index.json"
+
+        index = CatalogIndex(index_path)
+        assert index.lookup("tasks", source) is None
+        index.store("tasks", source, [{"name": "x"}])
+        index.save()
+
+        reloaded = CatalogIndex(index_path)
+        assert reloaded.lookup("tasks", source) == [{"name": "x"}]
+        assert reloaded.lookup("filters", source) is None
+        assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+    def test_modified_file_is_a_miss(self, tmp_path):
+        import os
+
+        source = tmp_path / "mod.py"
+        source.write_text("x = 1\n")
+        index = CatalogIndex(tmp_path / "index.json")
+        index.store("tasks", source, ["old"])
+
+        source.write_text("x = 22\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert index.lookup("tasks", source) is None
+
+    def test_touched_but_unchanged_file_is_a_hit(self, tmp_path):
+        import os
+
+        source = tmp_path / "mod.py"
+        source.write_text("x = 1\n")
+        index = CatalogIndex(tmp_path / "index.json")
+        index.store("tasks", source, ["same"])
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert index.lookup("tasks", source) == ["same"]
+
+    def test_corrupt_or_foreign_index_is_ignored(self, tmp_path):
+        index_path = tmp_path / "index.json"
+        index_path.write_text("{not json")
+        assert len(CatalogIndex(index_path)) == 0
+
+        index_path.write_text('{"version": 999, "entries": {"tasks:/x": {}}}')
+        assert len(CatalogIndex(index_path)) == 0
+
+    def test_save_drops_deleted_files(self, tmp_path):
+        source = tmp_path / "mod.py"
+        source.write_text("x = 1\n")
+        index_path = tmp_path / "index.json"
+        index = CatalogIndex(index_path)
+        index.store("tasks", source, [])
+        index.save()
+
+        source.unlink()
+        index = CatalogIndex(index_path)
+        index.save()
+
+        assert len(CatalogIndex(index_path)) == 0
+
+    def test_lazy_discovery_reuses_index(self, tmp_path):
+        from nornflow.utils import is_nornir_task, is_nornir_task_node
+
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        (tasks_dir / "lazy_tasks_mod.py").write_text(LAZY_TASKS_SOURCE)
+        index_path = tmp_path / "index.json"
+
+        def discover():
+            index = CatalogIndex(index_path)
+            catalog = CallableCatalog(name="tasks")
+            catalog.discover_items_in_dir(
+                str(tasks_dir),
+                predicate=is_nornir_task,
+                namespace=LOCAL_NAMESPACE,
+                tier=TIER_LOCAL,
+                lazy=True,
+                ast_predicate=is_nornir_task_node,
+                index=index,
+            )
+            index.save()
+            return catalog
+
+        cold = discover()
+        with patch("nornflow.catalogs.scan_module_functions") as scan:
+            warm = discover()
+
+        scan.assert_not_called()
+        assert sorted(warm.keys()) == sorted(cold.keys())
+        assert warm.sources["local.backup"]["description"] == "Back up the device config."
+        assert warm.sources["local.backup"]["parameters"] == ["task", "path"]
+
+    def test_file_catalog_reuses_indexed_descriptions(self, tmp_path):
+        from nornflow.utils import is_yaml_file
+
+        workflows_dir = tmp_path / "workflows"
+        workflows_dir.mkdir()
+        (workflows_dir / "wf.yaml").write_text("workflow:\n  name: wf\n  description: Cached\n  tasks: []\n")
+        index_path = tmp_path / "index.json"
+
+        def discover():
+            index = CatalogIndex(index_path)
+            catalog = FileCatalog(name="workflows")
+            catalog.discover_items_in_dir(str(workflows_dir), predicate=is_yaml_file, index=index)
+            index.save()
+            return catalog
+
+        discover()
+        with patch.object(FileCatalog, "_extract_description_from_file") as extract:
+            warm = discover()
+
+        extract.assert_not_called()
+        assert warm.sources["local.wf.yaml"]["description"] == "Cached"
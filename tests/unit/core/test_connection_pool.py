@@ -0,0 +1,215 @@
+"""Tests for keeping device connections open between runs."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from nornir.core.inventory import Host
+
+from nornflow.connection_pool import connection_key, ConnectionPool, is_alive
+from nornflow.exceptions import CoreError
+from nornflow.nornir_manager import NornirManager
+from tests.unit.core.test_sharding import make_nornflow, make_nornir
+
+
+class FakeConnection:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.closed = False
+        self.connection = MagicMock(spec=["is_alive"])
+        self.connection.is_alive.side_effect = lambda: self.alive
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("nornflow.connection_pool.time.monotonic", lambda: now[0])
+    return now
+
+
+def connected_host(name="r1", plugin="netmiko", **attributes):
+    host = Host(name, **attributes)
+    host.connections[plugin] = FakeConnection()
+    return host
+
+
+class TestIsAlive:
+    def test_bool_check(self):
+        plugin = MagicMock()
+        plugin.connection = MagicMock(spec=["is_alive"])
+        plugin.connection.is_alive.return_value = False
+        assert not is_alive("r1", plugin)
+
+    def test_dict_check(self):
+        plugin = MagicMock()
+        plugin.connection = MagicMock(spec=["is_alive"])
+        plugin.connection.is_alive.return_value = {"is_alive": True}
+        assert is_alive("r1", plugin)
+
+    def test_isalive_check(self):
+        plugin = MagicMock()
+        plugin.connection = MagicMock(spec=["isalive"])
+        plugin.connection.isalive.return_value = False
+        assert not is_alive("r1", plugin)
+
+    def test_no_check_assumed_alive(self):
+        plugin = MagicMock()
+        plugin.connection = object()
+        assert is_alive("r1", plugin)
+
+
+class TestConnectionPool:
+    @pytest.mark.parametrize("kwargs", [{"idle_timeout": -1}, {"max_idle_sessions": 0}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(CoreError):
+            ConnectionPool(**kwargs)
+
+    def test_connections_reused_by_next_run(self):
+        pool = ConnectionPool()
+        host = connected_host()
+        connection = host.connections["netmiko"]
+
+        assert pool.checkin([host]) == 1
+        assert host.connections == {}
+        assert len(pool) == 1
+
+        next_host = Host("r1")
+        assert pool.checkout([next_host, Host("r2")]) == 1
+        assert next_host.connections == {"netmiko": connection}
+        assert not connection.closed
+        assert len(pool) == 0
+        assert pool.stats.reused == 1
+        assert pool.stats.returned == 1
+
+    def test_changed_parameters_not_reused(self):
+        pool = ConnectionPool()
+        pool.checkin([connected_host(password="old")])
+
+        host = Host("r1", password="new")
+        assert pool.checkout([host]) == 0
+        assert host.connections == {}
+        assert len(pool) == 1
+
+    def test_key_depends_on_plugin_and_parameters(self):
+        host = Host("r1", hostname="10.0.0.1", username="admin")
+        assert connection_key(host, "netmiko") != connection_key(host, "napalm")
+        same_host = Host("r1", hostname="10.0.0.1", username="admin")
+        assert connection_key(host, "netmiko") == connection_key(same_host, "netmiko")
+        assert "admin" not in connection_key(host, "netmiko").fingerprint
+
+    def test_host_connection_kept_over_pooled_one(self):
+        pool = ConnectionPool()
+        pool.checkin([connected_host()])
+        host = connected_host()
+        own = host.connections["netmiko"]
+
+        assert pool.checkout([host]) == 0
+        assert host.connections["netmiko"] is own
+        assert len(pool) == 1
+
+    def test_idle_connections_closed(self, clock):
+        pool = ConnectionPool(idle_timeout=60)
+        host = connected_host()
+        connection = host.connections["netmiko"]
+        pool.checkin([host])
+
+        clock[0] += 61
+        assert pool.checkout([Host("r1")]) == 0
+        assert connection.closed
+        assert pool.stats.closed_idle == 1
+
+    def test_unhealthy_connections_closed(self):
+        pool = ConnectionPool()
+        host = connected_host()
+        connection = host.connections["netmiko"]
+        connection.alive = False
+        pool.checkin([host])
+
+        next_host = Host("r1")
+        assert pool.checkout([next_host]) == 0
+        assert next_host.connections == {}
+        assert connection.closed
+        assert pool.stats.closed_unhealthy == 1
+
+    def test_failing_health_check_counts_as_dead(self):
+        pool = ConnectionPool(health_check=MagicMock(side_effect=OSError("socket closed")))
+        pool.checkin([connected_host()])
+
+        assert pool.checkout([Host("r1")]) == 0
+        assert pool.stats.closed_unhealthy == 1
+
+    def test_least_recently_used_closed_over_cap(self, clock):
+        pool = ConnectionPool(max_idle_sessions=2)
+        hosts = [connected_host(f"r{index}") for index in range(1, 4)]
+        connections = [host.connections["netmiko"] for host in hosts]
+        for host in hosts:
+            clock[0] += 1
+            pool.checkin([host])
+
+        assert len(pool) == 2
+        assert [connection.closed for connection in connections] == [True, False, False]
+        assert pool.stats.closed_over_cap == 1
+
+    def test_close(self):
+        pool = ConnectionPool()
+        host = connected_host()
+        connection = host.connections["netmiko"]
+        pool.checkin([host])
+
+        pool.close()
+
+        assert connection.closed
+        assert len(pool) == 0
+
+
+class TestNornirManagerConnectionPool:
+    def make_manager(self, pool):
+        manager = NornirManager.__new__(NornirManager)
+        manager.connection_pool = pool
+        manager._inventory_index = None
+        manager.nornir = make_nornir(["r1", "r2"])
+        return manager
+
+    def test_connections_returned_to_pool_instead_of_closed(self):
+        pool = ConnectionPool()
+        manager = self.make_manager(pool)
+        manager.nornir.close_connections = MagicMock()
+        connection = FakeConnection()
+
+        with manager:
+            manager.nornir.inventory.hosts["r1"].connections["netmiko"] = connection
+
+        manager.nornir.close_connections.assert_not_called()
+        assert not connection.closed
+        assert len(pool) == 1
+
+        next_manager = self.make_manager(pool)
+        with next_manager:
+            assert next_manager.nornir.inventory.hosts["r1"].connections == {"netmiko": connection}
+
+
+class TestNornFlowConnectionPool:
+    def test_connection_pool_property(self):
+        nornflow = make_nornflow(2)
+        pool = ConnectionPool()
+
+        nornflow.connection_pool = pool
+        assert nornflow.connection_pool is pool
+        nornflow.connection_pool = None
+        assert nornflow.connection_pool is None
+        with pytest.raises(CoreError):
+            nornflow.connection_pool = "pool"
+
+    @pytest.mark.parametrize(("shards", "uses_pool"), [(None, True), (2, False)])
+    def test_pool_only_used_by_in_process_runs(self, shards, uses_pool):
+        nornflow = make_nornflow(2)
+        nornflow.connection_pool = ConnectionPool()
+        nornflow.shards = shards
+        nornflow._orchestrate_shards = MagicMock()
+        nornflow._run_workflow_tasks = MagicMock()
+
+        nornflow._orchestrate_execution()
+
+        assert (nornflow.nornir_manager.connection_pool is nornflow.connection_pool) is uses_pool
@@ -0,0 +1,391 @@
+"""Tests for distributed (multi-machine) workflow execution."""
+
+import socket
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from nornflow.builtins import JsonlResultsProcessor
+from nornflow.constants import DEFAULT_DISTRIBUTED_PORT, DISTRIBUTED_KEY_ENV
+from nornflow.distributed import (
+    DistributedCoordinator,
+    DistributedWorker,
+    get_transport,
+    register_transport,
+    RemoteCounter,
+    RemoteFlag,
+    SocketTransport,
+)
+from nornflow.distributed.transport import TRANSPORTS
+from nornflow.exceptions import CoreError
+from nornflow.runners import CancellationToken
+from nornflow.settings import NornFlowSettings
+
+from tests.unit.core.test_sharding import _echo, make_nornflow, make_nornir, make_shard
+
+SECRET = b"s3cret"
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def listening_transport():
+    transport = SocketTransport(("127.0.0.1", 0), authkey=SECRET)
+    transport.listen()
+    return transport
+
+
+def worker_transport(coordinator_transport, authkey=SECRET):
+    return get_transport(coordinator_transport.address, authkey)
+
+
+def run_distributed(coordinator, worker_count, fake_run_shard, monkeypatch):
+    """Run 'coordinator' with in-process workers whose batches run 'fake_run_shard'."""
+    monkeypatch.setattr("nornflow.distributed.worker.run_shard", fake_run_shard)
+    transport = coordinator.transport
+    listening = threading.Event()
+    listen = transport.listen
+
+    def _listen():
+        listen()
+        listening.set()
+
+    transport.listen = _listen
+    received = []
+    thread = threading.Thread(target=coordinator.run, args=(lambda *args: received.append(args),))
+    thread.start()
+    assert listening.wait(5)
+
+    workers = [
+        DistributedWorker(
+            worker_transport(transport),
+            nornflow_settings=NornFlowSettings(nornir_config_file="mock_config.yaml"),
+            name=f"w{index}",
+        )
+        for index in range(1, worker_count + 1)
+    ]
+    worker_threads = [threading.Thread(target=worker.run) for worker in workers]
+    for worker_thread in worker_threads:
+        worker_thread.start()
+    thread.join(10)
+    for worker_thread in worker_threads:
+        worker_thread.join(10)
+    assert not thread.is_alive()
+    return workers, received
+
+
+def make_coordinator(host_count=5, hosts_per_batch=2, token=None, worker_timeout=None):
+    return DistributedCoordinator(
+        SocketTransport(("127.0.0.1", 0), authkey=SECRET),
+        [f"r{index}" for index in range(1, host_count + 1)],
+        nornflow_kwargs={"vars": {"a": 1}},
+        workflow=None,
+        workflow_path=None,
+        cancellation_token=token or CancellationToken(),
+        hosts_per_batch=hosts_per_batch,
+        worker_timeout=worker_timeout,
+    )
+
+
+class TestGetTransport:
+    @pytest.mark.parametrize(
+        ("url", "address"),
+        [
+            ("tcp://10.0.0.1", ("10.0.0.1", DEFAULT_DISTRIBUTED_PORT)),
+            ("tcp://coordinator:7400", ("coordinator", 7400)),
+            ("tcp://127.0.0.1:0", ("127.0.0.1", 0)),
+            ("unix:///run/nornflow.sock", "/run/nornflow.sock"),
+        ],
+    )
+    def test_socket_urls(self, url, address):
+        transport = get_transport(url, "key")
+
+        assert isinstance(transport, SocketTransport)
+        assert transport._address == address
+        assert transport._authkey == b"key"
+
+    @pytest.mark.parametrize("url", ["tcp://", "tcp://host:port", "unix://"])
+    def test_invalid_urls(self, url):
+        with pytest.raises(CoreError, match="Invalid"):
+            get_transport(url, "key")
+
+    def test_unknown_scheme(self):
+        with pytest.raises(CoreError, match="Unknown transport 'udp'"):
+            get_transport("udp://host:1", "key")
+
+    def test_key_from_environment(self, monkeypatch):
+        monkeypatch.setenv(DISTRIBUTED_KEY_ENV, "from-env")
+        assert get_transport("tcp://host")._authkey == b"from-env"
+
+    def test_key_required(self, monkeypatch):
+        monkeypatch.delenv(DISTRIBUTED_KEY_ENV, raising=False)
+        with pytest.raises(CoreError, match=DISTRIBUTED_KEY_ENV):
+            get_transport("tcp://host")
+
+    def test_transport_returned_unchanged(self):
+        transport = SocketTransport("/tmp/x.sock", authkey=SECRET)
+        assert get_transport(transport) is transport
+
+    def test_register_transport(self, monkeypatch):
+        monkeypatch.setitem(TRANSPORTS, "tls", TRANSPORTS["tcp"])
+        factory = MagicMock()
+        register_transport("tls", factory)
+
+        assert get_transport("tls://host", "key") is factory.return_value
+        factory.assert_called_once_with("tls://host", b"key")
+
+
+class TestSocketTransport:
+    def test_messages_both_ways(self):
+        transport = listening_transport()
+        accepted = []
+        thread = threading.Thread(target=lambda: accepted.append(transport.accept()))
+        thread.start()
+        try:
+            client = worker_transport(transport).connect()
+            thread.join(5)
+            server = accepted[0]
+            client.send(("hello", "w1"))
+            assert server.recv() == ("hello", "w1")
+            server.send(("stop",))
+            assert client.recv() == ("stop",)
+            client.close()
+            with pytest.raises(EOFError):
+                server.recv()
+        finally:
+            transport.close()
+
+    def test_wrong_secret_refused(self):
+        transport = listening_transport()
+        threading.Thread(target=transport.accept, daemon=True).start()
+        try:
+            with pytest.raises(CoreError, match="shared secrets differ"):
+                worker_transport(transport, b"wrong").connect()
+        finally:
+            transport.close()
+
+    def test_close_wakes_accept(self):
+        transport = listening_transport()
+        accepted = []
+        thread = threading.Thread(target=lambda: accepted.append(transport.accept()))
+        thread.start()
+        time.sleep(0.1)
+
+        transport.close()
+        thread.join(5)
+
+        assert accepted == [None]
+
+    @pytest.mark.parametrize("unix", [False, True])
+    def test_close_wakes_blocked_recv(self, unix, tmp_path):
+        if unix:
+            transport = SocketTransport(str(tmp_path / "coordinator.sock"), authkey=SECRET)
+            transport.listen()
+        else:
+            transport = listening_transport()
+        accepted = []
+        thread = threading.Thread(target=lambda: accepted.append(transport.accept()))
+        thread.start()
+        try:
+            client = worker_transport(transport).connect()
+            thread.join(5)
+            server = accepted[0]
+            errors = []
+            receiver = threading.Thread(target=lambda: errors.append(pytest.raises(EOFError, server.recv)))
+            receiver.start()
+            time.sleep(0.1)
+
+            server.close()
+            receiver.join(5)
+
+            assert not receiver.is_alive()
+            assert len(errors) == 1
+            client.close()
+        finally:
+            transport.close()
+
+    def test_silent_peer_does_not_block_workers(self):
+        transport = SocketTransport(("127.0.0.1", 0), authkey=SECRET, handshake_timeout=0.5)
+        transport.listen()
+        accepted = []
+        thread = threading.Thread(target=lambda: accepted.append(transport.accept()))
+        thread.start()
+        try:
+            with socket.create_connection(transport._address) as silent:
+                client = worker_transport(transport).connect()
+                thread.join(5)
+                assert accepted[0] is not None
+
+                # The silent peer is dropped once the handshake times out
+                silent.settimeout(5)
+                assert silent.recv(4096)  # the challenge
+                assert silent.recv(4096) == b""
+            client.close()
+        finally:
+            transport.close()
+
+    def test_unreachable_coordinator(self):
+        transport = listening_transport()
+        address = transport.address
+        transport.close()
+
+        worker = DistributedWorker(get_transport(address, SECRET), name="w1")
+        with pytest.raises(CoreError, match="Cannot reach"):
+            worker.run()
+
+
+class TestRemoteState:
+    def test_remote_counter(self):
+        channel = FakeChannel()
+        counter = RemoteCounter(channel, 2)
+
+        assert counter.increment() == 3
+        counter.update(7)
+        counter.update(5)
+
+        assert counter.value == 7
+        assert channel.sent == [("failure", 1)]
+
+    def test_remote_flag(self):
+        channel = FakeChannel()
+        flag = RemoteFlag(channel)
+        flag.set()
+        flag.set()
+
+        assert flag.is_set()
+        assert channel.sent == [("halt", "execution halted by a worker")]
+
+    def test_marked_flag_not_relayed(self):
+        channel = FakeChannel()
+        flag = RemoteFlag(channel)
+        flag.mark()
+
+        assert flag.is_set()
+        assert channel.sent == []
+
+
+class TestDistributedRun:
+    def test_batches_spread_over_workers(self, monkeypatch):
+        def fake_run_shard(shard):
+            assert shard.remote
+            assert shard.nornflow_kwargs["vars"] == {"a": 1}
+            assert isinstance(shard.nornflow_kwargs["nornflow_settings"], NornFlowSettings)
+            shard.post(0, ("ran", shard.hosts))
+            time.sleep(0.05)
+            shard.done({"hosts": shard.hosts})
+
+        coordinator = make_coordinator()
+        workers, received = run_distributed(coordinator, 2, fake_run_shard, monkeypatch)
+
+        assert coordinator.batches == [("r1", "r2"), ("r3", "r4"), ("r5",)]
+        assert coordinator.reports == {
+            index: {"hosts": hosts} for index, hosts in enumerate(coordinator.batches, start=1)
+        }
+        assert sorted(message[1] for _, message in received) == coordinator.batches
+        assert coordinator.errors == {}
+        assert coordinator.unrun_hosts == []
+        assert sum(worker.batches_run for worker in workers) == 3
+        assert sum(coordinator.workers.values()) == 3
+
+    def test_failures_counted_across_workers(self, monkeypatch):
+        def fake_run_shard(shard):
+            shard.failure_count.increment(len(shard.hosts))
+            shard.done({})
+
+        coordinator = make_coordinator()
+        run_distributed(coordinator, 2, fake_run_shard, monkeypatch)
+
+        assert coordinator.failure_count == 5
+
+    def test_halt_stops_handing_out_batches(self, monkeypatch):
+        def fake_run_shard(shard):
+            shard._halt.set()
+            shard.done({})
+
+        token = CancellationToken()
+        coordinator = make_coordinator(host_count=3, hosts_per_batch=1, token=token)
+        run_distributed(coordinator, 1, fake_run_shard, monkeypatch)
+
+        assert list(coordinator.reports) == [1]
+        assert coordinator.unrun_hosts == ["r2", "r3"]
+        assert token.cancelled
+
+    def test_failed_batch_and_lost_worker(self, monkeypatch):
+        def fake_run_shard(shard):
+            if shard.index == 1:
+                shard.fail("Traceback...\nValueError: nope")
+            else:
+                raise RuntimeError("worker crashed")
+
+        coordinator = make_coordinator(host_count=2, hosts_per_batch=1)
+        monkeypatch.setattr(threading, "excepthook", lambda args: None)
+        run_distributed(coordinator, 1, fake_run_shard, monkeypatch)
+
+        assert coordinator.errors == {
+            1: "Traceback...\nValueError: nope",
+            2: "worker disconnected before the batch completed",
+        }
+
+
+    def test_gives_up_without_workers(self):
+        coordinator = make_coordinator(host_count=3, hosts_per_batch=2, worker_timeout=0.3)
+
+        started = time.monotonic()
+        coordinator.run(lambda *args: None)
+
+        assert time.monotonic() - started < 5
+        assert coordinator.errors == {
+            1: "no worker connected within 0.3 seconds",
+            2: "no worker connected within 0.3 seconds",
+        }
+        assert coordinator.unrun_hosts == []
+
+
+class TestJsonlProcessorRemoteShards:
+    def test_remote_shard_content_merged(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        processor = JsonlResultsProcessor(path=str(path))
+        processor.start_shard(make_shard(remote=True), MagicMock())
+        make_nornir(["r1", "r2"], [processor]).run(task=_echo, name="echo")
+
+        report = processor.finish_shard()
+        assert report["lines"] == 2
+        assert "path" not in report
+        assert list(tmp_path.iterdir()) == []
+
+        parent = JsonlResultsProcessor(path=str(path))
+        parent.merge_shard_report(report)
+        assert path.read_bytes() == report["data"]
+        assert parent.lines_written == 2
+
+
+class TestNornFlowDistributed:
+    def test_distributed_property(self):
+        nornflow = make_nornflow(2)
+        transport = SocketTransport(("127.0.0.1", 0), authkey=SECRET)
+
+        nornflow.distributed = transport
+        assert nornflow.distributed is transport
+        nornflow.distributed = None
+        assert nornflow.distributed is None
+
+    def test_distributed_rejects_shards_and_batch_size(self):
+        nornflow = make_nornflow(4)
+        nornflow.distributed = SocketTransport(("127.0.0.1", 0), authkey=SECRET)
+        nornflow._check_sharding()
+
+        nornflow.shards = 2
+        with pytest.raises(CoreError, match="sharded"):
+            nornflow._check_sharding()
+
+        nornflow.shards = None
+        nornflow.batch_size = 2
+        with pytest.raises(CoreError, match="batch size"):
+            nornflow._check_sharding()
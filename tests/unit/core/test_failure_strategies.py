@@ -9,9 +9,13 @@ from nornflow.builtins.processors import (
     DefaultNornFlowProcessor,
     NornFlowFailureStrategyProcessor,
 )
-from nornflow.constants import FailureStrategy
+from nornir.plugins.runners import SerialRunner, ThreadedRunner
+
+from nornflow.constants import FailureBudget, FailureStrategy
+from nornflow.exceptions import ProcessorError, TaskCancelledError
 from nornflow.masking import REDACTED
 from nornflow.models import WorkflowModel
+from nornflow.runners import AsyncioRunner, CancellableThreadedRunner, CancellationToken
 from nornflow.settings import NornFlowSettings
 
 
@@ -23,6 +27,7 @@ class TestFailureStrategyConstants:
         assert FailureStrategy.SKIP_FAILED == "skip-failed"
         assert FailureStrategy.FAIL_FAST == "fail-fast"
         assert FailureStrategy.RUN_ALL == "run-all"
+        assert FailureStrategy.FAILURE_BUDGET == "failure-budget"
 
     def test_failure_strategy_from_string(self):
         """Test creating FailureStrategy from string values."""
@@ -597,6 +602,262 @@ class TestFailFastBehavior:
         assert len(processor.collected_errors) == 3
 
 
+class TestFailFastCancellation:
+    """Test that FAIL_FAST cancels the shared CancellationToken."""
+
+    def _failure(self, host_name, exception=None):
+        mock_task = MagicMock()
+        mock_task.name = "failing_task"
+        mock_host = MagicMock()
+        mock_host.name = host_name
+        mock_result = MagicMock()
+        mock_result.failed = True
+        mock_result.exception = exception or Exception("Connection timeout")
+        return mock_task, mock_host, mock_result
+
+    @patch("builtins.print")
+    def test_fail_fast_cancels_token(self, mock_print):
+        token = CancellationToken()
+        processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAIL_FAST, cancellation_token=token)
+
+        processor.task_instance_completed(*self._failure("host1"))
+
+        assert processor.cancellation_token is token
+        assert token.cancelled is True
+        assert "host1" in token.reason
+
+    @pytest.mark.parametrize("strategy", [FailureStrategy.SKIP_FAILED, FailureStrategy.RUN_ALL])
+    def test_other_strategies_do_not_cancel(self, strategy):
+        processor = NornFlowFailureStrategyProcessor(strategy)
+
+        processor.task_instance_completed(*self._failure("host1"))
+
+        assert processor.cancellation_token.cancelled is False
+
+    def test_cancelled_results_do_not_trigger_fail_fast(self):
+        processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAIL_FAST)
+
+        processor.task_instance_completed(*self._failure("host1", TaskCancelledError("cancelled")))
+
+        assert processor.fail_fast_triggered is False
+        assert processor.cancellation_token.cancelled is False
+        assert len(processor.collected_errors) == 1
+
+    def test_subtasks_refused_once_cancelled(self):
+        processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAIL_FAST)
+        mock_task = MagicMock()
+        mock_task.name = "subtask"
+        mock_host = MagicMock()
+        mock_host.name = "host1"
+
+        processor.subtask_instance_started(mock_task, mock_host)
+        processor.cancellation_token.cancel()
+
+        with pytest.raises(TaskCancelledError):
+            processor.subtask_instance_started(mock_task, mock_host)
+
+
+class TestFailureBudgetBehavior:
+    """Test the FAILURE_BUDGET strategy."""
+
+    def _processor(self, budget, host_count=10):
+        processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAILURE_BUDGET, failure_budget=budget)
+        mock_nornir = MagicMock()
+        mock_nornir.inventory.hosts = {f"host{i}": MagicMock() for i in range(host_count)}
+        mock_nornir.data.failed_hosts = set()
+        mock_task = MagicMock()
+        mock_task.name = "rollout"
+        mock_task.nornir = mock_nornir
+        processor.task_started(mock_task)
+        return processor, mock_task
+
+    def _fail(self, processor, task, host_name):
+        mock_host = MagicMock()
+        mock_host.name = host_name
+        mock_result = MagicMock()
+        mock_result.failed = True
+        mock_result.exception = Exception("boom")
+        processor.task_instance_completed(task, mock_host, mock_result)
+
+    def test_requires_budget(self):
+        with pytest.raises(ProcessorError, match="failure budget"):
+            NornFlowFailureStrategyProcessor(FailureStrategy.FAILURE_BUDGET)
+
+    @patch("builtins.print")
+    def test_failures_within_budget_keep_running(self, mock_print):
+        processor, task = self._processor(FailureBudget(max_failures=2))
+
+        self._fail(processor, task, "host0")
+        self._fail(processor, task, "host1")
+
+        assert processor.failure_count.value == 2
+        assert processor.budget_exceeded is False
+        assert processor.cancellation_token.cancelled is False
+        assert processor.nornir.data.failed_hosts == set()
+
+    @patch("builtins.print")
+    def test_exceeding_budget_halts(self, mock_print):
+        processor, task = self._processor(FailureBudget(max_failures=2))
+
+        for host_name in ("host0", "host1", "host2"):
+            self._fail(processor, task, host_name)
+
+        assert processor.budget_exceeded is True
+        assert processor.cancellation_token.cancelled is True
+        assert "failure budget" in processor.cancellation_token.reason
+        assert len(processor.nornir.data.failed_hosts) == 10
+        assert processor.fail_fast_triggered is False
+
+    @patch("builtins.print")
+    def test_percentage_resolved_against_inventory(self, mock_print):
+        processor, task = self._processor(FailureBudget(max_fail_percentage=10), host_count=30)
+
+        assert processor.allowed_failures == 3
+        for index in range(3):
+            self._fail(processor, task, f"host{index}")
+        assert processor.budget_exceeded is False
+
+        self._fail(processor, task, "host3")
+        assert processor.budget_exceeded is True
+
+    @patch("builtins.print")
+    def test_zero_budget_behaves_like_fail_fast(self, mock_print):
+        processor, task = self._processor(FailureBudget(max_failures=0))
+
+        self._fail(processor, task, "host0")
+
+        assert processor.cancellation_token.cancelled is True
+
+    def test_cancelled_results_not_charged_to_budget(self):
+        processor, task = self._processor(FailureBudget(max_failures=0))
+        mock_host = MagicMock()
+        mock_host.name = "host0"
+        mock_result = MagicMock()
+        mock_result.failed = True
+        mock_result.exception = TaskCancelledError("cancelled")
+
+        processor.task_instance_completed(task, mock_host, mock_result)
+
+        assert processor.failure_count.value == 0
+        assert processor.budget_exceeded is False
+
+    def test_budget_ignored_by_other_strategies(self):
+        processor = NornFlowFailureStrategyProcessor(
+            FailureStrategy.SKIP_FAILED, failure_budget=FailureBudget(max_failures=0)
+        )
+        self._fail(processor, MagicMock(), "host0")
+
+        assert processor.cancellation_token.cancelled is False
+
+
+class TestNornFlowFailureBudget:
+    """Test failure budget precedence in NornFlow."""
+
+    def _nornflow(self, settings_budget=None, workflow_budget=None, init_budget=None):
+        settings = NornFlowSettings(nornir_config_file="mock_config.yaml", failure_budget=settings_budget)
+        workflow_model = MagicMock(spec=WorkflowModel)
+        workflow_model.name = "test_workflow"
+        workflow_model.failure_strategy = FailureStrategy.FAILURE_BUDGET
+        workflow_model.failure_budget = workflow_budget
+        with patch("nornflow.nornflow.load_file_to_dict", return_value={}):
+            return NornFlow(nornflow_settings=settings, workflow=workflow_model, failure_budget=init_budget)
+
+    def test_precedence(self):
+        assert self._nornflow(settings_budget=1).failure_budget == FailureBudget(max_failures=1)
+        assert self._nornflow(settings_budget=1, workflow_budget=FailureBudget(max_failures=2)).failure_budget == (
+            FailureBudget(max_failures=2)
+        )
+        nornflow = self._nornflow(settings_budget=1, workflow_budget=FailureBudget(max_failures=2), init_budget="5%")
+        assert nornflow.failure_budget == FailureBudget(max_fail_percentage=5.0)
+
+    def test_processor_receives_budget(self):
+        nornflow = self._nornflow(workflow_budget=FailureBudget(max_failures=4))
+
+        assert nornflow.failure_strategy_processor.failure_budget == FailureBudget(max_failures=4)
+
+    def test_missing_budget_rejected(self):
+        nornflow = self._nornflow()
+
+        with pytest.raises(ProcessorError):
+            _ = nornflow.failure_strategy_processor
+
+    def test_workflow_yaml_budget(self):
+        workflow = WorkflowModel.create(
+            {
+                "workflow": {
+                    "name": "budget_workflow",
+                    "failure_strategy": "failure_budget",
+                    "failure_budget": {"max_fail_percentage": "20%"},
+                    "tasks": [{"name": "echo"}],
+                }
+            }
+        )
+
+        assert workflow.failure_strategy == FailureStrategy.FAILURE_BUDGET
+        assert workflow.failure_budget == FailureBudget(max_fail_percentage=20.0)
+
+
+class TestNornFlowCancellableRunner:
+    """Test how NornFlow installs the cancellable runner and stops between tasks."""
+
+    def _nornflow(self, runner):
+        nornflow = NornFlow.__new__(NornFlow)
+        nornflow._failure_strategy_processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAIL_FAST)
+        nornflow._settings = NornFlowSettings(nornir_config_file="mock_config.yaml", cancel_grace_period=2.5)
+        nornflow._nornir_manager = MagicMock()
+        nornflow._nornir_manager.nornir.runner = runner
+        return nornflow
+
+    def test_threaded_runner_replaced(self):
+        nornflow = self._nornflow(ThreadedRunner(num_workers=7))
+
+        nornflow._apply_runner()
+
+        runner = nornflow._nornir_manager.apply_runner.call_args.args[0]
+        assert isinstance(runner, CancellableThreadedRunner)
+        assert runner.num_workers == 7
+        assert runner.grace_period == 2.5
+        assert runner.cancellation_token is nornflow.cancellation_token
+
+    def test_asyncio_runner_observes_token(self):
+        nornflow = self._nornflow(AsyncioRunner(num_workers=3, max_concurrency=500))
+
+        nornflow._apply_runner()
+
+        runner = nornflow._nornir_manager.apply_runner.call_args.args[0]
+        assert isinstance(runner, AsyncioRunner)
+        assert (runner.num_workers, runner.max_concurrency) == (3, 500)
+        assert runner.grace_period == 2.5
+        assert runner.cancellation_token is nornflow.cancellation_token
+
+    def test_other_runners_kept(self):
+        nornflow = self._nornflow(SerialRunner())
+
+        nornflow._apply_runner()
+
+        nornflow._nornir_manager.apply_runner.assert_not_called()
+
+    def test_remaining_tasks_skipped_after_cancellation(self):
+        nornflow = self._nornflow(ThreadedRunner())
+        nornflow._dry_run = False
+        nornflow._batch_size = None
+        nornflow._shards = None
+        nornflow._distributed = None
+        nornflow._connection_pool = None
+        nornflow._execution_strategy = None
+        nornflow._workflow = MagicMock(batch_size=None, execution_strategy=None)
+        nornflow._var_processor = MagicMock()
+        nornflow._tasks_catalog = MagicMock()
+        first, second = MagicMock(), MagicMock()
+        first.run.side_effect = lambda **kwargs: nornflow.cancellation_token.cancel()
+        nornflow._workflow.tasks = [first, second]
+
+        nornflow._orchestrate_execution()
+
+        first.run.assert_called_once()
+        second.run.assert_not_called()
+
+
 class TestRunAllBehavior:
     """Test RUN_ALL specific behavior."""
 
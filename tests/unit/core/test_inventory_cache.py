@@ -0,0 +1,170 @@
+"""Tests for reusing the loaded Nornir inventory across runs."""
+
+import os
+from pathlib import Path
+
+import pytest
+from nornir.core.configuration import Config
+
+from nornflow.builtins.constants import SILENT_SKIP_FLAG, SKIP_FLAG
+from nornflow.inventory_cache import inventory_files, InventoryCache
+from nornflow.nornir_manager import NornirManager
+from nornflow.settings import NornFlowSettings
+
+HOSTS = "r1:\n  hostname: 10.0.0.1\nr2:\n  hostname: 10.0.0.2\n"
+
+
+@pytest.fixture
+def nornir_config(tmp_path):
+    (tmp_path / "hosts.yaml").write_text(HOSTS)
+    (tmp_path / "groups.yaml").write_text("{}\n")
+    (tmp_path / "defaults.yaml").write_text("{}\n")
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "inventory:\n"
+        "  plugin: SimpleInventory\n"
+        "  options:\n"
+        f"    host_file: {tmp_path / 'hosts.yaml'}\n"
+        f"    group_file: {tmp_path / 'groups.yaml'}\n"
+        f"    defaults_file: {tmp_path / 'defaults.yaml'}\n"
+        "runner:\n"
+        "  plugin: serial\n"
+        "logging:\n"
+        "  enabled: false\n"
+    )
+    return config
+
+
+def load_config(path, **kwargs):
+    return Config.from_file(str(path), **kwargs)
+
+
+def touch(path, content):
+    """Rewrite 'path' making sure its stamp changes even on coarse clocks."""
+    stat = os.stat(path)
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestInventoryFiles:
+    def test_options_and_plugin_defaults(self, nornir_config, tmp_path):
+        config = load_config(nornir_config)
+        assert set(inventory_files(config)) >= {
+            str(tmp_path / "hosts.yaml"),
+            str(tmp_path / "groups.yaml"),
+            str(tmp_path / "defaults.yaml"),
+        }
+
+    def test_unknown_plugin(self, nornir_config):
+        config = load_config(nornir_config, inventory={"plugin": "NoSuchInventory", "options": {"a": "x"}})
+        assert inventory_files(config) == (str(Path("x").resolve()),)
+
+
+class TestInventoryCache:
+    def test_second_load_reuses_inventory(self, nornir_config):
+        cache = InventoryCache()
+        first = cache.load(load_config(nornir_config))
+        second = cache.load(load_config(nornir_config))
+
+        assert second is not first
+        assert second.defaults is first.defaults
+        assert sorted(first.hosts) == sorted(second.hosts) == ["r1", "r2"]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 1
+
+    def test_changed_file_reloads(self, nornir_config, tmp_path):
+        cache = InventoryCache()
+        first = cache.load(load_config(nornir_config))
+        touch(tmp_path / "hosts.yaml", HOSTS + "r3:\n  hostname: 10.0.0.3\n")
+
+        second = cache.load(load_config(nornir_config))
+
+        assert second is not first
+        assert sorted(second.hosts) == ["r1", "r2", "r3"]
+        assert cache.misses == 2
+        assert len(cache) == 1
+
+    def test_different_inventory_options_cached_separately(self, nornir_config, tmp_path):
+        other_hosts = tmp_path / "other_hosts.yaml"
+        other_hosts.write_text("r9: {}\n")
+        cache = InventoryCache()
+        first = cache.load(load_config(nornir_config))
+        other_options = {**load_config(nornir_config).inventory.options, "host_file": str(other_hosts)}
+        other = cache.load(load_config(nornir_config, inventory={"options": other_options}))
+
+        assert list(other.hosts) == ["r9"]
+        assert cache.load(load_config(nornir_config)).defaults is first.defaults
+        assert len(cache) == 2
+
+    def test_least_recently_used_dropped(self, nornir_config, tmp_path):
+        cache = InventoryCache(max_entries=1)
+        other_hosts = tmp_path / "other_hosts.yaml"
+        other_hosts.write_text("r9: {}\n")
+        other_options = {**load_config(nornir_config).inventory.options, "host_file": str(other_hosts)}
+
+        cache.load(load_config(nornir_config))
+        cache.load(load_config(nornir_config, inventory={"options": other_options}))
+        cache.load(load_config(nornir_config))
+
+        assert cache.misses == 3
+        assert len(cache) == 1
+
+    def test_each_load_gets_its_own_hosts(self, nornir_config):
+        cache = InventoryCache()
+        first = cache.load(load_config(nornir_config))
+        first.hosts["r1"].data[SKIP_FLAG] = True
+        first.hosts["r2"].data[SILENT_SKIP_FLAG] = True
+        first.hosts["r1"].connections["netmiko"] = object()
+
+        second = cache.load(load_config(nornir_config))
+
+        assert second.hosts["r1"] is not first.hosts["r1"]
+        assert SKIP_FLAG not in second.hosts["r1"].data
+        assert SILENT_SKIP_FLAG not in second.hosts["r2"].data
+        assert second.hosts["r1"].connections == {}
+        assert first.hosts["r1"].data[SKIP_FLAG] is True
+
+    def test_copied_hosts_keep_their_own_and_inherited_attributes(self, nornir_config, tmp_path):
+        (tmp_path / "hosts.yaml").write_text(HOSTS.replace("r2:", "  groups: [core]\nr2:"))
+        (tmp_path / "groups.yaml").write_text("core:\n  platform: ios\n")
+        cache = InventoryCache()
+        cache.load(load_config(nornir_config))
+
+        copied = cache.load(load_config(nornir_config)).hosts["r1"]
+
+        assert copied.hostname == "10.0.0.1"
+        assert copied.platform == "ios"
+        assert object.__getattribute__(copied, "platform") is None
+
+    def test_clear(self, nornir_config):
+        cache = InventoryCache()
+        first = cache.load(load_config(nornir_config))
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.load(load_config(nornir_config)) is not first
+
+
+class TestNornirManagerInventoryCache:
+    def test_managers_share_inventory_only(self, nornir_config):
+        cache = InventoryCache()
+        first = NornirManager(str(nornir_config), shared_inventory_cache=cache)
+        second = NornirManager(str(nornir_config), shared_inventory_cache=cache)
+        first.set_dry_run(True)
+
+        assert second.nornir.inventory.defaults is first.nornir.inventory.defaults
+        assert second.nornir.inventory.hosts["r1"] is not first.nornir.inventory.hosts["r1"]
+        assert second.nornir.runner is not first.nornir.runner
+        assert first.nornir.data.dry_run
+        assert not second.nornir.data.dry_run
+
+    def test_no_cache_loads_every_time(self, nornir_config):
+        first = NornirManager(str(nornir_config))
+        second = NornirManager(str(nornir_config))
+
+        assert second.nornir.inventory is not first.nornir.inventory
+
+
+class TestInventoryCacheSetting:
+    def test_disabled_by_default(self):
+        assert NornFlowSettings(nornir_config_file="mock_config.yaml").inventory_cache is False
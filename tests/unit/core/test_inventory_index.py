@@ -0,0 +1,174 @@
+"""Tests for indexed inventory filtering."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from nornir.core import Nornir
+from nornir.core.inventory import Defaults, Group, Groups, Host, Hosts, Inventory, ParentGroups
+from nornir.plugins.runners import SerialRunner
+
+from nornflow.batching import in_batch
+from nornflow.builtins.filters import groups, hosts
+from nornflow.exceptions import ProcessorError
+from nornflow.inventory_index import INDEXED_FILTERS, InventoryIndex, register_indexed_filter
+from nornflow.nornir_manager import NornirManager
+
+
+def make_inventory():
+    core = Group("core", platform="ios", data={"site": "lab"})
+    edge = Group("edge")
+    host_groups = {"r1": [core], "r2": [core, edge], "r3": [edge], "r4": []}
+    platforms = {"r3": "junos"}
+    data = {"r1": {"role": "spine"}, "r2": {"role": "leaf"}, "r3": {"role": "leaf", "tags": ["a"]}}
+    inventory_hosts = Hosts(
+        {
+            name: Host(
+                name,
+                groups=ParentGroups(parents),
+                platform=platforms.get(name),
+                data=data.get(name, {}),
+            )
+            for name, parents in host_groups.items()
+        }
+    )
+    return Inventory(hosts=inventory_hosts, groups=Groups({"core": core, "edge": edge}), defaults=Defaults())
+
+
+def make_manager():
+    manager = NornirManager.__new__(NornirManager)
+    manager.connection_pool = None
+    manager._inventory_index = None
+    manager.nornir = Nornir(inventory=make_inventory(), runner=SerialRunner())
+    return manager
+
+
+def selected(manager):
+    return list(manager.nornir.inventory.hosts)
+
+
+def by_role(host: Host, role: str) -> bool:
+    return host.get("role") == role
+
+
+class TestInventoryIndex:
+    def test_named(self):
+        index = InventoryIndex(make_inventory())
+        assert index.named(["r2", "r9"]) == {"r2"}
+        assert index.names == {"r1", "r2", "r3", "r4"}
+        assert len(index) == 4
+
+    def test_in_groups(self):
+        index = InventoryIndex(make_inventory())
+        assert index.in_groups(["core"]) == {"r1", "r2"}
+        assert index.in_groups(["core", "edge"]) == {"r1", "r2", "r3"}
+        assert index.in_groups(["missing"]) == frozenset()
+
+    def test_with_platforms_includes_inherited(self):
+        index = InventoryIndex(make_inventory())
+        assert index.with_platforms(["ios"]) == {"r1", "r2"}
+        assert index.with_platforms(["junos", None]) == {"r3", "r4"}
+
+    def test_with_data_includes_inherited(self):
+        index = InventoryIndex(make_inventory())
+        assert index.with_data("role", "leaf") == {"r2", "r3"}
+        assert index.with_data("site", "lab") == {"r1", "r2"}
+        assert index.with_data("role", "border") == frozenset()
+
+    def test_unhashable_data_not_indexed(self):
+        index = InventoryIndex(make_inventory())
+        assert index.with_data("tags", ["a"]) is None
+        assert index.with_data("role", ["leaf"]) is None
+
+    def test_hosts_in_inventory_order(self):
+        index = InventoryIndex(make_inventory())
+        assert list(index.hosts({"r3", "r1", "r9"})) == ["r1", "r3"]
+        assert list(index.hosts()) == ["r1", "r2", "r3", "r4"]
+
+
+class TestBuiltinFastPaths:
+    @pytest.mark.parametrize(
+        ("filter_func", "params"),
+        [
+            (hosts, {"hosts": ["r3", "r1"]}),
+            (hosts, {"hosts": []}),
+            (groups, {"groups": ["edge"]}),
+            (groups, {"groups": []}),
+            (in_batch, {"batch_hosts": frozenset({"r2", "r4"})}),
+        ],
+    )
+    def test_same_hosts_as_filter_function(self, filter_func, params):
+        inventory = make_inventory()
+        expected = {name for name, host in inventory.hosts.items() if filter_func(host, **params)}
+
+        assert INDEXED_FILTERS[filter_func](InventoryIndex(inventory), **params) == expected
+
+    def test_string_values_use_filter_function(self):
+        index = InventoryIndex(make_inventory())
+        assert INDEXED_FILTERS[hosts](index, hosts="r1") is None
+        assert INDEXED_FILTERS[groups](index, groups="core") is None
+
+
+class TestApplyFilterChain:
+    def test_indexed_filters_do_not_call_filter_functions(self):
+        manager = make_manager()
+        spy = MagicMock(side_effect=AssertionError("filter function called"))
+        register_indexed_filter(spy, lambda index, role: index.with_data("role", role))
+        try:
+            manager.apply_filter_chain(
+                [{"filter_func": groups, "groups": ["core", "edge"]}, {"filter_func": spy, "role": "leaf"}]
+            )
+        finally:
+            del INDEXED_FILTERS[spy]
+
+        assert selected(manager) == ["r2", "r3"]
+
+    def test_other_filters_combined_in_one_pass(self, monkeypatch):
+        manager = make_manager()
+        filter_calls = []
+        original_filter = Nornir.filter
+        monkeypatch.setattr(
+            Nornir,
+            "filter",
+            lambda self, **kwargs: filter_calls.append(kwargs) or original_filter(self, **kwargs),
+        )
+
+        manager.apply_filter_chain(
+            [{"filter_func": by_role, "role": "leaf"}, {"site": "lab"}, {"filter_func": hosts, "hosts": []}]
+        )
+
+        assert selected(manager) == ["r2"]
+        assert len(filter_calls) == 1
+
+    def test_single_plain_filter_handed_to_nornir(self):
+        manager = make_manager()
+        nornir = manager.nornir = MagicMock(wraps=manager.nornir)
+
+        manager.apply_filters(filter_func=by_role, role="spine")
+
+        nornir.filter.assert_called_once_with(filter_func=by_role, role="spine")
+
+    def test_narrowed_nornir_keeps_state(self):
+        manager = make_manager()
+        original = manager.nornir
+
+        manager.apply_filters(filter_func=hosts, hosts=["r4"])
+
+        assert manager.nornir is not original
+        assert manager.nornir.data is original.data
+        assert manager.nornir.processors is original.processors
+        assert manager.nornir.inventory.groups is original.inventory.groups
+        assert list(original.inventory.hosts) == ["r1", "r2", "r3", "r4"]
+
+    def test_index_reused_across_batches(self):
+        manager = make_manager()
+        batches = []
+        for batch in manager.iter_batches(3):
+            batches.append((batch, selected(manager)))
+            index = manager._inventory_index
+
+        assert batches == [(("r1", "r2", "r3"), ["r1", "r2", "r3"]), (("r4",), ["r4"])]
+        assert manager.inventory_index is index
+
+    def test_no_filters(self):
+        with pytest.raises(ProcessorError):
+            make_manager().apply_filter_chain([])
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from nornflow import NornFlow, NornFlowBuilder
-from nornflow.constants import FailureStrategy
+from nornflow.constants import FailureStrategy, OutputMode
 from nornflow.exceptions import (
     InitializationError,
     WorkflowError,
@@ -36,6 +36,53 @@ class TestNornFlowBasicCreation:
             assert "hello_world" in nornflow.tasks_catalog
             assert "set" in nornflow.tasks_catalog
 
+    def test_lazy_catalogs_defer_task_imports(self, tmp_path, task_content):
+        """With lazy_catalogs, local task modules are scanned and only imported on resolve."""
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        (tasks_dir / "task1.py").write_text(task_content)
+
+        with patch("nornflow.nornflow.NornFlow._initialize_nornir"):
+            settings = NornFlowSettings(
+                nornir_config_file="dummy_config.yaml",
+                local_tasks=[str(tasks_dir)],
+                lazy_catalogs=True,
+            )
+            nornflow = NornFlow(nornflow_settings=settings)
+
+        catalog = nornflow.tasks_catalog
+        assert "hello_world" in catalog
+        assert not catalog.is_loaded("local.hello_world")
+        assert catalog.sources["local.hello_world"]["description"] == "Say hello world"
+
+        task_func = catalog.resolve("hello_world")
+
+        assert task_func.__name__ == "hello_world"
+        assert catalog.is_loaded("local.hello_world")
+
+    def test_catalog_index_reused_across_instances(self, tmp_path, task_content):
+        """A warm catalog index serves lazy task scans without re-parsing modules."""
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        (tasks_dir / "task1.py").write_text(task_content)
+        index_file = tmp_path / ".nornflow" / "catalog_index.json"
+        settings = NornFlowSettings(
+            nornir_config_file="dummy_config.yaml",
+            local_tasks=[str(tasks_dir)],
+            lazy_catalogs=True,
+            catalog_index_file=str(index_file),
+        )
+
+        with patch("nornflow.nornflow.NornFlow._initialize_nornir"):
+            NornFlow(nornflow_settings=settings)
+            assert index_file.exists()
+
+            with patch("nornflow.catalogs.scan_module_functions") as scan:
+                nornflow = NornFlow(nornflow_settings=settings)
+
+        scan.assert_not_called()
+        assert "hello_world" in nornflow.tasks_catalog
+
     def test_create_without_settings_uses_defaults(self):
         """Test that NornFlow requires either settings object or no kwargs at all."""
         with patch("nornflow.nornflow.NornFlow._initialize_nornir"):
@@ -256,6 +303,52 @@ class TestRedactionEnabled:
         assert nf.logs_redaction_enabled is True
 
 
+class TestOutputMode:
+    """Test the session output mode on NornFlow instances."""
+
+    def test_output_mode_defaults_to_full(self):
+        settings = NornFlowSettings(nornir_config_file="dummy.yaml")
+
+        with patch("nornflow.nornflow.NornFlow._initialize_nornir"):
+            nf = NornFlow(nornflow_settings=settings)
+
+        assert nf.output_mode is OutputMode.FULL
+        assert nf.processors[0].output_mode is OutputMode.FULL
+
+    def test_output_mode_passed_to_default_processor(self):
+        settings = NornFlowSettings(nornir_config_file="dummy.yaml")
+
+        with patch("nornflow.nornflow.NornFlow._initialize_nornir"):
+            nf = NornFlow(nornflow_settings=settings, output_mode="summary")
+
+        assert nf.output_mode is OutputMode.SUMMARY
+        assert nf.processors[0].output_mode is OutputMode.SUMMARY
+
+    def test_explicit_output_mode_overrides_processor_args(self):
+        settings = NornFlowSettings(nornir_config_file="dummy.yaml")
+        processors = [
+            {
+                "class": "nornflow.builtins.DefaultNornFlowProcessor",
+                "args": {"output_mode": "changed-only"},
+            }
+        ]
+
+        with patch("nornflow.nornflow.NornFlow._initialize_nornir"):
+            configured = NornFlow(nornflow_settings=settings, processors=processors)
+            overridden = NornFlow(
+                nornflow_settings=settings, processors=processors, output_mode=OutputMode.FAILURES_ONLY
+            )
+
+        assert configured.processors[0].output_mode is OutputMode.CHANGED_ONLY
+        assert overridden.processors[0].output_mode is OutputMode.FAILURES_ONLY
+
+    def test_invalid_output_mode_raises(self):
+        settings = NornFlowSettings(nornir_config_file="dummy.yaml")
+
+        with patch("nornflow.nornflow.NornFlow._initialize_nornir"), pytest.raises(InitializationError):
+            NornFlow(nornflow_settings=settings, output_mode="verbose")
+
+
 class TestWorkflowModelCreation:
     """Test workflow model creation."""
 
@@ -392,6 +485,8 @@ class TestNornFlowExecution:
         wf.vars = {}
         wf.description = None
         wf.failure_strategy = None
+        wf.batch_size = None
+        wf.execution_strategy = None
         wf.name = "Test WF"
 
         settings = NornFlowSettings(
@@ -407,6 +502,47 @@ class TestNornFlowExecution:
         mock_mgr.__enter__.assert_called_once()
         mock_mgr.__exit__.assert_called_once()
 
+    @patch("nornflow.nornflow.NornirManager")
+    def test_run_after_fail_fast_halt_starts_tasks_again(self, mock_mgr_cls):
+        """A token cancelled by one run() does not stop the next one."""
+        mock_mgr = MagicMock()
+        mock_mgr.nornir = MagicMock()
+        mock_mgr.nornir.inventory.hosts = {}
+        mock_mgr.nornir.data.failed_hosts = {}
+        mock_mgr.nornir.processors = []
+        mock_mgr.__enter__.return_value = mock_mgr
+        mock_mgr.__exit__.return_value = None
+        mock_mgr_cls.return_value = mock_mgr
+
+        task_mock = MagicMock()
+        task_mock.name = "echo"
+
+        wf = MagicMock(spec=WorkflowModel)
+        wf.dry_run = False
+        wf.inventory_filters = {}
+        wf.processors = []
+        wf.vars = {}
+        wf.description = None
+        wf.failure_strategy = None
+        wf.batch_size = None
+        wf.execution_strategy = None
+        wf.name = "Test WF"
+        wf.tasks = [task_mock]
+
+        settings = NornFlowSettings(nornir_config_file="dummy.yaml", local_workflows=[])
+
+        with patch("nornflow.nornflow.load_file_to_dict", return_value={}):
+            nf = NornFlow(nornflow_settings=settings, workflow=wf)
+            nf._nornir_manager = mock_mgr
+            task_mock.run.side_effect = lambda **kwargs: nf.cancellation_token.cancel("boom")
+            nf.run()
+            first_token = nf.cancellation_token
+            nf.run()
+
+        assert task_mock.run.call_count == 2
+        assert first_token.cancelled
+        assert nf.cancellation_token is not first_token
+
     @patch("nornflow.nornflow.NornirManager")
     def test_run_handles_exceptions(self, mock_mgr_cls):
         """Connections are closed even when an error occurs."""
@@ -430,6 +566,8 @@ class TestNornFlowExecution:
         wf.vars = {}
         wf.description = None
         wf.failure_strategy = None
+        wf.batch_size = None
+        wf.execution_strategy = None
         wf.name = "Test WF"
         wf.tasks = [task_mock]
     
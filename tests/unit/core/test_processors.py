@@ -1,9 +1,16 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from nornflow.builtins.constants import SILENT_SKIP_FLAG
-from nornflow.builtins.processors.default_processor import DefaultNornFlowProcessor
+from nornflow.builtins.processors.default_processor import DefaultNornFlowProcessor, output_lock
+from nornflow.builtins.processors.hook_processor import NornFlowHookProcessor
+from nornflow.builtins.processors.output_writer import AsyncOutputWriter
+from nornflow.constants import DEFAULT_TEMPLATE_CACHE_SIZE, OutputMode
 from nornflow.masking import REDACTED
 from nornflow.exceptions import ProcessorError
 from nornflow.models import WorkflowModel
@@ -65,6 +72,8 @@ class TestNornFlowProcessors:
 
         # Configure logger settings to return proper strings
         settings.logger = {"directory": "/tmp/logs", "level": "INFO"}
+        settings.template_cache_size = DEFAULT_TEMPLATE_CACHE_SIZE
+        settings.template_bytecode_cache_dir = None
 
         # Create kwargs with processors
         kwargs_processors = [
@@ -103,6 +112,8 @@ class TestProcessorPrecedence:
 
         # Configure logger settings to return proper strings
         settings.logger = {"directory": "/tmp/logs", "level": "INFO"}
+        settings.template_cache_size = DEFAULT_TEMPLATE_CACHE_SIZE
+        settings.template_bytecode_cache_dir = None
 
         # Create workflow with processors - must include at least one task
         workflow_dict = {
@@ -228,6 +239,7 @@ class TestDefaultNornFlowProcessorSilentSkip:
         with patch("nornflow.builtins.processors.default_processor.output_lock"), \
              patch("builtins.print") as mock_print:
             processor.task_instance_completed(mock_task, mock_host, mock_result)
+            processor.flush_output()
 
         assert mock_print.called
 
@@ -291,3 +303,340 @@ class TestDefaultNornFlowProcessorOutputMasking:
         assert "hunter2" not in output
         assert REDACTED in output
         assert "router1" in output
+
+
+def _completed_host(name: str) -> tuple[MagicMock, MagicMock, MagicMock]:
+    task = MagicMock()
+    task.name = "test_task"
+    host = MagicMock()
+    host.name = name
+    host.data = {}
+    host.__str__ = MagicMock(return_value=name)
+    result = MagicMock()
+    result.failed = False
+    result.skipped = False
+    result.result = f"output of {name}"
+    return task, host, result
+
+
+class TestDefaultNornFlowProcessorAsyncOutput:
+    """Test the background output pipeline of DefaultNornFlowProcessor."""
+
+    def test_results_printed_on_writer_thread(self):
+        processor = DefaultNornFlowProcessor()
+        task, host, result = _completed_host("r1")
+        printing_threads = set()
+
+        def record_thread(*_args, **_kwargs):
+            printing_threads.add(threading.current_thread().name)
+
+        with patch("builtins.print", side_effect=record_thread):
+            processor.task_instance_completed(task, host, result)
+            processor.flush_output()
+
+        assert printing_threads == {"nornflow-output-writer"}
+        processor.print_final_workflow_summary()
+
+    def test_sync_output_prints_on_caller_thread(self):
+        processor = DefaultNornFlowProcessor(async_output=False)
+        task, host, result = _completed_host("r1")
+        printing_threads = set()
+
+        def record_thread(*_args, **_kwargs):
+            printing_threads.add(threading.current_thread().name)
+
+        with patch("builtins.print", side_effect=record_thread):
+            processor.task_instance_completed(task, host, result)
+
+        assert printing_threads == {threading.current_thread().name}
+
+    def test_formatting_happens_off_worker_thread(self):
+        processor = DefaultNornFlowProcessor()
+        task, host, result = _completed_host("r1")
+        formatting_threads = []
+        original_format = processor._format_task_output
+
+        def record_format(*args, **kwargs):
+            formatting_threads.append(threading.current_thread().name)
+            return original_format(*args, **kwargs)
+
+        with patch.object(processor, "_format_task_output", side_effect=record_format), \
+             patch("builtins.print"):
+            processor.task_instance_completed(task, host, result)
+            processor.flush_output()
+
+        assert formatting_threads == ["nornflow-output-writer"]
+        processor.print_final_workflow_summary()
+
+    def test_final_summary_drains_queue_and_stops_writer(self, capsys):
+        processor = DefaultNornFlowProcessor(output_queue_size=2)
+        processor.workflow_start_time = datetime.now()
+        for name in ("r1", "r2", "r3", "r4"):
+            task, host, result = _completed_host(name)
+            processor.task_instance_started(task, host)
+            processor.task_instance_completed(task, host, result)
+
+        processor.print_final_workflow_summary()
+
+        out = capsys.readouterr().out
+        positions = [out.index(f"output of {name}") for name in ("r1", "r2", "r3", "r4")]
+        assert positions == sorted(positions)
+        assert positions[-1] < out.index("EXECUTION SUMMARY")
+        assert not processor._writer.is_running
+
+    def test_pause_holder_prints_synchronously_and_releases_lock(self):
+        processor = DefaultNornFlowProcessor()
+        task, host, result = _completed_host("r1")
+        output_lock.acquire()
+        processor._pause_lock_holders.add((task.name, host.name))
+
+        with patch("builtins.print") as mock_print:
+            processor.task_instance_completed(task, host, result)
+            assert mock_print.called
+
+        assert (task.name, host.name) not in processor._pause_lock_holders
+        # The lock must be free again: another thread can take it without blocking
+        acquired = []
+
+        def try_acquire():
+            if output_lock.acquire(timeout=1):
+                acquired.append(True)
+                output_lock.release()
+
+        thread = threading.Thread(target=try_acquire)
+        thread.start()
+        thread.join()
+        assert acquired == [True]
+
+
+class TestDefaultNornFlowProcessorOutputMode:
+    """Test which result blocks DefaultNornFlowProcessor prints per output mode."""
+
+    @staticmethod
+    def _run_hosts(processor: DefaultNornFlowProcessor) -> list[str]:
+        """Complete one successful, one changed and one failed host; return printed hosts."""
+        outcomes = {"ok": (False, False), "changed": (False, True), "failed": (True, False)}
+        for name, (failed, changed) in outcomes.items():
+            task, host, result = _completed_host(name)
+            result.failed = failed
+            result.changed = changed
+            processor.task_instance_started(task, host)
+            processor.task_instance_completed(task, host, result)
+        return sorted(call.args[0].host.name for call in processor._print_task_result.call_args_list)
+
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [
+            (OutputMode.FULL, ["changed", "failed", "ok"]),
+            (OutputMode.FAILURES_ONLY, ["failed"]),
+            (OutputMode.CHANGED_ONLY, ["changed", "failed"]),
+            (OutputMode.SUMMARY, []),
+        ],
+    )
+    def test_printed_hosts_follow_mode(self, mode, expected):
+        processor = DefaultNornFlowProcessor(async_output=False, output_mode=mode)
+
+        with patch.object(processor, "_print_task_result"):
+            printed = self._run_hosts(processor)
+
+        assert printed == expected
+        assert processor.successful_executions == 2
+        assert processor.failed_executions == 1
+
+    def test_hidden_hosts_are_not_masked_or_formatted(self):
+        processor = DefaultNornFlowProcessor(async_output=False, output_mode="failures-only")
+        task, host, result = _completed_host("r1")
+
+        with patch("nornflow.builtins.processors.default_processor.mask_for_display") as mock_mask, \
+             patch.object(processor, "_format_task_output") as mock_format, \
+             patch.object(processor, "_is_output_suppressed") as mock_suppressed, \
+             patch("builtins.print"):
+            processor.task_instance_completed(task, host, result)
+
+        mock_mask.assert_not_called()
+        mock_format.assert_not_called()
+        mock_suppressed.assert_not_called()
+
+    def test_output_mode_accepts_underscore_strings(self):
+        processor = DefaultNornFlowProcessor(output_mode="CHANGED_ONLY")
+
+        assert processor.output_mode is OutputMode.CHANGED_ONLY
+
+    def test_summary_mode_skips_task_headers(self):
+        processor = DefaultNornFlowProcessor(async_output=False, output_mode=OutputMode.SUMMARY)
+        task = MagicMock()
+        task.name = "test_task"
+
+        with patch("builtins.print") as mock_print:
+            processor.task_started(task)
+
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "Execution started at" in printed
+        assert "Running task" not in printed
+
+    def test_hidden_pause_holder_releases_lock(self):
+        processor = DefaultNornFlowProcessor(output_mode=OutputMode.SUMMARY)
+        task, host, result = _completed_host("r1")
+        output_lock.acquire()
+        processor._pause_lock_holders.add((task.name, host.name))
+
+        with patch("builtins.print") as mock_print:
+            processor.task_instance_completed(task, host, result)
+
+        mock_print.assert_not_called()
+        assert (task.name, host.name) not in processor._pause_lock_holders
+        acquired = []
+
+        def try_acquire():
+            if output_lock.acquire(timeout=1):
+                acquired.append(True)
+                output_lock.release()
+
+        thread = threading.Thread(target=try_acquire)
+        thread.start()
+        thread.join()
+        assert acquired == [True]
+
+
+class TestDefaultNornFlowProcessorTimingMetrics:
+    """Test per-host timing collected and reported by DefaultNornFlowProcessor."""
+
+    def test_durations_recorded_for_hidden_hosts(self):
+        processor = DefaultNornFlowProcessor(async_output=False, output_mode=OutputMode.SUMMARY)
+        for name in ("r1", "r2"):
+            task, host, result = _completed_host(name)
+            processor.task_instance_started(task, host)
+            processor.task_instance_completed(task, host, result)
+
+        summary = processor.timing_metrics.summarize()
+
+        assert summary["test_task"]["count"] == 2
+        assert {entry["host"] for entry in summary["test_task"]["slowest_hosts"]} == {"r1", "r2"}
+
+    def test_steps_sharing_a_task_keep_separate_timings(self, capsys):
+        processor = DefaultNornFlowProcessor(async_output=False, output_mode=OutputMode.SUMMARY)
+        processor.workflow_start_time = datetime.now()
+        durations = {"r1": [100.0, 50.0], "r2": [100.0, 50.0]}
+        for step in range(2):
+            task, _, _ = _completed_host("r1")
+            processor.task_started(task)
+            for name, step_durations in durations.items():
+                _, host, result = _completed_host(name)
+                started = datetime.now()
+                processor.task_instance_started(task, host)
+                processor.start_times[(task.name, host)] = started - timedelta(
+                    milliseconds=step_durations[step]
+                )
+                processor.task_instance_completed(task, host, result)
+
+        summary = processor.timing_metrics.summarize()
+
+        assert list(summary) == ["test_task_1", "test_task_2"]
+        assert [stats["label"] for stats in summary.values()] == ["test_task", "test_task"]
+        assert [stats["count"] for stats in summary.values()] == [2, 2]
+        assert summary["test_task_1"]["p50_ms"] >= 100
+        assert 50 <= summary["test_task_2"]["p50_ms"] < 100
+
+        processor.print_workflow_summary()
+        out = capsys.readouterr().out
+        assert "test_task_1" in out
+        assert "test_task_2" in out
+
+    def test_steps_keyed_by_task_model_canonical_id(self):
+        processor = DefaultNornFlowProcessor(async_output=False, output_mode=OutputMode.SUMMARY)
+        hook_processor = NornFlowHookProcessor()
+        task, host, result = _completed_host("r1")
+        task.nornir.processors = [hook_processor]
+        hook_processor.task_specific_context = {"task_model": SimpleNamespace(name="echo", canonical_id="echo_3")}
+
+        processor.task_started(task)
+        processor.task_instance_started(task, host)
+        processor.task_instance_completed(task, host, result)
+
+        assert processor.timing_metrics.summarize()["echo_3"]["label"] == "echo"
+
+    def test_summary_prints_percentiles_and_slowest_hosts(self, capsys):
+        processor = DefaultNornFlowProcessor(async_output=False, output_mode=OutputMode.SUMMARY, slowest_hosts=1)
+        processor.workflow_start_time = datetime.now()
+        processor.timing_metrics.record("test_task", "fast", 10.0)
+        processor.timing_metrics.record("test_task", "slow", 900.0)
+
+        processor.print_workflow_summary()
+
+        out = capsys.readouterr().out
+        assert "Task Timing" in out
+        assert "p90: 900ms" in out
+        assert "Slowest: slow (900ms)" in out
+        assert "fast (10ms)" not in out
+
+    def test_timing_section_disabled(self, capsys):
+        processor = DefaultNornFlowProcessor(async_output=False, slowest_hosts=0)
+        processor.workflow_start_time = datetime.now()
+        processor.timing_metrics.record("test_task", "r1", 10.0)
+
+        processor.print_workflow_summary()
+
+        assert "Task Timing" not in capsys.readouterr().out
+
+    def test_metrics_file_written_at_end(self, tmp_path):
+        path = tmp_path / "metrics.json"
+        processor = DefaultNornFlowProcessor(output_mode=OutputMode.SUMMARY, metrics_file=str(path))
+        processor.workflow_start_time = datetime.now()
+        task, host, result = _completed_host("r1")
+        processor.task_instance_started(task, host)
+        processor.task_instance_completed(task, host, result)
+
+        with patch("builtins.print"):
+            processor.print_final_workflow_summary()
+
+        report = json.loads(path.read_text())
+        assert report["successful_executions"] == 1
+        assert report["tasks"]["test_task"]["count"] == 1
+        assert report["tasks"]["test_task"]["slowest_hosts"][0]["host"] == "r1"
+
+    def test_metrics_report_is_json_serializable(self):
+        processor = DefaultNornFlowProcessor()
+        processor.timing_metrics.record("test_task", "r1", 1.0)
+
+        assert json.loads(json.dumps(processor.metrics_report()))["tasks"]["test_task"]["count"] == 1
+
+
+class TestAsyncOutputWriter:
+    """Test the AsyncOutputWriter used by output processors."""
+
+    def test_jobs_run_in_order_under_lock(self):
+        lock = threading.RLock()
+        writer = AsyncOutputWriter(lock, max_queue_size=4)
+        seen = []
+
+        for index in range(20):
+            writer.submit(lambda index=index: seen.append((index, lock._is_owned())))
+        writer.flush()
+        writer.close()
+
+        assert [index for index, _ in seen] == list(range(20))
+        assert all(owned for _, owned in seen)
+
+    def test_failing_job_does_not_stop_writer(self):
+        writer = AsyncOutputWriter(threading.RLock(), max_queue_size=4)
+        seen = []
+
+        writer.submit(lambda: 1 / 0)
+        writer.submit(lambda: seen.append("after"))
+        writer.flush()
+
+        assert seen == ["after"]
+        writer.close()
+
+    def test_close_is_idempotent_and_writer_restarts(self):
+        writer = AsyncOutputWriter(threading.RLock(), max_queue_size=4)
+        writer.close()
+
+        seen = []
+        writer.submit(lambda: seen.append(1))
+        writer.close()
+        assert not writer.is_running
+
+        writer.submit(lambda: seen.append(2))
+        writer.close()
+        assert seen == [1, 2]
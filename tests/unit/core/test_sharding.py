@@ -0,0 +1,376 @@
+"""Tests for sharded (multi-process) workflow execution."""
+
+import gzip
+import json
+import multiprocessing
+import os
+import queue
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from nornir.core import Nornir
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.core.processor import Processors
+from nornir.core.task import Result, Task
+from nornir.plugins.runners import SerialRunner
+
+from nornflow import NornFlow
+from nornflow.builtins import JsonlResultsProcessor
+from nornflow.builtins.processors import DefaultNornFlowProcessor, NornFlowFailureStrategyProcessor
+from nornflow.builtins.processors.timing_metrics import TaskTimingMetrics
+from nornflow.cli.exceptions import CLIRunError
+from nornflow.cli.run import parse_shards
+from nornflow.constants import FailureBudget, FailureStrategy
+from nornflow.exceptions import CoreError, SettingsError
+from nornflow.models import WorkflowModel
+from nornflow.nornir_manager import NornirManager
+from nornflow.runners import CancellationToken
+from nornflow.settings import NornFlowSettings
+from nornflow.sharding import (
+    partition_hosts,
+    picklable,
+    ShardCoordinator,
+    SharedCounter,
+    SharedFlag,
+)
+from nornflow.utils import normalize_shards
+
+
+def make_nornir(host_names, processors=()):
+    hosts = Hosts({name: Host(name) for name in host_names})
+    return Nornir(inventory=Inventory(hosts=hosts), runner=SerialRunner(), processors=Processors(processors))
+
+
+def make_nornflow(host_count, *, processors=(), **settings):
+    nornflow = NornFlow.__new__(NornFlow)
+    nornflow._settings = NornFlowSettings(nornir_config_file="mock_config.yaml", **settings)
+    nornflow._shards = None
+    nornflow._distributed = None
+    nornflow._connection_pool = None
+    nornflow._batch_size = None
+    nornflow._workflow = MagicMock(spec=WorkflowModel)
+    nornflow._workflow.batch_size = None
+    nornflow._var_processor = MagicMock()
+    manager = NornirManager.__new__(NornirManager)
+    manager.connection_pool = None
+    manager._inventory_index = None
+    manager.nornir = make_nornir([f"r{index}" for index in range(1, host_count + 1)], processors)
+    nornflow._nornir_manager = manager
+    return nornflow
+
+
+def make_shard(index=1, total_hosts=4, failure_count=None, remote=False):
+    return SimpleNamespace(index=index, total_hosts=total_hosts, failure_count=failure_count, remote=remote)
+
+
+def _exit_silently() -> None:
+    os._exit(0)
+
+
+def _echo(task: Task) -> Result:
+    if task.host.name == "r2":
+        raise RuntimeError("boom on r2")
+    return Result(host=task.host, result=task.host.name)
+
+
+class TestNormalizeShards:
+    @pytest.mark.parametrize(("value", "expected"), [(None, None), (1, 1), (4, 4), ("3", 3), (" 2 ", 2)])
+    def test_valid_values(self, value, expected):
+        assert normalize_shards(value, SettingsError) == expected
+
+    def test_auto_uses_cpu_count(self, monkeypatch):
+        monkeypatch.setattr("nornflow.utils.os.cpu_count", lambda: 6)
+        assert normalize_shards("AUTO", SettingsError) == 6
+
+    @pytest.mark.parametrize("value", [0, -1, "0", "many", 2.5, True])
+    def test_invalid_values(self, value):
+        with pytest.raises(SettingsError):
+            normalize_shards(value, SettingsError)
+
+    def test_settings_validate_shards(self):
+        assert NornFlowSettings(nornir_config_file="mock_config.yaml", shards="2").shards == 2
+        with pytest.raises(SettingsError):
+            NornFlowSettings(nornir_config_file="mock_config.yaml", shards="lots")
+
+    def test_cli_parse_shards(self):
+        assert parse_shards(None) is None
+        assert parse_shards("4") == 4
+        with pytest.raises(CLIRunError):
+            parse_shards("four")
+
+
+class TestPartitionHosts:
+    def test_hosts_dealt_round_robin(self):
+        assert partition_hosts(["r1", "r2", "r3", "r4", "r5"], 2) == [("r1", "r3", "r5"), ("r2", "r4")]
+
+    def test_never_more_partitions_than_hosts(self):
+        assert partition_hosts(["r1", "r2"], 8) == [("r1",), ("r2",)]
+
+    def test_every_host_in_exactly_one_partition(self):
+        hosts = [f"h{index}" for index in range(103)]
+        partitions = partition_hosts(hosts, 7)
+
+        assert len(partitions) == 7
+        assert sorted(host for partition in partitions for host in partition) == sorted(hosts)
+        assert {len(partition) for partition in partitions} == {14, 15}
+
+    def test_picklable(self):
+        assert picklable({"a": [1, 2]})
+        assert not picklable(lambda: None)
+
+
+class TestSharedState:
+    def test_shared_counter(self):
+        counter = SharedCounter(2)
+
+        assert counter.increment() == 3
+        assert counter.increment(4) == 7
+        counter.reset()
+        assert counter.value == 0
+
+    def test_shared_flag(self):
+        flag = SharedFlag()
+
+        assert not flag.is_set()
+        flag.set()
+        assert flag.is_set()
+
+
+class TestShardCoordinatorCollect:
+    def make_coordinator(self):
+        return ShardCoordinator(
+            [("r1",), ("r2",)],
+            nornflow_kwargs={},
+            workflow=MagicMock(),
+            workflow_path=None,
+            cancellation_token=CancellationToken(),
+        )
+
+    def test_messages_relayed_and_reports_collected(self):
+        coordinator = self.make_coordinator()
+        events = queue.Queue()
+        events.put(("message", 1, (0, "hello")))
+        events.put(("done", 1, {"failed_hosts": set()}))
+        events.put(("error", 2, "Traceback...\nValueError: nope"))
+        received = []
+        processes = {1: MagicMock(exitcode=None), 2: MagicMock(exitcode=None)}
+
+        coordinator._collect(events, processes, lambda *args: received.append(args))
+
+        assert received == [(0, "hello")]
+        assert coordinator.reports == {1: {"failed_hosts": set()}}
+        assert coordinator.errors == {2: "Traceback...\nValueError: nope"}
+
+    def test_dead_worker_recorded_as_error(self):
+        coordinator = self.make_coordinator()
+        events = queue.Queue()
+        events.put(("done", 1, {}))
+        processes = {1: MagicMock(exitcode=0), 2: MagicMock(exitcode=-9)}
+
+        coordinator._collect(events, processes, MagicMock())
+
+        assert coordinator.reports == {1: {}}
+        assert coordinator.errors == {2: "worker process exited with code -9"}
+
+    def test_report_sent_before_exit_drained(self):
+        coordinator = self.make_coordinator()
+        events = MagicMock()
+        events.get.side_effect = queue.Empty
+        events.get_nowait.side_effect = [("done", 1, {}), queue.Empty()]
+        processes = {1: MagicMock(exitcode=0), 2: MagicMock(exitcode=0)}
+
+        coordinator._collect(events, processes, MagicMock())
+
+        assert coordinator.reports == {1: {}}
+        assert coordinator.errors == {2: "worker process exited without reporting"}
+
+    def test_spawned_worker_exiting_without_report(self):
+        coordinator = self.make_coordinator()
+        context = multiprocessing.get_context("spawn")
+        events = context.Queue()
+        process = context.Process(target=_exit_silently)
+        process.start()
+        try:
+            coordinator._collect(events, {1: process}, MagicMock())
+        finally:
+            process.join()
+
+        assert coordinator.errors == {1: "worker process exited without reporting"}
+
+
+class TestTimingMetricsMerge:
+    def test_samples_merge_into_another_collector(self):
+        first, second = TaskTimingMetrics(), TaskTimingMetrics()
+        first.record("a", "r1", 10.0)
+        second.record("a", "r2", 30.0)
+        second.record("b", "r2", 5.0)
+
+        first.merge(second.samples())
+
+        assert first.samples() == {"a": ("a", [10.0, 30.0], ["r1", "r2"]), "b": ("b", [5.0], ["r2"])}
+
+
+class TestDefaultProcessorShardRelay:
+    def test_shard_sends_headers_and_result_blocks(self):
+        processor = DefaultNornFlowProcessor()
+        sent = []
+        processor.start_shard(make_shard(), sent.append)
+        nornir = make_nornir(["r1"], [processor])
+
+        nornir.run(task=_echo, name="echo")
+        report = processor.finish_shard()
+
+        assert sent[0] == ("task", (1, "echo"))
+        assert sent[1][0] == "output"
+        assert any("Host: r1" in line for line in sent[1][1])
+        assert report["task_executions"] == 1
+        assert report["total_hosts"] == 1
+        assert report["timings"]["echo_1"] == ("echo", report["timings"]["echo_1"][1], ["r1"])
+
+    def test_headers_printed_once_per_task(self, capsys):
+        processor = DefaultNornFlowProcessor()
+
+        processor.receive_shard_message(("task", (1, "echo")))
+        processor.receive_shard_message(("task", (1, "echo")))
+        processor.receive_shard_message(("task", (2, "echo")))
+        processor.receive_shard_message(("output", ["line one", "line two"]))
+        processor.flush_output()
+
+        out = capsys.readouterr().out
+        assert out.count("Running task: echo") == 2
+        assert "line one\nline two\n" in out
+
+    def test_merge_shard_report(self):
+        processor = DefaultNornFlowProcessor()
+        earlier = datetime.now() - timedelta(seconds=5)
+        report = {
+            "workflow_start_time": earlier,
+            "total_hosts": 2,
+            "task_count": 3,
+            "tasks_completed": 3,
+            "task_executions": 6,
+            "successful_executions": 5,
+            "failed_executions": 1,
+            "skipped_executions": 0,
+            "timings": {"echo_1": ("echo", [1.0, 2.0], ["r1", "r3"])},
+        }
+
+        processor.merge_shard_report(report)
+        processor.merge_shard_report({**report, "workflow_start_time": datetime.now(), "task_count": 2})
+
+        assert processor.workflow_start_time == earlier
+        assert processor.total_hosts == 4
+        assert processor.task_count == 3
+        assert processor.task_executions == 12
+        assert processor.failed_executions == 2
+        assert processor.timing_metrics.samples()["echo_1"][2] == ["r1", "r3", "r1", "r3"]
+
+
+class TestFailureProcessorShards:
+    def test_shards_share_the_failure_count(self):
+        counter = SharedCounter()
+        processor = NornFlowFailureStrategyProcessor(
+            FailureStrategy.FAILURE_BUDGET, failure_budget=FailureBudget(max_fail_percentage=50)
+        )
+
+        processor.start_shard(make_shard(total_hosts=10, failure_count=counter), MagicMock())
+
+        assert processor.failure_count is counter
+        assert processor.allowed_failures == 5
+
+    def test_failure_summary_includes_shard_errors(self, capsys):
+        shard_processor = NornFlowFailureStrategyProcessor(FailureStrategy.SKIP_FAILED)
+        make_nornir(["r1", "r2"], [shard_processor]).run(task=_echo, name="echo")
+        parent = NornFlowFailureStrategyProcessor(FailureStrategy.SKIP_FAILED)
+
+        parent.merge_shard_report(shard_processor.finish_shard())
+        parent.print_final_workflow_summary()
+
+        out = capsys.readouterr().out
+        assert "FAILURE SUMMARY" in out
+        assert "boom on r2" in out
+        assert parent.fail_fast_triggered is False
+
+
+class TestJsonlProcessorShards:
+    @pytest.mark.parametrize("file_name", ["results.jsonl", "results.jsonl.gz"])
+    def test_shard_files_merged_into_output(self, tmp_path, file_name):
+        path = tmp_path / file_name
+        parent = JsonlResultsProcessor(path=str(path))
+        reports = []
+        for index, hosts in enumerate([("r1", "r3"), ("r2",)], start=1):
+            processor = JsonlResultsProcessor(path=str(path))
+            processor.start_shard(make_shard(index=index), MagicMock())
+            make_nornir(hosts, [processor]).run(task=_echo, name="echo")
+            reports.append(processor.finish_shard())
+
+        for report in reports:
+            parent.merge_shard_report(report)
+
+        opener = gzip.open if file_name.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as stream:
+            records = [json.loads(line) for line in stream]
+        assert [record["host"] for record in records] == ["r1", "r3", "r2"]
+        assert parent.lines_written == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == [file_name]
+
+    def test_shard_without_output(self, tmp_path):
+        processor = JsonlResultsProcessor(path=str(tmp_path / "results.jsonl"))
+        processor.start_shard(make_shard(), MagicMock())
+
+        assert processor.finish_shard() is None
+        processor.merge_shard_report(None)
+        assert not (tmp_path / "results.jsonl").exists()
+
+
+class TestNornFlowShards:
+    def test_shards_precedence(self):
+        nornflow = make_nornflow(1, shards=4)
+        assert nornflow.shards == 4
+
+        nornflow.shards = "2"
+        assert nornflow.shards == 2
+
+        nornflow.shards = None
+        assert nornflow.shards == 4
+
+    def test_invalid_shards(self):
+        nornflow = make_nornflow(1)
+        with pytest.raises(CoreError):
+            nornflow.shards = "zero"
+
+    @pytest.mark.parametrize(
+        ("shards", "host_count", "expected"), [(None, 3, 1), (4, 3, 3), (2, 3, 2), (4, 0, 1)]
+    )
+    def test_shard_count_capped_by_inventory(self, shards, host_count, expected):
+        nornflow = make_nornflow(host_count)
+        nornflow.shards = shards
+
+        assert nornflow._shard_count() == expected
+
+    def test_sharding_rejects_batch_size(self):
+        nornflow = make_nornflow(4, shards=2)
+        nornflow._check_sharding()
+
+        nornflow.batch_size = 2
+        with pytest.raises(CoreError, match="batch size"):
+            nornflow._check_sharding()
+
+    def test_merge_shard_report(self):
+        processor = MagicMock(spec=["merge_shard_report", "receive_shard_message"])
+        nornflow = make_nornflow(2, processors=[object(), processor])
+        device_context = MagicMock(runtime_vars={})
+        nornflow._var_processor.vars_manager.get_device_context.return_value = device_context
+
+        nornflow._merge_shard_report(
+            {"failed_hosts": {"r2"}, "runtime_vars": {"r1": {"out": 1}}, "processors": {0: {}, 1: {"n": 1}}}
+        )
+        nornflow._receive_shard_message(1, ("task", (1, "echo")))
+        nornflow._receive_shard_message(0, "ignored")
+
+        assert nornflow.nornir_manager.nornir.data.failed_hosts == {"r2"}
+        assert device_context.runtime_vars == {"out": 1}
+        processor.merge_shard_report.assert_called_once_with({"n": 1})
+        processor.receive_shard_message.assert_called_once_with(("task", (1, "echo")))
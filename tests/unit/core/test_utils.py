@@ -1,3 +1,4 @@
+import threading
 from types import ModuleType
 from typing import Literal
 from unittest.mock import Mock, patch
@@ -8,9 +9,10 @@ from nornir.core.processor import Processor
 from nornir.core.task import AggregatedResult, MultiResult, Result, Task
 from pydantic_serdes.custom_collections import HashableDict
 
-from nornflow.constants import FailureStrategy
+from nornflow.constants import BatchSize, FailureBudget, FailureStrategy
 from nornflow.exceptions import CoreError, ProcessorError, ResourceError, WorkflowError
 from nornflow.utils import (
+    AtomicCounter,
     check_for_jinja2_recursive,
     convert_lists_to_tuples,
     format_variable_value,
@@ -21,6 +23,8 @@ from nornflow.utils import (
     is_nornir_task,
     is_yaml_file,
     load_processor,
+    normalize_batch_size,
+    normalize_failure_budget,
     normalize_failure_strategy,
     print_workflow_overview,
     process_filter,
@@ -159,6 +163,121 @@ class TestNormalizeFailureStrategy:
             assert result == strategy
 
 
+class TestNormalizeFailureBudget:
+    """Tests for normalize_failure_budget function."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (5, FailureBudget(max_failures=5)),
+            ("5", FailureBudget(max_failures=5)),
+            ("10%", FailureBudget(max_fail_percentage=10.0)),
+            (" 12.5% ", FailureBudget(max_fail_percentage=12.5)),
+            ({"max_failures": 3}, FailureBudget(max_failures=3)),
+            ({"max_failures": 3, "max_fail_percentage": "20%"}, FailureBudget(3, 20.0)),
+            (None, None),
+        ],
+    )
+    def test_valid_values(self, value, expected):
+        assert normalize_failure_budget(value, WorkflowError) == expected
+
+    def test_budget_passthrough(self):
+        budget = FailureBudget(max_failures=1)
+        assert normalize_failure_budget(budget, WorkflowError) is budget
+
+    @pytest.mark.parametrize(
+        "value",
+        [-1, "-1", "abc", "101%", "x%", True, 1.5, {}, {"max_hosts": 1}, {"max_failures": 2.5}, ["5"]],
+    )
+    def test_invalid_values(self, value):
+        with pytest.raises(WorkflowError):
+            normalize_failure_budget(value, WorkflowError)
+
+    @pytest.mark.parametrize(
+        ("budget", "total_hosts", "expected"),
+        [
+            (FailureBudget(max_failures=3), 100, 3),
+            (FailureBudget(max_fail_percentage=10), 55, 5),
+            (FailureBudget(max_fail_percentage=10), 5, 0),
+            (FailureBudget(max_failures=3, max_fail_percentage=50), 100, 3),
+            (FailureBudget(max_failures=30, max_fail_percentage=10), 100, 10),
+        ],
+    )
+    def test_allowed_failures(self, budget, total_hosts, expected):
+        assert budget.allowed_failures(total_hosts) == expected
+
+    def test_str(self):
+        assert str(FailureBudget(max_fail_percentage=10.0)) == "10%"
+        assert str(FailureBudget(3, 12.5)) == "3 host(s) or 12.5%"
+
+
+class TestNormalizeBatchSize:
+    """Tests for normalize_batch_size function."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (5, BatchSize(hosts=5)),
+            ("5", BatchSize(hosts=5)),
+            ("10%", BatchSize(percentage=10.0)),
+            (" 2.5% ", BatchSize(percentage=2.5)),
+            (None, None),
+        ],
+    )
+    def test_valid_values(self, value, expected):
+        assert normalize_batch_size(value, WorkflowError) == expected
+
+    @pytest.mark.parametrize("value", [0, -1, "0", "0%", "101%", "abc", "x%", True, 1.5, ["5"]])
+    def test_invalid_values(self, value):
+        with pytest.raises(WorkflowError):
+            normalize_batch_size(value, WorkflowError)
+
+    @pytest.mark.parametrize(
+        ("batch_size", "total_hosts", "expected"),
+        [
+            (BatchSize(hosts=3), 100, 3),
+            (BatchSize(percentage=10), 55, 6),
+            (BatchSize(percentage=5), 10, 1),
+            (BatchSize(percentage=100), 7, 7),
+            (BatchSize(percentage=50), 0, 1),
+        ],
+    )
+    def test_hosts_per_batch(self, batch_size, total_hosts, expected):
+        assert batch_size.hosts_per_batch(total_hosts) == expected
+
+    def test_str(self):
+        assert str(BatchSize(hosts=3)) == "3 host(s)"
+        assert str(BatchSize(percentage=12.5)) == "12.5%"
+
+
+class TestAtomicCounter:
+    """Tests for AtomicCounter."""
+
+    def test_increment_returns_new_value(self):
+        counter = AtomicCounter()
+        assert counter.increment() == 1
+        assert counter.increment(5) == 6
+        assert counter.value == 6
+
+        counter.reset()
+        assert counter.value == 0
+
+    def test_concurrent_increments_are_not_lost(self):
+        counter = AtomicCounter()
+
+        def work():
+            for _ in range(2000):
+                counter.increment()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == 16000
+
+
 class TestImportModuleFromPath:
     """Tests for import_module_from_path function."""
 
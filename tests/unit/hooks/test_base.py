@@ -59,6 +59,20 @@ class TestHook:
         hook._current_context = {"task_model": mock_task_model2}
         assert hook.should_execute(mock_task2) is True
 
+    def test_reset_execution_allows_next_run(self):
+        """Test a run_once_per_task hook executes again after reset_execution."""
+        hook = Hook()
+        hook.run_once_per_task = True
+        mock_task = MagicMock()
+        mock_task_model = MagicMock()
+        hook._current_context = {"task_model": mock_task_model}
+
+        assert hook.should_execute(mock_task) is True
+        hook.reset_execution(mock_task_model)
+
+        assert hook.should_execute(mock_task) is True
+        assert hook.should_execute(mock_task) is False
+
     def test_get_context_empty(self):
         """Test context property returns empty dict when no context set."""
         hook = Hook()
@@ -96,7 +96,7 @@ class TestJinja2ResolvableMixin:
         result = hook._resolve_jinja2("{{ variable }}", mock_host)
         
         assert result == "resolved_value"
-        mock_vars_manager.resolve_string.assert_called_with("{{ variable }}", "router1")
+        mock_vars_manager.resolve_string.assert_called_with("{{ variable }}", "router1", native=False)
 
     def test_resolve_jinja2_without_vars_manager_raises_error(self):
         """Test Jinja2 resolution raises HookError when vars_manager is missing."""
@@ -135,7 +135,7 @@ class TestJinja2ResolvableMixin:
         result = hook.get_resolved_value(mock_task, host=mock_host)
         
         assert result == "resolved"
-        mock_vars_manager.resolve_string.assert_called_with("{{ variable }}", "router1")
+        mock_vars_manager.resolve_string.assert_called_with("{{ variable }}", "router1", native=False)
 
     def test_get_resolved_value_extracts_host_when_not_provided(self):
         """Test extracts host from task when host not provided."""
@@ -156,7 +156,7 @@ class TestJinja2ResolvableMixin:
         result = hook.get_resolved_value(mock_task)
         
         assert result == "resolved"
-        mock_vars_manager.resolve_string.assert_called_with("{{ variable }}", "router1")
+        mock_vars_manager.resolve_string.assert_called_with("{{ variable }}", "router1", native=False)
 
     def test_get_resolved_value_returns_default_when_empty(self):
         """Test returns default value when hook value is empty."""
@@ -190,9 +190,27 @@ class TestJinja2ResolvableMixin:
         mock_host.name = "router1"
         
         mock_vars_manager = MagicMock()
-        mock_vars_manager.resolve_string.return_value = "false"
+        mock_vars_manager.resolve_condition.return_value = False
         
         hook._current_context = {"vars_manager": mock_vars_manager}
         
         result = hook.get_resolved_value(mock_task, host=mock_host, as_bool=True)
         assert result is False
+        mock_vars_manager.resolve_condition.assert_called_once_with(hook._condition, "router1")
+        mock_vars_manager.resolve_string.assert_not_called()
+
+    def test_condition_compiled_once_per_hook(self):
+        """Test the condition is compiled on first use and reused for every host."""
+        hook = Jinja2MixinTestHook("{{ var }}")
+        mock_vars_manager = MagicMock()
+        mock_vars_manager.resolve_condition.return_value = True
+        hook._current_context = {"vars_manager": mock_vars_manager}
+
+        for name in ("router1", "router2", "router3"):
+            mock_host = MagicMock(spec=Host)
+            mock_host.name = name
+            assert hook.get_resolved_value(MagicMock(), host=mock_host, as_bool=True) is True
+
+        conditions = {id(call.args[0]) for call in mock_vars_manager.resolve_condition.call_args_list}
+        assert conditions == {id(hook._condition)}
+        assert hook._condition.is_expression
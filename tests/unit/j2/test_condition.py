@@ -0,0 +1,90 @@
+"""Tests for precompiled conditions."""
+
+from unittest.mock import patch
+
+import pytest
+
+from nornflow.j2 import Condition, TemplateError
+
+
+class Item:
+    platform = "ios"
+    data = {"count": 3, "tags": [], "site": "dc1"}  # noqa: RUF012
+
+
+CONTEXT = {"host": Item(), "enabled": "yes", "zero": 0, "nothing": None, "flag": True}
+
+
+class TestCondition:
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "{{ host.platform == 'ios' }}",
+            "{{ host.platform == 'eos' }}",
+            "{{ host.platform == 'ios' and host.data.site == 'dc1' }}",
+            "{{ flag }}",
+            "{{ not flag }}",
+            "{{ enabled }}",
+            "{{ host.data.count }}",
+            "{{ host.data.count > 2 }}",
+            "{{ host.data.tags }}",
+            "{{ zero }}",
+            "{{ nothing }}",
+            "{{ missing | default(false) }}",
+            "{{ missing | default('on') }}",
+            "{{ 1 }}",
+            "{{ 'TRUE' | lower }}",
+        ],
+    )
+    def test_same_result_as_rendering(self, jinja2_service, source):
+        condition = jinja2_service.build_condition(source)
+
+        assert isinstance(condition, Condition)
+        assert condition.is_expression
+        assert condition.evaluate(CONTEXT) is jinja2_service.to_bool(jinja2_service.resolve_string(source, CONTEXT))
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            " {{ flag }}",
+            "{{ flag }}\n",
+            "{{- flag -}}",
+            "{{ flag }}{{ flag }}",
+            "{% if flag %}true{% endif %}",
+            "{{ {'a': {'b': 1}} }}",
+            "{# note #}{{ flag }}",
+        ],
+    )
+    def test_other_templates_rendered(self, jinja2_service, source):
+        condition = jinja2_service.build_condition(source)
+
+        assert not condition.is_expression
+        assert condition.evaluate(CONTEXT) is jinja2_service.to_bool(jinja2_service.resolve_string(source, CONTEXT))
+
+    def test_expression_not_rendered(self, jinja2_service):
+        condition = jinja2_service.build_condition("{{ host.platform == 'ios' }}")
+
+        with patch.object(jinja2_service, "resolve_string", side_effect=AssertionError("rendered")):
+            assert condition.evaluate(CONTEXT) is True
+
+    def test_undefined_variable(self, jinja2_service):
+        condition = jinja2_service.build_condition("{{ missing }}")
+
+        with pytest.raises(TemplateError, match="Undefined variable"):
+            condition.evaluate({})
+
+    def test_syntax_error_raised_on_evaluation(self, jinja2_service):
+        condition = jinja2_service.build_condition("{{ flag == }}")
+
+        assert not condition.is_expression
+        with pytest.raises(TemplateError, match="compilation failed"):
+            condition.evaluate(CONTEXT)
+
+
+class TestCompileExpression:
+    def test_returns_python_value(self, jinja2_service):
+        expression = jinja2_service.compile_expression("{{ host.data.count + 1 }}")
+        assert expression(CONTEXT) == 4
+
+    def test_not_a_single_expression(self, jinja2_service):
+        assert jinja2_service.compile_expression("count: {{ count }}") is None
@@ -35,7 +35,7 @@ class TestJinja2Service:
         result = service.resolve_string("{{ var }}", {"var": "value"})
 
         assert result == "resolved"
-        mock_compile.assert_called_once_with("{{ var }}")
+        mock_compile.assert_called_once_with("{{ var }}", False)
         mock_template.render.assert_called_once_with({"var": "value"})
 
     @patch.object(Jinja2Service, "compile_template")
@@ -82,7 +82,7 @@ class TestJinja2Service:
             result = service.resolve_data(data, context)
 
             assert result == {"key": "resolved_value"}
-            mock_resolve.assert_called_once_with("{{ var }}", context, "")
+            mock_resolve.assert_called_once_with("{{ var }}", context, "", False)
 
     def test_resolve_data_list(self):
         """Test resolve_data with list input."""
@@ -96,7 +96,7 @@ class TestJinja2Service:
             result = service.resolve_data(data, context)
 
             assert result == ["item1"]
-            mock_resolve.assert_called_once_with("{{ var }}", context, "")
+            mock_resolve.assert_called_once_with("{{ var }}", context, "", False)
 
     def test_resolve_data_tuple(self):
         """Test resolve_data with tuple input (normalized to list)."""
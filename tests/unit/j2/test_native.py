@@ -0,0 +1,80 @@
+"""Tests for rendering templates to native Python values."""
+
+import pytest
+
+from nornflow.j2 import TemplateError
+from nornflow.j2.template_cache import filters_signature, TemplateBytecodeCache
+
+
+class TestNativeResolveString:
+    def test_native_values(self, jinja2_service):
+        context = {"n": "4", "items": ["a", "b"]}
+
+        assert jinja2_service.resolve_string("{{ n | int + 1 }}", context, native=True) == 5
+        assert jinja2_service.resolve_string("{{ items }}", context, native=True) == ["a", "b"]
+        assert jinja2_service.resolve_string("{{ n == '4' }}", context, native=True) is True
+
+    def test_text_stays_a_string(self, jinja2_service):
+        assert jinja2_service.resolve_string("vlan {{ n }}", {"n": 10}, native=True) == "vlan 10"
+
+    def test_string_mode_unchanged(self, jinja2_service):
+        assert jinja2_service.resolve_string("{{ n | int + 1 }}", {"n": "4"}) == "5"
+
+    def test_undefined_variable(self, jinja2_service):
+        with pytest.raises(TemplateError):
+            jinja2_service.resolve_string("{{ missing }}", {}, native=True)
+
+    def test_compiled_separately_from_string_templates(self, jinja2_service):
+        source = "{{ n + 1 }}"
+
+        native = jinja2_service.compile_template(source, native=True)
+        text = jinja2_service.compile_template(source)
+
+        assert native is not text
+        assert jinja2_service.compile_template(source, native=True) is native
+        assert jinja2_service.render_compiled(native, source, {"n": 1}) == 2
+        assert jinja2_service.render_compiled(text, source, {"n": 1}) == "2"
+
+    def test_custom_filters_shared(self, jinja2_service):
+        jinja2_service.environment.filters["double"] = lambda value: value * 2
+
+        assert jinja2_service.resolve_string("{{ [1] | double }}", {}, native=True) == [1, 1]
+
+    def test_bytecode_cache_keeps_environments_apart(self, jinja2_service, tmp_path):
+        cache = TemplateBytecodeCache(tmp_path)
+        signature = filters_signature(jinja2_service.environment)
+        cache.compile(jinja2_service.environment, "{{ n }}", signature)
+
+        native = cache.compile(jinja2_service.native_environment, "{{ n }}", signature)
+
+        assert native.render(n=3) == 3
+        assert cache.misses == 2
+
+
+class TestNativeRenderPlan:
+    def test_render_native_values(self, jinja2_service):
+        data = {"asn": "{{ asn | int }}", "vlans": "{{ vlans }}", "name": "r-{{ asn }}", "static": "x"}
+        plan = jinja2_service.build_render_plan(data, native=True)
+
+        assert plan.is_native
+        assert plan.render({"asn": "65000", "vlans": [10, 20]}) == {
+            "asn": 65000,
+            "vlans": [10, 20],
+            "name": "r-65000",
+            "static": "x",
+        }
+
+    def test_resolve_data_native(self, jinja2_service):
+        data = ["{{ 1 + 1 }}", {"k": "{{ flag }}"}]
+        assert jinja2_service.resolve_data(data, {"flag": False}, native=True) == [2, {"k": False}]
+
+    def test_mutable_invariant_output_not_shared(self, jinja2_service):
+        plan = jinja2_service.build_render_plan(
+            {"vlans": "{{ [10, 20] }}", "asn": "{{ 65000 }}"}, native=True
+        )
+
+        first = plan.render({})
+        second = plan.render({})
+
+        assert first == second == {"vlans": [10, 20], "asn": 65000}
+        assert first["vlans"] is not second["vlans"]
@@ -0,0 +1,153 @@
+"""Tests for precompiled render plans."""
+
+from unittest.mock import patch
+
+import pytest
+
+from nornflow.j2 import RenderPlan, TemplateError
+
+
+class TestRenderPlan:
+    def test_render_matches_resolve_data(self, jinja2_service):
+        data = {
+            "static": "plain",
+            "number": 5,
+            "templated": "{{ name }}",
+            "nested": {"list": ["a", "{{ name | upper }}", ("x", "{{ name }}")], "flag": True},
+        }
+        context = {"name": "r1"}
+
+        plan = jinja2_service.build_render_plan(data)
+
+        assert isinstance(plan, RenderPlan)
+        assert plan.template_count == 3
+        assert plan.render(context) == jinja2_service.resolve_data(data, context)
+
+    def test_static_subtrees_are_shared_between_renders(self, jinja2_service):
+        data = {"config": {"lines": ["a", "b"]}, "target": "{{ name }}"}
+        plan = jinja2_service.build_render_plan(data)
+
+        first = plan.render({"name": "r1"})
+        second = plan.render({"name": "r2"})
+
+        assert first["target"] == "r1"
+        assert second["target"] == "r2"
+        assert first["config"] is second["config"]
+
+    def test_only_templated_containers_are_copied(self, jinja2_service):
+        data = {"outer": {"inner": {"value": "{{ name }}"}, "static": {"k": "v"}}}
+        plan = jinja2_service.build_render_plan(data)
+
+        first = plan.render({"name": "r1"})
+        second = plan.render({"name": "r2"})
+
+        assert first["outer"]["inner"] is not second["outer"]["inner"]
+        assert first["outer"]["static"] is second["outer"]["static"]
+        assert first["outer"]["inner"]["value"] == "r1"
+        assert second["outer"]["inner"]["value"] == "r2"
+
+    def test_static_plan_returns_fresh_top_level(self, jinja2_service):
+        plan = jinja2_service.build_render_plan({"a": 1, "b": ("x",)})
+
+        first = plan.render({})
+        second = plan.render({})
+
+        assert plan.is_static
+        assert first == {"a": 1, "b": ["x"]}
+        assert first is not second
+
+    def test_templates_compiled_once(self, jinja2_service):
+        with patch.object(
+            jinja2_service, "compile_template", wraps=jinja2_service.compile_template
+        ) as spy:
+            plan = jinja2_service.build_render_plan({"a": "{{ x }}", "b": ["{{ x }}-{{ x }}"]})
+
+            for value in range(10):
+                plan.render({"x": value})
+
+        assert spy.call_count == 2
+
+    def test_undefined_variable_raises_template_error(self, jinja2_service):
+        plan = jinja2_service.build_render_plan({"a": "{{ missing }}"})
+
+        with pytest.raises(TemplateError, match="Undefined variable"):
+            plan.render({}, error_context="unit test")
+
+    def test_compile_error_is_raised_on_render(self, jinja2_service):
+        plan = jinja2_service.build_render_plan({"a": "{{ broken "})
+
+        with pytest.raises(TemplateError):
+            plan.render({})
+
+
+class TestHostInvariantTemplates:
+    def render_count(self, jinja2_service, plan, contexts):
+        with patch.object(jinja2_service, "render_compiled", wraps=jinja2_service.render_compiled) as spy:
+            results = [plan.render(context) for context in contexts]
+        return spy.call_count, results
+
+    def test_rendered_once_for_shared_values(self, jinja2_service):
+        shared = {"site": "dc1", "vlans": [10, 20]}
+        plan = jinja2_service.build_render_plan({"a": "{{ site | upper }}: {{ vlans | join(',') }}"})
+        contexts = [{**shared, "host": name} for name in ("r1", "r2", "r3")]
+
+        count, results = self.render_count(jinja2_service, plan, contexts)
+
+        assert plan.host_invariant_count == 1
+        assert count == 1
+        assert results == [{"a": "DC1: 10,20"}] * 3
+
+    def test_host_templates_rendered_per_host(self, jinja2_service):
+        plan = jinja2_service.build_render_plan({"a": "{{ site }}-{{ host }}"})
+        contexts = [{"site": "dc1", "host": name} for name in ("r1", "r2")]
+
+        count, results = self.render_count(jinja2_service, plan, contexts)
+
+        assert plan.host_invariant_count == 0
+        assert count == 2
+        assert results == [{"a": "dc1-r1"}, {"a": "dc1-r2"}]
+
+    def test_rendered_again_when_a_value_changes(self, jinja2_service):
+        site = "dc1"
+        plan = jinja2_service.build_render_plan({"a": "{{ site }}"})
+        contexts = [{"site": site}, {"site": "dc2"}, {"site": site}, {}]
+
+        count, results = self.render_count(jinja2_service, plan, contexts[:3])
+
+        assert count == 3
+        assert results == [{"a": "dc1"}, {"a": "dc2"}, {"a": "dc1"}]
+        with pytest.raises(TemplateError):
+            plan.render(contexts[3])
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "{{ items | random }}",
+            "{{ items | random_choice }}",
+            "{{ lipsum(1) }}",
+            "{{ 'items' | is_set }}",
+            "{{ items | map('upper') | list }}",
+        ],
+    )
+    def test_context_or_random_dependent_templates_rendered_per_host(self, jinja2_service, template):
+        plan = jinja2_service.build_render_plan({"a": template})
+        assert plan.host_invariant_count == 0
+
+    def test_custom_filter_rendered_per_host(self, jinja2_service):
+        jinja2_service.environment.filters["mine"] = str.upper
+        plan = jinja2_service.build_render_plan({"a": "{{ site | mine }}"})
+        assert plan.host_invariant_count == 0
+
+
+class TestFindTemplateVariables:
+    def test_variables(self, jinja2_service):
+        variables = jinja2_service.find_template_variables(
+            "{% for v in vlans %}{{ v }}{% set x = 1 %}{{ x }}{% endfor %} {{ site | default('x') }}"
+        )
+        assert variables == {"vlans", "site"}
+
+    def test_builtin_tests_allowed(self, jinja2_service):
+        assert jinja2_service.find_template_variables("{{ site is defined }}") == {"site"}
+
+    def test_syntax_error(self, jinja2_service):
+        assert jinja2_service.find_template_variables("{{ broken ") is None
@@ -0,0 +1,318 @@
+"""Tests for the compiled template cache."""
+
+import os
+import subprocess
+import sys
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from jinja2 import Environment
+
+from nornflow.builtins.processors.default_processor import DefaultNornFlowProcessor
+from nornflow.j2 import Jinja2Service
+from nornflow.j2.exceptions import Jinja2ServiceError, TemplateValidationError
+from nornflow.j2.template_cache import (
+    filters_fingerprint,
+    filters_signature,
+    TemplateBytecodeCache,
+    TemplateCache,
+)
+from nornflow.settings import NornFlowSettings
+
+
+def compile_with(environment):
+    return MagicMock(side_effect=environment.from_string)
+
+
+def write_filter(directory, body="return f'a-{value}'"):
+    directory.mkdir(exist_ok=True)
+    (directory / "my_filters.py").write_text(f"def tag(value):\n    {body}\n")
+    return NornFlowSettings(nornir_config_file="dummy.yaml", local_j2_filters=[str(directory)])
+
+
+@pytest.fixture(autouse=True)
+def fresh_service():
+    Jinja2Service.reset()
+    yield
+    Jinja2Service.reset()
+
+
+class TestTemplateCache:
+    def test_hits_and_misses(self):
+        cache = TemplateCache(8)
+        compile_template = compile_with(Environment())
+
+        first = cache.get("{{ a }}", compile_template)
+        assert cache.get("{{ a }}", compile_template) is first
+        cache.get("{{ b }}", compile_template)
+
+        assert compile_template.call_count == 2
+        assert cache.stats == (1, 2, 0, 2, 8)
+
+    def test_least_recently_used_evicted(self):
+        cache = TemplateCache(2)
+        compile_template = compile_with(Environment())
+        for source in ("{{ a }}", "{{ b }}", "{{ a }}", "{{ c }}"):
+            cache.get(source, compile_template)
+
+        cache.get("{{ a }}", compile_template)
+        cache.get("{{ b }}", compile_template)
+
+        assert cache.stats.evictions == 2
+        assert cache.stats.hits == 2
+        assert len(cache) == 2
+
+    def test_resize_evicts_excess(self):
+        cache = TemplateCache(4)
+        compile_template = compile_with(Environment())
+        for source in ("{{ a }}", "{{ b }}", "{{ c }}"):
+            cache.get(source, compile_template)
+
+        cache.resize(1)
+
+        assert len(cache) == 1
+        assert cache.stats.evictions == 2
+
+    def test_size_zero_disables_caching(self):
+        cache = TemplateCache(0)
+        compile_template = compile_with(Environment())
+        cache.get("{{ a }}", compile_template)
+        cache.get("{{ a }}", compile_template)
+
+        assert compile_template.call_count == 2
+        assert len(cache) == 0
+
+    def test_negative_size(self):
+        with pytest.raises(Jinja2ServiceError):
+            TemplateCache(-1)
+
+    def test_compile_errors_not_cached(self):
+        cache = TemplateCache(4)
+        with pytest.raises(ValueError, match="boom"):
+            cache.get("{{ a }}", MagicMock(side_effect=ValueError("boom")))
+        assert len(cache) == 0
+
+
+class TestFiltersFingerprint:
+    def test_same_code_same_fingerprint(self):
+        source = "def upper(value):\n    return value.upper()\n"
+        first, second = {}, {}
+        exec(source, first)  # noqa: S102
+        exec(source, second)  # noqa: S102
+
+        assert first["upper"] is not second["upper"]
+        assert filters_fingerprint({"up": first["upper"]}) == filters_fingerprint({"up": second["upper"]})
+
+    def test_changes_with_names_and_code(self):
+        def upper(value):
+            return value.upper()
+
+        def lower(value):
+            return value.lower()
+
+        lower.__qualname__ = upper.__qualname__
+        assert filters_fingerprint({"up": upper}) != filters_fingerprint({"upper": upper})
+        assert filters_fingerprint({"up": upper}) != filters_fingerprint({"up": lower})
+        assert filters_fingerprint({"up": upper}) != filters_fingerprint({"up": upper, "low": lower})
+
+
+class TestTemplateBytecodeCache:
+    def test_later_cache_loads_code_without_compiling(self, tmp_path):
+        environment = Jinja2Service().environment
+        signature = filters_signature(environment)
+        TemplateBytecodeCache(tmp_path).compile(environment, "{{ a | upper }}", signature)
+
+        later = TemplateBytecodeCache(tmp_path)
+        with patch.object(environment, "compile", side_effect=AssertionError("compiled")):
+            template = later.compile(environment, "{{ a | upper }}", signature)
+
+        assert template.render(a="x") == "X"
+        assert (later.hits, later.misses) == (1, 0)
+
+    def test_keyed_by_source_and_signature(self, tmp_path):
+        environment = Environment()
+        cache = TemplateBytecodeCache(tmp_path)
+        cache.compile(environment, "{{ a }}", "one")
+
+        assert cache.compile(environment, "{{ b }}", "one").render(a=1, b=2) == "2"
+        assert cache.compile(environment, "{{ a }}", "two").render(a=1) == "1"
+        assert cache.compile(environment, "{{ a }}", "one").render(a=1) == "1"
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_corrupt_entry_recompiled(self, tmp_path):
+        environment = Environment()
+        TemplateBytecodeCache(tmp_path).compile(environment, "{{ a }}", "sig")
+        for path in tmp_path.iterdir():
+            path.write_bytes(b"garbage")
+
+        cache = TemplateBytecodeCache(tmp_path)
+        assert cache.compile(environment, "{{ a }}", "sig").render(a=1) == "1"
+        assert cache.misses == 1
+
+    def test_clear(self, tmp_path):
+        TemplateBytecodeCache(tmp_path).compile(Environment(), "{{ a }}", "sig")
+        TemplateBytecodeCache(tmp_path).clear()
+        assert not list(tmp_path.iterdir())
+
+    def test_directory_not_creatable(self, tmp_path):
+        (tmp_path / "file").write_text("")
+        with pytest.raises(Jinja2ServiceError):
+            TemplateBytecodeCache(tmp_path / "file" / "cache")
+
+
+class TestFiltersSignature:
+    def test_stable_across_processes(self):
+        script = (
+            "from nornflow.j2 import Jinja2Service\n"
+            "from nornflow.j2.template_cache import filters_signature\n"
+            "print(filters_signature(Jinja2Service().environment))\n"
+        )
+        signatures = {
+            subprocess.run(  # noqa: S603
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+
+        assert signatures == {filters_signature(Jinja2Service().environment)}
+
+    def test_changes_with_filter_names(self):
+        environment = Environment()
+        before = filters_signature(environment)
+        environment.filters["tag"] = str
+
+        assert filters_signature(environment) != before
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"trim_blocks": True},
+            {"lstrip_blocks": True},
+            {"keep_trailing_newline": True},
+            {"newline_sequence": "\r\n"},
+            {"variable_start_string": "[[", "variable_end_string": "]]"},
+            {"autoescape": True},
+            {"finalize": str},
+        ],
+    )
+    def test_changes_with_code_generation_options(self, options):
+        assert filters_signature(Environment(**options)) != filters_signature(Environment())
+
+    def test_changes_with_test_names(self):
+        environment = Environment()
+        before = filters_signature(environment)
+        environment.tests["tagged"] = bool
+
+        assert filters_signature(environment) != before
+
+    def test_option_change_not_served_stale_code(self, tmp_path):
+        source = "{% if a %}\nx\n{% endif %}\n"
+        plain, trimmed = Environment(), Environment(trim_blocks=True)
+        TemplateBytecodeCache(tmp_path).compile(plain, source, filters_signature(plain))
+
+        cache = TemplateBytecodeCache(tmp_path)
+        template = cache.compile(trimmed, source, filters_signature(trimmed))
+
+        assert template.render(a=True) == "x\n"
+        assert cache.misses == 1
+
+
+class TestJinja2ServiceTemplateCache:
+    def test_templates_kept_when_filters_unchanged(self, tmp_path):
+        settings = write_filter(tmp_path / "filters")
+        Jinja2Service.initialize_with_settings(settings)
+        template = Jinja2Service().compile_template("{{ 'x' | tag }}")
+
+        Jinja2Service.initialize_with_settings(settings)
+
+        assert Jinja2Service().compile_template("{{ 'x' | tag }}") is template
+        assert Jinja2Service().template_cache_stats.hits == 1
+
+    def test_templates_dropped_when_filters_change(self, tmp_path):
+        Jinja2Service.initialize_with_settings(write_filter(tmp_path / "a"))
+        template = Jinja2Service().compile_template("{{ 'x' | tag }}")
+
+        Jinja2Service.initialize_with_settings(write_filter(tmp_path / "b", "return f'b-{value}'"))
+        recompiled = Jinja2Service().compile_template("{{ 'x' | tag }}")
+
+        assert recompiled is not template
+        assert recompiled.render() == "b-x"
+
+    def test_size_from_settings(self):
+        Jinja2Service.initialize_with_settings(
+            NornFlowSettings(nornir_config_file="dummy.yaml", local_j2_filters=[], template_cache_size=10)
+        )
+        assert Jinja2Service().template_cache_stats.max_size == 10
+
+    def test_bytecode_cache_from_settings(self, tmp_path):
+        settings = NornFlowSettings(
+            nornir_config_file="dummy.yaml",
+            local_j2_filters=[],
+            template_bytecode_cache_dir=str(tmp_path / "bytecode"),
+        )
+        Jinja2Service.initialize_with_settings(settings)
+        Jinja2Service().compile_template("{{ a }}")
+        Jinja2Service.reset()
+        Jinja2Service.initialize_with_settings(settings)
+
+        assert Jinja2Service().compile_template("{{ a }}").render(a=1) == "1"
+        assert Jinja2Service()._bytecode_cache.hits == 1
+
+    def test_reset_clears_templates(self):
+        template = Jinja2Service().compile_template("{{ a }}")
+        Jinja2Service.reset()
+        assert Jinja2Service().compile_template("{{ a }}") is not template
+
+    def test_compile_error(self):
+        with pytest.raises(TemplateValidationError):
+            Jinja2Service().compile_template("{{ a ")
+        assert Jinja2Service().template_cache_stats.size == 0
+
+
+class TestTemplateCacheInSummary:
+    def test_report_covers_the_run_only(self):
+        Jinja2Service().compile_template("{{ before }}")
+        processor = DefaultNornFlowProcessor(async_output=False)
+        for _ in range(3):
+            Jinja2Service().compile_template("{{ during }}")
+
+        report = processor.template_cache_report()
+
+        assert (report["hits"], report["misses"], report["evictions"]) == (2, 1, 0)
+        assert processor.metrics_report()["template_cache"] == report
+
+    def test_shard_activity_merged(self):
+        processor = DefaultNornFlowProcessor(async_output=False)
+        report = {
+            "workflow_start_time": None,
+            "total_hosts": 0,
+            "task_count": 0,
+            "tasks_completed": 0,
+            "task_executions": 0,
+            "successful_executions": 0,
+            "failed_executions": 0,
+            "skipped_executions": 0,
+            "timings": {},
+            "template_cache": {"hits": 7, "misses": 3, "evictions": 1, "size": 3, "max_size": 4096},
+        }
+        processor.merge_shard_report(report)
+        processor.merge_shard_report({**report, "template_cache": {**report["template_cache"], "size": 5}})
+
+        merged = processor.template_cache_report()
+        assert merged["hits"] == 14
+        assert merged["size"] == 5
+
+    def test_printed_in_summary(self, capsys):
+        processor = DefaultNornFlowProcessor(async_output=False)
+        processor.workflow_start_time = datetime.now()
+        Jinja2Service().compile_template("{{ a }}")
+        Jinja2Service().compile_template("{{ a }}")
+
+        processor.print_workflow_summary()
+
+        assert "Hits: 1 (50.0%)  Misses: 1  Evictions: 0" in capsys.readouterr().out
@@ -0,0 +1,233 @@
+import asyncio
+import threading
+import time
+from functools import wraps
+from unittest.mock import MagicMock
+
+import pytest
+from nornir.core.exceptions import NornirSubTaskError
+from nornir.core.inventory import Host
+from nornir.core.plugins.runners import RunnersPluginRegister
+from nornir.core.processor import Processors
+from nornir.core.task import Result, Task
+
+from nornflow.builtins.processors import NornFlowFailureStrategyProcessor
+from nornflow.constants import FailureStrategy
+from nornflow.exceptions import TaskCancelledError
+from nornflow.models import TaskModel
+from nornflow.runners import AsyncioRunner, CancellationToken, run_async
+from nornflow.runners.async_runner import is_async_task, sync_task
+
+
+def make_task(func, processors=None, name="test_task"):
+    return Task(func, MagicMock(), global_dry_run=False, processors=Processors(processors or []), name=name)
+
+
+def make_hosts(count):
+    return [Host(f"h{index}") for index in range(count)]
+
+
+class TestAsyncioRunner:
+    def test_coroutine_tasks_share_one_thread(self):
+        runner = AsyncioRunner(max_concurrency=500)
+        threads = set()
+
+        async def echo(task):
+            threads.add(threading.get_ident())
+            await asyncio.sleep(0.05)
+            return Result(host=task.host, result=task.host.name)
+
+        started = time.monotonic()
+        result = runner.run(make_task(echo), make_hosts(200))
+
+        assert time.monotonic() - started < 2
+        assert len(threads) == 1
+        assert list(result) == [f"h{index}" for index in range(200)]
+        assert [result[name].result for name in result] == list(result)
+        assert not result.failed
+
+    def test_never_exceeds_max_concurrency(self):
+        runner = AsyncioRunner(max_concurrency=3)
+        running = {"now": 0, "max": 0}
+
+        async def track(task):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.005)
+            running["now"] -= 1
+
+        runner.run(make_task(track), make_hosts(12))
+
+        assert running["max"] == 3
+
+    def test_regular_tasks_run_on_worker_threads(self):
+        runner = AsyncioRunner(num_workers=4)
+        threads = set()
+        lock = threading.Lock()
+
+        def echo(task):
+            with lock:
+                threads.add(threading.current_thread().name)
+            return task.host.name
+
+        result = runner.run(make_task(echo), make_hosts(8))
+
+        assert threading.current_thread().name not in threads
+        assert [result[name].result for name in result] == [f"h{index}" for index in range(8)]
+
+    def test_exceptions_become_failed_results(self):
+        async def boom(task):
+            raise RuntimeError("boom")
+
+        result = AsyncioRunner().run(make_task(boom), make_hosts(2))
+
+        assert result.failed
+        assert isinstance(result["h0"].exception, RuntimeError)
+        assert result["h0"][0].name == "test_task"
+
+    def test_processors_notified_around_coroutine_tasks(self):
+        processor = MagicMock()
+
+        async def noop(task):
+            return None
+
+        AsyncioRunner().run(make_task(noop, [processor]), make_hosts(2))
+
+        assert processor.task_instance_started.call_count == 2
+        assert processor.task_instance_completed.call_count == 2
+
+    def test_hook_wrapped_coroutine_is_awaited(self):
+        async def echo(task):
+            await asyncio.sleep(0)
+            return task.host.name
+
+        def hook_wrapper(func):
+            @wraps(func)
+            def wrapper(task, **kwargs):
+                return func(task, **kwargs)
+
+            return wrapper
+
+        result = AsyncioRunner().run(make_task(hook_wrapper(echo)), make_hosts(1))
+
+        assert result["h0"].result == "h0"
+
+    def test_run_async_subtasks(self):
+        async def child(task, value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        async def parent(task):
+            first = await run_async(task, child, value=1)
+            return first.result + 10
+
+        result = AsyncioRunner().run(make_task(parent), make_hosts(1))
+
+        assert [r.result for r in result["h0"]] == [12, 2]
+
+    def test_failed_async_subtask_fails_parent(self):
+        async def child(task):
+            raise ValueError("nope")
+
+        async def parent(task):
+            await run_async(task, child)
+
+        result = AsyncioRunner().run(make_task(parent), make_hosts(1))
+
+        assert result.failed
+        assert isinstance(result["h0"].exception, NornirSubTaskError)
+
+    def test_cancellation_stops_queued_hosts(self):
+        token = CancellationToken()
+        runner = AsyncioRunner(max_concurrency=1, cancellation_token=token)
+        started = []
+
+        async def fail_first(task):
+            started.append(task.host.name)
+            token.cancel("first host failed")
+
+        result = runner.run(make_task(fail_first), make_hosts(4))
+
+        assert started == ["h0"]
+        for name in ("h1", "h2", "h3"):
+            assert isinstance(result[name].exception, TaskCancelledError)
+            assert "first host failed" in str(result[name].exception)
+
+    def test_in_flight_coroutines_cancelled_after_grace_period(self):
+        token = CancellationToken()
+        runner = AsyncioRunner(cancellation_token=token, grace_period=0.05)
+
+        async def work(task):
+            if task.host.name == "h0":
+                token.cancel("stop")
+                return "done"
+            await asyncio.sleep(30)
+
+        started = time.monotonic()
+        result = runner.run(make_task(work), make_hosts(2))
+
+        assert time.monotonic() - started < 5
+        assert result["h0"].result == "done"
+        assert isinstance(result["h1"].exception, TaskCancelledError)
+
+    def test_failure_strategy_processor_cancels_remaining_hosts(self):
+        processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAIL_FAST)
+        runner = AsyncioRunner(max_concurrency=1, cancellation_token=processor.cancellation_token)
+
+        async def fail(task):
+            raise RuntimeError("boom")
+
+        result = runner.run(make_task(fail, [processor]), make_hosts(3))
+
+        assert isinstance(result["h0"].exception, RuntimeError)
+        assert isinstance(result["h2"].exception, TaskCancelledError)
+
+    def test_runs_from_inside_an_event_loop(self):
+        async def echo(task):
+            return task.host.name
+
+        async def main():
+            return AsyncioRunner().run(make_task(echo), make_hosts(2))
+
+        result = asyncio.run(main())
+
+        assert result["h1"].result == "h1"
+
+    def test_registered_as_nornir_runner_plugin(self):
+        assert RunnersPluginRegister.available["asyncio"] is AsyncioRunner
+
+
+class TestCoroutineTaskHelpers:
+    def test_is_async_task_sees_through_wrappers(self):
+        async def coro(task): ...
+
+        @wraps(coro)
+        def wrapper(task): ...
+
+        assert is_async_task(coro)
+        assert is_async_task(wrapper)
+        assert not is_async_task(lambda task: None)
+
+    def test_sync_task_runs_coroutine_to_completion(self):
+        async def coro(task, value):
+            await asyncio.sleep(0)
+            return value
+
+        wrapped = sync_task(coro)
+
+        assert wrapped.__name__ == "coro"
+        assert wrapped(MagicMock(), value=3) == 3
+
+    @pytest.mark.parametrize(("runner", "wrapped"), [(AsyncioRunner(), False), (MagicMock(), True)])
+    def test_task_model_adapts_coroutines_to_the_runner(self, runner, wrapped):
+        async def gather(task): ...
+
+        model = TaskModel.create({"name": "gather"})
+        nornir_manager = MagicMock()
+        nornir_manager.nornir.runner = runner
+
+        model.run(nornir_manager, MagicMock(), {"gather": gather})
+
+        task_func = nornir_manager.nornir.run.call_args.kwargs["task"]
+        assert (task_func is not gather) is wrapped
+        assert task_func.__name__ == "gather"
@@ -0,0 +1,122 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from nornflow.builtins.processors import NornFlowFailureStrategyProcessor
+from nornflow.constants import FailureStrategy
+from nornflow.exceptions import TaskCancelledError
+from nornflow.runners import CancellationToken, get_cancellation_token, raise_if_cancelled
+
+
+class TestCancellationToken:
+    def test_initially_not_cancelled(self):
+        token = CancellationToken()
+
+        assert token.cancelled is False
+        assert token.wait(timeout=0) is False
+        token.raise_if_cancelled("task")
+
+    def test_cancel_is_one_shot(self):
+        token = CancellationToken()
+
+        assert token.cancel("first") is True
+        assert token.cancel("second") is False
+        assert token.cancelled is True
+        assert token.reason == "first"
+
+    def test_callbacks_run_once_on_cancel(self):
+        token = CancellationToken()
+        calls = []
+        token.on_cancel(lambda: calls.append("a"))
+        token.on_cancel(lambda: calls.append("b"))
+
+        token.cancel()
+        token.cancel()
+
+        assert calls == ["a", "b"]
+
+    def test_callback_registered_after_cancel_runs_immediately(self):
+        token = CancellationToken()
+        token.cancel()
+        calls = []
+
+        token.on_cancel(lambda: calls.append(True))
+
+        assert calls == [True]
+
+    def test_removed_callback_does_not_run(self):
+        token = CancellationToken()
+        calls = []
+
+        def callback():
+            calls.append(True)
+
+        token.on_cancel(callback)
+        token.remove_callback(callback)
+        token.cancel()
+
+        assert calls == []
+
+    def test_failing_callback_does_not_block_others(self):
+        token = CancellationToken()
+        calls = []
+
+        def broken():
+            raise RuntimeError("boom")
+
+        token.on_cancel(broken)
+        token.on_cancel(lambda: calls.append(True))
+        token.cancel()
+
+        assert calls == [True]
+
+    def test_raise_if_cancelled_includes_context(self):
+        token = CancellationToken()
+        token.cancel("task 'backup' failed on host 'r1'")
+
+        with pytest.raises(TaskCancelledError) as exc_info:
+            token.raise_if_cancelled("configure", "r2")
+
+        assert exc_info.value.task_name == "configure"
+        assert exc_info.value.host_name == "r2"
+        assert "r2" in str(exc_info.value)
+        assert "backup" in str(exc_info.value)
+
+    def test_wait_wakes_up_on_cancel_from_another_thread(self):
+        token = CancellationToken()
+        timer = threading.Timer(0.05, token.cancel)
+        timer.start()
+
+        assert token.wait(timeout=5) is True
+        timer.join()
+
+
+class TestTaskHelpers:
+    def _task(self, processors):
+        task = MagicMock()
+        task.name = "upgrade"
+        task.host.name = "r1"
+        task.processors = processors
+        return task
+
+    def test_token_found_on_failure_strategy_processor(self):
+        processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAIL_FAST)
+
+        assert get_cancellation_token(self._task([MagicMock(spec=[]), processor])) is processor.cancellation_token
+
+    def test_no_token_outside_nornflow(self):
+        task = self._task([])
+
+        assert get_cancellation_token(task) is None
+        raise_if_cancelled(task)
+
+    def test_raise_if_cancelled_uses_task_context(self):
+        processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAIL_FAST)
+        processor.cancellation_token.cancel()
+
+        with pytest.raises(TaskCancelledError) as exc_info:
+            raise_if_cancelled(self._task([processor]))
+
+        assert exc_info.value.task_name == "upgrade"
+        assert exc_info.value.host_name == "r1"
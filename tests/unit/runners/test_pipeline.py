@@ -0,0 +1,359 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from nornir.core import Nornir
+from nornir.core.inventory import Host, Hosts, Inventory
+from nornir.core.processor import Processor, Processors
+from nornir.core.task import Result, Task
+from nornir.plugins.runners import SerialRunner
+
+from nornflow import NornFlow
+from nornflow.builtins.constants import SILENT_SKIP_FLAG
+from nornflow.builtins.processors import NornFlowHookProcessor
+from nornflow.constants import ExecutionStrategy
+from nornflow.exceptions import CoreError, TaskCancelledError
+from nornflow.models import WorkflowModel
+from nornflow.nornir_manager import NornirManager
+from nornflow.runners import CancellationToken, HostPipeline
+from nornflow.settings import NornFlowSettings
+
+
+class RecordingProcessor(Processor):
+    """Processor recording task-level events."""
+
+    def __init__(self):
+        self.events = []
+        self.completed = {}
+        self._lock = threading.Lock()
+
+    def task_started(self, task):
+        with self._lock:
+            self.events.append(("started", task.name))
+
+    def task_completed(self, task, result):
+        with self._lock:
+            self.events.append(("completed", task.name))
+            self.completed[task.name] = result
+
+    def task_instance_started(self, task, host):
+        pass
+
+    def task_instance_completed(self, task, host, result):
+        pass
+
+    def subtask_instance_started(self, task, host):
+        pass
+
+    def subtask_instance_completed(self, task, host, result):
+        pass
+
+
+def make_nornir(host_count, processors=()):
+    hosts = Hosts({f"r{index}": Host(f"r{index}") for index in range(1, host_count + 1)})
+    return Nornir(inventory=Inventory(hosts=hosts), runner=SerialRunner(), processors=Processors(processors))
+
+
+def make_task(nornir, func, name=None):
+    return Task(func, nornir, global_dry_run=False, processors=nornir.processors, name=name)
+
+
+def record(log, lock):
+    def step(task):
+        with lock:
+            log.append((task.name, task.host.name))
+        return Result(host=task.host, result=task.host.name)
+
+    return step
+
+
+class TestHostPipeline:
+    def test_runs_every_task_on_every_host(self):
+        processor = RecordingProcessor()
+        nornir = make_nornir(3, [processor])
+        log, lock = [], threading.Lock()
+        tasks = [make_task(nornir, record(log, lock), name) for name in ("first", "second")]
+
+        results = HostPipeline(nornir, tasks, num_workers=3).run()
+
+        assert sorted(log) == sorted((name, f"r{i}") for name in ("first", "second") for i in (1, 2, 3))
+        assert [result.name for result in results] == ["first", "second"]
+        assert all(set(result) == {"r1", "r2", "r3"} for result in results)
+        assert processor.events[0] == ("started", "first")
+        assert [event for event in processor.events if event[0] == "completed"] == [
+            ("completed", "first"),
+            ("completed", "second"),
+        ]
+
+    def test_fast_hosts_do_not_wait_for_slow_hosts(self):
+        nornir = make_nornir(2)
+        release = threading.Event()
+        finished = threading.Event()
+
+        def first(task):
+            if task.host.name == "r1":
+                release.wait(5)
+
+        def second(task):
+            if task.host.name == "r2":
+                finished.set()
+
+        tasks = [make_task(nornir, first), make_task(nornir, second)]
+        runner = threading.Thread(target=HostPipeline(nornir, tasks, num_workers=2).run)
+        runner.start()
+        try:
+            assert finished.wait(5)
+        finally:
+            release.set()
+            runner.join(5)
+
+    def test_failed_host_skips_rest_of_its_chain(self):
+        processor = RecordingProcessor()
+        nornir = make_nornir(3, [processor])
+        log, lock = [], threading.Lock()
+
+        def fail_r2(task):
+            if task.host.name == "r2":
+                raise RuntimeError("boom")
+
+        tasks = [make_task(nornir, fail_r2), make_task(nornir, record(log, lock), "after")]
+
+        results = HostPipeline(nornir, tasks).run()
+
+        assert results[0]["r2"].failed
+        assert sorted(log) == [("after", "r1"), ("after", "r3")]
+        assert set(processor.completed["after"]) == {"r1", "r3"}
+        assert nornir.data.failed_hosts == {"r2"}
+
+    def test_failed_host_continues_without_stop_on_failure(self):
+        nornir = make_nornir(2)
+        log, lock = [], threading.Lock()
+
+        def fail_r2(task):
+            if task.host.name == "r2":
+                raise RuntimeError("boom")
+
+        tasks = [make_task(nornir, fail_r2), make_task(nornir, record(log, lock), "after")]
+
+        HostPipeline(nornir, tasks, stop_on_failure=False).run()
+
+        assert sorted(log) == [("after", "r1"), ("after", "r2")]
+
+    def test_hosts_already_failed_are_not_run(self):
+        processor = RecordingProcessor()
+        nornir = make_nornir(2, [processor])
+        nornir.data.failed_hosts.update({"r1", "r2"})
+        log, lock = [], threading.Lock()
+
+        results = HostPipeline(nornir, [make_task(nornir, record(log, lock), "only")]).run()
+
+        assert log == []
+        assert len(results[0]) == 0
+        assert processor.events == [("started", "only"), ("completed", "only")]
+
+    def test_cancellation_stops_hosts_before_their_next_task(self):
+        processor = RecordingProcessor()
+        nornir = make_nornir(2, [processor])
+        token = CancellationToken()
+        r1_done = threading.Event()
+        log, lock = [], threading.Lock()
+
+        def first(task):
+            if task.host.name == "r1":
+                r1_done.set()
+                return
+            r1_done.wait(5)
+            token.cancel("r2 gave up")
+
+        tasks = [make_task(nornir, first), make_task(nornir, record(log, lock), "second")]
+
+        HostPipeline(nornir, tasks, num_workers=2, cancellation_token=token).run()
+
+        assert ("completed", "first") in processor.events
+        if ("started", "second") in processor.events:
+            assert isinstance(processor.completed["second"]["r2"].exception, TaskCancelledError)
+        assert ("second", "r2") not in log
+
+    def test_already_cancelled_token_starts_nothing(self):
+        processor = RecordingProcessor()
+        nornir = make_nornir(2, [processor])
+        token = CancellationToken()
+        token.cancel()
+
+        HostPipeline(nornir, [make_task(nornir, MagicMock(), "only")], cancellation_token=token).run()
+
+        assert processor.events == []
+
+    def test_empty_inventory_still_starts_and_completes_tasks(self):
+        processor = RecordingProcessor()
+        nornir = make_nornir(0, [processor])
+
+        HostPipeline(nornir, [make_task(nornir, MagicMock(), "only")]).run()
+
+        assert processor.events == [("started", "only"), ("completed", "only")]
+
+    def test_silent_skip_flag_cleared_after_each_host_task(self):
+        nornir = make_nornir(1)
+        seen = []
+
+        def flag(task):
+            task.host.data[SILENT_SKIP_FLAG] = True
+
+        def check(task):
+            seen.append(task.host.data.get(SILENT_SKIP_FLAG))
+
+        HostPipeline(nornir, [make_task(nornir, flag), make_task(nornir, check)]).run()
+
+        assert seen == [None]
+
+
+class TestHookProcessorTaskContexts:
+    def test_registered_context_is_resolved_per_task(self):
+        processor = NornFlowHookProcessor(workflow_context={"vars_manager": "vm"})
+        first_hook, second_hook = MagicMock(), MagicMock()
+        processor.register_task_context("first", {"task_model": "m1", "hooks": [first_hook]})
+        processor.register_task_context("second", {"task_model": "m2", "hooks": [second_hook]})
+        nornir = make_nornir(1)
+        first = make_task(nornir, MagicMock(), "first")
+        subtask = Task(MagicMock(), nornir, False, nornir.processors, name="sub", parent_task=first)
+
+        assert processor.hooks_for(first) == [first_hook]
+        assert processor.hooks_for(subtask) == [first_hook]
+        assert processor.context_for(make_task(nornir, MagicMock(), "second")) == {
+            "vars_manager": "vm",
+            "task_model": "m2",
+            "hooks": [second_hook],
+        }
+
+    def test_unregistered_task_falls_back_to_current_context(self):
+        processor = NornFlowHookProcessor()
+        hook = MagicMock()
+        processor.register_task_context("other", {"hooks": []})
+        processor.task_specific_context = {"hooks": [hook]}
+
+        assert processor.hooks_for(make_task(make_nornir(1), MagicMock(), "linear")) == [hook]
+
+    def test_task_completed_drops_only_its_registered_context(self):
+        processor = NornFlowHookProcessor()
+        processor.task_specific_context = {"hooks": []}
+        processor.register_task_context("first", {"hooks": []})
+        processor.register_task_context("second", {"hooks": []})
+        nornir = make_nornir(1)
+
+        processor.task_completed(make_task(nornir, MagicMock(), "first"), MagicMock())
+
+        assert "second" in processor._task_contexts
+        assert "first" not in processor._task_contexts
+        assert processor.task_specific_context == {"hooks": []}
+
+    def test_hooks_receive_their_own_task_context(self):
+        processor = NornFlowHookProcessor()
+        seen = {}
+
+        class Spy:
+            def __init__(self, key):
+                self.key = key
+                self._current_context = None
+
+            def should_execute(self, task):
+                return True
+
+            def task_instance_started(self, task, host):
+                seen[self.key] = self._current_context["task_model"]
+
+        processor.register_task_context("first", {"task_model": "m1", "hooks": [Spy("a")]})
+        processor.register_task_context("second", {"task_model": "m2", "hooks": [Spy("b")]})
+        nornir = make_nornir(1)
+        host = nornir.inventory.hosts["r1"]
+
+        processor.task_instance_started(make_task(nornir, MagicMock(), "second"), host)
+        processor.task_instance_started(make_task(nornir, MagicMock(), "first"), host)
+
+        assert seen == {"a": "m1", "b": "m2"}
+
+
+class TestNornFlowFreeStrategy:
+    def make_nornflow(self, tasks, **settings):
+        nornflow = NornFlow.__new__(NornFlow)
+        nornflow._settings = NornFlowSettings(nornir_config_file="mock_config.yaml", **settings)
+        nornflow._execution_strategy = None
+        nornflow._shards = None
+        nornflow._distributed = None
+        nornflow._connection_pool = None
+        nornflow._failure_strategy = None
+        nornflow._failure_strategy_processor = None
+        nornflow._redaction_sensitive_names = frozenset()
+        nornflow._no_redact = False
+        nornflow._dry_run = False
+        nornflow._workflow = MagicMock(spec=WorkflowModel)
+        nornflow._workflow.tasks = tasks
+        nornflow._workflow.execution_strategy = None
+        nornflow._workflow.failure_strategy = None
+        nornflow._workflow.dry_run = None
+        nornflow._var_processor = MagicMock()
+        nornflow._tasks_catalog = MagicMock()
+        manager = NornirManager.__new__(NornirManager)
+        manager.connection_pool = None
+        manager._inventory_index = None
+        manager.nornir = make_nornir(2)
+        nornflow._nornir_manager = manager
+        return nornflow
+
+    def make_workflow_task(self, function_name, canonical_id, log):
+        def func(task):
+            log.append((task.name, task.host.name))
+
+        func.__name__ = function_name
+        workflow_task = MagicMock()
+        workflow_task.canonical_id = canonical_id
+        workflow_task.resolve_task_func.return_value = func
+        workflow_task.prepare.side_effect = lambda nornir_manager, name=None, **kwargs: make_task(
+            nornir_manager.nornir, func, name
+        )
+        return workflow_task
+
+    def test_execution_strategy_precedence(self):
+        nornflow = self.make_nornflow([], execution_strategy="free")
+        assert nornflow.execution_strategy == ExecutionStrategy.FREE
+
+        nornflow._workflow.execution_strategy = ExecutionStrategy.LINEAR
+        assert nornflow.execution_strategy == ExecutionStrategy.LINEAR
+
+        nornflow.execution_strategy = "free"
+        assert nornflow.execution_strategy == ExecutionStrategy.FREE
+
+    def test_invalid_execution_strategy(self):
+        nornflow = self.make_nornflow([])
+        with pytest.raises(CoreError):
+            nornflow.execution_strategy = "parallel"
+
+    def test_free_strategy_pipelines_tasks_with_unique_names(self):
+        log = []
+        tasks = [
+            self.make_workflow_task("echo", "echo_1", log),
+            self.make_workflow_task("greet", "greet_2", log),
+            self.make_workflow_task("echo", "echo_3", log),
+        ]
+        nornflow = self.make_nornflow(tasks, execution_strategy="free")
+
+        nornflow._run_workflow_tasks()
+
+        assert [call.kwargs["name"] for call in (task.prepare.call_args for task in tasks)] == [
+            "echo_1",
+            None,
+            "echo_3",
+        ]
+        assert sorted(log) == sorted(
+            (name, host) for name in ("echo_1", "greet", "echo_3") for host in ("r1", "r2")
+        )
+        for task in tasks:
+            task.run.assert_not_called()
+
+    def test_linear_strategy_runs_tasks_one_by_one(self):
+        tasks = [self.make_workflow_task("echo", "echo_1", [])]
+        nornflow = self.make_nornflow(tasks)
+
+        nornflow._run_workflow_tasks()
+
+        tasks[0].run.assert_called_once()
+        tasks[0].prepare.assert_not_called()
@@ -0,0 +1,150 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from nornir.core.inventory import Host
+from nornir.core.processor import Processors
+from nornir.core.task import Result, Task
+
+from nornflow.builtins.processors import NornFlowFailureStrategyProcessor
+from nornflow.constants import FailureStrategy
+from nornflow.exceptions import TaskCancelledError
+from nornflow.runners import CancellableThreadedRunner, CancellationToken
+
+
+def make_task(func, processors=None, name="test_task"):
+    return Task(func, MagicMock(), global_dry_run=False, processors=Processors(processors or []), name=name)
+
+
+def make_hosts(count):
+    return [Host(f"h{index}") for index in range(count)]
+
+
+class TestCancellableThreadedRunner:
+    def test_runs_every_host_in_order(self):
+        runner = CancellableThreadedRunner(num_workers=3)
+
+        def echo(task):
+            time.sleep(0.001 * (5 - int(task.host.name[1:])))
+            return Result(host=task.host, result=task.host.name)
+
+        result = runner.run(make_task(echo), make_hosts(5))
+
+        assert list(result) == ["h0", "h1", "h2", "h3", "h4"]
+        assert [result[name].result for name in result] == ["h0", "h1", "h2", "h3", "h4"]
+        assert not result.failed
+
+    def test_never_exceeds_num_workers(self):
+        runner = CancellableThreadedRunner(num_workers=2)
+        lock = threading.Lock()
+        running = {"now": 0, "max": 0}
+
+        def track(task):
+            with lock:
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            time.sleep(0.005)
+            with lock:
+                running["now"] -= 1
+
+        runner.run(make_task(track), make_hosts(8))
+
+        assert running["max"] <= 2
+
+    def test_cancellation_stops_dispatching_queued_hosts(self):
+        token = CancellationToken()
+        runner = CancellableThreadedRunner(num_workers=1, cancellation_token=token)
+        started = []
+
+        def fail_first(task):
+            started.append(task.host.name)
+            if task.host.name == "h1":
+                token.cancel("h1 failed")
+                raise RuntimeError("boom")
+
+        result = runner.run(make_task(fail_first), make_hosts(50))
+
+        assert started == ["h0", "h1"]
+        assert len(result) == 50
+        assert not result["h0"].failed
+        assert isinstance(result["h1"].exception, RuntimeError)
+        for name in (f"h{index}" for index in range(2, 50)):
+            assert result[name].failed
+            assert isinstance(result[name].exception, TaskCancelledError)
+            assert "h1 failed" in str(result[name].exception)
+
+    def test_already_cancelled_token_starts_nothing(self):
+        token = CancellationToken()
+        token.cancel()
+        started = []
+
+        result = CancellableThreadedRunner(cancellation_token=token).run(
+            make_task(lambda task: started.append(task.host.name)), make_hosts(3)
+        )
+
+        assert started == []
+        assert all(isinstance(result[name].exception, TaskCancelledError) for name in result)
+
+    def test_waits_for_in_flight_hosts_without_grace_period(self):
+        token = CancellationToken()
+        runner = CancellableThreadedRunner(num_workers=2, cancellation_token=token)
+
+        def slow_or_cancel(task):
+            if task.host.name == "h0":
+                time.sleep(0.05)
+                return Result(host=task.host, result="finished")
+            token.cancel()
+            return None
+
+        result = runner.run(make_task(slow_or_cancel), make_hosts(2))
+
+        assert result["h0"].result == "finished"
+
+    def test_grace_period_bounds_time_to_halt(self):
+        token = CancellationToken()
+        release = threading.Event()
+        runner = CancellableThreadedRunner(num_workers=2, cancellation_token=token, grace_period=0.05)
+
+        def hang_or_cancel(task):
+            if task.host.name == "h0":
+                release.wait(5)
+                return None
+            token.cancel("h1 failed")
+            return None
+
+        started = time.perf_counter()
+        try:
+            result = runner.run(make_task(hang_or_cancel), make_hosts(4))
+        finally:
+            release.set()
+
+        assert time.perf_counter() - started < 2
+        assert isinstance(result["h0"].exception, TaskCancelledError)
+        assert not result["h1"].failed
+        assert isinstance(result["h2"].exception, TaskCancelledError)
+
+    def test_in_flight_host_stops_at_next_subtask(self):
+        processor = NornFlowFailureStrategyProcessor(FailureStrategy.FAIL_FAST)
+        token = processor.cancellation_token
+        runner = CancellableThreadedRunner(num_workers=2, cancellation_token=token)
+        subtasks_run = []
+        h0_started = threading.Event()
+
+        def step(task):
+            subtasks_run.append(task.host.name)
+
+        def grouped(task):
+            if task.host.name == "h1":
+                h0_started.wait(5)
+                token.cancel()
+                return None
+            h0_started.set()
+            while not token.cancelled:
+                time.sleep(0.001)
+            task.run(step)
+            return None
+
+        result = runner.run(make_task(grouped, processors=[processor]), make_hosts(2))
+
+        assert subtasks_run == []
+        assert isinstance(result["h0"].exception, TaskCancelledError)
@@ -4,7 +4,13 @@ import pytest
 import yaml
 from pydantic import ValidationError
 
-from nornflow.constants import NORNFLOW_SETTINGS_MANDATORY, NORNFLOW_SETTINGS_OPTIONAL
+from nornflow.constants import (
+    BatchSize,
+    ExecutionStrategy,
+    FailureBudget,
+    NORNFLOW_SETTINGS_MANDATORY,
+    NORNFLOW_SETTINGS_OPTIONAL,
+)
 from nornflow.exceptions import SettingsError
 from nornflow.settings import NornFlowSettings, RedactionSettings
 
@@ -135,6 +141,57 @@ def test_validate_failure_strategy_invalid():
         NornFlowSettings(**settings_dict)
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("10%", FailureBudget(max_fail_percentage=10.0)),
+        (3, FailureBudget(max_failures=3)),
+        ({"max_failures": 2, "max_fail_percentage": 5}, FailureBudget(2, 5.0)),
+    ],
+)
+def test_validate_failure_budget(value, expected):
+    settings = NornFlowSettings(nornir_config_file="dummy_config.yaml", failure_budget=value)
+    assert settings.failure_budget == expected
+
+
+def test_validate_failure_budget_from_env(monkeypatch):
+    monkeypatch.setenv("NORNFLOW_SETTINGS_failure_budget", "25%")
+    settings = NornFlowSettings(nornir_config_file="dummy_config.yaml")
+    assert settings.failure_budget == FailureBudget(max_fail_percentage=25.0)
+
+
+def test_validate_failure_budget_invalid():
+    with pytest.raises((SettingsError, ValidationError), match="between 0 and 100"):
+        NornFlowSettings(nornir_config_file="dummy_config.yaml", failure_budget="150%")
+
+
+def test_validate_batch_size():
+    settings = NornFlowSettings(nornir_config_file="dummy_config.yaml", batch_size="20%", batch_pause=1.5)
+    assert settings.batch_size == BatchSize(percentage=20.0)
+    assert settings.batch_pause == 1.5
+
+
+def test_validate_batch_size_invalid():
+    with pytest.raises((SettingsError, ValidationError), match="at least 1 host"):
+        NornFlowSettings(nornir_config_file="dummy_config.yaml", batch_size=0)
+
+
+def test_validate_execution_strategy():
+    settings = NornFlowSettings(nornir_config_file="dummy_config.yaml", execution_strategy="FREE")
+    assert settings.execution_strategy == ExecutionStrategy.FREE
+    assert NornFlowSettings(nornir_config_file="dummy_config.yaml").execution_strategy == ExecutionStrategy.LINEAR
+
+
+def test_validate_execution_strategy_invalid():
+    with pytest.raises((SettingsError, ValidationError), match="Invalid execution strategy"):
+        NornFlowSettings(nornir_config_file="dummy_config.yaml", execution_strategy="parallel")
+
+
+def test_validate_batch_pause_negative():
+    with pytest.raises(ValidationError):
+        NornFlowSettings(nornir_config_file="dummy_config.yaml", batch_pause=-1)
+
+
 def test_relative_paths_resolved_via_load(tmp_path):
     """Resolve all relative directories against the settings file location."""
     settings_file = tmp_path / "test_settings.yaml"
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+from nornir.core import Nornir
+from nornir.core.inventory import Defaults, Groups, Host, Hosts, Inventory
+from nornir.core.task import Result, Task
+from nornir.plugins.runners import ThreadedRunner
+
+from nornflow.vars.manager import NornFlowVariablesManager
+from nornflow.vars.processors import NornFlowVariableProcessor
+
+NUM_HOSTS = 2000
+NUM_WORKERS = 64
+
+
+def _echo(task: Task, message: str) -> Result:
+    # Yield the GIL so workers interleave between param resolution and execution
+    time.sleep(0)
+    return Result(host=task.host, result=message)
+
+
+@pytest.fixture()
+def large_nornir() -> Nornir:
+    hosts = Hosts(
+        {
+            f"dev{i:05d}": Host(name=f"dev{i:05d}", platform=f"os-{i % 7}", data={"site": f"site-{i}"})
+            for i in range(NUM_HOSTS)
+        }
+    )
+    inventory = Inventory(hosts=hosts, groups=Groups(), defaults=Defaults())
+    return Nornir(inventory=inventory, runner=ThreadedRunner(num_workers=NUM_WORKERS))
+
+
+class TestConcurrentHostResolution:
+    def test_templated_task_resolves_each_host_against_itself(self, tmp_path, large_nornir):
+        manager = NornFlowVariablesManager(vars_dir=str(tmp_path))
+        for name in large_nornir.inventory.hosts:
+            manager.set_runtime_variable("tag", f"tag-{name}", name)
+        nornir = large_nornir.with_processors([NornFlowVariableProcessor(manager)])
+
+        results = nornir.run(
+            task=_echo,
+            message="{{ host.name }}|{{ host.platform }}|{{ host.site }}|{{ tag }}",
+        )
+
+        assert len(results) == NUM_HOSTS
+        for name, multi_result in results.items():
+            host = large_nornir.inventory.hosts[name]
+            assert not multi_result.failed
+            assert multi_result[0].result == f"{name}|{host.platform}|{host['site']}|tag-{name}"
@@ -0,0 +1,105 @@
+import pytest
+
+from nornflow.vars.context import NornFlowDeviceContext
+
+
+@pytest.fixture()
+def shared_state():
+    NornFlowDeviceContext.initialize_shared_state(
+        cli_vars={"cli_var": "cli", "override_var": "cli"},
+        inline_workflow_vars={"inline_var": "inline", "override_var": "inline"},
+        domain_vars={"domain_var": "domain"},
+        default_vars={"default_var": "default", "override_var": "default"},
+        env_vars={"env_var": "env", "override_var": "env"},
+    )
+
+
+class TestFlatContextCaching:
+    def test_flat_context_respects_precedence(self, shared_state):
+        ctx = NornFlowDeviceContext("device1")
+        flat = ctx.get_flat_context()
+
+        assert flat["override_var"] == "cli"
+        assert flat["env_var"] == "env"
+        assert flat["domain_var"] == "domain"
+
+    def test_repeated_calls_return_same_object(self, shared_state):
+        ctx = NornFlowDeviceContext("device1")
+
+        assert ctx.get_flat_context() is ctx.get_flat_context()
+
+    def test_runtime_var_assignment_invalidates_cache(self, shared_state):
+        ctx = NornFlowDeviceContext("device1")
+        first = ctx.get_flat_context()
+
+        ctx.runtime_vars["override_var"] = "runtime"
+        second = ctx.get_flat_context()
+
+        assert second is not first
+        assert second["override_var"] == "runtime"
+        assert ctx.get_flat_context() is second
+
+    @pytest.mark.parametrize(
+        "mutation",
+        [
+            lambda rv: rv.update({"new_var": 1}),
+            lambda rv: rv.setdefault("new_var", 1),
+            lambda rv: rv.pop("seed"),
+            lambda rv: rv.clear(),
+            lambda rv: rv.__delitem__("seed"),
+        ],
+    )
+    def test_all_runtime_mutations_invalidate_cache(self, shared_state, mutation):
+        ctx = NornFlowDeviceContext("device1")
+        ctx.runtime_vars["seed"] = "value"
+        version = ctx.version
+
+        mutation(ctx.runtime_vars)
+
+        assert ctx.version != version
+        assert ctx.get_flat_context() == {**NornFlowDeviceContext._shared_flat_context, **ctx.runtime_vars}
+
+    def test_runtime_vars_setter_invalidates_cache(self, shared_state):
+        ctx = NornFlowDeviceContext("device1")
+        ctx.get_flat_context()
+
+        ctx.runtime_vars = {"replaced": True}
+        ctx.runtime_vars["added"] = True
+
+        flat = ctx.get_flat_context()
+        assert flat["replaced"] is True
+        assert flat["added"] is True
+
+    def test_override_layer_invalidates_cache(self, shared_state):
+        ctx = NornFlowDeviceContext("device1")
+        ctx.get_flat_context()
+
+        ctx.cli_vars = {"override_var": "device_cli"}
+
+        assert ctx.get_flat_context()["override_var"] == "device_cli"
+
+    def test_runtime_beats_overrides(self, shared_state):
+        ctx = NornFlowDeviceContext("device1")
+        ctx.cli_vars = {"override_var": "device_cli"}
+        ctx.runtime_vars["override_var"] = "runtime"
+
+        assert ctx.get_flat_context()["override_var"] == "runtime"
+
+    def test_shared_state_reinitialization_invalidates_cache(self, shared_state):
+        ctx = NornFlowDeviceContext("device1")
+        assert ctx.get_flat_context()["cli_var"] == "cli"
+
+        NornFlowDeviceContext.initialize_shared_state(
+            cli_vars={"cli_var": "new"}, inline_workflow_vars={}, domain_vars={}, default_vars={}, env_vars={}
+        )
+
+        assert ctx.get_flat_context()["cli_var"] == "new"
+
+    def test_devices_do_not_share_runtime_vars(self, shared_state):
+        ctx1 = NornFlowDeviceContext("device1")
+        ctx2 = NornFlowDeviceContext("device2")
+
+        ctx1.runtime_vars["only_on_1"] = True
+
+        assert "only_on_1" in ctx1.get_flat_context()
+        assert "only_on_1" not in ctx2.get_flat_context()
@@ -1,9 +1,11 @@
+import asyncio
+import threading
 from unittest.mock import MagicMock
 
 import pytest
 
 from nornflow.vars.exceptions import VariableError
-from nornflow.vars.proxy import NornirHostProxy
+from nornflow.vars.proxy import BoundHostProxy, NornirHostProxy
 
 
 class TestNornirHostProxyBasic:
@@ -82,4 +84,105 @@ class TestNornirHostProxyAttributeAccess:
         proxy._nornir = MagicMock()
         with pytest.raises(VariableError) as exc:
             _ = proxy.missing_key
-        assert "Attribute or key 'missing_key' not found" in str(exc.value)
\ No newline at end of file
+        assert "Attribute or key 'missing_key' not found" in str(exc.value)
+
+class TestNornirHostProxyThreadLocality:
+    def test_current_host_is_per_thread(self):
+        proxy = NornirHostProxy()
+        main_host = MagicMock()
+        main_host.name = "main"
+        proxy.current_host = main_host
+
+        seen_in_worker = []
+
+        def worker():
+            seen_in_worker.append(proxy.current_host)
+            other = MagicMock()
+            other.name = "worker"
+            proxy.current_host = other
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen_in_worker == [None]
+        assert proxy.current_host_name == "main"
+
+    def test_current_host_is_per_asyncio_task(self):
+        proxy = NornirHostProxy()
+
+        async def worker(name):
+            host = MagicMock()
+            host.name = name
+            proxy.current_host = host
+            await asyncio.sleep(0)
+            return proxy.current_host_name
+
+        async def main():
+            return await asyncio.gather(worker("r1"), worker("r2"))
+
+        assert asyncio.run(main()) == ["r1", "r2"]
+        assert proxy.current_host is None
+
+
+class TestBoundHostProxy:
+    def _proxy_with_hosts(self, *names):
+        proxy = NornirHostProxy()
+        hosts = {}
+        for name in names:
+            host = MagicMock()
+            host.name = name
+            host.get.side_effect = lambda key, _name=name: f"{_name}-{key}"
+            hosts[name] = host
+        mock_nornir = MagicMock()
+        mock_nornir.inventory.hosts = hosts
+        proxy.nornir = mock_nornir
+        return proxy
+
+    def test_bound_proxy_resolves_against_its_own_host(self):
+        proxy = self._proxy_with_hosts("host1", "host2")
+
+        bound1 = proxy.get_host_proxy("host1")
+        bound2 = proxy.get_host_proxy("host2")
+
+        assert isinstance(bound1, BoundHostProxy)
+        assert bound1.platform == "host1-platform"
+        assert bound2.platform == "host2-platform"
+        assert bound1.current_host_name == "host1"
+        assert proxy.current_host is None
+
+    def test_bound_proxy_is_reused_per_host(self):
+        proxy = self._proxy_with_hosts("host1")
+
+        assert proxy.get_host_proxy("host1") is proxy.get_host_proxy("host1")
+
+    def test_setting_new_nornir_discards_bound_proxies(self):
+        proxy = self._proxy_with_hosts("host1")
+        first = proxy.get_host_proxy("host1")
+
+        new_nornir = MagicMock()
+        new_nornir.inventory.hosts = {"host1": MagicMock()}
+        proxy.nornir = new_nornir
+
+        assert proxy.get_host_proxy("host1") is not first
+
+    def test_get_host_proxy_raises_when_nornir_missing(self):
+        proxy = NornirHostProxy()
+        with pytest.raises(VariableError) as exc:
+            proxy.get_host_proxy("host1")
+        assert "Nornir instance not set" in str(exc.value)
+
+    def test_get_host_proxy_raises_for_unknown_host(self):
+        proxy = self._proxy_with_hosts("host1")
+        with pytest.raises(VariableError) as exc:
+            proxy.get_host_proxy("missing")
+        assert "'missing' not found" in str(exc.value)
+
+    def test_bound_proxy_raises_when_value_missing(self):
+        host = MagicMock()
+        host.name = "hostX"
+        host.get.return_value = None
+        bound = BoundHostProxy(host)
+        with pytest.raises(VariableError) as exc:
+            _ = bound.missing_key
+        assert "Attribute or key 'missing_key' not found in host 'hostX'" in str(exc.value)
@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
+from nornflow.j2.exceptions import TemplateError
 from nornflow.vars.exceptions import VariableError
 from nornflow.vars.manager import NornFlowVariablesManager
 
@@ -77,4 +78,69 @@ class TestVariableManager:
         """Test that NornFlow custom filters are registered in Jinja2 environment."""
         env = basic_manager.jinja2.environment
         assert "is_set" in env.filters
-        assert "flatten_list" in env.filters
\ No newline at end of file
+        assert "flatten_list" in env.filters
+    def test_lookup_context_reused_until_runtime_change(self, setup_manager):
+        """Test that the per-host lookup context is cached until a runtime variable changes."""
+        first = setup_manager._get_lookup_context("test_device")
+        assert setup_manager._get_lookup_context("test_device") is first
+
+        setup_manager.set_runtime_variable("new_var", "new_value", "test_device")
+        second = setup_manager._get_lookup_context("test_device")
+
+        assert second is not first
+        assert second["new_var"] == "new_value"
+        assert setup_manager.resolve_string("{{ new_var }}", "test_device") == "new_value"
+
+    def test_additional_vars_do_not_pollute_cached_context(self, setup_manager):
+        """Test that additional_vars apply to a single resolution only."""
+        result = setup_manager.resolve_string("{{ extra }}", "test_device", additional_vars={"extra": "x"})
+        assert result == "x"
+        assert "extra" not in setup_manager._get_lookup_context("test_device")
+
+
+class TestResolveCondition:
+    def test_evaluates_per_host(self, setup_manager):
+        condition = setup_manager.jinja2.build_condition(
+            "{{ host.platform == 'ios' and runtime_var == 'runtime_value' }}"
+        )
+
+        assert setup_manager.resolve_condition(condition, "test_device") is True
+        assert not setup_manager.resolve_condition(condition, "test_device", additional_vars={"runtime_var": "x"})
+
+    def test_missing_host_name(self, setup_manager):
+        with pytest.raises(TemplateError):
+            setup_manager.resolve_condition(setup_manager.jinja2.build_condition("{{ true }}"), "")
+
+
+class TestResolvePlanSharedRenders:
+    def test_runtime_override_rendered_for_its_host(self, setup_manager):
+        plan = setup_manager.jinja2.build_render_plan(
+            {"shared": "{{ workflow_var }}-{{ backup_type }}", "override": "{{ override_var }}"}
+        )
+
+        assert plan.host_invariant_count == 2
+        assert setup_manager.resolve_plan(plan, "other_device") == {
+            "shared": "workflow_value-full",
+            "override": "workflow_value",
+        }
+        assert setup_manager.resolve_plan(plan, "test_device") == {
+            "shared": "workflow_value-full",
+            "override": "runtime_value",
+        }
+
+
+class TestNativeTemplates:
+    def test_resolve_data_defaults_to_manager_setting(self, setup_manager):
+        data = {"count": "{{ backup_type | length }}"}
+
+        assert setup_manager.resolve_data(data, "test_device") == {"count": "4"}
+        setup_manager.native_templates = True
+        assert setup_manager.resolve_data(data, "test_device") == {"count": 4}
+        assert setup_manager.resolve_data(data, "test_device", native=False) == {"count": "4"}
+
+    def test_resolve_string_defaults_to_manager_setting(self, setup_manager):
+        assert setup_manager.resolve_string("{{ dry_run }}", "test_device") == "True"
+        assert setup_manager.resolve_string("{{ dry_run }}", "test_device", native=True) is True
+        setup_manager.native_templates = True
+        assert setup_manager.resolve_string("{{ dry_run }}", "test_device") is True
+        assert setup_manager.resolve_string("{{ dry_run }}", "test_device", native=False) == "True"
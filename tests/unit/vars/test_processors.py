@@ -122,9 +122,8 @@ class TestVariableProcessor:
             processor.task_instance_started(task, host)
 
         # Verify params were stored and cleared
-        key = (task.name, host.name)
-        assert key in processor._deferred_params
-        assert processor._deferred_params[key] == {"command": "{{ host.name }}", "timeout": 30}
+        deferred = processor._task_states[task.name].deferred_params
+        assert deferred[host.name] == {"command": "{{ host.name }}", "timeout": 30}
         assert task.params == {}  # Cleared for deferred processing
 
     def test_resolve_deferred_params_with_stored_key(self, setup_processor, mock_host):
@@ -133,16 +132,15 @@ class TestVariableProcessor:
         task = MagicMock()
         task.name = "test_task"
         host = mock_host
-        key = (task.name, host.name)
         original_params = {"command": "{{ host.name }}", "timeout": 30}
-        processor._deferred_params[key] = original_params
+        processor._get_task_state(task).deferred_params[host.name] = original_params
 
         resolved = processor.resolve_deferred_params(task, host)
 
         # Verify resolution occurred and key was removed
         assert resolved["command"] == "test_device"  # Resolved via mock
         assert resolved["timeout"] == 30
-        assert key not in processor._deferred_params
+        assert host.name not in processor._task_states[task.name].deferred_params
 
     def test_resolve_deferred_params_missing_key(self, setup_processor, mock_host):
         """Test resolve_deferred_params returns None when no deferred params exist."""
@@ -161,11 +159,116 @@ class TestVariableProcessor:
         task = MagicMock()
         task.name = "cleanup_task"
         host = mock_host
-        key = (task.name, host.name)
-        processor._deferred_params[key] = {"unresolved": "param"}
+        processor._get_task_state(task).deferred_params[host.name] = {"unresolved": "param"}
 
         processor.task_instance_completed(task, host, mock_result)
 
         # Verify params were cleaned up
-        assert key not in processor._deferred_params
-        assert processor.vars_manager.nornir_host_proxy.current_host_name is None
\ No newline at end of file
+        assert host.name not in processor._task_states[task.name].deferred_params
+        assert processor.vars_manager.nornir_host_proxy.current_host_name is None
+    def test_task_instance_started_uses_render_plan(self, setup_processor, mock_host):
+        """Test per-host resolution goes through the plan built in task_started."""
+        processor = setup_processor
+        task = MagicMock()
+        task.name = "show_version"
+        task.params = {"command": "show version", "timeout": "{{ timeout }}", "opts": {"a": [1, 2]}}
+        processor.task_started(task)
+
+        host_tasks = []
+        with patch.object(processor.vars_manager, "resolve_data") as resolve_data:
+            for _ in range(2):
+                host_task = MagicMock()
+                host_task.name = task.name
+                host_task.params = dict(task.params)
+                processor.task_instance_started(host_task, mock_host)
+                host_tasks.append(host_task)
+
+        resolve_data.assert_not_called()
+        assert host_tasks[0].params["timeout"] == "30"
+        assert host_tasks[0].params == {"command": "show version", "timeout": "30", "opts": {"a": [1, 2]}}
+        assert host_tasks[0].params is not host_tasks[1].params
+        assert host_tasks[0].params["opts"] is host_tasks[1].params["opts"]
+
+    def test_render_plan_ignored_when_params_changed(self, setup_processor, mock_host):
+        """Test params that no longer match the planned ones fall back to full resolution."""
+        processor = setup_processor
+        task = MagicMock()
+        task.name = "show_version"
+        task.params = {"timeout": "{{ timeout }}"}
+        processor.task_started(task)
+
+        host_task = MagicMock()
+        host_task.name = task.name
+        host_task.params = {"timeout": "{{ timeout }}s"}
+        processor.task_instance_started(host_task, mock_host)
+
+        assert host_task.params["timeout"] == "30s"
+
+    def test_task_completed_drops_task_state(self, setup_processor, mock_result):
+        """Test task_completed discards the task's state, including its render plan."""
+        processor = setup_processor
+        task = MagicMock()
+        task.name = "show_version"
+        task.params = {"timeout": "{{ timeout }}"}
+        processor.task_started(task)
+        assert task.name in processor._task_states
+
+        processor.task_completed(task, mock_result)
+
+        assert task.name not in processor._task_states
+
+    def test_deferred_decision_computed_once_per_task(self, setup_processor, mock_host):
+        """Test hooks are scanned in task_started only, not for every host."""
+        processor = setup_processor
+        task = MagicMock()
+        task.name = "deferred_task"
+        task.params = {"command": "{{ host.name }}"}
+
+        with patch.object(processor, "_requires_deferred_templates", return_value=True) as scan:
+            processor.task_started(task)
+            for _ in range(3):
+                host_task = MagicMock()
+                host_task.name = task.name
+                host_task.params = dict(task.params)
+                processor.task_instance_started(host_task, mock_host)
+
+        scan.assert_called_once()
+        assert processor.requires_deferred_templates(task) is True
+
+    def test_deferred_params_resolved_through_render_plan(self, setup_processor, mock_host):
+        """Test deferred params keep the host's own dict and resolve via the plan."""
+        processor = setup_processor
+        task = MagicMock()
+        task.name = "deferred_task"
+        task.params = {"command": "{{ host.name }}", "timeout": 30}
+
+        with patch.object(processor, "_requires_deferred_templates", return_value=True):
+            processor.task_started(task)
+        host_task = MagicMock()
+        host_task.name = task.name
+        host_params = dict(task.params)
+        host_task.params = host_params
+        processor.task_instance_started(host_task, mock_host)
+
+        assert processor._task_states[task.name].deferred_params[mock_host.name] is host_params
+        with patch.object(processor.vars_manager, "resolve_data") as resolve_data:
+            resolved = processor.resolve_deferred_params(host_task, mock_host)
+
+        resolve_data.assert_not_called()
+        assert resolved == {"command": "test_device", "timeout": 30}
+
+    def test_native_templates_render_task_params_to_values(self, setup_processor, mock_host):
+        """Test task params keep their types when the manager renders native templates."""
+        processor = setup_processor
+        processor.vars_manager.native_templates = True
+        task = MagicMock()
+        task.name = "show_version"
+        task.params = {"timeout": "{{ timeout | int }}", "label": "t-{{ timeout }}"}
+        processor.task_started(task)
+
+        host_task = MagicMock()
+        host_task.name = task.name
+        host_task.params = dict(task.params)
+        processor.task_instance_started(host_task, mock_host)
+
+        assert host_task.params == {"timeout": 30, "label": "t-30"}